@@ -27,6 +27,10 @@ import re
 import os
 import collections
 
+# Format properties structures and their format feature members merged by the script
+FORMAT_PROPERTIES_STRUCTS = ('VkFormatProperties', 'VkFormatProperties3', 'VkFormatProperties3KHR')
+FORMAT_FEATURES = ('linearTilingFeatures', 'optimalTilingFeatures', 'bufferFeatures')
+
 class ProfileFile():
     def __init__(self):
         self.json_output = dict()
@@ -63,8 +67,7 @@ class ProfileFile():
 
     def dump(self, path):
         # Wite new merged profile
-        with open(path, 'w') as file:
-            json.dump(self.json_output, file, indent = 4)
+        gen_profiles_solution.writeFile(path, json.dumps(self.json_output, indent = 4))
 
 class ProfileConfig():
     def __init__(self, input_dir, input_profile_names, profile_api_version, merge_mode):
@@ -117,8 +120,8 @@ class ProfileConfig():
             json_files = list()
             for i in range(len(paths)):
                 print('Opening: ' + paths[i])
-                file = open(paths[i], "r")
-                json_files.append(json.load(file))
+                with open(paths[i], 'rb') as file:
+                    json_files.append(gen_profiles_solution.loadJson(file))
             # We need to iterate through profile names first, so the indices of jsons and profiles lists will match
             if (len(input_profile_names) > 0):
                 for profile_name in input_profile_names:
@@ -308,16 +311,26 @@ class ProfileMerger():
                                 self.add_struct(property, capability['properties'][property], merged_properties)
 
                 if 'formats' in capability:
+                    intersect = self.mode == 'intersection' and self.first is False
+                    formatsIntersected = False
                     for format in capability['formats']:
                         if (format not in merged_formats) and (self.mode == 'union' or self.first):
                             merged_formats[format] = dict()
-                            merged_formats[format]['VkFormatProperties'] = dict()
-                            merged_formats[format]['VkFormatProperties3'] = dict()
-                            merged_formats[format]['VkFormatProperties3KHR'] = dict()
+                            for prop_name in FORMAT_PROPERTIES_STRUCTS:
+                                merged_formats[format][prop_name] = dict()
 
                         if (format in merged_formats):
-                            for prop_name in ['VkFormatProperties', 'VkFormatProperties3', 'VkFormatProperties3KHR']:
-                                for features in ['linearTilingFeatures', 'optimalTilingFeatures', 'bufferFeatures']:
+                            if intersect:
+                                # Remove all formats not in current json, this only has to be done once per json
+                                if not formatsIntersected:
+                                    for mformat in dict(merged_formats):
+                                        if mformat not in capability['formats']:
+                                            del merged_formats[mformat]
+                                    formatsIntersected = True
+                                self.intersect_format_features(merged_formats, format, capability)
+
+                            for prop_name in FORMAT_PROPERTIES_STRUCTS:
+                                for features in FORMAT_FEATURES:
                                     self.merge_format_features(merged_formats, format, capability, prop_name, features)
 
                             # Remove empty entries (can occur when using intersect)
@@ -492,8 +505,8 @@ class ProfileMerger():
             formatsToRemove = list()
 
             for format in capabilities['formats']:
-                for prop_name in ['VkFormatProperties', 'VkFormatProperties3', 'VkFormatProperties3KHR']:
-                    for features in ['linearTilingFeatures', 'optimalTilingFeatures', 'bufferFeatures']:
+                for prop_name in FORMAT_PROPERTIES_STRUCTS:
+                    for features in FORMAT_FEATURES:
                         if features in capabilities['formats'][format][prop_name]:
                             if not capabilities['formats'][format][prop_name][features]:
                                 del capabilities['formats'][format][prop_name][features]
@@ -517,18 +530,14 @@ class ProfileMerger():
     def compareList(self, l1, l2):
         return collections.Counter(l1) == collections.Counter(l2)
 
-    def merge_format_features(self, merged_formats, format, capability, prop_name, features):
-        # Remove all format features not in current json if intersect is used
-        if self.mode == 'intersection' and self.first is False:
-            for mformat in dict(merged_formats):
-                if mformat not in capability['formats']:
-                    del merged_formats[mformat]
-
-            # Remove format features not in intersect
+    def intersect_format_features(self, merged_formats, format, capability):
+        # Remove format features not in intersect
+        for prop_name in FORMAT_PROPERTIES_STRUCTS:
             for feature in list(merged_formats[format][prop_name]):
                 if prop_name not in capability['formats'][format] or feature not in capability['formats'][format][prop_name]:
                     del merged_formats[format][prop_name][feature]
 
+    def merge_format_features(self, merged_formats, format, capability, prop_name, features):
         # Iterate all format features in current json
         if prop_name in capability['formats'][format]:
             if features in capability['formats'][format][prop_name]:
@@ -904,11 +913,11 @@ class ProfileMerger():
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Generate Vulkan profile JSON files')
 
-    parser.add_argument('--registry', '-r', action='store', required=True,
+    parser.add_argument('--registry', '-r', action='store', required=True, type=gen_profiles_solution.existingFile,
                         help='Use specified registry file instead of vk.xml.')
-    parser.add_argument('--config', '-c', action='store',
+    parser.add_argument('--config', '-c', action='store', type=gen_profiles_solution.existingFile,
                         help='Use specified a JSON merge config file path instead of using individual arguments.')
-    parser.add_argument('--input', '-i', action='store',
+    parser.add_argument('--input', '-i', action='store', type=gen_profiles_solution.existingDir,
                         help='Path to directory with profiles.')
     parser.add_argument('--input-profiles', action='store',
                         help='Comma separated list of profiles.')
@@ -1007,8 +1016,8 @@ if __name__ == '__main__':
     else:
         currentdir = os.path.dirname(args.config)
         
-        json_file = open(args.config, "r")
-        json_data = json.load(json_file)
+        with open(args.config, 'rb') as json_file:
+            json_data = gen_profiles_solution.loadJson(json_file)
 
         if json_data["$schema"]:
             profile_file.set_schema(json_data["$schema"])
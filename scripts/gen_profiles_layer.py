@@ -21,6 +21,7 @@
 
 import gen_profiles_solution
 import argparse
+import functools
 from typing import OrderedDict
 
 COPYRIGHT_HEADER = '''
@@ -3525,49 +3526,50 @@ class VulkanProfilesLayerGenerator():
     def generate(self, path, registry):
         self.registry = registry
         self.get_pdd_structs()
-        with open(path, 'w') as f:
-            f.write(COPYRIGHT_HEADER)
-            f.write(DESCRIPTION_HEADER)
-            f.write(INCLUDES_HEADER)
-            f.write(self.generate_helpers())
-            f.write(GLOBAL_CONSTANTS)
-            f.write(GLOBAL_VARS)
-            f.write(GET_DEFINES)
-            f.write(self.generate_is_instance_extension())
-            f.write(self.generate_video_profile_data())
-            f.write(self.generate_video_profile_enumerator())
-            f.write(self.generate_physical_device_data())
-            f.write(self.generate_json_loader())
-            f.write(self.generate_is_format_functions())
-            f.write(self.generate_warn_duplicated())
-            f.write(self.generate_get_feature())
-            f.write(self.generate_get_property())
-            f.write(JSON_LOADER_NON_GENERATED)
-            f.write(self.generate_get_queue_family_properties())
-            f.write(QUEUE_FAMILY_FUNCTIONS)
-            f.write(self.generate_add_promoted_extensions())
-            f.write(READ_PROFILE)
-            f.write(self.generate_json_get_value())
-            f.write(GET_UNDEFINE)
-            f.write(INSTANCE_FUNCTIONS)
-            f.write(self.generate_fill_physical_device_pnext_chain())
-            f.write(self.generate_fill_queue_family_properties_pnext_chain())
-            f.write(FORMAT_PROPERTIES_PNEXT)
-            f.write(GET_PHYSICAL_DEVICE_FEATURES_PROPERTIES_FUNCTIONS)
-            f.write(ENUMERATE_FUNCTIONS)
-            f.write(QUEUE_FAMILY_PROPERTIES_FUNCTIONS)
-            f.write(PHYSICAL_DEVICE_FORMAT_FUNCTIONS)
-            f.write(PHYSICAL_DEVICE_VIDEO_FUNCTIONS)
-            f.write(TOOL_PROPERTIES_FUNCTIONS)
-            f.write(TRANSFER_DEFINES)
-            f.write(TRANSFER_DEFINES_ARRAY)
-            f.write(self.generate_transfer_values())
-            f.write(TRANSFER_UNDEFINE)
-            f.write(self.generate_load_device_formats())
-            f.write(LOAD_QUEUE_FAMILY_PROPERTIES)
-            f.write(LOAD_VIDEO_PROFILES)
-            f.write(self.generate_enumerate_physical_device())
-            f.write(GET_INSTANCE_PROC_ADDR)
+        gen_profiles_solution.writeFile(path, ''.join([
+            COPYRIGHT_HEADER,
+            DESCRIPTION_HEADER,
+            INCLUDES_HEADER,
+            self.generate_helpers(),
+            GLOBAL_CONSTANTS,
+            GLOBAL_VARS,
+            GET_DEFINES,
+            self.generate_is_instance_extension(),
+            self.generate_video_profile_data(),
+            self.generate_video_profile_enumerator(),
+            self.generate_physical_device_data(),
+            self.generate_json_loader(),
+            self.generate_is_format_functions(),
+            self.generate_warn_duplicated(),
+            self.generate_get_feature(),
+            self.generate_get_property(),
+            JSON_LOADER_NON_GENERATED,
+            self.generate_get_queue_family_properties(),
+            QUEUE_FAMILY_FUNCTIONS,
+            self.generate_add_promoted_extensions(),
+            READ_PROFILE,
+            self.generate_json_get_value(),
+            GET_UNDEFINE,
+            INSTANCE_FUNCTIONS,
+            self.generate_fill_physical_device_pnext_chain(),
+            self.generate_fill_queue_family_properties_pnext_chain(),
+            FORMAT_PROPERTIES_PNEXT,
+            GET_PHYSICAL_DEVICE_FEATURES_PROPERTIES_FUNCTIONS,
+            ENUMERATE_FUNCTIONS,
+            QUEUE_FAMILY_PROPERTIES_FUNCTIONS,
+            PHYSICAL_DEVICE_FORMAT_FUNCTIONS,
+            PHYSICAL_DEVICE_VIDEO_FUNCTIONS,
+            TOOL_PROPERTIES_FUNCTIONS,
+            TRANSFER_DEFINES,
+            TRANSFER_DEFINES_ARRAY,
+            self.generate_transfer_values(),
+            TRANSFER_UNDEFINE,
+            self.generate_load_device_formats(),
+            LOAD_QUEUE_FAMILY_PROPERTIES,
+            LOAD_VIDEO_PROFILES,
+            self.generate_enumerate_physical_device(),
+            GET_INSTANCE_PROC_ADDR
+        ]))
 
     def struct_or_extension_platform(self, struct_or_ext_name):
         if struct_or_ext_name is None:
@@ -3599,21 +3601,21 @@ class VulkanProfilesLayerGenerator():
         gen = ''
         for struct in structs:
             structDef = self.registry.structs[struct]
-            gen += '\nstatic bool operator==(const {0}& lhs, const {0}& rhs) {{\n'.format(struct)
+            gen += f'\nstatic bool operator==(const {struct}& lhs, const {struct}& rhs) {{\n'
             for member in structDef.members:
-                gen += '    if (lhs.{0} != rhs.{0}) return false;\n'.format(member)
+                gen += f'    if (lhs.{member} != rhs.{member}) return false;\n'
             gen += '    return true;\n'
             gen += '}\n'
-            gen += '\nstatic bool operator!=(const {0}& lhs, const {0}& rhs) {{\n'.format(struct)
+            gen += f'\nstatic bool operator!=(const {struct}& lhs, const {struct}& rhs) {{\n'
             gen += '    return !operator==(lhs, rhs);\n'
             gen += '}\n'
             gen += '\ntemplate <>\n'
-            gen += 'struct std::hash<{0}> {{\n'.format(struct)
-            gen += '    std::size_t operator()(const {0}& k) const {{'.format(struct)
+            gen += f'struct std::hash<{struct}> {{\n'
+            gen += f'    std::size_t operator()(const {struct}& k) const {{'
             gen += '        const std::size_t kMagic = 0x9e3779b97f4a7c16UL;\n'
             gen += '        std::size_t h = 0;\n'
             for member in structDef.members:
-                gen += '        h ^= std::hash<decltype(k.{0})>{{}}(k.{0}) + kMagic + (h << 6) + (h >> 2);\n'.format(member)
+                gen += f'        h ^= std::hash<decltype(k.{member})>{{}}(k.{member}) + kMagic + (h << 6) + (h >> 2);\n'
             gen += '        return h;\n'
             gen += '    }\n'
             gen += '};\n'
@@ -3758,13 +3760,13 @@ class VulkanProfilesLayerGenerator():
             disjunctionList = []
             for ext in structDef.definedByExtensions:
                 disjunctionList.append(extension_check_lambda(ext))
-            conjunctionList.append('{0}'.format(' || '.join(disjunctionList)))
+            conjunctionList.append(' || '.join(disjunctionList))
         if len(conjunctionList) == 0:
             return ''
         elif len(conjunctionList) == 1:
-            return 'if ({0}) '.format(conjunctionList[0])
+            return f'if ({conjunctionList[0]}) '
         else:
-            return 'if (({0})) '.format(') && ('.join(conjunctionList))
+            return 'if ((' + ') && ('.join(conjunctionList) + ')) '
 
     def generate_video_profile_enumerator(self):
         # Generates an enumerator function that goes through all supportable video profiles
@@ -3820,18 +3822,18 @@ class VulkanProfilesLayerGenerator():
             for profileStruct in videoCodec.profileStructs:
                 gen += self.generate_platform_protect_begin(profileStruct)
 
-            gen += '{0}{{\n'.format(' ' * 16)
+            gen += '                {\n'
             indent = ' ' * 20
-            gen += '{0}const std::string profile_base_name = "{1}" + base_format(chroma_subsampling, luma_bit_depth, chroma_bit_depth);\n'.format(indent, videoCodec.name)
-            gen += '{0}video_profile_info.pNext = nullptr;\n'.format(indent)
-            gen += '{0}video_profile_info.videoCodecOperation = {1};\n'.format(indent, videoCodecOp)
+            gen += f'{indent}const std::string profile_base_name = "{videoCodec.name}" + base_format(chroma_subsampling, luma_bit_depth, chroma_bit_depth);\n'
+            gen += f'{indent}video_profile_info.pNext = nullptr;\n'
+            gen += f'{indent}video_profile_info.videoCodecOperation = {videoCodecOp};\n'
 
             for profileStruct in videoCodec.profileStructs:
                 profileStructDef = self.registry.structs[profileStruct]
                 profileStructVar = self.create_var_name(profileStruct)
-                gen += '{0}{1} {2} = {{{3}}};\n'.format(indent, profileStruct, profileStructVar, profileStructDef.sType)
-                gen += '{0}{1}.pNext = video_profile_info.pNext;\n'.format(indent, profileStructVar)
-                gen += '{0}video_profile_info.pNext = &{1};\n'.format(indent, profileStructVar)
+                gen += f'{indent}{profileStruct} {profileStructVar} = {{{profileStructDef.sType}}};\n'
+                gen += f'{indent}{profileStructVar}.pNext = video_profile_info.pNext;\n'
+                gen += f'{indent}video_profile_info.pNext = &{profileStructVar};\n'
 
             # Permute profiles for each profile struct member value
             profiles = OrderedDict({'': []})
@@ -3843,7 +3845,7 @@ class VulkanProfilesLayerGenerator():
                     newProfiles = {}
                     for profileStructMemberValue, profileStructMemberName in profileStructMember.values.items():
                         for profileName, profile in profiles.items():
-                            newProfileName = '{0} {1}'.format(profileName, profileStructMemberName)
+                            newProfileName = f'{profileName} {profileStructMemberName}'
                             newProfiles[newProfileName] = profile + [{
                                 "struct": profileStruct.struct,
                                 "member": profileStructMember.name,
@@ -3856,11 +3858,11 @@ class VulkanProfilesLayerGenerator():
                     for elem in profile:
                         if elem['struct'] == profileStruct:
                             if lastValue[elem['struct']][elem['member']] != elem['value']:
-                                gen += '{0}{1}.{2} = {3};\n'.format(indent, self.create_var_name(elem['struct']), elem['member'], elem['value'])
+                                gen += f"{indent}{self.create_var_name(elem['struct'])}.{elem['member']} = {elem['value']};\n"
                                 lastValue[elem['struct']][elem['member']] = elem['value']
-                gen += '{0}callback(video_profile_info, (profile_base_name + "{1}").c_str());\n'.format(indent, profileName)
+                gen += f'{indent}callback(video_profile_info, (profile_base_name + "{profileName}").c_str());\n'
 
-            gen += '{0}}}\n'.format(' ' * 16)
+            gen += '                }\n'
 
             for profileStruct in reversed(videoCodec.profileStructs):
                 gen += self.generate_platform_protect_end(profileStruct)
@@ -3914,12 +3916,12 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             indent = ' ' * 16
             gen += self.generate_platform_protect_begin(struct)
-            gen += '{0}case {1}:\n'.format(indent, self.registry.structs[struct].sType)
-            gen += '{0}    if (ppnext != nullptr) *ppnext = &{1};\n'.format(indent, structVar)
-            gen += '{0}    {1} = *reinterpret_cast<const {2}*>(p);\n'.format(indent, structVar, struct)
-            gen += '{0}    {1}.pNext = nullptr;\n'.format(indent, structVar)
-            gen += '{0}    ppnext = &{1}.pNext;\n'.format(indent, structVar)
-            gen += '{0}    break;\n'.format(indent)
+            gen += f'{indent}case {self.registry.structs[struct].sType}:\n'
+            gen += f'{indent}    if (ppnext != nullptr) *ppnext = &{structVar};\n'
+            gen += f'{indent}    {structVar} = *reinterpret_cast<const {struct}*>(p);\n'
+            gen += f'{indent}    {structVar}.pNext = nullptr;\n'
+            gen += f'{indent}    ppnext = &{structVar}.pNext;\n'
+            gen += f'{indent}    break;\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '                default:\n'
         gen += '                    valid = false;\n'
@@ -3934,12 +3936,12 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '        if ({0}.sType == {1}) {{\n'.format(structVar, structDef.sType)
-            gen += '            if (rhs.{0}.sType != {1}) return false;\n'.format(structVar, structDef.sType)
+            gen += f'        if ({structVar}.sType == {structDef.sType}) {{\n'
+            gen += f'            if (rhs.{structVar}.sType != {structDef.sType}) return false;\n'
             for member in structDef.members:
-                gen += '            if ({0}.{1} != rhs.{0}.{1}) return false;\n'.format(structVar, member)
+                gen += f'            if ({structVar}.{member} != rhs.{structVar}.{member}) return false;\n'
             gen += '        } else {\n'
-            gen += '            if (rhs.{0}.sType == {1}) return false;\n'.format(structVar, structDef.sType)
+            gen += f'            if (rhs.{structVar}.sType == {structDef.sType}) return false;\n'
             gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '        return true;\n'
@@ -3954,10 +3956,10 @@ class VulkanProfilesLayerGenerator():
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
             indent = ' ' * 12
-            gen += '{0}if (key.{1}.sType == {2}) {{\n'.format(indent, structVar, structDef.sType)
+            gen += f'{indent}if (key.{structVar}.sType == {structDef.sType}) {{\n'
             for member in structDef.members:
-                gen += '{0}    h ^= std::hash<decltype(key.{1}.{2})>{{}}(key.{1}.{2}) + kMagic + (h << 6) + (h >> 2);\n'.format(indent, structVar, member)
-            gen += '{0}}}\n'.format(indent)
+                gen += f'{indent}    h ^= std::hash<decltype(key.{structVar}.{member})>{{}}(key.{structVar}.{member}) + kMagic + (h << 6) + (h >> 2);\n'
+            gen += f'{indent}}}\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '            return h;\n'
         gen += '        }\n'
@@ -3973,11 +3975,11 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '    bool {0}defined_{{false}};\n'.format(structVar)
+            gen += f'    bool {structVar}defined_{{false}};\n'
             gen += '    struct {\n'
             for member in structDef.members.values():
-                gen += '        std::optional<{0}> {1}{{}};\n'.format(member.type, member.name)
-            gen += '    }} {0}{{}};\n'.format(structVar)
+                gen += f'        std::optional<{member.type}> {member.name}{{}};\n'
+            gen += f'    }} {structVar}{{}};\n'
             gen += self.generate_platform_protect_end(struct)
 
         # Parses JSON video profile info
@@ -3988,32 +3990,32 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '        const Json::Value *{0}json = nullptr;\n'.format(structVar)
+            gen += f'        const Json::Value *{structVar}json = nullptr;\n'
             for alias in self.registry.structs[struct].aliases:
-                gen += '        if (profile_info_json.isMember("{0}")) {{\n'.format(alias)
-                gen += '            if ({0}json != nullptr) return false;\n'.format(structVar)
-                gen += '            {0}json = &profile_info_json["{1}"];\n'.format(structVar, alias)
+                gen += f'        if (profile_info_json.isMember("{alias}")) {{\n'
+                gen += f'            if ({structVar}json != nullptr) return false;\n'
+                gen += f'            {structVar}json = &profile_info_json["{alias}"];\n'
                 gen += '        }\n'
-            gen += '        if ({0}json != nullptr) {{\n'.format(structVar)
-            gen += '            {0}defined_ = true;\n'.format(structVar)
+            gen += f'        if ({structVar}json != nullptr) {{\n'
+            gen += f'            {structVar}defined_ = true;\n'
             for member in structDef.members.values():
-                gen += '            if ({0}json->isMember("{1}")) {{\n'.format(structVar, member.name)
-                gen += '                const Json::Value &value = (*{0}json)["{1}"];\n'.format(structVar, member.name)
+                gen += f'            if ({structVar}json->isMember("{member.name}")) {{\n'
+                gen += f'                const Json::Value &value = (*{structVar}json)["{member.name}"];\n'
                 if member.type in self.registry.enums:
                     gen += '                if (!value.isString()) return false;\n'
-                    gen += '                {0}.{1} = static_cast<{2}>(VkStringToUint64(value.asString()));\n'.format(structVar, member.name, member.type)
+                    gen += f'                {structVar}.{member.name} = static_cast<{member.type}>(VkStringToUint64(value.asString()));\n'
                 elif member.type in self.registry.bitmasks:
                     gen += '                if (!value.isArray()) return false;\n'
                     gen += '                uint64_t mask = 0;\n'
                     gen += '                for (const auto &entry : value) {\n'
                     gen += '                    mask |= VkStringToUint64(entry.asString());\n'
                     gen += '                }\n'
-                    gen += '                {0}.{1} = static_cast<{2}>(mask);\n'.format(structVar, member.name, member.type)
+                    gen += f'                {structVar}.{member.name} = static_cast<{member.type}>(mask);\n'
                 elif member.type == 'VkBool32':
                     gen += '                if (!value.isBool()) return false;\n'
-                    gen += '                {0}.{1} = value.asBool() ? VK_TRUE : VK_FALSE;\n'.format(structVar, member.name)
+                    gen += f'                {structVar}.{member.name} = value.asBool() ? VK_TRUE : VK_FALSE;\n'
                 else:
-                    gen += '#error Unsupported video profile info type "{0}" in "{1}::{2}"\n'.format(member.type, struct, member.name)
+                    gen += f'#error Unsupported video profile info type "{member.type}" in "{struct}::{member.name}"\n'
                 gen += '            }\n'
             gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
@@ -4034,11 +4036,11 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '        if (profile_info.{0}.sType == {1}) {{\n'.format(structVar, structDef.sType)
+            gen += f'        if (profile_info.{structVar}.sType == {structDef.sType}) {{\n'
             for member in structDef.members.keys():
-                gen += '            if ({0}.{1}.has_value() && {0}.{1}.value() != profile_info.{0}.{1}) return false;\n'.format(structVar, member)
+                gen += f'            if ({structVar}.{member}.has_value() && {structVar}.{member}.value() != profile_info.{structVar}.{member}) return false;\n'
             gen += '        } else {\n'
-            gen += '            if ({0}defined_) return false;\n'.format(structVar)
+            gen += f'            if ({structVar}defined_) return false;\n'
             gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '        return true;\n'
@@ -4050,9 +4052,9 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '        if (profile_info.{0}.sType == {1}) {{\n'.format(structVar, structDef.sType)
+            gen += f'        if (profile_info.{structVar}.sType == {structDef.sType}) {{\n'
             for member in structDef.members.keys():
-                gen += '            if (!{0}.{1}.has_value()) return false;\n'.format(structVar, member)
+                gen += f'            if (!{structVar}.{member}.has_value()) return false;\n'
             gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '        return true;\n'
@@ -4092,12 +4094,12 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             indent = ' ' * 16
             gen += self.generate_platform_protect_begin(struct)
-            gen += '{0}case {1}:\n'.format(indent, self.registry.structs[struct].sType)
-            gen += '{0}    if (ppnext != nullptr) *ppnext = &{1};\n'.format(indent, structVar)
-            gen += '{0}    {1} = *reinterpret_cast<const {2}*>(p);\n'.format(indent, structVar, struct)
-            gen += '{0}    {1}.pNext = nullptr;\n'.format(indent, structVar)
-            gen += '{0}    ppnext = &{1}.pNext;\n'.format(indent, structVar)
-            gen += '{0}    break;\n'.format(indent)
+            gen += f'{indent}case {self.registry.structs[struct].sType}:\n'
+            gen += f'{indent}    if (ppnext != nullptr) *ppnext = &{structVar};\n'
+            gen += f'{indent}    {structVar} = *reinterpret_cast<const {struct}*>(p);\n'
+            gen += f'{indent}    {structVar}.pNext = nullptr;\n'
+            gen += f'{indent}    ppnext = &{structVar}.pNext;\n'
+            gen += f'{indent}    break;\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '                default:\n'
         gen += '                    valid = false;\n'
@@ -4116,19 +4118,19 @@ class VulkanProfilesLayerGenerator():
         gen += '        video_capabilities_ = {VK_STRUCTURE_TYPE_VIDEO_CAPABILITIES_KHR, nullptr};\n'
         gen += '        switch (op) {\n'
         for videoCodecOp, videoCodec in self.registry.videoCodecsByValue.items():
-            gen += '            case {0}:\n'.format(videoCodecOp)
+            gen += f'            case {videoCodecOp}:\n'
             for capsStruct in videoCodec.capabilities:
                 capsStructDef = self.registry.structs[capsStruct]
                 capsStructVar = self.create_var_name(capsStruct)
                 gen += self.generate_platform_protect_begin(capsStruct)
                 indent = ' ' * 16
-                gen += '{0}{1}{{\n'.format(indent,
-                    self.generate_struct_precondition(capsStruct,
-                        lambda ver : 'check_api_version({0})'.format(ver),
-                        lambda ext : 'check_extension("{0}")'.format(ext)))
-                gen += '{0}    {1} = {{{2}, video_capabilities_.pNext}};\n'.format(indent, capsStructVar, capsStructDef.sType)
-                gen += '{0}    video_capabilities_.pNext = &{1};\n'.format(indent, capsStructVar)
-                gen += '{0}}}\n'.format(indent)
+                precondition = self.generate_struct_precondition(capsStruct,
+                    lambda ver : f'check_api_version({ver})',
+                    lambda ext : f'check_extension("{ext}")')
+                gen += f'{indent}{precondition}{{\n'
+                gen += f'{indent}    {capsStructVar} = {{{capsStructDef.sType}, video_capabilities_.pNext}};\n'
+                gen += f'{indent}    video_capabilities_.pNext = &{capsStructVar};\n'
+                gen += f'{indent}}}\n'
                 gen += self.generate_platform_protect_end(capsStruct)
             gen += '                break;\n'
         gen += '            default:\n'
@@ -4146,11 +4148,11 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             indent = ' ' * 16
             gen += self.generate_platform_protect_begin(struct)
-            gen += '{0}case {1}:\n'.format(indent, self.registry.structs[struct].sType)
-            gen += '{0}    orig_pnext = {1}.pNext;\n'.format(indent, structVar)
-            gen += '{0}    {1} = *reinterpret_cast<const {2}*>(p);\n'.format(indent, structVar, struct)
-            gen += '{0}    {1}.pNext = orig_pnext;\n'.format(indent, structVar)
-            gen += '{0}    break;\n'.format(indent)
+            gen += f'{indent}case {self.registry.structs[struct].sType}:\n'
+            gen += f'{indent}    orig_pnext = {structVar}.pNext;\n'
+            gen += f'{indent}    {structVar} = *reinterpret_cast<const {struct}*>(p);\n'
+            gen += f'{indent}    {structVar}.pNext = orig_pnext;\n'
+            gen += f'{indent}    break;\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '                default:\n'
         gen += '                    break;\n'
@@ -4173,13 +4175,13 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             indent = ' ' * 20
             gen += self.generate_platform_protect_begin(struct)
-            gen += '{0}case {1}: {{\n'.format(indent, self.registry.structs[struct].sType)
-            gen += '{0}    auto s = reinterpret_cast<{1}*>(dst);\n'.format(indent, struct)
-            gen += '{0}    orig_pnext = s->pNext;\n'.format(indent)
-            gen += '{0}    *s = *reinterpret_cast<const {1}*>(p);\n'.format(indent, struct)
-            gen += '{0}    s->pNext = orig_pnext;\n'.format(indent)
-            gen += '{0}    break;\n'.format(indent)
-            gen += '{0}}}\n'.format(indent)
+            gen += f'{indent}case {self.registry.structs[struct].sType}: {{\n'
+            gen += f'{indent}    auto s = reinterpret_cast<{struct}*>(dst);\n'
+            gen += f'{indent}    orig_pnext = s->pNext;\n'
+            gen += f'{indent}    *s = *reinterpret_cast<const {struct}*>(p);\n'
+            gen += f'{indent}    s->pNext = orig_pnext;\n'
+            gen += f'{indent}    break;\n'
+            gen += f'{indent}}}\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '                    default:\n'
         gen += '                        break;\n'
@@ -4212,11 +4214,11 @@ class VulkanProfilesLayerGenerator():
                     nestedStructDef = self.registry.structs[member.type]
                     gen += '        struct {\n'
                     for nestedMember in nestedStructDef.members.values():
-                        gen += '            {0}<{1}> {2}{{}};\n'.format(limittype, nestedMember.type, nestedMember.name)
-                    gen += '        }} {0}{{}};\n'.format(member.name)
+                        gen += f'            {limittype}<{nestedMember.type}> {nestedMember.name}{{}};\n'
+                    gen += f'        }} {member.name}{{}};\n'
                 else:
-                    gen += '        {0}<{1}> {2}{{}};\n'.format(limittype, member.type, member.name)
-            gen += '    }} {0}{{}};\n'.format(self.create_var_name(struct))
+                    gen += f'        {limittype}<{member.type}> {member.name}{{}};\n'
+            gen += f'    }} {self.create_var_name(struct)}{{}};\n'
             gen += self.generate_platform_protect_end(struct)
 
         # Parses JSON video profile capabilities
@@ -4227,64 +4229,64 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '        const Json::Value *{0}json = nullptr;\n'.format(structVar)
+            gen += f'        const Json::Value *{structVar}json = nullptr;\n'
             for alias in self.registry.structs[struct].aliases:
-                gen += '        if (profile_caps_json.isMember("{0}")) {{\n'.format(alias)
-                gen += '            if ({0}json != nullptr) return false;\n'.format(structVar)
-                gen += '            {0}json = &profile_caps_json["{1}"];\n'.format(structVar, alias)
+                gen += f'        if (profile_caps_json.isMember("{alias}")) {{\n'
+                gen += f'            if ({structVar}json != nullptr) return false;\n'
+                gen += f'            {structVar}json = &profile_caps_json["{alias}"];\n'
                 gen += '        }\n'
-            gen += '        if ({0}json != nullptr) {{\n'.format(structVar)
+            gen += f'        if ({structVar}json != nullptr) {{\n'
             for member in structDef.members.values():
-                gen += '            if ({0}json->isMember("{1}")) {{\n'.format(structVar, member.name)
-                gen += '                const Json::Value &value = (*{0}json)["{1}"];\n'.format(structVar, member.name)
+                gen += f'            if ({structVar}json->isMember("{member.name}")) {{\n'
+                gen += f'                const Json::Value &value = (*{structVar}json)["{member.name}"];\n'
                 if member.type in self.registry.enums:
                     gen += '                if (!value.isString()) return false;\n'
-                    gen += '                {0}.{1}.limit = static_cast<{2}>(VkStringToUint64(value.asString()));\n'.format(structVar, member.name, member.type)
+                    gen += f'                {structVar}.{member.name}.limit = static_cast<{member.type}>(VkStringToUint64(value.asString()));\n'
                 elif member.type in self.registry.bitmasks:
                     gen += '                if (!value.isArray()) return false;\n'
                     gen += '                uint64_t mask = 0;\n'
                     gen += '                for (const auto &entry : value) {\n'
                     gen += '                    mask |= VkStringToUint64(entry.asString());\n'
                     gen += '                }\n'
-                    gen += '                {0}.{1}.limit = static_cast<{2}>(mask);\n'.format(structVar, member.name, member.type)
+                    gen += f'                {structVar}.{member.name}.limit = static_cast<{member.type}>(mask);\n'
                 elif member.type == 'VkBool32':
                     gen += '                if (!value.isBool()) return false;\n'
-                    gen += '                {0}.{1}.limit = value.asBool() ? VK_TRUE : VK_FALSE;\n'.format(structVar, member.name)
+                    gen += f'                {structVar}.{member.name}.limit = value.asBool() ? VK_TRUE : VK_FALSE;\n'
                 elif member.type in self.int_to_json_type_map:
                     intType = self.int_to_json_type_map[member.type]
-                    gen += '                if (!value.is{0}()) return false;\n'.format(intType)
-                    gen += '                {0}.{1}.limit = value.as{2}();\n'.format(structVar, member.name, intType)
+                    gen += f'                if (!value.is{intType}()) return false;\n'
+                    gen += f'                {structVar}.{member.name}.limit = value.as{intType}();\n'
                 elif member.name == 'stdHeaderVersion' and member.type == 'VkExtensionProperties':
                     # stdHeaderVersion is a special case
                     gen += '                if (!value.isObject()) return false;\n'
                     gen += '                if (value.isMember("extensionName")) {\n'
                     gen += '                    const Json::Value &std_header_name = value["extensionName"];\n'
                     gen += '                    if (!std_header_name.isString()) return false;\n'
-                    gen += '                    {0}.stdHeaderVersion.extensionName.limit = std_header_name.asString();\n'.format(structVar)
+                    gen += f'                    {structVar}.stdHeaderVersion.extensionName.limit = std_header_name.asString();\n'
                     gen += '                }\n'
                     gen += '                if (value.isMember("specVersion")) {\n'
                     gen += '                    const Json::Value &std_header_version = value["specVersion"];\n'
                     gen += '                    if (!std_header_version.isUInt()) return false;\n'
-                    gen += '                    {0}.stdHeaderVersion.specVersion.limit = std_header_version.asUInt();\n'.format(structVar)
+                    gen += f'                    {structVar}.stdHeaderVersion.specVersion.limit = std_header_version.asUInt();\n'
                     gen += '                }\n'
                 elif member.type in self.registry.structs:
                     nestedStructDef = self.registry.structs[member.type]
                     gen += '                if (!value.isObject()) return false;\n'
                     for nestedMember in nestedStructDef.members.values():
-                        gen += '                if (value.isMember("{0}")) {{\n'.format(nestedMember.name)
-                        gen += '                    const Json::Value &nested_value = value["{0}"];\n'.format(nestedMember.name)
+                        gen += f'                if (value.isMember("{nestedMember.name}")) {{\n'
+                        gen += f'                    const Json::Value &nested_value = value["{nestedMember.name}"];\n'
                         if nestedMember.type in self.registry.enums:
                             gen += '                    if (!nested_value.isString()) return false;\n'
-                            gen += '                    {0}.{1}.{2}.limit = static_cast<{3}>(VkStringToUint64(nested_value.asString()));\n'.format(structVar, member.name, nestedMember.name, nestedMember.type)
+                            gen += f'                    {structVar}.{member.name}.{nestedMember.name}.limit = static_cast<{nestedMember.type}>(VkStringToUint64(nested_value.asString()));\n'
                         elif nestedMember.type in self.int_to_json_type_map:
                             intType = self.int_to_json_type_map[nestedMember.type]
-                            gen += '                    if (!nested_value.is{0}()) return false;\n'.format(intType)
-                            gen += '                    {0}.{1}.{2}.limit = nested_value.as{3}();\n'.format(structVar, member.name, nestedMember.name, intType)
+                            gen += f'                    if (!nested_value.is{intType}()) return false;\n'
+                            gen += f'                    {structVar}.{member.name}.{nestedMember.name}.limit = nested_value.as{intType}();\n'
                         else:
-                            gen += '#error Unsupported video profile capability type "{0}" in "{1}::{2}::{3}"\n'.format(nestedMember.type, struct, member.name, nestedMember.name)
+                            gen += f'#error Unsupported video profile capability type "{nestedMember.type}" in "{struct}::{member.name}::{nestedMember.name}"\n'
                         gen += '                }\n'
                 else:
-                    gen += '#error Unsupported video profile capability type "{0}" in "{1}::{2}"\n'.format(member.type, struct, member.name)
+                    gen += f'#error Unsupported video profile capability type "{member.type}" in "{struct}::{member.name}"\n'
                 gen += '            }\n'
             gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
@@ -4312,13 +4314,13 @@ class VulkanProfilesLayerGenerator():
                     # Structure members need to be expanded
                     nestedStructDef = self.registry.structs[member.type]
                     for nestedMember in nestedStructDef.members.values():
-                        gen += '        if (caps.{0}.{1}.{2}.limit.has_value() && !{0}.{1}.{2}.Combine(caps.{0}.{1}.{2}.limit.value())) {{\n'.format(structVar, member.name, nestedMember.name)
-                        gen += '            LogMessage(layer_settings, DEBUG_REPORT_ERROR_BIT, error_msg, "{0}::{1}::{2}");\n'.format(struct, member.name, nestedMember.name)
+                        gen += f'        if (caps.{structVar}.{member.name}.{nestedMember.name}.limit.has_value() && !{structVar}.{member.name}.{nestedMember.name}.Combine(caps.{structVar}.{member.name}.{nestedMember.name}.limit.value())) {{\n'
+                        gen += f'            LogMessage(layer_settings, DEBUG_REPORT_ERROR_BIT, error_msg, "{struct}::{member.name}::{nestedMember.name}");\n'
                         gen += '            result = false;\n'
                         gen += '        }\n'
                 else:
-                    gen += '        if (caps.{0}.{1}.limit.has_value() && !{0}.{1}.Combine(caps.{0}.{1}.limit.value())) {{\n'.format(structVar, member.name)
-                    gen += '            LogMessage(layer_settings, DEBUG_REPORT_ERROR_BIT, error_msg, "{0}::{1}");\n'.format(struct, member.name)
+                    gen += f'        if (caps.{structVar}.{member.name}.limit.has_value() && !{structVar}.{member.name}.Combine(caps.{structVar}.{member.name}.limit.value())) {{\n'
+                    gen += f'            LogMessage(layer_settings, DEBUG_REPORT_ERROR_BIT, error_msg, "{struct}::{member.name}");\n'
                     gen += '            result = false;\n'
                     gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
@@ -4333,7 +4335,7 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '        if (caps.{0}.sType == {1}) {{\n'.format(structVar, structDef.sType)
+            gen += f'        if (caps.{structVar}.sType == {structDef.sType}) {{\n'
             indent = ' ' * 12
             for member in structDef.members.values():
                 if member.type in self.registry.structs:
@@ -4342,23 +4344,23 @@ class VulkanProfilesLayerGenerator():
                     for nestedMember in nestedStructDef.members.values():
                         if member.name == 'stdHeaderVersion' and member.type == 'VkExtensionProperties' and nestedMember.name == 'extensionName':
                             # stdHeaderVersion.extensionName is a special case
-                            gen += '{0}if ({1}.{2}.{3}.limit.has_value() && strncmp({1}.{2}.{3}.limit.value().c_str(), caps.{1}.{2}.{3}, VK_MAX_EXTENSION_NAME_SIZE - 1) != 0) {{\n'.format(indent, structVar, member.name, nestedMember.name)
-                            gen += '{0}    memset(caps.{1}.{2}.{3}, 0, VK_MAX_EXTENSION_NAME_SIZE - 1);\n'.format(indent, structVar, member.name, nestedMember.name)
-                            gen += '{0}    strncpy(caps.{1}.{2}.{3}, {1}.{2}.{3}.limit.value().c_str(), VK_MAX_EXTENSION_NAME_SIZE - 1);\n'.format(indent, structVar, member.name, nestedMember.name)
+                            gen += f'{indent}if ({structVar}.{member.name}.{nestedMember.name}.limit.has_value() && strncmp({structVar}.{member.name}.{nestedMember.name}.limit.value().c_str(), caps.{structVar}.{member.name}.{nestedMember.name}, VK_MAX_EXTENSION_NAME_SIZE - 1) != 0) {{\n'
+                            gen += f'{indent}    memset(caps.{structVar}.{member.name}.{nestedMember.name}, 0, VK_MAX_EXTENSION_NAME_SIZE - 1);\n'
+                            gen += f'{indent}    strncpy(caps.{structVar}.{member.name}.{nestedMember.name}, {structVar}.{member.name}.{nestedMember.name}.limit.value().c_str(), VK_MAX_EXTENSION_NAME_SIZE - 1);\n'
                         else:
-                            gen += '{0}if (!{1}.{2}.{3}.Override(caps.{1}.{2}.{3})) {{\n'.format(indent, structVar, member.name, nestedMember.name)
-                        gen += '{0}    if (enable_warnings) {{\n'.format(indent)
-                        gen += '{0}        LogMessage(layer_settings, DEBUG_REPORT_WARNING_BIT, warn_msg, "{1}::{2}::{3}", name);\n'.format(indent, struct, member.name, nestedMember.name)
-                        gen += '{0}        result = false;\n'.format(indent)
-                        gen += '{0}    }}\n'.format(indent)
-                        gen += '{0}}}\n'.format(indent)
+                            gen += f'{indent}if (!{structVar}.{member.name}.{nestedMember.name}.Override(caps.{structVar}.{member.name}.{nestedMember.name})) {{\n'
+                        gen += f'{indent}    if (enable_warnings) {{\n'
+                        gen += f'{indent}        LogMessage(layer_settings, DEBUG_REPORT_WARNING_BIT, warn_msg, "{struct}::{member.name}::{nestedMember.name}", name);\n'
+                        gen += f'{indent}        result = false;\n'
+                        gen += f'{indent}    }}\n'
+                        gen += f'{indent}}}\n'
                 else:
-                    gen += '{0}if (!{1}.{2}.Override(caps.{1}.{2})) {{\n'.format(indent, structVar, member.name)
-                    gen += '{0}    if (enable_warnings) {{\n'.format(indent)
-                    gen += '{0}        LogMessage(layer_settings, DEBUG_REPORT_WARNING_BIT, warn_msg, "{1}::{2}", name);\n'.format(indent, struct, member.name)
-                    gen += '{0}        result = false;\n'.format(indent)
-                    gen += '{0}    }}\n'.format(indent)
-                    gen += '{0}}}\n'.format(indent)
+                    gen += f'{indent}if (!{structVar}.{member.name}.Override(caps.{structVar}.{member.name})) {{\n'
+                    gen += f'{indent}    if (enable_warnings) {{\n'
+                    gen += f'{indent}        LogMessage(layer_settings, DEBUG_REPORT_WARNING_BIT, warn_msg, "{struct}::{member.name}", name);\n'
+                    gen += f'{indent}        result = false;\n'
+                    gen += f'{indent}    }}\n'
+                    gen += f'{indent}}}\n'
             gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '        return result;\n'
@@ -4370,8 +4372,8 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '        if (caps.{0}.sType == {1}) {{\n'.format(structVar, structDef.sType)
-            gen += '            caps.{0} = {{caps.{0}.sType, caps.{0}.pNext}};\n'.format(structVar)
+            gen += f'        if (caps.{structVar}.sType == {structDef.sType}) {{\n'
+            gen += f'            caps.{structVar} = {{caps.{structVar}.sType, caps.{structVar}.pNext}};\n'
             indent = ' ' * 12
             for member in structDef.members.values():
                 if member.type in self.registry.structs:
@@ -4380,14 +4382,14 @@ class VulkanProfilesLayerGenerator():
                     for nestedMember in nestedStructDef.members.values():
                         if member.name == 'stdHeaderVersion' and member.type == 'VkExtensionProperties' and nestedMember.name == 'extensionName':
                             # stdHeaderVersion.extensionName is a special case
-                            gen += '{0}if ({1}.{2}.{3}.limit.has_value()) {{\n'.format(indent, structVar, member.name, nestedMember.name)
-                            gen += '{0}    memset(caps.{1}.{2}.{3}, 0, VK_MAX_EXTENSION_NAME_SIZE - 1);\n'.format(indent, structVar, member.name, nestedMember.name)
-                            gen += '{0}    strncpy(caps.{1}.{2}.{3}, {1}.{2}.{3}.limit.value().c_str(), VK_MAX_EXTENSION_NAME_SIZE - 1);\n'.format(indent, structVar, member.name, nestedMember.name)
-                            gen += '{0}}}\n'.format(indent)
+                            gen += f'{indent}if ({structVar}.{member.name}.{nestedMember.name}.limit.has_value()) {{\n'
+                            gen += f'{indent}    memset(caps.{structVar}.{member.name}.{nestedMember.name}, 0, VK_MAX_EXTENSION_NAME_SIZE - 1);\n'
+                            gen += f'{indent}    strncpy(caps.{structVar}.{member.name}.{nestedMember.name}, {structVar}.{member.name}.{nestedMember.name}.limit.value().c_str(), VK_MAX_EXTENSION_NAME_SIZE - 1);\n'
+                            gen += f'{indent}}}\n'
                         else:
-                            gen += '{0}if ({1}.{2}.{3}.limit.has_value()) caps.{1}.{2}.{3} = {1}.{2}.{3}.limit.value();\n'.format(indent, structVar, member.name, nestedMember.name)
+                            gen += f'{indent}if ({structVar}.{member.name}.{nestedMember.name}.limit.has_value()) caps.{structVar}.{member.name}.{nestedMember.name} = {structVar}.{member.name}.{nestedMember.name}.limit.value();\n'
                 else:
-                    gen += '{0}if ({1}.{2}.limit.has_value()) caps.{1}.{2} = {1}.{2}.limit.value();\n'.format(indent, structVar, member.name)
+                    gen += f'{indent}if ({structVar}.{member.name}.limit.has_value()) caps.{structVar}.{member.name} = {structVar}.{member.name}.limit.value();\n'
             gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '    }\n'
@@ -4426,12 +4428,12 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             indent = ' ' * 16
             gen += self.generate_platform_protect_begin(struct)
-            gen += '{0}case {1}:\n'.format(indent, self.registry.structs[struct].sType)
-            gen += '{0}    if (ppnext != nullptr) *ppnext = &{1};\n'.format(indent, structVar)
-            gen += '{0}    {1} = *reinterpret_cast<const {2}*>(p);\n'.format(indent, structVar, struct)
-            gen += '{0}    {1}.pNext = nullptr;\n'.format(indent, structVar)
-            gen += '{0}    ppnext = &{1}.pNext;\n'.format(indent, structVar)
-            gen += '{0}    break;\n'.format(indent)
+            gen += f'{indent}case {self.registry.structs[struct].sType}:\n'
+            gen += f'{indent}    if (ppnext != nullptr) *ppnext = &{structVar};\n'
+            gen += f'{indent}    {structVar} = *reinterpret_cast<const {struct}*>(p);\n'
+            gen += f'{indent}    {structVar}.pNext = nullptr;\n'
+            gen += f'{indent}    ppnext = &{structVar}.pNext;\n'
+            gen += f'{indent}    break;\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '                default:\n'
         gen += '                    valid = false;\n'
@@ -4451,22 +4453,22 @@ class VulkanProfilesLayerGenerator():
         gen += '        video_format_properties_ = {VK_STRUCTURE_TYPE_VIDEO_FORMAT_PROPERTIES_KHR, nullptr};\n'
         gen += '        switch (op) {\n'
         for videoCodecOp, videoCodec in self.registry.videoCodecsByValue.items():
-            gen += '            case {0}:\n'.format(videoCodecOp)
+            gen += f'            case {videoCodecOp}:\n'
             gen += '                switch (usage) {\n'
             for videoFormat in videoCodec.formats.values():
-                gen += '                    case {0}:\n'.format(videoFormat.usage)
+                gen += f'                    case {videoFormat.usage}:\n'
                 for formatStruct in videoFormat.properties:
                     formatStructDef = self.registry.structs[formatStruct]
                     formatStructVar = self.create_var_name(formatStruct)
                     gen += self.generate_platform_protect_begin(formatStruct)
                     indent = ' ' * 24
-                    gen += '{0}{1}{{\n'.format(indent,
-                        self.generate_struct_precondition(formatStruct,
-                            lambda ver : 'check_api_version({0})'.format(ver),
-                            lambda ext : 'check_extension("{0}")'.format(ext)))
-                    gen += '{0}    {1} = {{{2}, video_format_properties_.pNext}};\n'.format(indent, formatStructVar, formatStructDef.sType)
-                    gen += '{0}    video_format_properties_.pNext = &{1};\n'.format(indent, formatStructVar)
-                    gen += '{0}}}\n'.format(indent)
+                    precondition = self.generate_struct_precondition(formatStruct,
+                        lambda ver : f'check_api_version({ver})',
+                        lambda ext : f'check_extension("{ext}")')
+                    gen += f'{indent}{precondition}{{\n'
+                    gen += f'{indent}    {formatStructVar} = {{{formatStructDef.sType}, video_format_properties_.pNext}};\n'
+                    gen += f'{indent}    video_format_properties_.pNext = &{formatStructVar};\n'
+                    gen += f'{indent}}}\n'
                     gen += self.generate_platform_protect_end(formatStruct)
                 gen += '                        break;\n'
             gen += '                    default:\n'
@@ -4489,11 +4491,11 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             indent = ' ' * 16
             gen += self.generate_platform_protect_begin(struct)
-            gen += '{0}case {1}:\n'.format(indent, self.registry.structs[struct].sType)
-            gen += '{0}    orig_pnext = {1}.pNext;\n'.format(indent, structVar)
-            gen += '{0}    {1} = *reinterpret_cast<const {2}*>(p);\n'.format(indent, structVar, struct)
-            gen += '{0}    {1}.pNext = orig_pnext;\n'.format(indent, structVar)
-            gen += '{0}    break;\n'.format(indent)
+            gen += f'{indent}case {self.registry.structs[struct].sType}:\n'
+            gen += f'{indent}    orig_pnext = {structVar}.pNext;\n'
+            gen += f'{indent}    {structVar} = *reinterpret_cast<const {struct}*>(p);\n'
+            gen += f'{indent}    {structVar}.pNext = orig_pnext;\n'
+            gen += f'{indent}    break;\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '                default:\n'
         gen += '                    break;\n'
@@ -4516,13 +4518,13 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             indent = ' ' * 20
             gen += self.generate_platform_protect_begin(struct)
-            gen += '{0}case {1}: {{\n'.format(indent, self.registry.structs[struct].sType)
-            gen += '{0}    auto s = reinterpret_cast<{1}*>(dst);\n'.format(indent, struct)
-            gen += '{0}    orig_pnext = s->pNext;\n'.format(indent)
-            gen += '{0}    *s = *reinterpret_cast<const {1}*>(p);\n'.format(indent, struct)
-            gen += '{0}    s->pNext = orig_pnext;\n'.format(indent)
-            gen += '{0}    break;\n'.format(indent)
-            gen += '{0}}}\n'.format(indent)
+            gen += f'{indent}case {self.registry.structs[struct].sType}: {{\n'
+            gen += f'{indent}    auto s = reinterpret_cast<{struct}*>(dst);\n'
+            gen += f'{indent}    orig_pnext = s->pNext;\n'
+            gen += f'{indent}    *s = *reinterpret_cast<const {struct}*>(p);\n'
+            gen += f'{indent}    s->pNext = orig_pnext;\n'
+            gen += f'{indent}    break;\n'
+            gen += f'{indent}}}\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '                    default:\n'
         gen += '                        break;\n'
@@ -4539,7 +4541,7 @@ class VulkanProfilesLayerGenerator():
             gen += self.generate_platform_protect_begin(struct)
             for member in structDef.members.values():
                 if member.limittype == 'exact':
-                    gen += '        if ({0}.{1} != rhs.{0}.{1}) return false;\n'.format(self.create_var_name(struct), member.name)
+                    gen += f'        if ({self.create_var_name(struct)}.{member.name} != rhs.{self.create_var_name(struct)}.{member.name}) return false;\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '        return true;\n'
         gen += '    }\n\n'
@@ -4553,11 +4555,11 @@ class VulkanProfilesLayerGenerator():
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
             indent = ' ' * 12
-            gen += '{0}if (key.{1}.sType == {2}) {{\n'.format(indent, structVar, structDef.sType)
+            gen += f'{indent}if (key.{structVar}.sType == {structDef.sType}) {{\n'
             for member in structDef.members.values():
                 if member.limittype == 'exact':
-                    gen += '{0}    h ^= std::hash<decltype(key.{1}.{2})>{{}}(key.{1}.{2}) + kMagic + (h << 6) + (h >> 2);\n'.format(indent, structVar, member.name)
-            gen += '{0}}}\n'.format(indent)
+                    gen += f'{indent}    h ^= std::hash<decltype(key.{structVar}.{member.name})>{{}}(key.{structVar}.{member.name}) + kMagic + (h << 6) + (h >> 2);\n'
+            gen += f'{indent}}}\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '            return h;\n'
         gen += '        }\n'
@@ -4572,20 +4574,20 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '        if ({0}.sType == {1} && source.{0}.sType == {1}) {{\n'.format(structVar, structDef.sType)
+            gen += f'        if ({structVar}.sType == {structDef.sType} && source.{structVar}.sType == {structDef.sType}) {{\n'
             indent = ' ' * 12
             for member in self.registry.structs[struct].members.values():
                 if 'min' in member.limittype or 'max' in member.limittype or 'bits' in member.limittype:
                     minOrMax = 'max' if 'min' in member.limittype else 'min'
                     if member.type in self.registry.structs:
                         for subMember in self.registry.structs[member.type].members.values():
-                            gen += '{0}{1}.{2}.{3} = std::{4}({1}.{2}.{3}, source.{1}.{2}.{3});\n'.format(indent, structVar, member.name, subMember.name, minOrMax)
+                            gen += f'{indent}{structVar}.{member.name}.{subMember.name} = std::{minOrMax}({structVar}.{member.name}.{subMember.name}, source.{structVar}.{member.name}.{subMember.name});\n'
                     else:
-                        gen += '{0}{1}.{2} = std::{4}({1}.{2}, source.{1}.{2});\n'.format(indent, structVar, member.name, minOrMax)
+                        gen += f'{indent}{structVar}.{member.name} = std::{minOrMax}({structVar}.{member.name}, source.{structVar}.{member.name});\n'
                 elif 'bitmask' in member.limittype:
-                    gen += '{0}{1}.{2} &= source.{1}.{2};\n'.format(indent, structVar, member.name)
+                    gen += f'{indent}{structVar}.{member.name} &= source.{structVar}.{member.name};\n'
                 elif member.limittype != 'exact':
-                    print("ERROR: Unexpected limittype '{0}' in member '{1}' of structure '{2}'".format(member.limittype, member.name, struct))
+                    print(f"ERROR: Unexpected limittype '{member.limittype}' in member '{member.name}' of structure '{struct}'")
             gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '    }\n'
@@ -4602,7 +4604,7 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '    bool {0}defined_{{false}};\n'.format(structVar)
+            gen += f'    bool {structVar}defined_{{false}};\n'
             gen += '    struct {\n'
             for member in structDef.members.values():
                 limittype = self.get_limittype_class(member.limittype)
@@ -4611,11 +4613,11 @@ class VulkanProfilesLayerGenerator():
                     nestedStructDef = self.registry.structs[member.type]
                     gen += '        struct {\n'
                     for nestedMember in nestedStructDef.members.values():
-                        gen += '            {0}<{1}> {2}{{}};\n'.format(limittype, nestedMember.type, nestedMember.name)
-                    gen += '        }} {0}{{}};\n'.format(member.name)
+                        gen += f'            {limittype}<{nestedMember.type}> {nestedMember.name}{{}};\n'
+                    gen += f'        }} {member.name}{{}};\n'
                 else:
-                    gen += '        {0}<{1}> {2}{{}};\n'.format(limittype, member.type, member.name)
-            gen += '    }} {0}{{}};\n'.format(structVar)
+                    gen += f'        {limittype}<{member.type}> {member.name}{{}};\n'
+            gen += f'    }} {structVar}{{}};\n'
             gen += self.generate_platform_protect_end(struct)
 
         # Parses JSON video profile format properties
@@ -4624,51 +4626,51 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '        const Json::Value *{0}json = nullptr;\n'.format(structVar)
+            gen += f'        const Json::Value *{structVar}json = nullptr;\n'
             for alias in self.registry.structs[struct].aliases:
-                gen += '        if (format_json.isMember("{0}")) {{\n'.format(alias)
-                gen += '            if ({0}json != nullptr) return false;\n'.format(structVar)
-                gen += '            {0}json = &format_json["{1}"];\n'.format(structVar, alias)
+                gen += f'        if (format_json.isMember("{alias}")) {{\n'
+                gen += f'            if ({structVar}json != nullptr) return false;\n'
+                gen += f'            {structVar}json = &format_json["{alias}"];\n'
                 gen += '        }\n'
-            gen += '        if ({0}json != nullptr) {{\n'.format(structVar)
+            gen += f'        if ({structVar}json != nullptr) {{\n'
             for member in structDef.members.values():
-                gen += '            if ({0}json->isMember("{1}")) {{\n'.format(structVar, member.name)
-                gen += '                const Json::Value &value = (*{0}json)["{1}"];\n'.format(structVar, member.name)
+                gen += f'            if ({structVar}json->isMember("{member.name}")) {{\n'
+                gen += f'                const Json::Value &value = (*{structVar}json)["{member.name}"];\n'
                 if member.type in self.registry.enums:
                     gen += '                if (!value.isString()) return false;\n'
-                    gen += '                {0}.{1}.limit = static_cast<{2}>(VkStringToUint64(value.asString()));\n'.format(structVar, member.name, member.type)
+                    gen += f'                {structVar}.{member.name}.limit = static_cast<{member.type}>(VkStringToUint64(value.asString()));\n'
                 elif member.type in self.registry.bitmasks:
                     gen += '                if (!value.isArray()) return false;\n'
                     gen += '                uint64_t mask = 0;\n'
                     gen += '                for (const auto &entry : value) {\n'
                     gen += '                    mask |= VkStringToUint64(entry.asString());\n'
                     gen += '                }\n'
-                    gen += '                {0}.{1}.limit = static_cast<{2}>(mask);\n'.format(structVar, member.name, member.type)
+                    gen += f'                {structVar}.{member.name}.limit = static_cast<{member.type}>(mask);\n'
                 elif member.type == 'VkBool32':
                     gen += '                if (!value.isBool()) return false;\n'
-                    gen += '                {0}.{1}.limit = value.asBool() ? VK_TRUE : VK_FALSE;\n'.format(structVar, member.name)
+                    gen += f'                {structVar}.{member.name}.limit = value.asBool() ? VK_TRUE : VK_FALSE;\n'
                 elif member.type in self.int_to_json_type_map:
                     intType = self.int_to_json_type_map[member.type]
-                    gen += '                if (!value.is{0}()) return false;\n'.format(intType)
-                    gen += '                {0}.{1}.limit = value.as{2}();\n'.format(structVar, member.name, intType)
+                    gen += f'                if (!value.is{intType}()) return false;\n'
+                    gen += f'                {structVar}.{member.name}.limit = value.as{intType}();\n'
                 elif member.type in self.registry.structs:
                     nestedStructDef = self.registry.structs[member.type]
                     gen += '                if (!value.isObject()) return false;\n'
                     for nestedMember in nestedStructDef.members.values():
-                        gen += '                if (value.isMember("{0}")) {{\n'.format(nestedMember.name)
-                        gen += '                    const Json::Value &nested_value = value["{0}"];\n'.format(nestedMember.name)
+                        gen += f'                if (value.isMember("{nestedMember.name}")) {{\n'
+                        gen += f'                    const Json::Value &nested_value = value["{nestedMember.name}"];\n'
                         if nestedMember.type in self.registry.enums:
                             gen += '                    if (!nested_value.isString()) return false;\n'
-                            gen += '                    {0}.{1}.{2}.limit = static_cast<{3}>(VkStringToUint64(nested_value.asString()));\n'.format(structVar, member.name, nestedMember.name, nestedMember.type)
+                            gen += f'                    {structVar}.{member.name}.{nestedMember.name}.limit = static_cast<{nestedMember.type}>(VkStringToUint64(nested_value.asString()));\n'
                         elif nestedMember.type in self.int_to_json_type_map:
                             intType = self.int_to_json_type_map[nestedMember.type]
-                            gen += '                    if (!nested_value.is{0}()) return false;\n'.format(intType)
-                            gen += '                    {0}.{1}.{2}.limit = nested_value.as{3}();\n'.format(structVar, member.name, nestedMember.name, intType)
+                            gen += f'                    if (!nested_value.is{intType}()) return false;\n'
+                            gen += f'                    {structVar}.{member.name}.{nestedMember.name}.limit = nested_value.as{intType}();\n'
                         else:
-                            gen += '#error Unsupported video profile format type "{0}" in "{1}::{2}::{3}"\n'.format(nestedMember.type, struct, member.name, nestedMember.name)
+                            gen += f'#error Unsupported video profile format type "{nestedMember.type}" in "{struct}::{member.name}::{nestedMember.name}"\n'
                         gen += '                }\n'
                 else:
-                    gen += '#error Unsupported video profile format type "{0}" in "{1}::{2}"\n'.format(member.type, struct, member.name)
+                    gen += f'#error Unsupported video profile format type "{member.type}" in "{struct}::{member.name}"\n'
                 gen += '            }\n'
             gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
@@ -4695,7 +4697,7 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '        if (format.{0}.sType == {1}) {{\n'.format(structVar, structDef.sType)
+            gen += f'        if (format.{structVar}.sType == {structDef.sType}) {{\n'
             indent = ' ' * 12
             for member in structDef.members.values():
                 if member.limittype in ['exact', 'noauto', 'not']:
@@ -4703,11 +4705,11 @@ class VulkanProfilesLayerGenerator():
                         # Structure members need to be expanded
                         nestedStructDef = self.registry.structs[member.type]
                         for nestedMember in nestedStructDef.members.values():
-                            gen += '{0}if ({1}.{2}.{3}.limit.has_value() && {1}.{2}.{3}.limit.value() != format.{1}.{2}.{3}) return false;\n'.format(indent, self.create_var_name(struct), member.name, nestedMember.name)
+                            gen += f'{indent}if ({self.create_var_name(struct)}.{member.name}.{nestedMember.name}.limit.has_value() && {self.create_var_name(struct)}.{member.name}.{nestedMember.name}.limit.value() != format.{self.create_var_name(struct)}.{member.name}.{nestedMember.name}) return false;\n'
                     else:
-                        gen += '{0}if ({1}.{2}.limit.has_value() && {1}.{2}.limit.value() != format.{1}.{2}) return false;\n'.format(indent, self.create_var_name(struct), member.name)
+                        gen += f'{indent}if ({self.create_var_name(struct)}.{member.name}.limit.has_value() && {self.create_var_name(struct)}.{member.name}.limit.value() != format.{self.create_var_name(struct)}.{member.name}) return false;\n'
             gen += '        } else {\n'
-            gen += '            if ({0}defined_) return false;\n'.format(structVar)
+            gen += f'            if ({structVar}defined_) return false;\n'
             gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '        return true;\n'
@@ -4719,7 +4721,7 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '        if (format.{0}.sType == {1}) {{\n'.format(structVar, structDef.sType)
+            gen += f'        if (format.{structVar}.sType == {structDef.sType}) {{\n'
             indent = ' ' * 12
             for member in structDef.members.values():
                 if member.limittype in ['exact', 'noauto', 'not']:
@@ -4727,9 +4729,9 @@ class VulkanProfilesLayerGenerator():
                         # Structure members need to be expanded
                         nestedStructDef = self.registry.structs[member.type]
                         for nestedMember in nestedStructDef.members.values():
-                            gen += '{0}if (!{1}.{2}.{3}.limit.has_value()) return false;\n'.format(indent, self.create_var_name(struct), member.name, nestedMember.name)
+                            gen += f'{indent}if (!{self.create_var_name(struct)}.{member.name}.{nestedMember.name}.limit.has_value()) return false;\n'
                     else:
-                        gen += '{0}if (!{1}.{2}.limit.has_value()) return false;\n'.format(indent, self.create_var_name(struct), member.name)
+                        gen += f'{indent}if (!{self.create_var_name(struct)}.{member.name}.limit.has_value()) return false;\n'
             gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '        return true;\n'
@@ -4751,13 +4753,13 @@ class VulkanProfilesLayerGenerator():
                     # Structure members need to be expanded
                     nestedStructDef = self.registry.structs[member.type]
                     for nestedMember in nestedStructDef.members.values():
-                        gen += '        if (format.{0}.{1}.{2}.limit.has_value() && !{0}.{1}.{2}.Combine(format.{0}.{1}.{2}.limit.value())) {{\n'.format(structVar, member.name, nestedMember.name)
-                        gen += '            LogMessage(layer_settings, DEBUG_REPORT_ERROR_BIT, error_msg, "{0}::{1}::{2}");\n'.format(struct, member.name, nestedMember.name)
+                        gen += f'        if (format.{structVar}.{member.name}.{nestedMember.name}.limit.has_value() && !{structVar}.{member.name}.{nestedMember.name}.Combine(format.{structVar}.{member.name}.{nestedMember.name}.limit.value())) {{\n'
+                        gen += f'            LogMessage(layer_settings, DEBUG_REPORT_ERROR_BIT, error_msg, "{struct}::{member.name}::{nestedMember.name}");\n'
                         gen += '            result = false;\n'
                         gen += '        }\n'
                 else:
-                    gen += '        if (format.{0}.{1}.limit.has_value() && !{0}.{1}.Combine(format.{0}.{1}.limit.value())) {{\n'.format(structVar, member.name)
-                    gen += '            LogMessage(layer_settings, DEBUG_REPORT_ERROR_BIT, error_msg, "{0}::{1}");\n'.format(struct, member.name)
+                    gen += f'        if (format.{structVar}.{member.name}.limit.has_value() && !{structVar}.{member.name}.Combine(format.{structVar}.{member.name}.limit.value())) {{\n'
+                    gen += f'            LogMessage(layer_settings, DEBUG_REPORT_ERROR_BIT, error_msg, "{struct}::{member.name}");\n'
                     gen += '            result = false;\n'
                     gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
@@ -4773,7 +4775,7 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '        if (format.{0}.sType == {1}) {{\n'.format(structVar, structDef.sType)
+            gen += f'        if (format.{structVar}.sType == {structDef.sType}) {{\n'
             indent = ' ' * 12
             for member in structDef.members.values():
                 # We only override modifiable properties
@@ -4783,19 +4785,19 @@ class VulkanProfilesLayerGenerator():
                     # Structure members need to be expanded
                     nestedStructDef = self.registry.structs[member.type]
                     for nestedMember in nestedStructDef.members.values():
-                        gen += '{0}if (!{1}.{2}.{3}.Override(format.{1}.{2}.{3})) {{\n'.format(indent, structVar, member.name, nestedMember.name)
-                        gen += '{0}    if (enable_warnings) {{\n'.format(indent)
-                        gen += '{0}        LogMessage(layer_settings, DEBUG_REPORT_WARNING_BIT, warn_msg, "{1}::{2}::{3}", name);\n'.format(indent, struct, member.name, nestedMember.name)
-                        gen += '{0}        result = false;\n'.format(indent)
-                        gen += '{0}    }}\n'.format(indent)
-                        gen += '{0}}}\n'.format(indent)
+                        gen += f'{indent}if (!{structVar}.{member.name}.{nestedMember.name}.Override(format.{structVar}.{member.name}.{nestedMember.name})) {{\n'
+                        gen += f'{indent}    if (enable_warnings) {{\n'
+                        gen += f'{indent}        LogMessage(layer_settings, DEBUG_REPORT_WARNING_BIT, warn_msg, "{struct}::{member.name}::{nestedMember.name}", name);\n'
+                        gen += f'{indent}        result = false;\n'
+                        gen += f'{indent}    }}\n'
+                        gen += f'{indent}}}\n'
                 else:
-                    gen += '{0}if (!{1}.{2}.Override(format.{1}.{2})) {{\n'.format(indent, structVar, member.name)
-                    gen += '{0}    if (enable_warnings) {{\n'.format(indent)
-                    gen += '{0}        LogMessage(layer_settings, DEBUG_REPORT_WARNING_BIT, warn_msg, "{1}::{2}", name);\n'.format(indent, struct, member.name)
-                    gen += '{0}        result = false;\n'.format(indent)
-                    gen += '{0}    }}\n'.format(indent)
-                    gen += '{0}}}\n'.format(indent)
+                    gen += f'{indent}if (!{structVar}.{member.name}.Override(format.{structVar}.{member.name})) {{\n'
+                    gen += f'{indent}    if (enable_warnings) {{\n'
+                    gen += f'{indent}        LogMessage(layer_settings, DEBUG_REPORT_WARNING_BIT, warn_msg, "{struct}::{member.name}", name);\n'
+                    gen += f'{indent}        result = false;\n'
+                    gen += f'{indent}    }}\n'
+                    gen += f'{indent}}}\n'
             gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '        return result;\n'
@@ -4807,17 +4809,17 @@ class VulkanProfilesLayerGenerator():
             structVar = self.create_var_name(struct)
             structDef = self.registry.structs[struct]
             gen += self.generate_platform_protect_begin(struct)
-            gen += '        if (format.{0}.sType == {1}) {{\n'.format(structVar, structDef.sType)
-            gen += '            format.{0} = {{format.{0}.sType, format.{0}.pNext}};\n'.format(structVar)
+            gen += f'        if (format.{structVar}.sType == {structDef.sType}) {{\n'
+            gen += f'            format.{structVar} = {{format.{structVar}.sType, format.{structVar}.pNext}};\n'
             indent = ' ' * 12
             for member in structDef.members.values():
                 if member.type in self.registry.structs:
                     # Structure members need to be expanded
                     nestedStructDef = self.registry.structs[member.type]
                     for nestedMember in nestedStructDef.members.values():
-                        gen += '{0}if ({1}.{2}.{3}.limit.has_value()) format.{1}.{2}.{3} = {1}.{2}.{3}.limit.value();\n'.format(indent, structVar, member.name, nestedMember.name)
+                        gen += f'{indent}if ({structVar}.{member.name}.{nestedMember.name}.limit.has_value()) format.{structVar}.{member.name}.{nestedMember.name} = {structVar}.{member.name}.{nestedMember.name}.limit.value();\n'
                 else:
-                    gen += '{0}if ({1}.{2}.limit.has_value()) format.{1}.{2} = {1}.{2}.limit.value();\n'.format(indent, structVar, member.name)
+                    gen += f'{indent}if ({structVar}.{member.name}.limit.has_value()) format.{structVar}.{member.name} = {structVar}.{member.name}.limit.value();\n'
             gen += '        }\n'
             gen += self.generate_platform_protect_end(struct)
         gen += '    }\n'
@@ -4839,7 +4841,7 @@ class VulkanProfilesLayerGenerator():
         gen += '        switch (info.video_profile_info_.videoCodecOperation) {\n'
 
         for videoCodecOp, videoCodec in self.registry.videoCodecsByValue.items():
-            gen += '            case {0}:\n'.format(videoCodecOp)
+            gen += f'            case {videoCodecOp}:\n'
             for videoFormat in videoCodec.formats.values():
                 for formatStruct in videoFormat.properties:
                     gen += self.generate_platform_protect_begin(formatStruct)
@@ -4853,18 +4855,19 @@ class VulkanProfilesLayerGenerator():
                 for requiredCaps in videoFormat.requiredCaps:
                     capsStructDef = self.registry.structs[requiredCaps.struct]
                     capsStructMember = capsStructDef.members[requiredCaps.member]
-                    capsStructMemberVar = 'caps.{0}.{1}'.format(self.create_var_name(requiredCaps.struct), requiredCaps.member)
+                    capsStructMemberVar = f'caps.{self.create_var_name(requiredCaps.struct)}.{requiredCaps.member}'
                     if capsStructMember.limittype == 'bitmask':
                         conditions.append(gen_profiles_solution.genCConditionForFlags(requiredCaps.value, capsStructMemberVar))
                     else:
-                        conditions.append('{0} == {1}'.format(capsStructMemberVar, requiredCaps.value))
+                        conditions.append(f'{capsStructMemberVar} == {requiredCaps.value}')
 
                 if len(conditions) == 0:
-                    gen += '{0}result.push_back({1});\n'.format(indent, videoFormat.usage)
+                    gen += f'{indent}result.push_back({videoFormat.usage});\n'
                 elif len(conditions) == 1:
-                    gen += '{0}if ({1}) {{\n{0}    result.push_back({2});\n{0}}}\n'.format(indent, conditions[0], videoFormat.usage)
+                    gen += f'{indent}if ({conditions[0]}) {{\n{indent}    result.push_back({videoFormat.usage});\n{indent}}}\n'
                 else:
-                    gen += '{0}if (({1})) {{\n{0}    result.push_back({2});\n{0}}}\n'.format(indent, ') && ('.join(conditions), videoFormat.usage)
+                    conjunction = ') && ('.join(conditions)
+                    gen += f'{indent}if (({conjunction})) {{\n{indent}    result.push_back({videoFormat.usage});\n{indent}}}\n'
 
                 for requiredCaps in reversed(videoFormat.requiredCaps):
                     gen += self.generate_platform_protect_end(requiredCaps.struct)
@@ -5442,7 +5445,7 @@ class VulkanProfilesLayerGenerator():
             elif member.limittype == 'max' or member.limittype == 'bits': # enum values
                 gen += '        GET_VALUE_ENUM_WARN(member, ' + member_name + ', ' + not_modifiable + ', requested_profile, WarnIfGreater);\n'
             else:
-                print("ERROR: Unsupported limittype '{0}' in member '{1}' of structure '{2}'".format(member.limittype, member_name, structure))
+                print(f"ERROR: Unsupported limittype '{member.limittype}' in member '{member_name}' of structure '{structure}'")
 
         gen += '    }\n'
         gen += '    return valid;\n'
@@ -5569,6 +5572,8 @@ class VulkanProfilesLayerGenerator():
             return True
         return False
 
+    # Every structure is named many times while generating the layer, derive each name only once
+    @functools.lru_cache(maxsize = None)
     def create_var_name(self, struct):
         nv = struct.endswith("NV")
         arm = struct.endswith("ARM")
@@ -5753,7 +5758,7 @@ if __name__ == '__main__':
                         default='vulkan',
                         choices=['vulkan'],
                         help="Target API")
-    parser.add_argument('--registry', '-r', action='store', help='Use specified registry file instead of vk.xml')
+    parser.add_argument('--registry', '-r', action='store', type=gen_profiles_solution.existingFile, help='Use specified registry file instead of vk.xml')
     parser.add_argument('--out-layer', action='store', help='Output the layer source file')
 
     args = parser.parse_args()
@@ -20,2983 +20,175 @@
 # - Christophe Riccio <christophe@lunarg.com>
 
 import os
+import sys
 import re
 import copy
 import itertools
 import functools
 import argparse
 from typing import OrderedDict
-import xml.etree.ElementTree as etree
 import json
+import pickle
+import mmap
+import logging
 from collections import deque
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from string import Template
 
-def apiNameMatch(str, supported):
-    """Return whether a required api name matches a pattern specified for an
-    XML <feature> 'api' attribute or <extension> 'supported' attribute.
-    - str - API name such as 'vulkan' or 'openxr'. May be None, in which
-        case it never matches (this should not happen).
-    - supported - comma-separated list of XML API names. May be None, in
-        which case str always matches (this is the usual case)."""
-
-    if str is not None:
-        return supported is None or str in supported.split(',')
-
-    # Fallthrough case - either str is None or the test failed
-    return False
-
-def stripNonmatchingAPIs(tree, apiName, actuallyDelete = True):
-    """Remove tree Elements with 'api' attributes matching apiName.
-        tree - Element at the root of the hierarchy to strip. Only its
-            children can actually be removed, not the tree itself.
-        apiName - string which much match a command-separated component of
-            the 'api' attribute.
-        actuallyDelete - only delete matching elements if True."""
-
-    stack = deque()
-    stack.append(tree)
-
-    while len(stack) > 0:
-        parent = stack.pop()
-
-        for child in parent.findall('*'):
-            api = child.get('api')
-
-            if apiNameMatch(apiName, api):
-                # Add child to the queue
-                stack.append(child)
-            elif not apiNameMatch(apiName, api):
-                # Child does not match requested api. Remove it.
-                if actuallyDelete:
-                    parent.remove(child)
-
-COPYRIGHT_HEADER = '''
-/*
- * Copyright (C) 2021-2024 Valve Corporation
- * Copyright (C) 2021-2024 LunarG, Inc.
- *
- * Licensed under the Apache License, Version 2.0 (the "License")
- * you may not use this file except in compliance with the License.
- * You may obtain a copy of the License at
- *
- *     http://www.apache.org/licenses/LICENSE-2.0
- *
- * Unless required by applicable law or agreed to in writing, software
- * distributed under the License is distributed on an "AS IS" BASIS,
- * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
- * See the License for the specific language governing permissions and
- * limitations under the License.
- *
- * This file is ***GENERATED***.  Do Not Edit.
- * See scripts/gen_profiles_solution.py for modifications.
- */
-'''
-
-DEBUG_MSG_CB_DEFINE = '''
-#include <cstdio>
-
-#ifndef VP_DEBUG_MESSAGE_CALLBACK
-#if defined(ANDROID) || defined(__ANDROID__)
-#include <android/log.h>
-#define VP_DEBUG_MESSAGE_CALLBACK(MSG) \\
-    __android_log_print(ANDROID_LOG_ERROR, "Profiles ERROR", "%s", MSG); \\
-    __android_log_print(ANDROID_LOG_DEBUG, "Profiles WARNING", "%s", MSG)
-#else
-#define VP_DEBUG_MESSAGE_CALLBACK(MSG) fprintf(stderr, "%s\\n", MSG)
-#endif
-#else
-void VP_DEBUG_MESSAGE_CALLBACK(const char*);
-#endif
-
-#define VP_DEBUG_MSG(MSG) VP_DEBUG_MESSAGE_CALLBACK((MSG))
-#define VP_DEBUG_MSGF(MSGFMT, ...) { char msg[1024]; snprintf(msg, sizeof(msg) - 1, (MSGFMT), __VA_ARGS__); VP_DEBUG_MESSAGE_CALLBACK(msg); }
-#define VP_DEBUG_COND_MSG(COND, MSG) if ((COND)) { VP_DEBUG_MSG((MSG)); }
-#define VP_DEBUG_COND_MSGF(COND, MSGFMT, ...) if ((COND)) { VP_DEBUG_MSGF((MSGFMT), __VA_ARGS__); }
-'''
-
-H_HEADER = '''
-#ifndef VULKAN_PROFILES_H_
-#define VULKAN_PROFILES_H_ 1
-
-#define VPAPI_ATTR
-
-#ifdef __cplusplus
-    extern "C" {
-#endif
-
-#include <vulkan/vulkan.h>
-'''
-
-H_FOOTER = '''
-#ifdef __cplusplus
-}
-#endif
-
-#endif // VULKAN_PROFILES_H_
-'''
-
-HPP_HEADER = '''
-#pragma once
-
-#define VPAPI_ATTR inline
-
-#include <vulkan/vulkan.h>
-'''
-
-SHARED_INCLUDE = '''
-#include <cstddef>
-#include <cstdarg>
-#include <cstdio>
-#include <cstring>
-#include <cstdint>
-#include <cassert>
-#include <cmath>
-#include <string>
-#include <vector>
-#include <algorithm>
-#include <memory>
-#include <map>
-'''
-
-API_DEFS = '''
-#define VP_HEADER_VERSION_COMPLETE VK_MAKE_API_VERSION(0, 2, 0, VK_HEADER_VERSION)
-
-#define VP_MAX_PROFILE_NAME_SIZE 256U
-
-typedef struct VpProfileProperties {
-    char        profileName[VP_MAX_PROFILE_NAME_SIZE];
-    uint32_t    specVersion;
-} VpProfileProperties;
-
-typedef struct VpBlockProperties {
-    VpProfileProperties profiles;
-    uint32_t apiVersion;
-    char blockName[VP_MAX_PROFILE_NAME_SIZE];
-} VpBlockProperties;
-
-typedef struct VpVideoProfileProperties {
-    char name[VP_MAX_PROFILE_NAME_SIZE];
-} VpVideoProfileProperties;
-
-typedef enum VpInstanceCreateFlagBits {
-    VP_INSTANCE_CREATE_FLAG_BITS_MAX_ENUM = 0x7FFFFFFF
-} VpInstanceCreateFlagBits;
-typedef VkFlags VpInstanceCreateFlags;
-
-typedef struct VpInstanceCreateInfo {
-    const VkInstanceCreateInfo* pCreateInfo;
-    VpInstanceCreateFlags       flags;
-    uint32_t                    enabledFullProfileCount;
-    const VpProfileProperties*  pEnabledFullProfiles;
-    uint32_t                    enabledProfileBlockCount;
-    const VpBlockProperties*    pEnabledProfileBlocks;
-} VpInstanceCreateInfo;
-
-typedef enum VpDeviceCreateFlagBits {
-    VP_DEVICE_CREATE_DISABLE_ROBUST_BUFFER_ACCESS_BIT = 0x0000001,
-    VP_DEVICE_CREATE_DISABLE_ROBUST_IMAGE_ACCESS_BIT = 0x0000002,
-    VP_DEVICE_CREATE_DISABLE_ROBUST_ACCESS =
-        VP_DEVICE_CREATE_DISABLE_ROBUST_BUFFER_ACCESS_BIT | VP_DEVICE_CREATE_DISABLE_ROBUST_IMAGE_ACCESS_BIT,
-
-    VP_DEVICE_CREATE_FLAG_BITS_MAX_ENUM = 0x7FFFFFFF
-} VpDeviceCreateFlagBits;
-typedef VkFlags VpDeviceCreateFlags;
-
-typedef struct VpDeviceCreateInfo {
-    const VkDeviceCreateInfo*   pCreateInfo;
-    VpDeviceCreateFlags         flags;
-    uint32_t                    enabledFullProfileCount;
-    const VpProfileProperties*  pEnabledFullProfiles;
-    uint32_t                    enabledProfileBlockCount;
-    const VpBlockProperties*    pEnabledProfileBlocks;
-} VpDeviceCreateInfo;
-
-VK_DEFINE_HANDLE(VpCapabilities)
-
-typedef enum VpCapabilitiesCreateFlagBits {
-    VP_PROFILE_CREATE_STATIC_BIT = (1 << 0),
-    //VP_PROFILE_CREATE_DYNAMIC_BIT = (1 << 1),
-    VP_PROFILE_CREATE_FLAG_BITS_MAX_ENUM = 0x7FFFFFFF
-} VpCapabilitiesCreateFlagBits;
-
-typedef VkFlags VpCapabilitiesCreateFlags;
-
-// Pointers to some Vulkan functions - a subset used by the library.
-// Used in VpCapabilitiesCreateInfo::pVulkanFunctions.
-
-typedef struct VpVulkanFunctions {
-    /// Required when using VP_DYNAMIC_VULKAN_FUNCTIONS.
-    PFN_vkGetInstanceProcAddr GetInstanceProcAddr;
-    /// Required when using VP_DYNAMIC_VULKAN_FUNCTIONS.
-    PFN_vkGetDeviceProcAddr GetDeviceProcAddr;
-    PFN_vkEnumerateInstanceVersion EnumerateInstanceVersion;
-    PFN_vkEnumerateInstanceExtensionProperties EnumerateInstanceExtensionProperties;
-    PFN_vkEnumerateDeviceExtensionProperties EnumerateDeviceExtensionProperties;
-    PFN_vkGetPhysicalDeviceFeatures2 GetPhysicalDeviceFeatures2;
-    PFN_vkGetPhysicalDeviceProperties2 GetPhysicalDeviceProperties2;
-    PFN_vkGetPhysicalDeviceFormatProperties2 GetPhysicalDeviceFormatProperties2;
-    PFN_vkGetPhysicalDeviceQueueFamilyProperties2 GetPhysicalDeviceQueueFamilyProperties2;
-    PFN_vkCreateInstance CreateInstance;
-    PFN_vkCreateDevice CreateDevice;
-} VpVulkanFunctions;
-
-/// Description of a Allocator to be created.
-typedef struct VpCapabilitiesCreateInfo
-{
-    /// Flags for created allocator. Use #VpInstanceCreateFlagBits enum.
-    VpCapabilitiesCreateFlags       flags;
-    uint32_t                        apiVersion;
-    const VpVulkanFunctions*        pVulkanFunctions;
-} VpCapabilitiesCreateInfo;
-
-VPAPI_ATTR VkResult vpCreateCapabilities(
-    const VpCapabilitiesCreateInfo*             pCreateInfo,
-    const VkAllocationCallbacks*                pAllocator,
-    VpCapabilities*                             pCapabilities);
-
-/// Destroys allocator object.
-VPAPI_ATTR void vpDestroyCapabilities(
-    VpCapabilities                              capabilities,
-    const VkAllocationCallbacks*                pAllocator);
-
-// Query the list of available profiles in the library
-VPAPI_ATTR VkResult vpGetProfiles(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    uint32_t*                                   pPropertyCount,
-    VpProfileProperties*                        pProperties);
-
-// List the required profiles of a profile
-VPAPI_ATTR VkResult vpGetProfileRequiredProfiles(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    uint32_t*                                   pPropertyCount,
-    VpProfileProperties*                        pProperties);
-
-// Query the profile required Vulkan API version
-VPAPI_ATTR uint32_t vpGetProfileAPIVersion(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile);
-
-// List the recommended fallback profiles of a profile
-VPAPI_ATTR VkResult vpGetProfileFallbacks(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    uint32_t*                                   pPropertyCount,
-    VpProfileProperties*                        pProperties);
-
-// Query whether the profile has multiple variants. Profiles with multiple variants can only use vpGetInstanceProfileSupport and vpGetPhysicalDeviceProfileSupport capabilities of the library. Other function will return a VK_ERROR_UNKNOWN error
-VPAPI_ATTR VkResult vpHasMultipleVariantsProfile(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    VkBool32*                                   pHasMultipleVariants);
-
-// Check whether a profile is supported at the instance level
-VPAPI_ATTR VkResult vpGetInstanceProfileSupport(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const char*                                 pLayerName,
-    const VpProfileProperties*                  pProfile,
-    VkBool32*                                   pSupported);
-
-// Check whether a variant of a profile is supported at the instance level and report this list of blocks used to validate the profiles
-VPAPI_ATTR VkResult vpGetInstanceProfileVariantsSupport(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const char*                                 pLayerName,
-    const VpProfileProperties*                  pProfile,
-    VkBool32*                                   pSupported,
-    uint32_t*                                   pPropertyCount,
-    VpBlockProperties*                          pProperties);
-
-// Create a VkInstance with the profile instance extensions enabled
-VPAPI_ATTR VkResult vpCreateInstance(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpInstanceCreateInfo*                 pCreateInfo,
-    const VkAllocationCallbacks*                pAllocator,
-    VkInstance*                                 pInstance);
-
-// Check whether a profile is supported by the physical device
-VPAPI_ATTR VkResult vpGetPhysicalDeviceProfileSupport(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    VkInstance                                  instance,
-    VkPhysicalDevice                            physicalDevice,
-    const VpProfileProperties*                  pProfile,
-    VkBool32*                                   pSupported);
-
-// Check whether a variant of a profile is supported by the physical device and report this list of blocks used to validate the profiles
-VPAPI_ATTR VkResult vpGetPhysicalDeviceProfileVariantsSupport(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    VkInstance                                  instance,
-    VkPhysicalDevice                            physicalDevice,
-    const VpProfileProperties*                  pProfile,
-    VkBool32*                                   pSupported,
-    uint32_t*                                   pPropertyCount,
-    VpBlockProperties*                          pProperties);
-
-// Create a VkDevice with the profile features and device extensions enabled
-VPAPI_ATTR VkResult vpCreateDevice(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    VkPhysicalDevice                            physicalDevice,
-    const VpDeviceCreateInfo*                   pCreateInfo,
-    const VkAllocationCallbacks*                pAllocator,
-    VkDevice*                                   pDevice);
-
-// Query the list of instance extensions of a profile
-VPAPI_ATTR VkResult vpGetProfileInstanceExtensionProperties(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pPropertyCount,
-    VkExtensionProperties*                      pProperties);
-
-// Query the list of device extensions of a profile
-VPAPI_ATTR VkResult vpGetProfileDeviceExtensionProperties(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pPropertyCount,
-    VkExtensionProperties*                      pProperties);
-
-// Fill the feature structures with the requirements of a profile
-VPAPI_ATTR VkResult vpGetProfileFeatures(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    void*                                       pNext);
-
-// Query the list of feature structure types specified by the profile
-VPAPI_ATTR VkResult vpGetProfileFeatureStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes);
-
-// Fill the property structures with the requirements of a profile
-VPAPI_ATTR VkResult vpGetProfileProperties(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    void*                                       pNext);
-
-// Query the list of property structure types specified by the profile
-VPAPI_ATTR VkResult vpGetProfilePropertyStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes);
-
-// Fill the queue family property structures with the requirements of a profile
-VPAPI_ATTR VkResult vpGetProfileQueueFamilyProperties(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pPropertyCount,
-    VkQueueFamilyProperties2KHR*                pProperties);
-
-// Query the list of queue family property structure types specified by the profile
-VPAPI_ATTR VkResult vpGetProfileQueueFamilyStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes);
-
-// Query the list of formats with specified requirements by a profile
-VPAPI_ATTR VkResult vpGetProfileFormats(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pFormatCount,
-    VkFormat*                                   pFormats);
-
-// Query the requirements of a format for a profile
-VPAPI_ATTR VkResult vpGetProfileFormatProperties(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    VkFormat                                    format,
-    void*                                       pNext);
-
-// Query the list of format structure types specified by the profile
-VPAPI_ATTR VkResult vpGetProfileFormatStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes);
-
-#ifdef VK_KHR_video_queue
-// Query the list of video profiles specified by the profile
-VPAPI_ATTR VkResult vpGetProfileVideoProfiles(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pVideoProfileCount,
-    VpVideoProfileProperties*                   pVideoProfiles);
-
-// Query the video profile info structures for a video profile defined by a profile
-VPAPI_ATTR VkResult vpGetProfileVideoProfileInfo(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t                                    videoProfileIndex,
-    VkVideoProfileInfoKHR*                      pVideoProfileInfo);
-
-// Query the list of video profile info structure types specified by the profile for a video profile
-VPAPI_ATTR VkResult vpGetProfileVideoProfileInfoStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t                                    videoProfileIndex,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes);
-
-// Query the video capabilities requirements for a video profile defined by a profile
-VPAPI_ATTR VkResult vpGetProfileVideoCapabilities(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t                                    videoProfileIndex,
-    void*                                       pNext);
-
-// Query the list of video capability structure types specified by the profile for a video profile
-VPAPI_ATTR VkResult vpGetProfileVideoCapabilityStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t                                    videoProfileIndex,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes);
-
-// Query the video format property requirements for a video profile defined by a profile
-VPAPI_ATTR VkResult vpGetProfileVideoFormatProperties(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t                                    videoProfileIndex,
-    uint32_t*                                   pPropertyCount,
-    VkVideoFormatPropertiesKHR*                 pProperties);
-
-// Query the list of video format property structure types specified by the profile for a video profile
-VPAPI_ATTR VkResult vpGetProfileVideoFormatStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t                                    videoProfileIndex,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes);
-#endif  // VK_KHR_video_queue
-'''
-
-PRIVATE_DEFS = '''
-VPAPI_ATTR std::string FormatString(const char* message, ...) {
-    std::size_t const STRING_BUFFER(4096);
-
-    assert(message != nullptr);
-    assert(strlen(message) >= 1 && strlen(message) < STRING_BUFFER);
-
-    char buffer[STRING_BUFFER];
-    va_list list;
-
-    va_start(list, message);
-    vsnprintf(buffer, STRING_BUFFER, message, list);
-    va_end(list);
-
-    return buffer;
-}
-
-VPAPI_ATTR const void* vpGetStructure(const void* pNext, VkStructureType type) {
-    const VkBaseOutStructure* p = static_cast<const VkBaseOutStructure*>(pNext);
-    while (p != nullptr) {
-        if (p->sType == type) return p;
-        p = p->pNext;
-    }
-    return nullptr;
-}
-
-VPAPI_ATTR void* vpGetStructure(void* pNext, VkStructureType type) {
-    VkBaseOutStructure* p = static_cast<VkBaseOutStructure*>(pNext);
-    while (p != nullptr) {
-        if (p->sType == type) return p;
-        p = p->pNext;
-    }
-    return nullptr;
-}
-
-VPAPI_ATTR VkBaseOutStructure* vpExtractStructure(VkPhysicalDeviceFeatures2KHR* pFeatures, VkStructureType structureType) {
-    if (structureType == VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2_KHR) {
-        return nullptr;
-    }
-
-    VkBaseOutStructure* current = reinterpret_cast<VkBaseOutStructure*>(pFeatures);
-    VkBaseOutStructure* previous = nullptr;
-    VkBaseOutStructure* found = nullptr;
-
-    while (current != nullptr) {
-        if (structureType == current->sType) {
-            found = current;
-            if (previous != nullptr) {
-                previous->pNext = current->pNext;
-            }
-            current = nullptr;
-        } else {
-            previous = current;
-            current = current->pNext;
-        }
-    }
-
-    if (found != nullptr) {
-        found->pNext = nullptr;
-        return found;
-    } else {
-        return nullptr;
-    }
-}
-
-VPAPI_ATTR void GatherStructureTypes(std::vector<VkStructureType>& structureTypes, VkBaseOutStructure* pNext) {
-    while (pNext) {
-        if (std::find(structureTypes.begin(), structureTypes.end(), pNext->sType) == structureTypes.end()) {
-            structureTypes.push_back(pNext->sType);
-        }
-
-        pNext = pNext->pNext;
-    }
-}
-
-VPAPI_ATTR bool isMultiple(double source, double multiple) {
-    double mod = std::fmod(source, multiple);
-    return std::abs(mod) < 0.0001;
-}
-
-VPAPI_ATTR bool isPowerOfTwo(double source) {
-    double mod = std::fmod(source, 1.0);
-    if (std::abs(mod) >= 0.0001) return false;
-
-    std::uint64_t value = static_cast<std::uint64_t>(std::abs(source));
-    return !(value & (value - static_cast<std::uint64_t>(1)));
-}
-
-using PFN_vpStructFiller = void(*)(VkBaseOutStructure* p);
-using PFN_vpStructComparator = bool(*)(VkBaseOutStructure* p);
-using PFN_vpStructChainerCb = void(*)(VkBaseOutStructure* p, void* pUser);
-using PFN_vpStructChainer = void(*)(VkBaseOutStructure* p, void* pUser, PFN_vpStructChainerCb pfnCb);
-using PFN_vpStructArrayChainerCb = void(*)(uint32_t count, VkBaseOutStructure* p, void* pUser);
-using PFN_vpStructArrayChainer = void(*)(uint32_t count, VkBaseOutStructure* p, void* pUser, PFN_vpStructArrayChainerCb pfnCb);
-
-struct VpFeatureDesc {
-    PFN_vpStructFiller              pfnFiller;
-    PFN_vpStructComparator          pfnComparator;
-};
-
-struct VpPropertyDesc {
-    PFN_vpStructFiller              pfnFiller;
-    PFN_vpStructComparator          pfnComparator;
-};
-
-struct VpQueueFamilyDesc {
-    PFN_vpStructFiller              pfnFiller;
-    PFN_vpStructComparator          pfnComparator;
-};
-
-struct VpFormatDesc {
-    VkFormat                        format;
-    PFN_vpStructFiller              pfnFiller;
-    PFN_vpStructComparator          pfnComparator;
-};
-
-struct VpStructChainerDesc {
-    PFN_vpStructChainer             pfnFeature;
-    PFN_vpStructChainer             pfnProperty;
-    PFN_vpStructArrayChainer        pfnQueueFamily;
-    PFN_vpStructChainer             pfnFormat;
-};
-
-struct VpVideoProfileInfoDesc {
-    PFN_vpStructFiller              pfnFiller;
-    PFN_vpStructComparator          pfnComparator;
-};
-
-struct VpVideoCapabilityDesc {
-    PFN_vpStructFiller              pfnFiller;
-    PFN_vpStructComparator          pfnComparator;
-};
-
-struct VpVideoFormatDesc {
-    PFN_vpStructFiller              pfnFiller;
-    PFN_vpStructComparator          pfnComparator;
-};
-
-struct VpVideoProfileStructChainerDesc {
-    PFN_vpStructChainer             pfnInfo;
-    PFN_vpStructChainer             pfnCapability;
-    PFN_vpStructArrayChainer        pfnFormat;
-};
-
-struct VpVideoProfileDesc {
-    VpVideoProfileProperties properties;
-
-    uint32_t infoStructTypeCount;
-    const VkStructureType* pInfoStructTypes;
-    VpVideoProfileInfoDesc info;
-
-    uint32_t capabilityStructTypeCount;
-    const VkStructureType* pCapabilityStructTypes;
-    VpVideoCapabilityDesc capability;
-
-    uint32_t formatStructTypeCount;
-    const VkStructureType* pFormatStructTypes;
-    uint32_t formatCount;
-    const VpVideoFormatDesc* pFormats;
-
-    VpVideoProfileStructChainerDesc chainers;
-};
-
-struct VpVariantDesc {
-    char blockName[VP_MAX_PROFILE_NAME_SIZE];
-
-    uint32_t instanceExtensionCount;
-    const VkExtensionProperties* pInstanceExtensions;
-
-    uint32_t deviceExtensionCount;
-    const VkExtensionProperties* pDeviceExtensions;
-
-    uint32_t featureStructTypeCount;
-    const VkStructureType* pFeatureStructTypes;
-    VpFeatureDesc feature;
-
-    uint32_t propertyStructTypeCount;
-    const VkStructureType* pPropertyStructTypes;
-    VpPropertyDesc property;
-
-    uint32_t queueFamilyStructTypeCount;
-    const VkStructureType* pQueueFamilyStructTypes;
-    uint32_t queueFamilyCount;
-    const VpQueueFamilyDesc* pQueueFamilies;
-
-    uint32_t formatStructTypeCount;
-    const VkStructureType* pFormatStructTypes;
-    uint32_t formatCount;
-    const VpFormatDesc* pFormats;
-
-    VpStructChainerDesc chainers;
-
-    uint32_t videoProfileCount;
-    const VpVideoProfileDesc* pVideoProfiles;
-};
-
-struct VpCapabilitiesDesc {
-    uint32_t variantCount;
-    const VpVariantDesc* pVariants;
-};
-
-struct VpProfileDesc {
-    VpProfileProperties             props;
-    uint32_t                        minApiVersion;
-
-    const detail::VpVariantDesc*    pMergedCapabilities;
-
-    uint32_t                        requiredProfileCount;
-    const VpProfileProperties*      pRequiredProfiles;
-
-    uint32_t                        requiredCapabilityCount;
-    const VpCapabilitiesDesc*       pRequiredCapabilities;
-
-    uint32_t                        fallbackCount;
-    const VpProfileProperties*      pFallbacks;
-};
-
-template <typename T>
-VPAPI_ATTR bool vpCheckFlags(const T& actual, const uint64_t expected) {
-    return (actual & expected) == expected;
-}
-'''
-
-PRIVATE_IMPL_BODY = '''
-VPAPI_ATTR const VpProfileDesc* vpGetProfileDesc(const char profileName[VP_MAX_PROFILE_NAME_SIZE]) {
-    for (uint32_t profileIndex = 0; profileIndex < profileCount; ++profileIndex) {
-        if (strncmp(profiles[profileIndex].props.profileName, profileName, VP_MAX_PROFILE_NAME_SIZE) == 0) {
-            return &profiles[profileIndex];
-        }
-    }
-    return nullptr;
-}
-
-VPAPI_ATTR std::vector<VpProfileProperties> GatherProfiles(const VpProfileProperties& profile, const char* pBlockName = nullptr) {
-    std::vector<VpProfileProperties> gatheredProfiles;
-
-    if (pBlockName == nullptr) {
-        const detail::VpProfileDesc* profileDesc = detail::vpGetProfileDesc(profile.profileName);
-        if (profileDesc != nullptr) {
-            for (uint32_t profileIndex = 0; profileIndex < profileDesc->requiredProfileCount; ++profileIndex) {
-                gatheredProfiles.push_back(profileDesc->pRequiredProfiles[profileIndex]);
-            }
-        }
-    }
-
-    gatheredProfiles.push_back(profile);
-
-    return gatheredProfiles;
-}
-
-VPAPI_ATTR bool vpCheckVersion(uint32_t actual, uint32_t expected) {
-    uint32_t actualMajor = VK_API_VERSION_MAJOR(actual);
-    uint32_t actualMinor = VK_API_VERSION_MINOR(actual);
-    uint32_t expectedMajor = VK_API_VERSION_MAJOR(expected);
-    uint32_t expectedMinor = VK_API_VERSION_MINOR(expected);
-    return actualMajor > expectedMajor || (actualMajor == expectedMajor && actualMinor >= expectedMinor);
-}
-
-VPAPI_ATTR bool HasExtension(const std::vector<VkExtensionProperties>& list, const VkExtensionProperties& element) {
-    for (std::size_t i = 0, n = list.size(); i < n; ++i) {
-        if (strcmp(list[i].extensionName, element.extensionName) == 0) {
-            return true;
-        }
-    }
-
-    return false;
-}
-
-VPAPI_ATTR bool CheckExtension(const VkExtensionProperties* supportedProperties, size_t supportedSize, const char *requestedExtension) {
-    bool found = false;
-    for (size_t i = 0, n = supportedSize; i < n; ++i) {
-        if (strcmp(supportedProperties[i].extensionName, requestedExtension) == 0) {
-            found = true;
-            break;
-            // Drivers don't actually update their spec version, so we cannot rely on this
-            // if (supportedProperties[i].specVersion >= expectedVersion) found = true;
-        }
-    }
-    VP_DEBUG_COND_MSGF(!found, "Unsupported extension: %s", requestedExtension);
-    return found;
-}
-
-VPAPI_ATTR bool CheckExtension(const std::vector<const char*>& extensions, const char* extension) {
-    for (const char* c : extensions) {
-        if (strcmp(c, extension) == 0) {
-            return true;
-        }
-    }
-    return false;
-}
-
-VPAPI_ATTR void GetExtensions(uint32_t extensionCount, const VkExtensionProperties *pExtensions, std::vector<const char *> &extensions) {
-    for (uint32_t ext_index = 0; ext_index < extensionCount; ++ext_index) {
-        if (CheckExtension(extensions, pExtensions[ext_index].extensionName)) {
-            continue;
-        }
-        extensions.push_back(pExtensions[ext_index].extensionName);
-    }
-}
-
-VPAPI_ATTR std::vector<VpBlockProperties> GatherBlocks(
-    uint32_t enabledFullProfileCount, const VpProfileProperties* pEnabledFullProfiles,
-    uint32_t enabledProfileBlockCount, const VpBlockProperties* pEnabledProfileBlocks) {
-    std::vector<VpBlockProperties> results;
-
-    for (std::size_t profile_index = 0; profile_index < enabledFullProfileCount; ++profile_index) {
-        const std::vector<VpProfileProperties>& gathered_profiles = GatherProfiles(pEnabledFullProfiles[profile_index]);
-
-        for (std::size_t gathered_index = 0; gathered_index < gathered_profiles.size(); ++gathered_index) {
-            VpBlockProperties block{gathered_profiles[gathered_index], 0, ""};
-            results.push_back(block);
-        }
-    }
-
-    for (std::size_t block_index = 0; block_index < enabledProfileBlockCount; ++block_index) {
-        results.push_back(pEnabledProfileBlocks[block_index]);
-    }
-
-    return results;
-}
-
-VPAPI_ATTR VkResult vpGetInstanceProfileSupportSingleProfile(
-    uint32_t                                    api_version,
-    const std::vector<VkExtensionProperties>&   supported_extensions,
-    const VpProfileProperties*                  pProfile,
-    VkBool32*                                   pSupported,
-    std::vector<VpBlockProperties>&             supportedBlocks,
-    std::vector<VpBlockProperties>&             unsupportedBlocks) {
-    assert(pProfile != nullptr);
-
-    const detail::VpProfileDesc* pProfileDesc = vpGetProfileDesc(pProfile->profileName);
-    if (pProfileDesc == nullptr) {
-        *pSupported = VK_FALSE;
-        return VK_ERROR_UNKNOWN;
-    }
-
-    VpBlockProperties block{*pProfile, api_version};
-
-    if (pProfileDesc->props.specVersion < pProfile->specVersion) {
-        *pSupported = VK_FALSE;
-        unsupportedBlocks.push_back(block);
-    }
-
-    // Required API version is built in root profile, not need to check dependent profile API versions
-    if (api_version != 0) {
-        if (!vpCheckVersion(api_version, pProfileDesc->minApiVersion)) {
-            VP_DEBUG_MSGF("Unsupported Profile API version %u.%u.%u on a Vulkan system with version %u.%u.%u", VK_API_VERSION_MAJOR(pProfileDesc->minApiVersion), VK_API_VERSION_MINOR(pProfileDesc->minApiVersion), VK_API_VERSION_PATCH(pProfileDesc->minApiVersion), VK_API_VERSION_MAJOR(api_version), VK_API_VERSION_MINOR(api_version), VK_API_VERSION_PATCH(api_version));
-
-            *pSupported = VK_FALSE;
-            unsupportedBlocks.push_back(block);
-        }
-    }
-
-    for (uint32_t capability_index = 0; capability_index < pProfileDesc->requiredCapabilityCount; ++capability_index) {
-        const VpCapabilitiesDesc& capabilities_desc = pProfileDesc->pRequiredCapabilities[capability_index];
-
-        VkBool32 supported_capabilities = VK_FALSE;
-        for (uint32_t variant_index = 0; variant_index < capabilities_desc.variantCount; ++variant_index) {
-            const VpVariantDesc& variant_desc = capabilities_desc.pVariants[variant_index];
-
-            VkBool32 supported_variant = VK_TRUE;
-            for (uint32_t i = 0; i < variant_desc.instanceExtensionCount; ++i) {
-                if (!detail::CheckExtension(supported_extensions.data(), supported_extensions.size(),
-                                              variant_desc.pInstanceExtensions[i].extensionName)) {
-                    supported_variant = VK_FALSE;
-                    memcpy(block.blockName, variant_desc.blockName, VP_MAX_PROFILE_NAME_SIZE * sizeof(char));
-                    unsupportedBlocks.push_back(block);
-                }
-            }
-
-            if (supported_variant == VK_TRUE) {
-                supported_capabilities = VK_TRUE;
-                memcpy(block.blockName, variant_desc.blockName, VP_MAX_PROFILE_NAME_SIZE * sizeof(char));
-                supportedBlocks.push_back(block);
-            }
-        }
-
-        if (supported_capabilities == VK_FALSE) {
-            *pSupported = VK_FALSE;
-            return VK_SUCCESS;
-        }
-    }
-
-    return VK_SUCCESS;
-}
-
-enum structure_type {
-    STRUCTURE_FEATURE = 0,
-    STRUCTURE_PROPERTY,
-    STRUCTURE_QUEUE_FAMILY,
-    STRUCTURE_FORMAT
-};
-
-VPAPI_ATTR VkResult vpGetProfileStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    structure_type                              type,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    VkResult result = pBlockName == nullptr ? VK_SUCCESS : VK_INCOMPLETE;
-
-    std::vector<VkStructureType> results;
-
-    const std::vector<VpProfileProperties>& gathered_profiles = detail::GatherProfiles(*pProfile);
-
-    for (std::size_t profile_index = 0, profile_count = gathered_profiles.size(); profile_index < profile_count; ++profile_index) {
-        const detail::VpProfileDesc* profile_desc = detail::vpGetProfileDesc(gathered_profiles[profile_index].profileName);
-        if (profile_desc == nullptr) return VK_ERROR_UNKNOWN;
-
-        for (uint32_t capability_index = 0; capability_index < profile_desc->requiredCapabilityCount; ++capability_index) {
-            const detail::VpCapabilitiesDesc& cap_desc = profile_desc->pRequiredCapabilities[capability_index];
-
-            for (uint32_t variant_index = 0; variant_index < cap_desc.variantCount; ++variant_index) {
-                const detail::VpVariantDesc& variant = cap_desc.pVariants[variant_index];
-                if (pBlockName != nullptr) {
-                    if (strcmp(variant.blockName, pBlockName) != 0) {
-                        continue;
-                    }
-                    result = VK_SUCCESS;
-                }
-
-                uint32_t count = 0;
-                const VkStructureType* data = nullptr;
-
-                switch (type) {
-                    default:
-                    case STRUCTURE_FEATURE:
-                        count = variant.featureStructTypeCount;
-                        data = variant.pFeatureStructTypes;
-                        break;
-                    case STRUCTURE_PROPERTY:
-                        count = variant.propertyStructTypeCount;
-                        data = variant.pPropertyStructTypes;
-                        break;
-                    case STRUCTURE_QUEUE_FAMILY:
-                        count = variant.queueFamilyStructTypeCount;
-                        data = variant.pQueueFamilyStructTypes;
-                        break;
-                    case STRUCTURE_FORMAT:
-                        count = variant.formatStructTypeCount;
-                        data = variant.pFormatStructTypes;
-                        break;
-                }
-
-                for (uint32_t type_index = 0; type_index < count; ++type_index) {
-                    const VkStructureType dataType = data[type_index];
-                    if (std::find(results.begin(), results.end(), dataType) == std::end(results)) {
-                        results.push_back(dataType);
-                    }
-                }
-            }
-        }
-    }
-
-    const uint32_t count = static_cast<uint32_t>(results.size());
-    std::sort(results.begin(), results.end());
-
-    if (pStructureTypes == nullptr) {
-        *pStructureTypeCount = count;
-    } else {
-        if (*pStructureTypeCount < count) {
-            result = VK_INCOMPLETE;
-        } else {
-            *pStructureTypeCount = count;
-        }
-
-        if (*pStructureTypeCount > 0) {
-            memcpy(pStructureTypes, &results[0], *pStructureTypeCount * sizeof(VkStructureType));
-        }
-    }
-
-    return result;
-}
-
-enum ExtensionType {
-    EXTENSION_INSTANCE,
-    EXTENSION_DEVICE,
-};
-
-VPAPI_ATTR VkResult vpGetProfileExtensionProperties(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    ExtensionType                               type,
-    uint32_t*                                   pPropertyCount,
-    VkExtensionProperties*                      pProperties) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    VkResult result = pBlockName == nullptr ? VK_SUCCESS : VK_INCOMPLETE;
-
-    std::vector<VkExtensionProperties> results;
-
-    const std::vector<VpProfileProperties>& gathered_profiles = detail::GatherProfiles(*pProfile, pBlockName);
-
-    for (std::size_t profile_index = 0, profile_count = gathered_profiles.size(); profile_index < profile_count; ++profile_index) {
-        const detail::VpProfileDesc* profile_desc = detail::vpGetProfileDesc(gathered_profiles[profile_index].profileName);
-        if (profile_desc == nullptr) {
-            return VK_ERROR_UNKNOWN;
-        }
-
-        for (uint32_t capability_index = 0; capability_index < profile_desc->requiredCapabilityCount; ++capability_index) {
-            const detail::VpCapabilitiesDesc& cap_desc = profile_desc->pRequiredCapabilities[capability_index];
-
-            for (uint32_t variant_index = 0; variant_index < cap_desc.variantCount; ++variant_index) {
-                const detail::VpVariantDesc& variant = cap_desc.pVariants[variant_index];
-                if (pBlockName != nullptr) {
-                    if (strcmp(variant.blockName, pBlockName) != 0) {
-                        continue;
-                    }
-                    result = VK_SUCCESS;
-                }
-
-                switch (type) {
-                    default:
-                    case EXTENSION_INSTANCE:
-                        for (uint32_t ext_index = 0; ext_index < variant.instanceExtensionCount; ++ext_index) {
-                            if (detail::HasExtension(results, variant.pInstanceExtensions[ext_index])) {
-                                continue;
-                            }
-                            results.push_back(variant.pInstanceExtensions[ext_index]);
-                        }
-                        break;
-                    case EXTENSION_DEVICE:
-                        for (uint32_t ext_index = 0; ext_index < variant.deviceExtensionCount; ++ext_index) {
-                            if (detail::HasExtension(results, variant.pDeviceExtensions[ext_index])) {
-                                continue;
-                            }
-                            results.push_back(variant.pDeviceExtensions[ext_index]);
-                        }
-                        break;
-                }
-            }
-        }
-    }
-
-    const uint32_t count = static_cast<uint32_t>(results.size());
-
-    if (pProperties == nullptr) {
-        *pPropertyCount = count;
-    } else {
-        if (*pPropertyCount < count) {
-            result = VK_INCOMPLETE;
-        } else {
-            *pPropertyCount = count;
-        }
-        if (*pPropertyCount > 0) {
-            memcpy(pProperties, &results[0], *pPropertyCount * sizeof(VkExtensionProperties));
-        }
-    }
-
-    return result;
-}
-
-VPAPI_ATTR VkResult vpGetProfileVideoProfileDesc(
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t                                    videoProfileIndex,
-    const detail::VpVideoProfileDesc**          ppVideoProfileDesc) {
-    VkResult result = pBlockName == nullptr ? VK_SUCCESS : VK_INCOMPLETE;
-
-    uint32_t curr_base_video_profile_index = 0;
-
-    const std::vector<VpProfileProperties>& gathered_profiles = detail::GatherProfiles(*pProfile);
-
-    for (std::size_t profile_index = 0, profile_count = gathered_profiles.size(); profile_index < profile_count; ++profile_index) {
-        const detail::VpProfileDesc* profile_desc = detail::vpGetProfileDesc(gathered_profiles[profile_index].profileName);
-        if (profile_desc == nullptr) return VK_ERROR_UNKNOWN;
-
-        for (uint32_t capability_index = 0; capability_index < profile_desc->requiredCapabilityCount; ++capability_index) {
-            const detail::VpCapabilitiesDesc& cap_desc = profile_desc->pRequiredCapabilities[capability_index];
-
-            for (uint32_t variant_index = 0; variant_index < cap_desc.variantCount; ++variant_index) {
-                const detail::VpVariantDesc& variant = cap_desc.pVariants[variant_index];
-                if (pBlockName != nullptr) {
-                    if (strcmp(variant.blockName, pBlockName) != 0) {
-                        continue;
-                    }
-                    result = VK_SUCCESS;
-                }
-
-                if (videoProfileIndex < curr_base_video_profile_index + variant.videoProfileCount) {
-                    *ppVideoProfileDesc = &variant.pVideoProfiles[videoProfileIndex - curr_base_video_profile_index];
-                    return result;
-                } else {
-                    curr_base_video_profile_index += variant.videoProfileCount;
-                }
-            }
-        }
-    }
-
-    *ppVideoProfileDesc = nullptr;
-    return VK_ERROR_UNKNOWN;
-}
-'''
-
-PUBLIC_IMPL_BODY = '''
-struct VpCapabilities_T : public VpVulkanFunctions {
-    bool singleton = false;
-    uint32_t apiVersion = VK_API_VERSION_1_0;
-
-    static VpCapabilities_T& Get() {
-        static VpCapabilities_T instance;
-        VpCapabilitiesCreateInfo createInfo{};
-        createInfo.flags = VP_PROFILE_CREATE_STATIC_BIT;
-        instance.init(&createInfo);
-        instance.singleton = true;
-        return instance;
-    }
-
-    VpCapabilities_T() {
-        this->GetInstanceProcAddr = nullptr;
-        this->GetDeviceProcAddr = nullptr;
-        this->EnumerateInstanceVersion = nullptr;
-        this->EnumerateInstanceExtensionProperties = nullptr;
-        this->EnumerateDeviceExtensionProperties = nullptr;
-        this->GetPhysicalDeviceFeatures2 = nullptr;
-        this->GetPhysicalDeviceProperties2 = nullptr;
-        this->GetPhysicalDeviceFormatProperties2 = nullptr;
-        this->GetPhysicalDeviceQueueFamilyProperties2 = nullptr;
-        this->CreateInstance = nullptr;
-        this->CreateDevice = nullptr;
-    }
-
-    VkResult init(const VpCapabilitiesCreateInfo* pCreateInfo) {
-        assert(pCreateInfo != nullptr);
-
-        return ImportVulkanFunctions(pCreateInfo);
-    }
-
-    VkResult ImportVulkanFunctions(const VpCapabilitiesCreateInfo* pCreateInfo) {
-        if (pCreateInfo->flags & VP_PROFILE_CREATE_STATIC_BIT) {
-            ImportVulkanFunctions_Static();
-        }
-
-        if (pCreateInfo->pVulkanFunctions != nullptr) {
-            ImportVulkanFunctions_Custom((VpVulkanFunctions*)pCreateInfo->pVulkanFunctions);
-        }
-/*
-        if (pCreateInfo->flags & VP_PROFILE_CREATE_DYNAMIC_BIT) {
-            ImportVulkanFunctions_Dynamic();
-        }
-*/
-        return ValidateVulkanFunctions();
-    }
-
-    void ImportVulkanFunctions_Static() {
-        // Vulkan 1.1
-        this->GetInstanceProcAddr = (PFN_vkGetInstanceProcAddr)vkGetInstanceProcAddr;
-        this->GetDeviceProcAddr = (PFN_vkGetDeviceProcAddr)vkGetDeviceProcAddr;
-
-        this->EnumerateInstanceVersion = (PFN_vkEnumerateInstanceVersion)vkEnumerateInstanceVersion;
-        this->EnumerateInstanceExtensionProperties = (PFN_vkEnumerateInstanceExtensionProperties)vkEnumerateInstanceExtensionProperties;
-        this->EnumerateDeviceExtensionProperties = (PFN_vkEnumerateDeviceExtensionProperties)vkEnumerateDeviceExtensionProperties;
-
-        this->GetPhysicalDeviceFeatures2 = (PFN_vkGetPhysicalDeviceFeatures2)vkGetPhysicalDeviceFeatures2;
-        this->GetPhysicalDeviceProperties2 = (PFN_vkGetPhysicalDeviceProperties2)vkGetPhysicalDeviceProperties2;
-        this->GetPhysicalDeviceFormatProperties2 = (PFN_vkGetPhysicalDeviceFormatProperties2)vkGetPhysicalDeviceFormatProperties2;
-        this->GetPhysicalDeviceQueueFamilyProperties2 = (PFN_vkGetPhysicalDeviceQueueFamilyProperties2)vkGetPhysicalDeviceQueueFamilyProperties2;
-
-        this->CreateInstance = (PFN_vkCreateInstance)vkCreateInstance;
-        this->CreateDevice = (PFN_vkCreateDevice)vkCreateDevice;
-    }
-
-    void ImportVulkanFunctions_Custom(VpVulkanFunctions* pFunctions) {
-    #define VP_COPY_IF_NOT_NULL(funcName) \
-        if(pFunctions->funcName != nullptr) this->funcName = pFunctions->funcName;
-
-        VP_COPY_IF_NOT_NULL(GetInstanceProcAddr);
-        VP_COPY_IF_NOT_NULL(GetDeviceProcAddr);
-
-        VP_COPY_IF_NOT_NULL(EnumerateInstanceVersion);
-        VP_COPY_IF_NOT_NULL(EnumerateInstanceExtensionProperties);
-        VP_COPY_IF_NOT_NULL(EnumerateDeviceExtensionProperties);
-
-        VP_COPY_IF_NOT_NULL(GetPhysicalDeviceFeatures2);
-        VP_COPY_IF_NOT_NULL(GetPhysicalDeviceProperties2);
-        VP_COPY_IF_NOT_NULL(GetPhysicalDeviceFormatProperties2);
-        VP_COPY_IF_NOT_NULL(GetPhysicalDeviceQueueFamilyProperties2);
-
-        VP_COPY_IF_NOT_NULL(CreateInstance);
-        VP_COPY_IF_NOT_NULL(CreateDevice);
-    #undef VP_COPY_IF_NOT_NULL
-    }
-/*
-    VkResult ImportVulkanFunctions_Dynamic() {
-        // To use VP_PROFILE_CREATE_DYNAMIC_BIT you have to pass VpVulkanFunctions::vkGetInstanceProcAddr and vkGetDeviceProcAddr as VpCapabilitiesCreateInfo::pVulkanFunctions. Other members can be null.
-        if (this->GetInstanceProcAddr == nullptr || this->GetDeviceProcAddr == nullptr) {
-            return VK_ERROR_INITIALIZATION_FAILED;
-        }
-
-    #define VP_FETCH_INSTANCE_FUNC(memberName, functionNameString) \
-        if(this->memberName == nullptr) \
-           this->memberName = (PFN_vk##memberName)this->GetInstanceProcAddr(m_hInstance, functionNameString);
-    #define VP_FETCH_DEVICE_FUNC(memberName, functionNameString) \
-        if(this->memberName == nullptr) \
-            this->memberName = (PFN_vk##memberName)this->GetDeviceProcAddr(m_hDevice, functionNameString);
-
-        VP_FETCH_INSTANCE_FUNC(GetInstanceProcAddr, "vkGetInstanceProcAddr");
-        VP_FETCH_DEVICE_FUNC(GetDeviceProcAddr, "vkGetDeviceProcAddr");
-
-        VP_FETCH_INSTANCE_FUNC(EnumerateInstanceVersion, "vkEnumerateInstanceVersion");
-        VP_FETCH_INSTANCE_FUNC(EnumerateInstanceExtensionProperties, "vkEnumerateInstanceExtensionProperties");
-        VP_FETCH_DEVICE_FUNC(EnumerateDeviceExtensionProperties, "vkEnumerateDeviceExtensionProperties");
-
-        VP_FETCH_DEVICE_FUNC(GetPhysicalDeviceFeatures2, "vkGetPhysicalDeviceFeatures2");
-        VP_FETCH_DEVICE_FUNC(GetPhysicalDeviceProperties2, "vkGetPhysicalDeviceProperties2");
-        VP_FETCH_DEVICE_FUNC(GetPhysicalDeviceFormatProperties2, "vkGetPhysicalDeviceFormatProperties2");
-        VP_FETCH_DEVICE_FUNC(GetPhysicalDeviceQueueFamilyProperties2, "vkGetPhysicalDeviceQueueFamilyProperties2");
-
-        VP_FETCH_INSTANCE_FUNC(CreateInstance, "vkCreateInstance");
-        VP_FETCH_DEVICE_FUNC(CreateDevice, "vkCreateDevice");
-    #undef VP_FETCH_DEVICE_FUNC
-    #undef VP_FETCH_INSTANCE_FUNC
-    }
-*/
-    VkResult ValidateVulkanFunctions() {
-        if (this->GetInstanceProcAddr == nullptr) {
-            return VK_ERROR_INITIALIZATION_FAILED;
-        }
-
-        if (this->GetDeviceProcAddr == nullptr) {
-            return VK_ERROR_INITIALIZATION_FAILED;
-        }
-
-        if (this->EnumerateInstanceVersion == nullptr && apiVersion >= VK_API_VERSION_1_1) {
-            return VK_ERROR_INITIALIZATION_FAILED;
-        }
-
-        if (this->EnumerateInstanceExtensionProperties == nullptr) {
-            return VK_ERROR_INITIALIZATION_FAILED;
-        }
-
-        if (this->EnumerateDeviceExtensionProperties == nullptr) {
-            return VK_ERROR_INITIALIZATION_FAILED;
-        }
-
-        if (this->GetPhysicalDeviceFeatures2 == nullptr) {
-            return apiVersion >= VK_API_VERSION_1_1 ? VK_ERROR_INITIALIZATION_FAILED : VK_ERROR_EXTENSION_NOT_PRESENT;
-        }
-
-        if (this->GetPhysicalDeviceProperties2 == nullptr) {
-            return apiVersion >= VK_API_VERSION_1_1 ? VK_ERROR_INITIALIZATION_FAILED : VK_ERROR_EXTENSION_NOT_PRESENT;
-        }
-
-        if (this->GetPhysicalDeviceFormatProperties2 == nullptr) {
-            return apiVersion >= VK_API_VERSION_1_1 ? VK_ERROR_INITIALIZATION_FAILED : VK_ERROR_EXTENSION_NOT_PRESENT;
-        }
-
-        if (this->GetPhysicalDeviceQueueFamilyProperties2 == nullptr) {
-            return apiVersion >= VK_API_VERSION_1_1 ? VK_ERROR_INITIALIZATION_FAILED : VK_ERROR_EXTENSION_NOT_PRESENT;
-        }
-
-        if (this->CreateInstance == nullptr) {
-            return VK_ERROR_INITIALIZATION_FAILED;
-        }
-
-        if (this->CreateDevice == nullptr) {
-            return VK_ERROR_INITIALIZATION_FAILED;
-        }
-
-        return VK_SUCCESS;
-    }
-};
-
-VPAPI_ATTR VkResult vpCreateCapabilities(
-    const VpCapabilitiesCreateInfo*             pCreateInfo,
-    const VkAllocationCallbacks*                pAllocator,
-    VpCapabilities*                             pCapabilities) {
-    (void)pAllocator;
-
-    VpCapabilities_T* capabilities = new VpCapabilities_T();
-    VkResult result = capabilities->init(pCreateInfo);
-    *pCapabilities = capabilities;
-
-    return result;
-}
-
-/// Destroys allocator object.
-VPAPI_ATTR void vpDestroyCapabilities(
-    VpCapabilities                              capabilities,
-    const VkAllocationCallbacks*                pAllocator) {
-    (void)pAllocator;
-    
-    delete capabilities;
-}
-
-VPAPI_ATTR VkResult vpGetProfiles(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    uint32_t*                                   pPropertyCount,
-    VpProfileProperties*                        pProperties) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    VkResult result = VK_SUCCESS;
-
-    if (pProperties == nullptr) {
-        *pPropertyCount = detail::profileCount;
-    } else {
-        if (*pPropertyCount < detail::profileCount) {
-            result = VK_INCOMPLETE;
-        } else {
-            *pPropertyCount = detail::profileCount;
-        }
-        for (uint32_t property_index = 0; property_index < *pPropertyCount; ++property_index) {
-            pProperties[property_index] = detail::profiles[property_index].props;
-        }
-    }
-    return result;
-}
-
-VPAPI_ATTR VkResult vpGetProfileRequiredProfiles(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    uint32_t*                                   pPropertyCount,
-    VpProfileProperties*                        pProperties) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    VkResult result = VK_SUCCESS;
-
-    const detail::VpProfileDesc* desc = detail::vpGetProfileDesc(pProfile->profileName);
-    if (desc == nullptr) {
-        return VK_ERROR_UNKNOWN;
-    }
-
-    if (pProperties == nullptr) {
-        *pPropertyCount = desc->requiredProfileCount;
-    } else {
-        if (*pPropertyCount < desc->requiredProfileCount) {
-            result = VK_INCOMPLETE;
-        } else {
-            *pPropertyCount = desc->requiredProfileCount;
-        }
-        for (uint32_t property_index = 0; property_index < *pPropertyCount; ++property_index) {
-            pProperties[property_index] = desc->pRequiredProfiles[property_index];
-        }
-    }
-    return result;
-}
-
-VPAPI_ATTR uint32_t vpGetProfileAPIVersion(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    const std::vector<VpProfileProperties>& gathered_profiles = detail::GatherProfiles(*pProfile, nullptr);
-
-    uint32_t major = 0;
-    uint32_t minor = 0;
-    uint32_t patch = 0;
-
-    for (std::size_t profile_index = 0, profile_count = gathered_profiles.size(); profile_index < profile_count; ++profile_index) {
-        const detail::VpProfileDesc* desc = detail::vpGetProfileDesc(gathered_profiles[profile_index].profileName);
-        if (desc == nullptr) {
-            return 0;
-        }
-
-        major = std::max<uint32_t>(major, VK_API_VERSION_MAJOR(desc->minApiVersion));
-        minor = std::max<uint32_t>(minor, VK_API_VERSION_MINOR(desc->minApiVersion));
-        patch = std::max<uint32_t>(patch, VK_API_VERSION_PATCH(desc->minApiVersion));
-    }
-
-    return VK_MAKE_API_VERSION(0, major, minor, patch);
-}
-
-VPAPI_ATTR VkResult vpGetProfileFallbacks(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    uint32_t*                                   pPropertyCount,
-    VpProfileProperties*                        pProperties) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    VkResult result = VK_SUCCESS;
-
-    const detail::VpProfileDesc* desc = detail::vpGetProfileDesc(pProfile->profileName);
-    if (desc == nullptr) {
-        return VK_ERROR_UNKNOWN;
-    }
-
-    if (pProperties == nullptr) {
-        *pPropertyCount = desc->fallbackCount;
-    } else {
-        if (*pPropertyCount < desc->fallbackCount) {
-            result = VK_INCOMPLETE;
-        } else {
-            *pPropertyCount = desc->fallbackCount;
-        }
-        for (uint32_t i = 0; i < *pPropertyCount; ++i) {
-            pProperties[i] = desc->pFallbacks[i];
-        }
-    }
-    return result;
-}
-
-VPAPI_ATTR VkResult vpHasMultipleVariantsProfile(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    VkBool32*                                   pHasMultipleVariants) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    const std::vector<VpProfileProperties>& gathered_profiles = detail::GatherProfiles(*pProfile, nullptr);
-
-    for (std::size_t profile_index = 0, profile_count = gathered_profiles.size(); profile_index < profile_count; ++profile_index) {
-        const detail::VpProfileDesc* desc = detail::vpGetProfileDesc(gathered_profiles[profile_index].profileName);
-        if (desc == nullptr) {
-            return VK_ERROR_UNKNOWN;
-        }
-
-        for (uint32_t caps_index = 0, caps_count = desc->requiredCapabilityCount; caps_index < caps_count; ++caps_index) {
-            if (desc->pRequiredCapabilities[caps_index].variantCount > 1) {
-                *pHasMultipleVariants = VK_TRUE;
-                return VK_SUCCESS;
-            }
-        }
-    }
-
-    *pHasMultipleVariants = VK_FALSE;
-    return VK_SUCCESS;
-}
-
-VPAPI_ATTR VkResult vpGetInstanceProfileVariantsSupport(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                      capabilities,
-#endif//VP_USE_OBJECT
-    const char*                         pLayerName,
-    const VpProfileProperties*          pProfile,
-    VkBool32*                           pSupported,
-    uint32_t*                           pPropertyCount,
-    VpBlockProperties*                  pProperties) {
-#ifdef VP_USE_OBJECT
-    const VpCapabilities_T& vp = capabilities == nullptr ? VpCapabilities_T::Get() : *capabilities;
-#else
-    const VpCapabilities_T& vp = VpCapabilities_T::Get();
-#endif//VP_USE_OBJECT
-
-    VkResult result = VK_SUCCESS;
-
-    uint32_t api_version = VK_API_VERSION_1_0;
-    PFN_vkEnumerateInstanceVersion pfnEnumerateInstanceVersion = vp.singleton ?
-        (PFN_vkEnumerateInstanceVersion)vkGetInstanceProcAddr(VK_NULL_HANDLE, "vkEnumerateInstanceVersion") : vp.EnumerateInstanceVersion;
-    if (pfnEnumerateInstanceVersion != nullptr) {
-        result = pfnEnumerateInstanceVersion(&api_version);
-        if (result != VK_SUCCESS) {
-            *pSupported = VK_FALSE;
-            return result;
-        } /* else {
-            VP_DEBUG_MSGF("Instance API version %u.%u.%u", VK_API_VERSION_MAJOR(api_version), VK_API_VERSION_MINOR(api_version), VK_API_VERSION_PATCH(api_version));
-        } */
-    }
-
-    uint32_t supported_instance_extension_count = 0;
-    result = vp.EnumerateInstanceExtensionProperties(pLayerName, &supported_instance_extension_count, nullptr);
-    if (result != VK_SUCCESS) {
-        *pSupported = VK_FALSE;
-        return result;
-    }
-    std::vector<VkExtensionProperties> supported_instance_extensions;
-    if (supported_instance_extension_count > 0) {
-        supported_instance_extensions.resize(supported_instance_extension_count);
-    }
-    result = vp.EnumerateInstanceExtensionProperties(pLayerName, &supported_instance_extension_count, supported_instance_extensions.data());
-    if (result != VK_SUCCESS) {
-        *pSupported = VK_FALSE;
-        return result;
-    }
+# Prefer lxml (libxml2) for parsing the registry, fall back to the pure Python ElementTree
+try:
+    # On PyPy lxml runs through the emulated C API, which is slower than the JIT compiled ElementTree
+    if sys.implementation.name == 'pypy':
+        raise ModuleNotFoundError("lxml is not used on PyPy")
+    from lxml import etree
 
-    VkBool32 supported = VK_TRUE;
-
-    // We require VK_KHR_get_physical_device_properties2 if we are on Vulkan 1.0
-    if (api_version < VK_API_VERSION_1_1) {
-        bool foundGPDP2 = false;
-        for (size_t ext_index = 0, ext_count = supported_instance_extensions.size(); ext_index < ext_count; ++ext_index) {
-            if (strcmp(supported_instance_extensions[ext_index].extensionName, VK_KHR_GET_PHYSICAL_DEVICE_PROPERTIES_2_EXTENSION_NAME) == 0) {
-                foundGPDP2 = true;
-                break;
-            }
-        }
-        if (!foundGPDP2) {
-            VP_DEBUG_MSG("Unsupported mandatory extension VK_KHR_get_physical_device_properties2 on Vulkan 1.0");
-            supported = VK_FALSE;
-        }
-    }
-
-    const detail::VpProfileDesc* pProfileDesc = detail::vpGetProfileDesc(pProfile->profileName);
-    if (pProfileDesc == nullptr) return VK_ERROR_UNKNOWN;
-
-    std::vector<VpBlockProperties> supported_blocks;
-    std::vector<VpBlockProperties> unsupported_blocks;
-
-    result = detail::vpGetInstanceProfileSupportSingleProfile(api_version, supported_instance_extensions, pProfile, &supported, supported_blocks, unsupported_blocks);
-    if (result != VK_SUCCESS) {
-        *pSupported = supported;
-        return result;
-    }
-
-    for (std::size_t required_profile_index = 0; required_profile_index < pProfileDesc->requiredProfileCount; ++required_profile_index) {
-        result = detail::vpGetInstanceProfileSupportSingleProfile(0, supported_instance_extensions, &pProfileDesc->pRequiredProfiles[required_profile_index], &supported, supported_blocks, unsupported_blocks);
-        if (result != VK_SUCCESS) {
-            *pSupported = supported;
-            return result;
-        }
-    }
-
-    const std::vector<VpBlockProperties>& blocks = supported ? supported_blocks : unsupported_blocks;
-
-    if (pProperties == nullptr) {
-        *pPropertyCount = static_cast<uint32_t>(blocks.size());
-    } else {
-        if (*pPropertyCount < static_cast<uint32_t>(blocks.size())) {
-            result = VK_INCOMPLETE;
-        } else {
-            *pPropertyCount = static_cast<uint32_t>(blocks.size());
-        }
-        for (uint32_t block_index = 0, block_count = static_cast<uint32_t>(blocks.size()); block_index < block_count; ++block_index) {
-            pProperties[block_index] = blocks[block_index];
-        }
-    }
-
-    *pSupported = supported;
-    return result;
-}
-
-VPAPI_ATTR VkResult vpGetInstanceProfileSupport(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const char*                                 pLayerName,
-    const VpProfileProperties*                  pProfile,
-    VkBool32*                                   pSupported) {
-    uint32_t count = 0;
-
-    return vpGetInstanceProfileVariantsSupport(
-#ifdef VP_USE_OBJECT
-        capabilities,
-#endif//VP_USE_OBJECT
-        pLayerName, pProfile, pSupported, &count, nullptr);
-}
-
-VPAPI_ATTR VkResult vpCreateInstance(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpInstanceCreateInfo*                 pCreateInfo,
-    const VkAllocationCallbacks*                pAllocator,
-    VkInstance*                                 pInstance) {
-#ifdef VP_USE_OBJECT
-    const VpCapabilities_T& vp = capabilities == nullptr ? VpCapabilities_T::Get() : *capabilities;
-#else
-    const VpCapabilities_T& vp = VpCapabilities_T::Get();
-#endif//VP_USE_OBJECT
-
-    if (pCreateInfo == nullptr || pInstance == nullptr) {
-        return vp.CreateInstance(pCreateInfo == nullptr ? nullptr : pCreateInfo->pCreateInfo, pAllocator, pInstance);
-    }
-
-    const std::vector<VpBlockProperties>& blocks = detail::GatherBlocks(
-        pCreateInfo->enabledFullProfileCount, pCreateInfo->pEnabledFullProfiles,
-        pCreateInfo->enabledProfileBlockCount, pCreateInfo->pEnabledProfileBlocks);
-
-    std::vector<const char*> extensions;
-    for (std::uint32_t ext_index = 0, ext_count = pCreateInfo->pCreateInfo->enabledExtensionCount; ext_index < ext_count; ++ext_index) {
-        extensions.push_back(pCreateInfo->pCreateInfo->ppEnabledExtensionNames[ext_index]);
-    }
-
-    for (std::size_t block_index = 0, block_count = blocks.size(); block_index < block_count; ++block_index) {
-        const detail::VpProfileDesc* profile_desc = detail::vpGetProfileDesc(blocks[block_index].profiles.profileName);
-        if (profile_desc == nullptr) {
-            return VK_ERROR_UNKNOWN;
-        }
-
-        for (std::size_t caps_index = 0, caps_count = profile_desc->requiredCapabilityCount; caps_index < caps_count; ++caps_index) {
-            const detail::VpCapabilitiesDesc* caps_desc = &profile_desc->pRequiredCapabilities[caps_index];
-
-            for (std::size_t variant_index = 0, variant_count = caps_desc->variantCount; variant_index < variant_count; ++variant_index) {
-                const detail::VpVariantDesc* variant = &caps_desc->pVariants[variant_index];
-
-                if (strcmp(blocks[block_index].blockName, "") != 0) {
-                    if (strcmp(variant->blockName, blocks[block_index].blockName) != 0) {
-                        continue;
-                    }
-                }
-
-                detail::GetExtensions(variant->instanceExtensionCount, variant->pInstanceExtensions, extensions);
-            }
-        }
-    }
-
-    VkApplicationInfo appInfo{VK_STRUCTURE_TYPE_APPLICATION_INFO};
-    if (pCreateInfo->pCreateInfo->pApplicationInfo != nullptr) {
-        appInfo = *pCreateInfo->pCreateInfo->pApplicationInfo;
-    } else if (!blocks.empty()) {
-        appInfo.apiVersion = vpGetProfileAPIVersion(
-#ifdef VP_USE_OBJECT
-            capabilities,
-#endif//VP_USE_OBJECT
-            &blocks[0].profiles);
-    }
-
-    VkInstanceCreateInfo createInfo = *pCreateInfo->pCreateInfo;
-    createInfo.pApplicationInfo = &appInfo;
-
-    // Need to include VK_KHR_get_physical_device_properties2 if we are on Vulkan 1.0
-    if (createInfo.pApplicationInfo->apiVersion < VK_API_VERSION_1_1) {
-        bool foundGPDP2 = false;
-        for (size_t ext_index = 0, ext_count = extensions.size(); ext_index < ext_count; ++ext_index) {
-            if (strcmp(extensions[ext_index], VK_KHR_GET_PHYSICAL_DEVICE_PROPERTIES_2_EXTENSION_NAME) == 0) {
-                foundGPDP2 = true;
-                break;
-            }
-        }
-        if (!foundGPDP2) {
-            extensions.push_back(VK_KHR_GET_PHYSICAL_DEVICE_PROPERTIES_2_EXTENSION_NAME);
-        }
-    }
-
-#ifdef __APPLE__
-    bool has_portability_ext = false;
-    for (std::size_t ext_index = 0, ext_count = extensions.size(); ext_index < ext_count; ++ext_index) {
-        if (strcmp(extensions[ext_index], VK_KHR_PORTABILITY_ENUMERATION_EXTENSION_NAME) == 0) {
-            has_portability_ext = true;
-            break;
-        }
-    }
-
-    if (!has_portability_ext) {
-        extensions.push_back(VK_KHR_PORTABILITY_ENUMERATION_EXTENSION_NAME);
-    }
-
-    createInfo.flags |= VK_INSTANCE_CREATE_ENUMERATE_PORTABILITY_BIT_KHR;
-#endif
-
-    if (!extensions.empty()) {
-        createInfo.enabledExtensionCount = static_cast<uint32_t>(extensions.size());
-        createInfo.ppEnabledExtensionNames = extensions.data();
-    }
-
-    return vp.CreateInstance(&createInfo, pAllocator, pInstance);
-}
-
-VPAPI_ATTR VkResult vpGetPhysicalDeviceProfileVariantsSupport(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    VkInstance instance,
-    VkPhysicalDevice physicalDevice,
-    const VpProfileProperties *pProfile,
-    VkBool32 *pSupported,
-    uint32_t *pPropertyCount,
-    VpBlockProperties* pProperties) {
-#ifdef VP_USE_OBJECT
-    const VpCapabilities_T& vp = capabilities == nullptr ? VpCapabilities_T::Get() : *capabilities;
-#else
-    const VpCapabilities_T& vp = VpCapabilities_T::Get();
-#endif//VP_USE_OBJECT
-
-    VkResult result = VK_SUCCESS;
-
-    uint32_t supported_device_extension_count = 0;
-    result = vp.EnumerateDeviceExtensionProperties(physicalDevice, nullptr, &supported_device_extension_count, nullptr);
-    if (result != VK_SUCCESS) {
-        return result;
-    }
-    std::vector<VkExtensionProperties> supported_device_extensions;
-    if (supported_device_extension_count > 0) {
-        supported_device_extensions.resize(supported_device_extension_count);
-    }
-    result = vp.EnumerateDeviceExtensionProperties(physicalDevice, nullptr, &supported_device_extension_count, supported_device_extensions.data());
-    if (result != VK_SUCCESS) {
-        return result;
-    }
-
-    // Workaround old loader bug where count could be smaller on the second call to vkEnumerateDeviceExtensionProperties
-    if (supported_device_extension_count > 0) {
-        supported_device_extensions.resize(supported_device_extension_count);
-    }
-
-    {
-        const detail::VpProfileDesc* pProfileDesc = detail::vpGetProfileDesc(pProfile->profileName);
-        if (pProfileDesc == nullptr) {
-            return VK_ERROR_UNKNOWN;
-        }
-    }
-
-    struct GPDP2EntryPoints {
-        PFN_vkGetPhysicalDeviceFeatures2KHR                 pfnGetPhysicalDeviceFeatures2;
-        PFN_vkGetPhysicalDeviceProperties2KHR               pfnGetPhysicalDeviceProperties2;
-        PFN_vkGetPhysicalDeviceFormatProperties2KHR         pfnGetPhysicalDeviceFormatProperties2;
-        PFN_vkGetPhysicalDeviceQueueFamilyProperties2KHR    pfnGetPhysicalDeviceQueueFamilyProperties2;
-    };
-
-#ifdef VK_KHR_video_queue
-    struct VideoInfo {
-        PFN_vkGetPhysicalDeviceVideoCapabilitiesKHR         pfnGetPhysicalDeviceVideoCapabilitiesKHR;
-        PFN_vkGetPhysicalDeviceVideoFormatPropertiesKHR     pfnGetPhysicalDeviceVideoFormatPropertiesKHR;
-        const detail::VpVideoProfileDesc*                   pProfileDesc;
-        VkVideoProfileInfoKHR                               profileInfo;
-        VkPhysicalDeviceVideoFormatInfoKHR                  formatInfo;
-        bool                                                supportedProfile;
-        uint32_t                                            matchingProfiles;
-    };
-#endif  // VK_KHR_video_queue
-
-    std::vector<VpBlockProperties> supported_blocks;
-    std::vector<VpBlockProperties> unsupported_blocks;
-
-    struct UserData {
-        VkPhysicalDevice physicalDevice;
-        std::vector<VpBlockProperties>& supported_blocks;
-        std::vector<VpBlockProperties>& unsupported_blocks;
-        const detail::VpVariantDesc* variant;
-        GPDP2EntryPoints gpdp2;
-#ifdef VK_KHR_video_queue
-        VideoInfo video;
-#endif  // VK_KHR_video_queue
-        uint32_t index;
-        detail::PFN_vpStructChainerCb pfnCb;
-        bool supported;
-    } userData{physicalDevice, supported_blocks, unsupported_blocks};
-
-    if (!vp.singleton) {
-        userData.gpdp2.pfnGetPhysicalDeviceFeatures2 = vp.GetPhysicalDeviceFeatures2;
-        userData.gpdp2.pfnGetPhysicalDeviceProperties2 = vp.GetPhysicalDeviceProperties2;
-        userData.gpdp2.pfnGetPhysicalDeviceFormatProperties2 = vp.GetPhysicalDeviceFormatProperties2;
-        userData.gpdp2.pfnGetPhysicalDeviceQueueFamilyProperties2 = vp.GetPhysicalDeviceQueueFamilyProperties2;
-    }
-
-    // Attempt to load core versions of the GPDP2 entry points
-    if (userData.gpdp2.pfnGetPhysicalDeviceFeatures2 == nullptr) {
-        userData.gpdp2.pfnGetPhysicalDeviceFeatures2 =
-            (PFN_vkGetPhysicalDeviceFeatures2KHR)vkGetInstanceProcAddr(instance, "vkGetPhysicalDeviceFeatures2");
-        userData.gpdp2.pfnGetPhysicalDeviceProperties2 =
-            (PFN_vkGetPhysicalDeviceProperties2KHR)vkGetInstanceProcAddr(instance, "vkGetPhysicalDeviceProperties2");
-        userData.gpdp2.pfnGetPhysicalDeviceFormatProperties2 =
-            (PFN_vkGetPhysicalDeviceFormatProperties2KHR)vkGetInstanceProcAddr(instance, "vkGetPhysicalDeviceFormatProperties2");
-        userData.gpdp2.pfnGetPhysicalDeviceQueueFamilyProperties2 =
-            (PFN_vkGetPhysicalDeviceQueueFamilyProperties2KHR)vkGetInstanceProcAddr(instance, "vkGetPhysicalDeviceQueueFamilyProperties2");
-    }
-
-    // If not successful, try to load KHR variant
-    if (userData.gpdp2.pfnGetPhysicalDeviceFeatures2 == nullptr) {
-        userData.gpdp2.pfnGetPhysicalDeviceFeatures2 =
-            (PFN_vkGetPhysicalDeviceFeatures2KHR)vkGetInstanceProcAddr(instance, "vkGetPhysicalDeviceFeatures2KHR");
-        userData.gpdp2.pfnGetPhysicalDeviceProperties2 =
-            (PFN_vkGetPhysicalDeviceProperties2KHR)vkGetInstanceProcAddr(instance, "vkGetPhysicalDeviceProperties2KHR");
-        userData.gpdp2.pfnGetPhysicalDeviceFormatProperties2 =
-            (PFN_vkGetPhysicalDeviceFormatProperties2KHR)vkGetInstanceProcAddr(instance, "vkGetPhysicalDeviceFormatProperties2KHR");
-        userData.gpdp2.pfnGetPhysicalDeviceQueueFamilyProperties2 =
-            (PFN_vkGetPhysicalDeviceQueueFamilyProperties2KHR)vkGetInstanceProcAddr(instance, "vkGetPhysicalDeviceQueueFamilyProperties2KHR");
-    }
-
-    if (userData.gpdp2.pfnGetPhysicalDeviceFeatures2 == nullptr ||
-        userData.gpdp2.pfnGetPhysicalDeviceProperties2 == nullptr ||
-        userData.gpdp2.pfnGetPhysicalDeviceFormatProperties2 == nullptr ||
-        userData.gpdp2.pfnGetPhysicalDeviceQueueFamilyProperties2 == nullptr) {
-        return VK_ERROR_EXTENSION_NOT_PRESENT;
-    }
-
-#ifdef VK_KHR_video_queue
-    PFN_vkGetInstanceProcAddr gipa = vp.singleton ? vkGetInstanceProcAddr : vp.GetInstanceProcAddr;
-    userData.video.pfnGetPhysicalDeviceVideoCapabilitiesKHR =
-        (PFN_vkGetPhysicalDeviceVideoCapabilitiesKHR)gipa(instance, "vkGetPhysicalDeviceVideoCapabilitiesKHR");
-    userData.video.pfnGetPhysicalDeviceVideoFormatPropertiesKHR =
-        (PFN_vkGetPhysicalDeviceVideoFormatPropertiesKHR)gipa(instance, "vkGetPhysicalDeviceVideoFormatPropertiesKHR");
-#endif  // VK_KHR_video_queue
-
-    bool supported = true;
-
-    const std::vector<VpProfileProperties>& gathered_profiles = detail::GatherProfiles(*pProfile);
-
-    for (std::size_t profile_index = 0, profile_count = gathered_profiles.size(); profile_index < profile_count; ++profile_index) {
-        const char* profile_name = gathered_profiles[profile_index].profileName;
-
-        const detail::VpProfileDesc* profile_desc = detail::vpGetProfileDesc(profile_name);
-        if (profile_desc == nullptr) {
-            return VK_ERROR_UNKNOWN;
-        }
-
-        bool supported_profile = true;
-
-        if (profile_desc->props.specVersion < gathered_profiles[profile_index].specVersion) {
-            VP_DEBUG_MSGF("Unsupported requested %s profile version: %u, profile supported at version %u", profile_name, profile_desc->props.specVersion, pProfile->specVersion);
-            supported_profile = false;
-        }
-
-        VpBlockProperties block{gathered_profiles[profile_index], profile_desc->minApiVersion};
-
-        {
-            VkPhysicalDeviceProperties2KHR properties2{ VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROPERTIES_2_KHR };
-            userData.gpdp2.pfnGetPhysicalDeviceProperties2(physicalDevice, &properties2);
-            if (!detail::vpCheckVersion(properties2.properties.apiVersion, profile_desc->minApiVersion)) {
-                VP_DEBUG_MSGF("Unsupported API version: %u.%u.%u", VK_API_VERSION_MAJOR(profile_desc->minApiVersion), VK_API_VERSION_MINOR(profile_desc->minApiVersion), VK_API_VERSION_PATCH(profile_desc->minApiVersion));
-                supported_profile = false;
-            }
-        }
-
-        for (uint32_t required_capability_index = 0; required_capability_index < profile_desc->requiredCapabilityCount; ++required_capability_index) {
-            const detail::VpCapabilitiesDesc* required_capabilities = &profile_desc->pRequiredCapabilities[required_capability_index];
-
-            bool supported_block = false;
-
-            for (uint32_t variant_index = 0; variant_index < required_capabilities->variantCount; ++variant_index) {
-                const detail::VpVariantDesc& variant_desc = required_capabilities->pVariants[variant_index];
-
-                bool supported_variant = true;
-
-                for (uint32_t ext_index = 0; ext_index < variant_desc.deviceExtensionCount; ++ext_index) {
-                    const char *requested_extension = variant_desc.pDeviceExtensions[ext_index].extensionName;
-                    if (!detail::CheckExtension(supported_device_extensions.data(), supported_device_extensions.size(), requested_extension)) {
-                        supported_variant = false;
-                    }
-                }
-
-                userData.variant = &variant_desc;
-
-                VkPhysicalDeviceFeatures2KHR features{ VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2_KHR };
-                userData.variant->chainers.pfnFeature(
-                    static_cast<VkBaseOutStructure*>(static_cast<void*>(&features)), &userData,
-                    [](VkBaseOutStructure* p, void* pUser) {
-                        UserData* pUserData = static_cast<UserData*>(pUser);
-                        pUserData->gpdp2.pfnGetPhysicalDeviceFeatures2(
-                            pUserData->physicalDevice,
-                            static_cast<VkPhysicalDeviceFeatures2KHR*>(static_cast<void*>(p)));
-
-                        pUserData->supported = true;
-                        while (p != nullptr) {
-                            if (!pUserData->variant->feature.pfnComparator(p)) {
-                                pUserData->supported = false;
-                            }
-                            p = p->pNext;
-                        }
-                    }
-                );
-                if (!userData.supported) {
-                    supported_variant = false;
-                }
-
-                VkPhysicalDeviceProperties2KHR device_properties2{ VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_PROPERTIES_2_KHR };
-                userData.variant->chainers.pfnProperty(
-                    static_cast<VkBaseOutStructure*>(static_cast<void*>(&device_properties2)), &userData,
-                    [](VkBaseOutStructure* p, void* pUser) {
-                        UserData* pUserData = static_cast<UserData*>(pUser);
-                        pUserData->gpdp2.pfnGetPhysicalDeviceProperties2(
-                            pUserData->physicalDevice,
-                            static_cast<VkPhysicalDeviceProperties2KHR*>(static_cast<void*>(p)));
-
-                        pUserData->supported = true;
-                        while (p != nullptr) {
-                            if (!pUserData->variant->property.pfnComparator(p)) {
-                                pUserData->supported = false;
-                            }
-                            p = p->pNext;
-                        }
-                    }
-                );
-                if (!userData.supported) {
-                    supported_variant = false;
-                }
-
-                if (userData.variant->queueFamilyCount > 0) {
-                    uint32_t queue_family_count = 0;
-                    userData.gpdp2.pfnGetPhysicalDeviceQueueFamilyProperties2(physicalDevice, &queue_family_count, nullptr);
-                    std::vector<VkQueueFamilyProperties2KHR> queueFamilyProps(queue_family_count, { VK_STRUCTURE_TYPE_QUEUE_FAMILY_PROPERTIES_2_KHR });
-                    userData.variant->chainers.pfnQueueFamily(
-                        queue_family_count, static_cast<VkBaseOutStructure*>(static_cast<void*>(queueFamilyProps.data())), &userData,
-                        [](uint32_t queue_family_count, VkBaseOutStructure* pBaseArray, void* pUser) {
-                            UserData* pUserData = static_cast<UserData*>(pUser);
-                            VkQueueFamilyProperties2KHR* pArray = static_cast<VkQueueFamilyProperties2KHR*>(static_cast<void*>(pBaseArray));
-                            pUserData->gpdp2.pfnGetPhysicalDeviceQueueFamilyProperties2(pUserData->physicalDevice, &queue_family_count, pArray);
-                            pUserData->supported = true;
-                            for (uint32_t profile_qf_idx = 0; profile_qf_idx < pUserData->variant->queueFamilyCount; ++profile_qf_idx) {
-                                bool found_matching = false;
-                                for (uint32_t queue_family_index = 0; queue_family_index < queue_family_count; ++queue_family_index) {
-                                    bool this_matches = true;
-                                    VkBaseOutStructure* p = static_cast<VkBaseOutStructure*>(static_cast<void*>(&pArray[queue_family_index]));
-                                    while (p != nullptr) {
-                                        if (!pUserData->variant->pQueueFamilies[profile_qf_idx].pfnComparator(p)) {
-                                            this_matches = false;
-                                        }
-                                        p = p->pNext;
-                                    }
-                                    if (this_matches) {
-                                        found_matching = true;
-                                        break;
-                                    }
-                                }
-                                if (!found_matching) {
-                                    pUserData->supported = false;
-                                    break;
-                                }
-                            }
-                        }
-                    );
-                    if (!userData.supported) {
-                        supported_variant = false;
-                    }
-                }
-
-                for (uint32_t format_index = 0; format_index < userData.variant->formatCount && supported_variant; ++format_index) {
-                    userData.index = format_index;
-                    VkFormatProperties2KHR format_properties2{ VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_2_KHR };
-                    userData.variant->chainers.pfnFormat(
-                        static_cast<VkBaseOutStructure*>(static_cast<void*>(&format_properties2)), &userData,
-                        [](VkBaseOutStructure* p, void* pUser) {
-                            UserData* pUserData = static_cast<UserData*>(pUser);
-                            pUserData->gpdp2.pfnGetPhysicalDeviceFormatProperties2(
-                                pUserData->physicalDevice,
-                                pUserData->variant->pFormats[pUserData->index].format,
-                                static_cast<VkFormatProperties2KHR*>(static_cast<void*>(p)));
-                            pUserData->supported = true;
-                            while (p != nullptr) {
-                                if (!pUserData->variant->pFormats[pUserData->index].pfnComparator(p)) {
-                                    pUserData->supported = false;
-                                }
-                                p = p->pNext;
-                            }
-                        }
-                    );
-                    if (!userData.supported) {
-                        supported_variant = false;
-                    }
-                }
-
-#ifdef VK_KHR_video_queue
-                if (userData.variant->videoProfileCount > 0) {
-                    VkVideoProfileListInfoKHR profile_list{ VK_STRUCTURE_TYPE_VIDEO_PROFILE_LIST_INFO_KHR };
-                    profile_list.profileCount = 1;
-                    profile_list.pProfiles = &userData.video.profileInfo;
-                    userData.video.formatInfo.sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VIDEO_FORMAT_INFO_KHR;
-                    userData.video.formatInfo.pNext = &profile_list;
-
-                    if (userData.video.pfnGetPhysicalDeviceVideoCapabilitiesKHR != nullptr &&
-                        userData.video.pfnGetPhysicalDeviceVideoFormatPropertiesKHR != nullptr) {
-                        for (uint32_t video_profile_index = 0; video_profile_index < userData.variant->videoProfileCount; ++video_profile_index) {
-                            userData.video.profileInfo = VkVideoProfileInfoKHR{ VK_STRUCTURE_TYPE_VIDEO_PROFILE_INFO_KHR };
-                            userData.video.pProfileDesc = &userData.variant->pVideoProfiles[video_profile_index];
-                            userData.supported = true;
-                            userData.video.matchingProfiles = 0;
-
-                            detail::vpForEachMatchingVideoProfiles(&userData.video.profileInfo, &userData,
-                                [](VkBaseOutStructure* p, void* pUser) {
-                                    UserData* pUserData = static_cast<UserData*>(pUser);
-                                    while (p != nullptr) {
-                                        if (!pUserData->video.pProfileDesc->info.pfnComparator(p)) {
-                                            return;
-                                        }
-                                        p = p->pNext;
-                                    }
-
-                                    pUserData->video.supportedProfile = true;
-
-                                    VkVideoCapabilitiesKHR capabilities{ VK_STRUCTURE_TYPE_VIDEO_CAPABILITIES_KHR };
-                                    pUserData->video.pProfileDesc->chainers.pfnCapability(
-                                        static_cast<VkBaseOutStructure*>(static_cast<void*>(&capabilities)), pUserData,
-                                        [](VkBaseOutStructure* p, void* pUser) {
-                                            UserData* pUserData = static_cast<UserData*>(pUser);
-                                            VkResult result = pUserData->video.pfnGetPhysicalDeviceVideoCapabilitiesKHR(
-                                                pUserData->physicalDevice,
-                                                &pUserData->video.profileInfo,
-                                                static_cast<VkVideoCapabilitiesKHR*>(static_cast<void*>(p)));
-                                            if (result != VK_SUCCESS) {
-                                                pUserData->video.supportedProfile = false;
-                                                return;
-                                            }
-                                            while (p != nullptr) {
-                                                if (!pUserData->video.pProfileDesc->capability.pfnComparator(p)) {
-                                                    pUserData->supported = false;
-                                                }
-                                                p = p->pNext;
-                                            }
-                                        }
-                                    );
-
-                                    if (pUserData->video.supportedProfile) {
-                                        pUserData->video.matchingProfiles++;
-                                    } else {
-                                        return;
-                                    }
-
-                                    std::vector<VkVideoFormatPropertiesKHR> format_props;
-                                    for (uint32_t format_index = 0; format_index < pUserData->video.pProfileDesc->formatCount; ++format_index) {
-                                        pUserData->index = format_index;
-                                        {
-                                            VkVideoFormatPropertiesKHR tmp_props{ VK_STRUCTURE_TYPE_VIDEO_FORMAT_PROPERTIES_KHR };
-                                            pUserData->video.pProfileDesc->pFormats[format_index].pfnFiller(static_cast<VkBaseOutStructure*>(static_cast<void*>(&tmp_props)));
-                                            pUserData->video.formatInfo.imageUsage = tmp_props.imageUsageFlags;
-                                        }
-
-                                        uint32_t format_count = 0;
-                                        pUserData->video.pfnGetPhysicalDeviceVideoFormatPropertiesKHR(pUserData->physicalDevice, &pUserData->video.formatInfo, &format_count, nullptr);
-                                        format_props.resize(format_count, { VK_STRUCTURE_TYPE_VIDEO_FORMAT_PROPERTIES_KHR });
-                                        pUserData->video.pProfileDesc->chainers.pfnFormat(
-                                            format_count, static_cast<VkBaseOutStructure*>(static_cast<void*>(format_props.data())), pUserData,
-                                            [](uint32_t format_count, VkBaseOutStructure* pBaseArray, void* pUser) {
-                                                UserData* pUserData = static_cast<UserData*>(pUser);
-                                                VkVideoFormatPropertiesKHR* pArray = static_cast<VkVideoFormatPropertiesKHR*>(static_cast<void*>(pBaseArray));
-                                                pUserData->video.pfnGetPhysicalDeviceVideoFormatPropertiesKHR(pUserData->physicalDevice, &pUserData->video.formatInfo, &format_count, pArray);
-                                                bool found_matching = false;
-                                                for (uint32_t i = 0; i < format_count; ++i) {
-                                                    bool this_matches = true;
-                                                    VkBaseOutStructure* p = static_cast<VkBaseOutStructure*>(static_cast<void*>(&pArray[i]));
-                                                    while (p != nullptr) {
-                                                        if (!pUserData->video.pProfileDesc->pFormats[pUserData->index].pfnComparator(p)) {
-                                                            this_matches = false;
-                                                        }
-                                                        p = p->pNext;
-                                                    }
-                                                    if (this_matches) {
-                                                        found_matching = true;
-                                                        break;
-                                                    }
-                                                }
-                                                if (!found_matching) {
-                                                    pUserData->supported = false;
-                                                }
-                                            }
-                                        );
-                                    }
-                                }
-                            );
-                            if (!userData.supported || userData.video.matchingProfiles == 0) {
-                                supported_variant = false;
-                            }
-                        }
-                    } else {
-                        supported_variant = false;
-                    }
-                }
-#endif  // VK_KHR_video_queue
-
-                memcpy(block.blockName, variant_desc.blockName, VP_MAX_PROFILE_NAME_SIZE * sizeof(char));
-                if (supported_variant) {
-                    supported_blocks.push_back(block);
-                    supported_block = true;
-                    break;
-                } else {
-                    unsupported_blocks.push_back(block);
-                }
-            }
-
-            if (!supported_block) {
-                supported_profile = false;
-            }
-        }
-
-        if (!supported_profile) {
-            supported = false;
-        }
-    }
-
-    const std::vector<VpBlockProperties>& blocks = supported ? supported_blocks : unsupported_blocks;
-
-    if (pProperties == nullptr) {
-        *pPropertyCount = static_cast<uint32_t>(blocks.size());
-    } else {
-        if (*pPropertyCount < static_cast<uint32_t>(blocks.size())) {
-            result = VK_INCOMPLETE;
-        } else {
-            *pPropertyCount = static_cast<uint32_t>(blocks.size());
-        }
-        for (uint32_t i = 0, n = static_cast<uint32_t>(blocks.size()); i < n; ++i) {
-            pProperties[i] = blocks[i];
-        }
-    }
-
-    *pSupported = supported ? VK_TRUE : VK_FALSE;
-    return VK_SUCCESS;
-}
-
-VPAPI_ATTR VkResult vpGetPhysicalDeviceProfileSupport(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    VkInstance                                  instance,
-    VkPhysicalDevice                            physicalDevice,
-    const VpProfileProperties*                  pProfile,
-    VkBool32 *pSupported) {
-    uint32_t count = 0;
-
-    return vpGetPhysicalDeviceProfileVariantsSupport(
-#ifdef VP_USE_OBJECT
-        capabilities,
-#endif//VP_USE_OBJECT
-        instance, physicalDevice, pProfile, pSupported, &count, nullptr);
-}
-
-VPAPI_ATTR VkResult vpCreateDevice(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    VkPhysicalDevice                            physicalDevice,
-    const VpDeviceCreateInfo*                   pCreateInfo,
-    const VkAllocationCallbacks*                pAllocator,
-    VkDevice*                                   pDevice) {
-#ifdef VP_USE_OBJECT
-    const VpCapabilities_T& vp = capabilities == nullptr ? VpCapabilities_T::Get() : *capabilities;
-#else
-    const VpCapabilities_T& vp = VpCapabilities_T::Get();
-#endif//VP_USE_OBJECT
-
-    if (physicalDevice == VK_NULL_HANDLE || pCreateInfo == nullptr || pDevice == nullptr) {
-        return vp.CreateDevice(physicalDevice, pCreateInfo == nullptr ? nullptr : pCreateInfo->pCreateInfo, pAllocator, pDevice);
-    }
-
-    const std::vector<VpBlockProperties>& blocks = detail::GatherBlocks(
-        pCreateInfo->enabledFullProfileCount, pCreateInfo->pEnabledFullProfiles,
-        pCreateInfo->enabledProfileBlockCount, pCreateInfo->pEnabledProfileBlocks);
-
-    std::unique_ptr<detail::FeaturesChain> chain = std::make_unique<detail::FeaturesChain>();
-    std::vector<VkStructureType> structureTypes;
-
-    std::vector<const char*> extensions;
-    for (std::uint32_t ext_index = 0, ext_count = pCreateInfo->pCreateInfo->enabledExtensionCount; ext_index < ext_count; ++ext_index) {
-        extensions.push_back(pCreateInfo->pCreateInfo->ppEnabledExtensionNames[ext_index]);
-    }
-
-    for (std::size_t block_index = 0, block_count = blocks.size(); block_index < block_count; ++block_index) {
-        const detail::VpProfileDesc* pProfileDesc = detail::vpGetProfileDesc(blocks[block_index].profiles.profileName);
-        if (pProfileDesc == nullptr) return VK_ERROR_UNKNOWN;
-
-        for (std::size_t caps_index = 0, caps_count = pProfileDesc->requiredCapabilityCount; caps_index < caps_count; ++caps_index) {
-            const detail::VpCapabilitiesDesc* pCapsDesc = &pProfileDesc->pRequiredCapabilities[caps_index];
-
-            for (std::size_t variant_index = 0, variant_count = pCapsDesc->variantCount; variant_index < variant_count; ++variant_index) {
-                const detail::VpVariantDesc* variant = &pCapsDesc->pVariants[variant_index];
-
-                if (strcmp(blocks[block_index].blockName, "") != 0) {
-                    if (strcmp(variant->blockName, blocks[block_index].blockName) != 0) {
-                        continue;
-                    }
-                }
-
-                for (uint32_t type_index = 0; type_index < variant->featureStructTypeCount; ++type_index) {
-                    const VkStructureType type = variant->pFeatureStructTypes[type_index];
-                    if (std::find(structureTypes.begin(), structureTypes.end(), type) == std::end(structureTypes)) {
-                        structureTypes.push_back(type);
-                    }
-                }
-
-                detail::GetExtensions(variant->deviceExtensionCount, variant->pDeviceExtensions, extensions);
-            }
-        }
-    }
-
-    VkBaseOutStructure* pNext = static_cast<VkBaseOutStructure*>(const_cast<void*>(pCreateInfo->pCreateInfo->pNext));
-    detail::GatherStructureTypes(structureTypes, pNext);
-
-    chain->Build(structureTypes);
-
-    VkPhysicalDeviceFeatures2KHR* pFeatures = &chain->requiredFeaturesChain;
-    if (pCreateInfo->pCreateInfo->pEnabledFeatures) {
-        pFeatures->features = *pCreateInfo->pCreateInfo->pEnabledFeatures;
-    }
-
-    for (std::size_t block_index = 0, block_count = blocks.size(); block_index < block_count; ++block_index) {
-        const detail::VpProfileDesc* pProfileDesc = detail::vpGetProfileDesc(blocks[block_index].profiles.profileName);
-        if (pProfileDesc == nullptr) {
-            return VK_ERROR_UNKNOWN;
-        }
-
-        for (std::size_t caps_index = 0, caps_count = pProfileDesc->requiredCapabilityCount; caps_index < caps_count; ++caps_index) {
-            const detail::VpCapabilitiesDesc* pCapsDesc = &pProfileDesc->pRequiredCapabilities[caps_index];
-
-            for (std::size_t variant_index = 0, variant_count = pCapsDesc->variantCount; variant_index < variant_count; ++variant_index) {
-                const detail::VpVariantDesc* variant = &pCapsDesc->pVariants[variant_index];
-
-                VkBaseOutStructure* base_ptr = reinterpret_cast<VkBaseOutStructure*>(pFeatures);
-                if (variant->feature.pfnFiller != nullptr) {
-                    while (base_ptr != nullptr) {
-                        variant->feature.pfnFiller(base_ptr);
-                        base_ptr = base_ptr->pNext;
-                    }
-                }
-            }
-        }
-    }
-
-    chain->ApplyFeatures(pCreateInfo);
-
-    if (pCreateInfo->flags & VP_DEVICE_CREATE_DISABLE_ROBUST_BUFFER_ACCESS_BIT) {
-        pFeatures->features.robustBufferAccess = VK_FALSE;
-    }
-
-    VkDeviceCreateInfo createInfo{VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO};
-    createInfo.pNext = &chain->requiredFeaturesChain;
-    createInfo.queueCreateInfoCount = pCreateInfo->pCreateInfo->queueCreateInfoCount;
-    createInfo.pQueueCreateInfos = pCreateInfo->pCreateInfo->pQueueCreateInfos;
-    createInfo.enabledExtensionCount = static_cast<uint32_t>(extensions.size());
-    createInfo.ppEnabledExtensionNames = extensions.data();
-
-    return vp.CreateDevice(physicalDevice, &createInfo, pAllocator, pDevice);
-}
-
-VPAPI_ATTR VkResult vpGetProfileInstanceExtensionProperties(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pPropertyCount,
-    VkExtensionProperties*                      pProperties) {
-    return detail::vpGetProfileExtensionProperties(
-#ifdef VP_USE_OBJECT
-        capabilities,
-#endif//VP_USE_OBJECT
-        pProfile, pBlockName, detail::EXTENSION_INSTANCE, pPropertyCount, pProperties);
-}
-
-VPAPI_ATTR VkResult vpGetProfileDeviceExtensionProperties(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pPropertyCount,
-    VkExtensionProperties*                      pProperties) {
-    return detail::vpGetProfileExtensionProperties(
-#ifdef VP_USE_OBJECT
-        capabilities,
-#endif//VP_USE_OBJECT
-        pProfile, pBlockName, detail::EXTENSION_DEVICE, pPropertyCount, pProperties);
-}
-
-VPAPI_ATTR VkResult vpGetProfileFeatures(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    void*                                       pNext) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    VkResult result = pBlockName == nullptr ? VK_SUCCESS : VK_INCOMPLETE;
-
-    const std::vector<VpProfileProperties>& gathered_profiles = detail::GatherProfiles(*pProfile);
-
-    for (std::size_t profile_index = 0, profile_count = gathered_profiles.size(); profile_index < profile_count; ++profile_index) {
-        const detail::VpProfileDesc* profile_desc = detail::vpGetProfileDesc(gathered_profiles[profile_index].profileName);
-        if (profile_desc == nullptr) return VK_ERROR_UNKNOWN;
-
-        for (uint32_t capability_index = 0; capability_index < profile_desc->requiredCapabilityCount; ++capability_index) {
-            const detail::VpCapabilitiesDesc& cap_desc = profile_desc->pRequiredCapabilities[capability_index];
-
-            for (uint32_t variant_index = 0; variant_index < cap_desc.variantCount; ++variant_index) {
-                const detail::VpVariantDesc& variant = cap_desc.pVariants[variant_index];
-                if (pBlockName != nullptr) {
-                    if (strcmp(variant.blockName, pBlockName) != 0) {
-                        continue;
-                    }
-                    result = VK_SUCCESS;
-                }
-
-                if (variant.feature.pfnFiller == nullptr) continue;
-
-                VkBaseOutStructure* p = static_cast<VkBaseOutStructure*>(pNext);
-                while (p != nullptr) {
-                    variant.feature.pfnFiller(p);
-                    p = p->pNext;
-                }
-            }
-        }
-    }
-
-    return result;
-}
-
-VPAPI_ATTR VkResult vpGetProfileProperties(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    void*                                       pNext) {
-    VkResult result = pBlockName == nullptr ? VK_SUCCESS : VK_INCOMPLETE;
-
-    VkBool32 multiple_variants = VK_FALSE;
-    if (vpHasMultipleVariantsProfile(
-#ifdef VP_USE_OBJECT
-        capabilities,
-#endif//VP_USE_OBJECT
-        pProfile,
-        &multiple_variants) == VK_ERROR_UNKNOWN) {
-        return VK_ERROR_UNKNOWN;
-    }
-    if (multiple_variants == VK_TRUE && pBlockName == nullptr) {
-        return VK_ERROR_UNKNOWN;
-    }
-
-    const std::vector<VpProfileProperties>& gathered_profiles = detail::GatherProfiles(*pProfile);
-
-    for (std::size_t profile_index = 0, profile_count = gathered_profiles.size(); profile_index < profile_count; ++profile_index) {
-        const detail::VpProfileDesc* profile_desc = detail::vpGetProfileDesc(gathered_profiles[profile_index].profileName);
-        if (profile_desc == nullptr) return VK_ERROR_UNKNOWN;
-
-        for (uint32_t capability_index = 0; capability_index < profile_desc->requiredCapabilityCount; ++capability_index) {
-            const detail::VpCapabilitiesDesc& cap_desc = profile_desc->pRequiredCapabilities[capability_index];
-
-            for (uint32_t variant_index = 0; variant_index < cap_desc.variantCount; ++variant_index) {
-                const detail::VpVariantDesc& variant = cap_desc.pVariants[variant_index];
-                if (pBlockName != nullptr) {
-                    if (strcmp(variant.blockName, pBlockName) != 0) {
-                        continue;
-                    }
-                    result = VK_SUCCESS;
-                }
-
-                if (variant.property.pfnFiller == nullptr) continue;
-
-                VkBaseOutStructure* p = static_cast<VkBaseOutStructure*>(pNext);
-                while (p != nullptr) {
-                    variant.property.pfnFiller(p);
-                    p = p->pNext;
-                }
-            }
-        }
-    }
-
-    return result;
-}
-
-VPAPI_ATTR VkResult vpGetProfileQueueFamilyProperties(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pPropertyCount,
-    VkQueueFamilyProperties2KHR*                pProperties) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    if (pPropertyCount == nullptr) return VK_ERROR_UNKNOWN;
-
-    VkResult result = pBlockName == nullptr ? VK_SUCCESS : VK_INCOMPLETE;
-
-    const std::vector<VpProfileProperties>& gathered_profiles = detail::GatherProfiles(*pProfile);
-
-    uint32_t total_queue_family_count = 0;
-
-    for (std::size_t profile_index = 0, profile_count = gathered_profiles.size(); profile_index < profile_count; ++profile_index) {
-        const detail::VpProfileDesc* profile_desc = detail::vpGetProfileDesc(gathered_profiles[profile_index].profileName);
-        if (profile_desc == nullptr) return VK_ERROR_UNKNOWN;
-
-        for (uint32_t capability_index = 0; capability_index < profile_desc->requiredCapabilityCount; ++capability_index) {
-            const detail::VpCapabilitiesDesc& cap_desc = profile_desc->pRequiredCapabilities[capability_index];
-
-            for (uint32_t variant_index = 0; variant_index < cap_desc.variantCount; ++variant_index) {
-                const detail::VpVariantDesc& variant = cap_desc.pVariants[variant_index];
-                if (pBlockName != nullptr) {
-                    if (strcmp(variant.blockName, pBlockName) != 0) {
-                        continue;
-                    }
-                    result = VK_SUCCESS;
-                }
-
-                if (pProperties != nullptr) {
-                    for (uint32_t i = 0; i < variant.queueFamilyCount; ++i) {
-                        if (total_queue_family_count < *pPropertyCount) {
-                            if (variant.pQueueFamilies[i].pfnFiller == nullptr) continue;
-
-                            VkBaseOutStructure* p = reinterpret_cast<VkBaseOutStructure*>(pProperties);
-                            while (p != nullptr) {
-                                variant.pQueueFamilies[i].pfnFiller(p);
-                                p = p->pNext;
-                            }
-
-                            total_queue_family_count++;
-                            pProperties++;
-                        } else {
-                            result = VK_INCOMPLETE;
-                            break;
-                        }
-                    }
-                } else {
-                    total_queue_family_count += variant.queueFamilyCount;
-                }
-            }
-        }
-    }
-
-    *pPropertyCount = total_queue_family_count;
-    return result;
-}
-
-VPAPI_ATTR VkResult vpGetProfileFormats(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pFormatCount,
-    VkFormat*                                   pFormats) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    VkResult result = pBlockName == nullptr ? VK_SUCCESS : VK_INCOMPLETE;
-
-    std::vector<VkFormat> results;
-
-    const std::vector<VpProfileProperties>& gathered_profiles = detail::GatherProfiles(*pProfile);
-
-    for (std::size_t profile_index = 0, profile_count = gathered_profiles.size(); profile_index < profile_count; ++profile_index) {
-        const detail::VpProfileDesc* profile_desc = detail::vpGetProfileDesc(gathered_profiles[profile_index].profileName);
-        if (profile_desc == nullptr) return VK_ERROR_UNKNOWN;
-
-        for (uint32_t capability_index = 0; capability_index < profile_desc->requiredCapabilityCount; ++capability_index) {
-            const detail::VpCapabilitiesDesc& cap_desc = profile_desc->pRequiredCapabilities[capability_index];
-
-            for (uint32_t variant_index = 0; variant_index < cap_desc.variantCount; ++variant_index) {
-                const detail::VpVariantDesc& variant = cap_desc.pVariants[variant_index];
-                if (pBlockName != nullptr) {
-                    if (strcmp(variant.blockName, pBlockName) != 0) {
-                        continue;
-                    }
-                    result = VK_SUCCESS;
-                }
-
-                for (uint32_t format_index = 0; format_index < variant.formatCount; ++format_index) {
-                    if (std::find(results.begin(), results.end(), variant.pFormats[format_index].format) == std::end(results)) {
-                        results.push_back(variant.pFormats[format_index].format);
-                    }
-                }
-            }
-        }
-    }
-
-    const uint32_t count = static_cast<uint32_t>(results.size());
-
-    if (pFormats == nullptr) {
-        *pFormatCount = count;
-    } else {
-        if (*pFormatCount < count) {
-            result = VK_INCOMPLETE;
-        } else {
-            *pFormatCount = count;
-        }
-
-        if (*pFormatCount > 0) {
-            memcpy(pFormats, &results[0], *pFormatCount * sizeof(VkFormat));
-        }
-    }
-    return result;
-}
-
-VPAPI_ATTR VkResult vpGetProfileFormatProperties(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    VkFormat                                    format,
-    void*                                       pNext) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    VkResult result = pBlockName == nullptr ? VK_SUCCESS : VK_INCOMPLETE;
-
-    const std::vector<VpProfileProperties>& gathered_profiles = detail::GatherProfiles(*pProfile);
-
-    for (std::size_t profile_index = 0, profile_count = gathered_profiles.size(); profile_index < profile_count; ++profile_index) {
-        const char* profile_name = gathered_profiles[profile_index].profileName;
-
-        const detail::VpProfileDesc* pProfileDesc = detail::vpGetProfileDesc(profile_name);
-        if (pProfileDesc == nullptr) return VK_ERROR_UNKNOWN;
-
-        for (uint32_t required_capability_index = 0; required_capability_index < pProfileDesc->requiredCapabilityCount;
-                ++required_capability_index) {
-            const detail::VpCapabilitiesDesc& required_capabilities = pProfileDesc->pRequiredCapabilities[required_capability_index];
-
-            for (uint32_t required_variant_index = 0; required_variant_index < required_capabilities.variantCount; ++required_variant_index) {
-                const detail::VpVariantDesc& variant = required_capabilities.pVariants[required_variant_index];
-                if (pBlockName != nullptr) {
-                    if (strcmp(variant.blockName, pBlockName) != 0) {
-                        continue;
-                    }
-                    result = VK_SUCCESS;
-                }
-
-                for (uint32_t format_index = 0; format_index < variant.formatCount; ++format_index) {
-                    if (variant.pFormats[format_index].format != format) {
-                        continue;
-                    }
-
-                    VkBaseOutStructure* base_ptr = static_cast<VkBaseOutStructure*>(static_cast<void*>(pNext));
-                    while (base_ptr != nullptr) {
-                        variant.pFormats[format_index].pfnFiller(base_ptr);
-                        base_ptr = base_ptr->pNext;
-                    }
-#if defined(VK_VERSION_1_3) || defined(VK_KHR_format_feature_flags2)
-                    VkFormatProperties2KHR* fp2 = static_cast<VkFormatProperties2KHR*>(
-                        detail::vpGetStructure(pNext, VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_2_KHR));
-                    VkFormatProperties3KHR* fp3 = static_cast<VkFormatProperties3KHR*>(
-                        detail::vpGetStructure(pNext, VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_3_KHR));
-                    if (fp3 != nullptr) {
-                        VkFormatProperties2KHR fp{ VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_2_KHR };
-                        variant.pFormats[format_index].pfnFiller(static_cast<VkBaseOutStructure*>(static_cast<void*>(&fp)));
-                        fp3->linearTilingFeatures |= static_cast<VkFormatFeatureFlags2KHR>(fp3->linearTilingFeatures | fp.formatProperties.linearTilingFeatures);
-                        fp3->optimalTilingFeatures |= static_cast<VkFormatFeatureFlags2KHR>(fp3->optimalTilingFeatures | fp.formatProperties.optimalTilingFeatures);
-                        fp3->bufferFeatures |= static_cast<VkFormatFeatureFlags2KHR>(fp3->bufferFeatures | fp.formatProperties.bufferFeatures);
-                    }
-                    if (fp2 != nullptr) {
-                        VkFormatProperties3KHR fp{ VK_STRUCTURE_TYPE_FORMAT_PROPERTIES_3_KHR };
-                        variant.pFormats[format_index].pfnFiller(static_cast<VkBaseOutStructure*>(static_cast<void*>(&fp)));
-                        fp2->formatProperties.linearTilingFeatures |= static_cast<VkFormatFeatureFlags>(fp2->formatProperties.linearTilingFeatures | fp.linearTilingFeatures);
-                        fp2->formatProperties.optimalTilingFeatures |= static_cast<VkFormatFeatureFlags>(fp2->formatProperties.optimalTilingFeatures | fp.optimalTilingFeatures);
-                        fp2->formatProperties.bufferFeatures |= static_cast<VkFormatFeatureFlags>(fp2->formatProperties.bufferFeatures | fp.bufferFeatures);
-                    }
-#endif
-                }
-            }
-        }
-    }
-
-    return result;
-}
-
-VPAPI_ATTR VkResult vpGetProfileFeatureStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes) {
-    return detail::vpGetProfileStructureTypes(
-#ifdef VP_USE_OBJECT
-        capabilities,
-#endif//VP_USE_OBJECT
-        pProfile, pBlockName, detail::STRUCTURE_FEATURE, pStructureTypeCount, pStructureTypes);
-}
-
-VPAPI_ATTR VkResult vpGetProfilePropertyStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes) {
-    return detail::vpGetProfileStructureTypes(
-#ifdef VP_USE_OBJECT
-        capabilities,
-#endif//VP_USE_OBJECT
-        pProfile, pBlockName, detail::STRUCTURE_PROPERTY, pStructureTypeCount, pStructureTypes);
-}
-
-VPAPI_ATTR VkResult vpGetProfileQueueFamilyStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes) {
-    return detail::vpGetProfileStructureTypes(
-#ifdef VP_USE_OBJECT
-        capabilities,
-#endif//VP_USE_OBJECT
-        pProfile, pBlockName, detail::STRUCTURE_QUEUE_FAMILY, pStructureTypeCount, pStructureTypes);
-}
-
-VPAPI_ATTR VkResult vpGetProfileFormatStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes) {
-    return detail::vpGetProfileStructureTypes(
-#ifdef VP_USE_OBJECT
-        capabilities,
-#endif//VP_USE_OBJECT
-        pProfile, pBlockName, detail::STRUCTURE_FORMAT, pStructureTypeCount, pStructureTypes);
-}
-
-#ifdef VK_KHR_video_queue
-// Query the list of video profiles specified by the profile
-VPAPI_ATTR VkResult vpGetProfileVideoProfiles(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t*                                   pVideoProfileCount,
-    VpVideoProfileProperties*                   pVideoProfiles) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-    if (pVideoProfileCount == nullptr) return VK_ERROR_UNKNOWN;
-
-    VkResult result = pBlockName == nullptr ? VK_SUCCESS : VK_INCOMPLETE;
-
-    uint32_t total_video_profile_count = 0;
-
-    const std::vector<VpProfileProperties>& gathered_profiles = detail::GatherProfiles(*pProfile);
-
-    for (std::size_t profile_index = 0, profile_count = gathered_profiles.size(); profile_index < profile_count; ++profile_index) {
-        const detail::VpProfileDesc* profile_desc = detail::vpGetProfileDesc(gathered_profiles[profile_index].profileName);
-        if (profile_desc == nullptr) return VK_ERROR_UNKNOWN;
-
-        for (uint32_t capability_index = 0; capability_index < profile_desc->requiredCapabilityCount; ++capability_index) {
-            const detail::VpCapabilitiesDesc& cap_desc = profile_desc->pRequiredCapabilities[capability_index];
-
-            for (uint32_t variant_index = 0; variant_index < cap_desc.variantCount; ++variant_index) {
-                const detail::VpVariantDesc& variant = cap_desc.pVariants[variant_index];
-                if (pBlockName != nullptr) {
-                    if (strcmp(variant.blockName, pBlockName) != 0) {
-                        continue;
-                    }
-                    result = VK_SUCCESS;
-                }
-
-                if (pVideoProfiles != nullptr) {
-                    for (uint32_t i = 0; i < variant.videoProfileCount; ++i) {
-                        if (total_video_profile_count < *pVideoProfileCount) {
-                            *pVideoProfiles = variant.pVideoProfiles[i].properties;
-                            total_video_profile_count++;
-                            pVideoProfiles++;
-                        } else {
-                            result = VK_INCOMPLETE;
-                            break;
-                        }
-                    }
-                } else {
-                    total_video_profile_count += variant.videoProfileCount;
-                }
-            }
-        }
-    }
-
-    *pVideoProfileCount = total_video_profile_count;
-    return result;
-}
-
-VPAPI_ATTR VkResult vpGetProfileVideoProfileInfo(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t                                    videoProfileIndex,
-    VkVideoProfileInfoKHR*                      pVideoProfileInfo) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    const detail::VpVideoProfileDesc* pVideoProfileDesc = nullptr;
-    VkResult result = detail::vpGetProfileVideoProfileDesc(pProfile, pBlockName, videoProfileIndex, &pVideoProfileDesc);
-
-    if (pVideoProfileDesc != nullptr) {
-        VkBaseOutStructure* p = reinterpret_cast<VkBaseOutStructure*>(pVideoProfileInfo);
-        while (p != nullptr) {
-            pVideoProfileDesc->info.pfnFiller(p);
-            p = p->pNext;
-        }
-    }
-
-    return result;
-}
-
-VPAPI_ATTR VkResult vpGetProfileVideoCapabilities(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t                                    videoProfileIndex,
-    void*                                       pNext) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    const detail::VpVideoProfileDesc* pVideoProfileDesc = nullptr;
-    VkResult result = detail::vpGetProfileVideoProfileDesc(pProfile, pBlockName, videoProfileIndex, &pVideoProfileDesc);
-
-    if (pVideoProfileDesc != nullptr) {
-        VkBaseOutStructure* p = reinterpret_cast<VkBaseOutStructure*>(pNext);
-        while (p != nullptr) {
-            pVideoProfileDesc->capability.pfnFiller(p);
-            p = p->pNext;
-        }
-    }
-
-    return result;
-}
-
-VPAPI_ATTR VkResult vpGetProfileVideoFormatProperties(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t                                    videoProfileIndex,
-    uint32_t*                                   pPropertyCount,
-    VkVideoFormatPropertiesKHR*                 pProperties) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    const detail::VpVideoProfileDesc* pVideoProfileDesc = nullptr;
-    VkResult result = detail::vpGetProfileVideoProfileDesc(pProfile, pBlockName, videoProfileIndex, &pVideoProfileDesc);
-
-    uint32_t property_count = 0;
-    if (pVideoProfileDesc != nullptr) {
-        if (pProperties != nullptr) {
-            for (; property_count < pVideoProfileDesc->formatCount; ++property_count) {
-                if (property_count < *pPropertyCount) {
-                    VkBaseOutStructure* p = reinterpret_cast<VkBaseOutStructure*>(&pProperties[property_count]);
-                    while (p != nullptr) {
-                        pVideoProfileDesc->pFormats[property_count].pfnFiller(p);
-                        p = p->pNext;
-                    }
-                } else {
-                    result = VK_INCOMPLETE;
-                    break;
-                }
-            }
-        } else {
-            property_count = pVideoProfileDesc->formatCount;
-        }
-    }
+    def compileXPath(path):
+        return etree.XPath(path)
 
-    *pPropertyCount = property_count;
-    return result;
-}
+    def parseXml(path):
+        # Comments are never looked at, drop them while parsing like ElementTree does
+        return etree.parse(path, etree.XMLParser(remove_comments = True))
+except ModuleNotFoundError:
+    import xml.etree.ElementTree as etree
 
-VPAPI_ATTR VkResult vpGetProfileVideoProfileInfoStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t                                    videoProfileIndex,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    const detail::VpVideoProfileDesc* pVideoProfileDesc = nullptr;
-    VkResult result = detail::vpGetProfileVideoProfileDesc(pProfile, pBlockName, videoProfileIndex, &pVideoProfileDesc);
-
-    if (pVideoProfileDesc != nullptr) {
-        if (pStructureTypes != nullptr) {
-            if (*pStructureTypeCount < pVideoProfileDesc->infoStructTypeCount) {
-                result = VK_INCOMPLETE;
-            } else {
-                *pStructureTypeCount = pVideoProfileDesc->infoStructTypeCount;
-            }
-            if (*pStructureTypeCount > 0) {
-                memcpy(pStructureTypes, pVideoProfileDesc->pInfoStructTypes, *pStructureTypeCount * sizeof(VkStructureType));
-            }
-        } else {
-            *pStructureTypeCount = pVideoProfileDesc->infoStructTypeCount;
-        }
-    }
+    def parseXml(path):
+        return etree.parse(path)
 
-    return result;
-}
+    def compileXPath(path):
+        def evaluate(xml):
+            return xml.findall(path)
+        return evaluate
 
-VPAPI_ATTR VkResult vpGetProfileVideoCapabilityStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t                                    videoProfileIndex,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    const detail::VpVideoProfileDesc* pVideoProfileDesc = nullptr;
-    VkResult result = detail::vpGetProfileVideoProfileDesc(pProfile, pBlockName, videoProfileIndex, &pVideoProfileDesc);
-
-    if (pVideoProfileDesc != nullptr) {
-        if (pStructureTypes != nullptr) {
-            if (*pStructureTypeCount < pVideoProfileDesc->capabilityStructTypeCount) {
-                result = VK_INCOMPLETE;
-            } else {
-                *pStructureTypeCount = pVideoProfileDesc->capabilityStructTypeCount;
-            }
-            if (*pStructureTypeCount > 0) {
-                memcpy(pStructureTypes, pVideoProfileDesc->pCapabilityStructTypes, *pStructureTypeCount * sizeof(VkStructureType));
-            }
-        } else {
-            *pStructureTypeCount = pVideoProfileDesc->capabilityStructTypeCount;
-        }
-    }
+# Prefer orjson for parsing the profile files, fall back to the standard json module
+try:
+    import orjson
 
-    return result;
-}
+    def loadJson(f):
+        # Parse straight from a read-only mapping of the file instead of reading a copy of it
+        try:
+            mapping = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return orjson.loads(f.read())
+        with mapping, memoryview(mapping) as view:
+            return orjson.loads(view)
+except ModuleNotFoundError:
+    def loadJson(f):
+        return json.load(f)
+
+# Writes a generated file unless it already has the same content, so that its timestamp only changes with it
+def writeFile(path, content):
+    try:
+        with open(path, 'r') as f:
+            if f.read() == content:
+                return
+    except (OSError, UnicodeDecodeError):
+        pass
+    # Replace the file at once so that an interrupted run does not leave it truncated
+    tmpPath = path + '.tmp'
+    with open(tmpPath, 'w') as f:
+        f.write(content)
+    os.replace(tmpPath, path)
+
+# Argument types rejecting missing input paths before anything is loaded
+def existingFile(path):
+    if not os.path.isfile(path):
+        raise argparse.ArgumentTypeError(f"file '{path}' does not exist")
+    return path
+
+def existingDir(path):
+    if not os.path.isdir(path):
+        raise argparse.ArgumentTypeError(f"directory '{path}' does not exist")
+    return path
+
+# Registry queries evaluated repeatedly while parsing
+XPATH_PLATFORMS = compileXPath("./platforms/platform")
+XPATH_FEATURES = compileXPath("./feature")
+XPATH_EXTENSIONS = compileXPath("./extensions/extension")
+XPATH_STRUCT_TYPES = compileXPath("./types/type[@category='struct']")
+XPATH_MEMBERS = compileXPath("./member")
+XPATH_REQUIRE_TYPES = compileXPath("./require/type")
+
+# Patterns matched repeatedly while parsing the registry
+REGEX_STRUCTURE_TYPE = re.compile(r'VK_STRUCTURE_TYPE_')
+REGEX_VERSION_NUMBER = re.compile(r'[1-9][0-9]*\.[0-9]+$')
+REGEX_ARRAY_1D = re.compile(r'\[([0-9]+)\]$')
+REGEX_ARRAY_2D = re.compile(r'\[([0-9]+)\]\[([0-9]+)\]$')
+
+# Patterns matched repeatedly while processing profiles
+REGEX_API_VERSION = re.compile(r'([1-9][0-9]*)\.([0-9]+)$')
+REGEX_API_VERSION_PATCH = re.compile(r'([1-9][0-9]*)\.([0-9]+)\.([0-9]+)$')
+REGEX_DEBUG_MSG_STRUCT = re.compile(r"(VP_DEBUG_COND_MSG\([^,]+[^:]+: )prettify_Vk([^\-]+)\->([^\)]+\))")
+REGEX_DEBUG_MSG_FLAGS = re.compile(r"(VP_DEBUG_COND_MSG\([^,]+[^:]+: )vpCheckFlags\(prettify_Vk([^\-]+)\->([^,]+), ([^\)]+)\)")
+REGEX_CORE_FEATURES_STRUCT = re.compile(r'VkPhysicalDeviceVulkan[0-9]+Features$')
+REGEX_CORE_PROPERTIES_STRUCT = re.compile(r'VkPhysicalDeviceVulkan[0-9]+Properties$')
 
-VPAPI_ATTR VkResult vpGetProfileVideoFormatStructureTypes(
-#ifdef VP_USE_OBJECT
-    VpCapabilities                              capabilities,
-#endif//VP_USE_OBJECT
-    const VpProfileProperties*                  pProfile,
-    const char*                                 pBlockName,
-    uint32_t                                    videoProfileIndex,
-    uint32_t*                                   pStructureTypeCount,
-    VkStructureType*                            pStructureTypes) {
-#ifdef VP_USE_OBJECT
-    (void)capabilities;
-#endif//VP_USE_OBJECT
-
-    const detail::VpVideoProfileDesc* pVideoProfileDesc = nullptr;
-    VkResult result = detail::vpGetProfileVideoProfileDesc(pProfile, pBlockName, videoProfileIndex, &pVideoProfileDesc);
-
-    if (pVideoProfileDesc != nullptr) {
-        if (pStructureTypes != nullptr) {
-            if (*pStructureTypeCount < pVideoProfileDesc->formatStructTypeCount) {
-                result = VK_INCOMPLETE;
-            } else {
-                *pStructureTypeCount = pVideoProfileDesc->formatStructTypeCount;
-            }
-            if (*pStructureTypeCount > 0) {
-                memcpy(pStructureTypes, pVideoProfileDesc->pFormatStructTypes, *pStructureTypeCount * sizeof(VkStructureType));
-            }
-        } else {
-            *pStructureTypeCount = pVideoProfileDesc->formatStructTypeCount;
-        }
-    }
+def apiNameMatch(str, supported):
+    """Return whether a required api name matches a pattern specified for an
+    XML <feature> 'api' attribute or <extension> 'supported' attribute.
+    - str - API name such as 'vulkan' or 'openxr'. May be None, in which
+        case it never matches (this should not happen).
+    - supported - comma-separated list of XML API names. May be None, in
+        which case str always matches (this is the usual case)."""
 
-    return result;
-}
-#endif  // VK_KHR_video_queue
-'''
+    if str is not None:
+        return supported is None or str in supported.split(',')
 
-PRIVATE_IMPL_FEATURES_CHAIN_IMPL = '''
-    VkPhysicalDeviceFeatures2KHR requiredFeaturesChain{VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2_KHR, nullptr};
-    VkBaseOutStructure* current = nullptr;
+    # Fallthrough case - either str is None or the test failed
+    return False
 
-    void ApplyRobustness(const VpDeviceCreateInfo* pCreateInfo) {
-#ifdef VK_VERSION_1_1
-        VkPhysicalDeviceFeatures2KHR* pFeatures2 = static_cast<VkPhysicalDeviceFeatures2KHR*>(
-            vpGetStructure(&this->requiredFeaturesChain, VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2_KHR));
-        if (pFeatures2 != nullptr && (pCreateInfo->flags & VP_DEVICE_CREATE_DISABLE_ROBUST_BUFFER_ACCESS_BIT)) {
-            pFeatures2->features.robustBufferAccess = VK_FALSE;
-        }
-#endif
-
-#ifdef VK_EXT_robustness2
-        VkPhysicalDeviceRobustness2FeaturesEXT* pRobustness2FeaturesEXT = static_cast<VkPhysicalDeviceRobustness2FeaturesEXT*>(
-            vpGetStructure(&this->requiredFeaturesChain, VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_ROBUSTNESS_2_FEATURES_EXT));
-        if (pRobustness2FeaturesEXT != nullptr) {
-            if (pCreateInfo->flags & VP_DEVICE_CREATE_DISABLE_ROBUST_BUFFER_ACCESS_BIT) {
-                pRobustness2FeaturesEXT->robustBufferAccess2 = VK_FALSE;
-            }
-            if (pCreateInfo->flags & VP_DEVICE_CREATE_DISABLE_ROBUST_IMAGE_ACCESS_BIT) {
-                pRobustness2FeaturesEXT->robustImageAccess2 = VK_FALSE;
-            }
-        }
-#endif
-#ifdef VK_EXT_image_robustness
-        VkPhysicalDeviceImageRobustnessFeaturesEXT* pImageRobustnessFeaturesEXT =
-            static_cast<VkPhysicalDeviceImageRobustnessFeaturesEXT*>(vpGetStructure(
-                &this->requiredFeaturesChain, VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_ROBUSTNESS_FEATURES_EXT));
-        if (pImageRobustnessFeaturesEXT != nullptr && (pCreateInfo->flags & VP_DEVICE_CREATE_DISABLE_ROBUST_IMAGE_ACCESS_BIT)) {
-            pImageRobustnessFeaturesEXT->robustImageAccess = VK_FALSE;
-        }
-#endif
-#ifdef VK_VERSION_1_3
-        VkPhysicalDeviceVulkan13Features* pVulkan13Features = static_cast<VkPhysicalDeviceVulkan13Features*>(
-            vpGetStructure(&this->requiredFeaturesChain, VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_3_FEATURES));
-        if (pVulkan13Features != nullptr && (pCreateInfo->flags & VP_DEVICE_CREATE_DISABLE_ROBUST_IMAGE_ACCESS_BIT)) {
-            pVulkan13Features->robustImageAccess = VK_FALSE;
-        }
-#endif
-    }
+def stripNonmatchingAPIs(tree, apiName, actuallyDelete = True):
+    """Remove tree Elements with 'api' attributes matching apiName.
+        tree - Element at the root of the hierarchy to strip. Only its
+            children can actually be removed, not the tree itself.
+        apiName - string which much match a command-separated component of
+            the 'api' attribute.
+        actuallyDelete - only delete matching elements if True."""
 
-    void ApplyFeatures(const VpDeviceCreateInfo* pCreateInfo) {
-        const std::size_t offset = sizeof(VkBaseOutStructure);
-        const VkBaseOutStructure* q = reinterpret_cast<const VkBaseOutStructure*>(pCreateInfo->pCreateInfo->pNext);
-        while (q) {
-            const std::size_t count = this->structureSize[q->sType];
-            for (std::size_t index = 0; index < count; ++index) {
-                const VkBaseOutStructure* pInputStruct = reinterpret_cast<const VkBaseOutStructure*>(q);
-                VkBaseOutStructure* pOutputStruct = reinterpret_cast<VkBaseOutStructure*>(detail::vpGetStructure(&this->requiredFeaturesChain, q->sType));
-                const uint8_t* pInputData = reinterpret_cast<const uint8_t*>(pInputStruct) + offset;
-                uint8_t* pOutputData = reinterpret_cast<uint8_t*>(pOutputStruct) + offset;
-                const VkBool32* input = reinterpret_cast<const VkBool32*>(pInputData);
-                VkBool32* output = reinterpret_cast<VkBool32*>(pOutputData);
-
-                output[index] = (output[index] == VK_TRUE || input[index] == VK_TRUE) ? VK_TRUE : VK_FALSE;
-            }
-            q = q->pNext;
-        }
+    if hasattr(tree, 'getparent'):
+        # lxml elements know their parent, so only the elements with an 'api' attribute need to be visited
+        if actuallyDelete:
+            for element in tree.findall('.//*[@api]'):
+                if not apiNameMatch(apiName, element.get('api')):
+                    element.getparent().remove(element)
+        return
 
-        this->ApplyRobustness(pCreateInfo);
-    }
+    stack = deque()
+    stack.append(tree)
 
-    void PushBack(VkBaseOutStructure* found) {
-        VkBaseOutStructure* last = reinterpret_cast<VkBaseOutStructure*>(&requiredFeaturesChain);
-        while (last->pNext != nullptr) {
-            last = last->pNext;
-        }
-        last->pNext = found;
-    }
+    while len(stack) > 0:
+        parent = stack.pop()
+
+        for child in parent.findall('*'):
+            api = child.get('api')
 
-    void Build(const std::vector<VkStructureType>& requiredList) {
-        for (std::size_t i = 0, n = requiredList.size(); i < n; ++i) {
-            const VkStructureType sType = requiredList[i];
-            if (sType == VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2_KHR) {
-                continue;
-            }
+            if apiNameMatch(apiName, api):
+                # Add child to the queue
+                stack.append(child)
+            elif not apiNameMatch(apiName, api):
+                # Child does not match requested api. Remove it.
+                if actuallyDelete:
+                    parent.remove(child)
 
-            VkBaseOutStructure* found = vpExtractStructure(&physicalDeviceFeatures2KHR, sType);
-            if (found == nullptr) {
-                continue;
-            }
+# The static parts of the generated library code are stored in the templates directory next to this script
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
 
-            PushBack(found);
-        }
-    }
-'''
+def loadTemplate(name):
+    with open(os.path.join(TEMPLATES_DIR, name + '.tmpl'), 'r', encoding = 'utf-8') as f:
+        return f.read()
+
+COPYRIGHT_HEADER = loadTemplate('copyright_header')
+DEBUG_MSG_CB_DEFINE = loadTemplate('debug_msg_cb_define')
+H_HEADER = loadTemplate('h_header')
+H_FOOTER = loadTemplate('h_footer')
+HPP_HEADER = loadTemplate('hpp_header')
+SHARED_INCLUDE = loadTemplate('shared_include')
+API_DEFS = loadTemplate('api_defs')
+PRIVATE_DEFS = loadTemplate('private_defs')
+PRIVATE_IMPL_BODY = loadTemplate('private_impl_body')
+PUBLIC_IMPL_BODY = loadTemplate('public_impl_body')
+FEATURES_CHAIN = Template(loadTemplate('features_chain'))
 
 
 # Evaluates that a condition is satisfied per the specified list of values
@@ -3063,28 +255,59 @@ def genCConditionForFlags(condition, variable):
     return c_cond
 
 
+class LogFormatter(logging.Formatter):
+    prefixes = {
+        logging.CRITICAL: 'FATAL: ',
+        logging.ERROR: 'ERROR: ',
+        logging.WARNING: 'WARNING: '
+    }
+
+    def format(self, record):
+        return self.prefixes.get(record.levelno, '') + record.getMessage()
+
+
+logger = logging.getLogger('gen_profiles')
+logger.setLevel(logging.INFO)
+logger.propagate = False
+if not logger.handlers:
+    logHandler = logging.StreamHandler(sys.stdout)
+    logHandler.setFormatter(LogFormatter())
+    logger.addHandler(logHandler)
+
+
+# Messages may use %-style arguments, these are only formatted if the message is actually emitted
 class Log():
-    def f(msg):
-        print('FATAL: ' + msg)
+    @staticmethod
+    def f(msg, *args):
+        if args:
+            msg = msg % args
+        logger.critical(msg)
         raise Exception(msg)
 
-    def e(msg):
-        print('ERROR: ' + msg)
+    @staticmethod
+    def e(msg, *args):
+        logger.error(msg, *args)
 
-    def w(msg):
-        print('WARNING: ' + msg)
+    @staticmethod
+    def w(msg, *args):
+        logger.warning(msg, *args)
 
-    def i(msg):
-        print(msg)
+    @staticmethod
+    def i(msg, *args):
+        logger.info(msg, *args)
 
 
 class VulkanPlatform():
+    __slots__ = ('name', 'protect')
+
     def __init__(self, data):
         self.name = data.get('name')
         self.protect = data.get('protect')
 
 
 class VulkanStructMember():
+    __slots__ = ('name', 'type', 'limittype', 'isArray', 'arraySizeMember', 'nullTerminated', 'arraySize')
+
     def __init__(self, name, type, limittype, isArray = False):
         self.name = name
         self.type = type
@@ -3096,6 +319,8 @@ class VulkanStructMember():
 
 
 class VulkanStruct():
+    __slots__ = ('name', 'sType', 'extends', 'members', 'aliases', 'isAlias', 'definedByVersion', 'definedByExtensions', 'isBeta')
+
     def __init__(self, name):
         self.name = name
         self.sType = None
@@ -3109,6 +334,8 @@ class VulkanStruct():
 
 
 class VulkanEnum():
+    __slots__ = ('name', 'aliases', 'isAlias', 'values', 'aliasValues')
+
     def __init__(self, name):
         self.name = name
         self.aliases = [ name ]
@@ -3118,6 +345,8 @@ class VulkanEnum():
 
 
 class VulkanBitmask():
+    __slots__ = ('name', 'aliases', 'isAlias', 'bitsType')
+
     def __init__(self, name):
         self.name = name
         self.aliases = [ name ]
@@ -3126,18 +355,24 @@ class VulkanBitmask():
 
 
 class VulkanFeature():
+    __slots__ = ('name', 'structs')
+
     def __init__(self, name):
         self.name = name
         self.structs = set()
 
 
 class VulkanLimit():
+    __slots__ = ('name', 'structs')
+
     def __init__(self, name):
         self.name = name
         self.structs = set()
 
 
 class VulkanVideoRequiredCapabilities():
+    __slots__ = ('struct', 'member', 'value')
+
     def __init__(self, struct, member, value):
         self.struct = struct
         self.member = member
@@ -3145,6 +380,8 @@ class VulkanVideoRequiredCapabilities():
 
 
 class VulkanVideoFormat():
+    __slots__ = ('name', 'usage', 'properties', 'requiredCaps')
+
     def __init__(self, name, usage):
         self.name = name
         self.usage = usage
@@ -3186,18 +423,24 @@ class VulkanVideoFormat():
 
 
 class VulkanVideoProfileStructMember():
+    __slots__ = ('name', 'values')
+
     def __init__(self, name):
         self.name = name
         self.values = OrderedDict()
 
 
 class VulkanVideoProfileStruct():
+    __slots__ = ('struct', 'members')
+
     def __init__(self, struct):
         self.struct = struct
         self.members = OrderedDict()
 
 
 class VulkanVideoCodec():
+    __slots__ = ('name', 'value', 'profileStructs', 'capabilities', 'formats')
+
     def __init__(self, name, extend = None, value = None):
         self.name = name
         self.value = value
@@ -3244,8 +487,10 @@ class VulkanVideoCodec():
 
 
 class VulkanVersionNumber():
+    __slots__ = ('major', 'minor', 'patch', 'sortKey', 'versionName', 'versionMacro', 'versionStructSuffic')
+
     def __init__(self, versionStr, targetApi = None, versionName = None):
-        match = re.search(r"^([1-9][0-9]*)\.([0-9]+)$", versionStr)
+        match = REGEX_API_VERSION.match(versionStr)
         if match != None:
             # Only major and minor version specified
             self.major = int(match.group(1))
@@ -3253,7 +498,7 @@ class VulkanVersionNumber():
             self.patch = None
         else:
             # Otherwise expect major, minor, and patch version
-            match = re.search(r"^([1-9][0-9]*)\.([0-9]+)\.([0-9]+)$", versionStr)
+            match = REGEX_API_VERSION_PATCH.match(versionStr)
             if match != None:
                 self.major = int(match.group(1))
                 self.minor = int(match.group(2))
@@ -3261,6 +506,9 @@ class VulkanVersionNumber():
             else:
                 Log.f("Invalid API version string: '{0}'".format(versionStr))
 
+        # Only major and minor version are considered in comparisons
+        self.sortKey = (self.major, self.minor)
+
         # Construct version number pre-processor definition's name
         if targetApi == 'vulkan':
             self.versionName = 'VK_VERSION_{0}_{1}'.format(self.major, self.minor)
@@ -3277,27 +525,24 @@ class VulkanVersionNumber():
 
     def __eq__(self, other):
         if isinstance(other, VulkanVersionNumber):
-            # Only consider major and minor version in comparison
-            return self.major == other.major and self.minor == other.minor
+            return self.sortKey == other.sortKey
         else:
             return False
 
     def __gt__(self, other):
-        # Only consider major and minor version in comparison
-        return self.major > other.major or (self.major == other.major and self.minor > other.minor)
+        return self.sortKey > other.sortKey
 
     def __lt__(self, other):
-        # Only consider major and minor version in comparison
-        return self.major < other.major or (self.major == other.major and self.minor < other.minor)
+        return self.sortKey < other.sortKey
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __ge__(self, other):
-        return self.__eq__(other) or self.__gt__(other)
+        return self.sortKey >= other.sortKey
 
     def __le__(self, other):
-        return self.__eq__(other) or self.__lt__(other)
+        return self.sortKey <= other.sortKey
 
     def __str__(self):
         if self.patch != None:
@@ -3307,20 +552,22 @@ class VulkanVersionNumber():
 
 
 class VulkanDefinitions():
+    __slots__ = ('enums', 'types')
+
     def __init__(self):
         self.enums = set()
         self.types = set()
 
     def add(self, elements):
         for element in elements:
-            for enum in element.findall("./enum"):
+            for enum in element.iterfind("./enum"):
                 self.enums.add(enum.get('name'))
-            for type in element.findall("./type"):
+            for type in element.iterfind("./type"):
                 self.types.add(type.get('name'))
 
     def addDependencies(self, xml, targetApi):
         # Add types that are required by required types as dependency
-        for type in xml.findall("./types/type[@requires]"):
+        for type in xml.iterfind("./types/type[@requires]"):
             apiList = type.get('api')
 
             # Skip dependency if it does not apply to the target API
@@ -3332,7 +579,7 @@ class VulkanDefinitions():
                 self.types.add(type.get('requires'))
 
         # Add types that contain the definition of required alias types as dependency
-        for type in xml.findall("./types/type[@alias]"):
+        for type in xml.iterfind("./types/type[@alias]"):
 
             # Skip dependency if it does not apply to the target API
             if apiList is not None and not targetApi in apiList.split(','):
@@ -3344,14 +591,18 @@ class VulkanDefinitions():
 
 
 class VulkanDefinitionScope():
+    __slots__ = ('sTypeAliases',)
+
     def parseAliases(self, xml):
         self.sTypeAliases = dict()
-        for sTypeAlias in xml.findall("./require/enum[@alias]"):
-            if re.search(r'^VK_STRUCTURE_TYPE_.*', sTypeAlias.get('name')):
+        for sTypeAlias in xml.iterfind("./require/enum[@alias]"):
+            if REGEX_STRUCTURE_TYPE.match(sTypeAlias.get('name')):
                 self.sTypeAliases[sTypeAlias.get('alias')] = sTypeAlias.get('name')
 
 
 class VulkanVersion(VulkanDefinitionScope):
+    __slots__ = ('name', 'number', 'extensions', 'features', 'limits')
+
     def __init__(self, xml, targetApi):
         self.name = xml.get('name')
         self.number = VulkanVersionNumber(xml.get('number'), targetApi, self.name)
@@ -3362,6 +613,8 @@ class VulkanVersion(VulkanDefinitionScope):
 
 
 class VulkanExtension(VulkanDefinitionScope):
+    __slots__ = ('name', 'upperCaseName', 'type', 'features', 'limits', 'platform', 'provisional', 'promotedTo', 'obsoletedBy', 'deprecatedBy', 'spec_version')
+
     def __init__(self, xml, upperCaseName):
         self.name = xml.get('name')
         self.upperCaseName = upperCaseName
@@ -3374,7 +627,7 @@ class VulkanExtension(VulkanDefinitionScope):
         self.obsoletedBy = xml.get('obsoletedby')
         self.deprecatedBy = xml.get('deprecatedby')
         self.spec_version = 1
-        for e in xml.findall("./require/enum"):
+        for e in xml.iterfind("./require/enum"):
             if (e.get('name').endswith("SPEC_VERSION")):
                 self.spec_version = e.get('value')
                 break
@@ -3384,18 +637,272 @@ class VulkanExtension(VulkanDefinitionScope):
 # Dynamic arrays are ill-formed, but some of them still have a maximum size that can be used
 struct_with_valid_dynamic_array = ["VkQueueFamilyGlobalPriorityProperties"]
 
+# TODO: We currently have to apply workarounds due to "noauto" limittypes and other bugs related to limittypes in the vk.xml
+# These can only be solved permanently if we make modifications to the registry xml itself
+# The registry xml is also missing limittype definitions for format and queue family properties
+# For now we just add the important ones, this needs a larger overhaul in the vk.xml
+LIMITTYPE_WORKAROUNDS = {
+    'VkPhysicalDeviceLimits': {
+        'subPixelPrecisionBits': 'bits',
+        'subTexelPrecisionBits': 'bits',
+        'mipmapPrecisionBits': 'bits',
+        'viewportSubPixelBits': 'bits',
+        'subPixelInterpolationOffsetBits': 'bits',
+        'minMemoryMapAlignment': 'min,pot',
+        'minTexelBufferOffsetAlignment': 'min,pot',
+        'minUniformBufferOffsetAlignment': 'min,pot',
+        'minStorageBufferOffsetAlignment': 'min,pot',
+        'optimalBufferCopyOffsetAlignment': 'min,pot',
+        'optimalBufferCopyRowPitchAlignment': 'min,pot',
+        'nonCoherentAtomSize': 'min,pot',
+        'timestampPeriod': 'noauto',
+        'bufferImageGranularity': 'min,mul',
+        'pointSizeGranularity': 'min,mul',
+        'lineWidthGranularity': 'min,mul',
+        'strictLines': 'exact',
+        'standardSampleLocations': 'exact',
+    },
+    'VkPhysicalDeviceSparseProperties': {
+        'residencyAlignedMipSize': 'not',
+    },
+    'VkPhysicalDeviceVulkan11Properties': {
+        'deviceUUID': 'noauto',
+        'driverUUID': 'noauto',
+        'deviceLUID': 'noauto',
+        'deviceNodeMask': 'noauto',
+        'deviceLUIDValid': 'noauto',
+        'subgroupSize': 'max,pot',
+        'pointClippingBehavior': 'exact',
+        'protectedNoFault': 'exact',
+    },
+    'VkPhysicalDeviceVulkan12Properties': {
+        'driverID': 'noauto',
+        'driverName': 'noauto',
+        'driverInfo': 'noauto',
+        'conformanceVersion': 'noauto',
+        'denormBehaviorIndependence': 'exact',
+        'roundingModeIndependence': 'exact',
+    },
+    'VkPhysicalDeviceVulkan13Properties': {
+        'storageTexelBufferOffsetAlignmentBytes': 'min,pot',
+        'storageTexelBufferOffsetSingleTexelAlignment': 'exact',
+        'uniformTexelBufferOffsetAlignmentBytes': 'min,pot',
+        'uniformTexelBufferOffsetSingleTexelAlignment': 'exact',
+        'minSubgroupSize': 'min,pot',
+        'maxSubgroupSize': 'max,pot',
+    },
+    'VkPhysicalDeviceVulkan14Properties': {
+        'maxCombinedImageSamplerDescriptorCount': 'min,pot',
+    },
+    'VkPhysicalDeviceTexelBufferAlignmentProperties': {
+        'storageTexelBufferOffsetAlignmentBytes': 'min,pot',
+        'storageTexelBufferOffsetSingleTexelAlignment': 'exact',
+        'uniformTexelBufferOffsetAlignmentBytes': 'min,pot',
+        'uniformTexelBufferOffsetSingleTexelAlignment': 'exact',
+    },
+    'VkPhysicalDeviceProperties': {
+        'apiVersion': 'noauto',
+        'driverVersion': 'noauto',
+        'vendorID': 'noauto',
+        'deviceID': 'noauto',
+        'deviceType': 'noauto',
+        'deviceName': 'noauto',
+        'pipelineCacheUUID': 'noauto',
+    },
+    'VkPhysicalDeviceToolProperties': {
+        'name': 'noauto',
+        'version': 'noauto',
+        'purposes': 'noauto',
+        'description': 'noauto',
+        'layer': 'noauto',
+    },
+    'VkPhysicalDeviceSubgroupSizeControlProperties': {
+        'minSubgroupSize': 'min,pot',
+        'maxSubgroupSize': 'max,pot',
+    },
+    'VkPhysicalDeviceDriverProperties': {
+        'driverID': 'noauto',
+        'driverName': 'noauto',
+        'driverInfo': 'noauto',
+        'conformanceVersion': 'noauto',
+    },
+    'VkPhysicalDeviceIDProperties': {
+        'deviceUUID': 'noauto',
+        'driverUUID': 'noauto',
+        'deviceLUID': 'noauto',
+        'deviceNodeMask': 'noauto',
+        'deviceLUIDValid': 'noauto',
+    },
+    'VkPhysicalDeviceSubgroupProperties': {
+        'subgroupSize': 'max,pot',
+    },
+    'VkPhysicalDevicePointClippingProperties': {
+        'pointClippingBehavior': 'exact',
+    },
+    'VkPhysicalDeviceProtectedMemoryProperties': {
+        'protectedNoFault': 'exact',
+    },
+    'VkPhysicalDeviceFloatControlsProperties': {
+        'denormBehaviorIndependence': 'exact',
+        'roundingModeIndependence': 'exact',
+    },
+    'VkPhysicalDevicePortabilitySubsetPropertiesKHR': {
+        'minVertexInputBindingStrideAlignment': 'min,pot',
+    },
+    'VkPhysicalDeviceFragmentShadingRatePropertiesKHR': {
+        'maxFragmentShadingRateAttachmentTexelSizeAspectRatio': 'max,pot',
+        'maxFragmentSizeAspectRatio': 'max,pot',
+        'maxFragmentShadingRateCoverageSamples': 'max',
+    },
+    'VkPhysicalDeviceRayTracingPipelinePropertiesKHR': {
+        'shaderGroupHandleSize': 'exact',
+        'shaderGroupBaseAlignment': 'exact',
+        'shaderGroupHandleCaptureReplaySize': 'exact',
+        'shaderGroupHandleAlignment': 'min,pot',
+    },
+    'VkPhysicalDeviceConservativeRasterizationPropertiesEXT': {
+        'primitiveOverestimationSize': 'exact',
+        'extraPrimitiveOverestimationSizeGranularity': 'min,mul',
+        'conservativePointAndLineRasterization': 'exact',
+        'degenerateTrianglesRasterized': 'exact',
+        'degenerateLinesRasterized': 'exact',
+    },
+    'VkPhysicalDeviceLineRasterizationPropertiesEXT': {
+        'lineSubPixelPrecisionBits': 'bits',
+    },
+    'VkPhysicalDeviceExternalMemoryHostPropertiesEXT': {
+        'minImportedHostPointerAlignment': 'min,pot',
+    },
+    'VkPhysicalDevicePCIBusInfoPropertiesEXT': {
+        'pciDomain': 'noauto',
+        'pciBus': 'noauto',
+        'pciDevice': 'noauto',
+        'pciFunction': 'noauto',
+    },
+    'VkPhysicalDeviceDrmPropertiesEXT': {
+        'hasPrimary': 'noauto',
+        'hasRender': 'noauto',
+        'primaryMajor': 'noauto',
+        'primaryMinor': 'noauto',
+        'renderMajor': 'noauto',
+        'renderMinor': 'noauto',
+    },
+    'VkPhysicalDeviceFragmentDensityMap2PropertiesEXT': {
+        'subsampledLoads': 'exact',
+        'subsampledCoarseReconstructionEarlyAccess': 'exact',
+    },
+    'VkPhysicalDeviceSampleLocationsPropertiesEXT': {
+        'sampleLocationSubPixelBits': 'bits',
+    },
+    'VkPhysicalDeviceRobustness2PropertiesEXT': {
+        'robustStorageBufferAccessSizeAlignment': 'min,pot',
+        'robustUniformBufferAccessSizeAlignment': 'min,pot',
+    },
+    'VkPhysicalDeviceShaderCorePropertiesAMD': {
+        'shaderEngineCount': 'exact',
+        'shaderArraysPerEngineCount': 'exact',
+        'computeUnitsPerShaderArray': 'exact',
+        'simdPerComputeUnit': 'exact',
+        'wavefrontsPerSimd': 'exact',
+        'wavefrontSize': 'max',
+        'sgprsPerSimd': 'exact',
+        'sgprAllocationGranularity': 'min,mul',
+        'vgprsPerSimd': 'exact',
+        'vgprAllocationGranularity': 'min,mul',
+    },
+    'VkPhysicalDeviceSubpassShadingPropertiesHUAWEI': {
+        'maxSubpassShadingWorkgroupSizeAspectRatio': 'max,pot',
+    },
+    'VkPhysicalDeviceRayTracingPropertiesNV': {
+        'shaderGroupHandleSize': 'exact',
+        'shaderGroupBaseAlignment': 'exact',
+    },
+    'VkPhysicalDeviceShadingRateImagePropertiesNV': {
+        'shadingRateTexelSize': 'exact',
+    },
+    'VkPhysicalDeviceMeshShaderPropertiesNV': {
+        'meshOutputPerVertexGranularity': 'min,mul',
+        'meshOutputPerPrimitiveGranularity': 'min,mul',
+    },
+    'VkPhysicalDevicePipelineRobustnessPropertiesEXT': {
+        'defaultRobustnessStorageBuffers': 'exact',
+        'defaultRobustnessUniformBuffers': 'exact',
+        'defaultRobustnessVertexInputs': 'exact',
+        'defaultRobustnessImages': 'exact',
+    },
+    'VkPhysicalDeviceFragmentDensityMapOffsetPropertiesQCOM': {
+        'fragmentDensityOffsetGranularity': 'min,mul',
+    },
+    'VkPhysicalDeviceSchedulingControlsPropertiesARM': {
+        'schedulingControlsFlags': 'bitmask',
+    },
+    'VkPhysicalDeviceExternalFormatResolvePropertiesANDROID': {
+        'nullColorAttachmentWithExternalFormatResolve': 'not',
+    },
+    'VkPhysicalDeviceRenderPassStripedPropertiesARM': {
+        'renderPassStripeGranularity': 'min',
+        'maxRenderPassStripes': 'max',
+    },
+    'VkPhysicalDeviceMaintenance6PropertiesKHR': {
+        'maxCombinedImageSamplerDescriptorCount': 'max',
+    },
+    'VkPhysicalDeviceDeviceGeneratedCommandsPropertiesEXT': {
+        'supportedIndirectCommandsInputModes': 'bitmask',
+        'supportedIndirectCommandsShaderStages': 'bitmask',
+        'supportedIndirectCommandsShaderStagesPipelineBinding': 'bitmask',
+        'supportedIndirectCommandsShaderStagesShaderBinding': 'bitmask',
+    },
+    'VkFormatProperties': {
+        'linearTilingFeatures': 'bitmask',
+        'optimalTilingFeatures': 'bitmask',
+        'bufferFeatures': 'bitmask',
+    },
+    'VkFormatProperties3': {
+        'linearTilingFeatures': 'bitmask',
+        'optimalTilingFeatures': 'bitmask',
+        'bufferFeatures': 'bitmask',
+    },
+    'VkQueueFamilyProperties': {
+        'queueFlags': 'bitmask',
+        'queueCount': 'max',
+        'timestampValidBits': 'bits',
+        'minImageTransferGranularity': 'min,mul',
+    },
+    'VkSparseImageFormatProperties': {
+        'aspectMask': 'bitmask',
+        'imageGranularity': 'min,mul',
+        'flags': 'bitmask',
+    },
+}
+
+
+class VulkanRegistryUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        # The cache may have been written while this module was running as a script or was imported by another script
+        if module == '__main__' or module == 'gen_profiles_solution':
+            module = __name__
+        return super().find_class(module, name)
+
+
 class VulkanRegistry():
     def __init__(self, registryFile, api = 'vulkan'):
-        Log.i("Loading registry file: '{0}'".format(registryFile))
-        xml = etree.parse(registryFile)
+        Log.i("Loading registry file: '%s'", registryFile)
+        videoRegistryFile = registryFile.replace('vk.xml', 'video.xml')
+
+        # Reuse the registry parsed by a previous run if neither the registry files nor this script changed since
+        cacheFile = registryFile + '.cache'
+        cacheKey = self.getCacheKey(api, [ registryFile, videoRegistryFile, os.path.abspath(__file__) ])
+        if self.loadCache(cacheFile, cacheKey):
+            return
+
+        xml = parseXml(registryFile)
         stripNonmatchingAPIs(xml.getroot(), api, actuallyDelete = True)
 
-        videoRegistryFile = registryFile.replace('vk.xml', 'video.xml')
         if os.path.isfile(videoRegistryFile):
-            Log.i("Loading video registry file: '{0}'".format(videoRegistryFile))
-            videoxml = etree.parse(videoRegistryFile)
+            Log.i("Loading video registry file: '%s'", videoRegistryFile)
+            videoxml = parseXml(videoRegistryFile)
         else:
-            Log.w("Video registry file '{0}' does not exist, building without video support".format(videoRegistryFile))
+            Log.w("Video registry file '%s' does not exist, building without video support", videoRegistryFile)
             videoxml = None
 
         self.api = api
@@ -3422,159 +929,251 @@ class VulkanRegistry():
         self.parseVideoCodecs(xml, videoxml)
         self.applyWorkarounds()
 
+        # The registry elements are only needed while parsing
+        del self.versionElements
+        del self.extensionElements
+        del self.structAliases
+
+        # Extension promotion chains resolved on demand
+        self.extensionPromotedToVersion = dict()
+        self.extensionPromotedToExtensionList = dict()
+
+        self.storeCache(cacheFile, cacheKey)
+
+    def getCacheKey(self, api, files):
+        # Use the exact modification time and the size of each input file, a missing file is also part of the key
+        stats = []
+        for file in files:
+            try:
+                stat = os.stat(file)
+                stats.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stats.append(None)
+        return (api, stats)
+
+    def loadCache(self, cacheFile, cacheKey):
+        if not os.path.isfile(cacheFile):
+            return False
+        try:
+            with open(cacheFile, 'rb') as f:
+                key, state = VulkanRegistryUnpickler(f).load()
+        except Exception:
+            # Unreadable or incompatible cache, parse the registry again
+            return False
+        if key != cacheKey:
+            return False
+        Log.i("Using cached registry file: '%s'", cacheFile)
+        self.__dict__.update(state)
+        return True
+
+    def storeCache(self, cacheFile, cacheKey):
+        try:
+            data = pickle.dumps((cacheKey, self.__dict__), pickle.HIGHEST_PROTOCOL)
+        except pickle.PicklingError:
+            # The classes of this module cannot be found when it runs through a wrapper like cProfile
+            return
+        try:
+            # Replace the cache at once so that an interrupted run never leaves a truncated one behind
+            tmpFile = cacheFile + '.tmp'
+            with open(tmpFile, 'wb') as f:
+                f.write(data)
+            os.replace(tmpFile, cacheFile)
+        except OSError:
+            # The registry may be in a read-only location, caching is only an optimization
+            pass
+
     def findAllFeatures(self, xml, xpath = None):
         results = []
-        for feature in xml.findall("./feature"):
+        for feature in XPATH_FEATURES(xml):
             apiList = feature.get('api')
             if self.api in apiList.split(','):
                 if xpath is None:
                     results.append(feature)
                 else:
-                    results.extend(feature.findall(xpath))
+                    results.extend(feature.iterfind(xpath))
         return results
 
     def findAllExtensions(self, xml, xpath = None):
         results = []
-        for extension in xml.findall("./extensions/extension"):
+        for extension in XPATH_EXTENSIONS(xml):
             apiList = extension.get('supported')
             if self.api in apiList.split(','):
                 if xpath is None:
                     results.append(extension)
                 else:
-                    results.extend(extension.findall(xpath))
+                    results.extend(extension.iterfind(xpath))
         return results
 
     def parseRequireRemove(self, xml):
-        self.require.add(xml.findall("./require"))
-        self.remove.add(xml.findall("./remove"))
+        self.require.add(xml.iterfind("./require"))
+        self.remove.add(xml.iterfind("./remove"))
 
     def parsePlatformInfo(self, xml):
         self.platforms = dict()
-        for plat in xml.findall("./platforms/platform"):
+        for plat in XPATH_PLATFORMS(xml):
             self.platforms[plat.get('name')] = VulkanPlatform(plat)
 
     def parseVersionInfo(self, xml):
         self.versions = dict()
+        self.versionElements = []
         for feature in self.findAllFeatures(xml):
-            if re.search(r"^[1-9][0-9]*\.[0-9]+$", feature.get('number')):
-                self.versions[feature.get('name')] = VulkanVersion(feature, self.api)
+            if REGEX_VERSION_NUMBER.match(feature.get('number')):
+                version = VulkanVersion(feature, self.api)
+                self.versions[version.name] = version
+                self.versionElements.append((feature, version))
                 self.parseRequireRemove(feature)
             else:
                 Log.f("Unsupported feature with number '{0}'".format(feature.get('number')))
 
+        # Accumulate the sType aliases available up to each core version
+        self.versionSTypeAliases = dict()
+        sTypeAliases = dict()
+        for version in sorted(self.versions.values(), key = lambda version: version.number.sortKey):
+            for sType, sTypeAlias in version.sTypeAliases.items():
+                sTypeAliases.setdefault(sType, sTypeAlias)
+            self.versionSTypeAliases[version.name] = dict(sTypeAliases)
+
     def parseExtensionInfo(self, xml):
         self.extensions = dict()
+        self.extensionElements = []
         for ext in self.findAllExtensions(xml):
             name = ext.get('name')
 
             # Find name enum (due to inconsistencies in lower case and upper case names this is non-trivial)
-            foundNameEnum = False
-            matches = ext.findall("./require/enum[@value='\"" + name + "\"']")
-            for match in matches:
-                if match.get('name').endswith("_EXTENSION_NAME"):
+            nameValue = '"' + name + '"'
+            for enum in ext.iterfind('./require/enum'):
+                enumName = enum.get('name')
+                if enumName != None and enumName.endswith("_EXTENSION_NAME") and enum.get('value') == nameValue:
                     # Add extension definition
-                    self.extensions[name] = VulkanExtension(ext, match.get('name')[:-len("_EXTENSION_NAME")])
-                    foundNameEnum = True
+                    extension = VulkanExtension(ext, enumName[:-len("_EXTENSION_NAME")])
+                    self.extensions[name] = extension
+                    self.extensionElements.append((ext, extension))
                     break
-            if not foundNameEnum:
+            else:
                 Log.f("Cannot find name enum for extension '{0}'".format(name))
 
             self.parseRequireRemove(ext)
 
     def parseStructInfo(self, xml):
         self.structs = dict()
-        for struct in xml.findall("./types/type[@category='struct']"):
-            name = struct.get('name')
+        self.structAliases = []
+        # Member names and types repeat across many structures, share a single string object for each of them
+        intern = sys.intern
+        for struct in XPATH_STRUCT_TYPES(xml):
+            attrib = struct.attrib
+            name = attrib['name']
 
             # Don't process structure if it is not required or if it is removed
             if name not in self.require.types or name in self.remove.types:
                 continue
 
+            # Remember struct aliases for parseAliases
+            alias = attrib.get('alias')
+            if alias != None:
+                self.structAliases.append((name, alias))
+
             # Define base struct information
             structDef = VulkanStruct(name)
 
             # Find out whether it's an extension structure
-            extends = struct.get('structextends')
+            extends = attrib.get('structextends')
             if extends != None:
                 structDef.extends = extends.split(',')
 
-            # Find sType value
-            sType = struct.find("./member[name='sType']")
-            if sType != None:
-                structDef.sType = sType.get('values')
-
             # Parse struct members
-            for member in struct.findall('./member'):
-                name = member.find('./name').text
-                tail = member.find('./name').tail
-                type = member.find('./type').text
-
-                # Only add real members (skip sType and pNext)
-                if name != 'sType' and name != 'pNext':
-                    # Define base member information
-                    structDef.members[name] = VulkanStructMember(
-                        name,
+            members = structDef.members
+            for member in XPATH_MEMBERS(struct):
+                memberAttrib = member.attrib
+                nameElement = member.find('./name')
+                memberName = intern(nameElement.text)
+                tail = nameElement.tail
+                type = intern(member.find('./type').text)
+
+                if memberName == 'sType':
+                    # Find sType value
+                    if structDef.sType == None:
+                        structDef.sType = memberAttrib.get('values')
+                elif memberName != 'pNext':
+                    # Define base member information (sType and pNext are not real members)
+                    limittype = memberAttrib.get('limittype')
+                    memberDef = VulkanStructMember(
+                        memberName,
                         type,
-                        member.get('limittype')
+                        intern(limittype) if limittype is not None else None
                     )
+                    members[memberName] = memberDef
 
                     # Detect if it's an array
                     if tail != None and tail[0] == '[':
-                        structDef.members[name].isArray = True
-                        match1D = re.search(r"^\[([0-9]+)\]$", tail)
-                        match2D = re.search(r"^\[([0-9]+)\]\[([0-9]+)\]$", tail)
+                        memberDef.isArray = True
+                        match1D = REGEX_ARRAY_1D.match(tail)
+                        match2D = REGEX_ARRAY_2D.match(tail)
                         enum = member.find('./enum')
                         if match1D != None:
                             # [<number>] case
-                            structDef.members[name].arraySize = int(match1D.group(1))
+                            memberDef.arraySize = int(match1D.group(1))
                         elif match2D != None:
                             # [<number>][<number>] case
-                            structDef.members[name].arraySize = [ int(match2D.group(1)), int(match2D.group(2)) ]
+                            memberDef.arraySize = [ int(match2D.group(1)), int(match2D.group(2)) ]
                         elif tail == '[' and enum != None and enum.tail == ']':
                             # [<enum>] case
-                            structDef.members[name].arraySize = enum.text
+                            memberDef.arraySize = enum.text
                         else:
-                            Log.f("Unsupported array format for struct member '{0}::{1}'".format(structDef.name, name))
+                            Log.f("Unsupported array format for struct member '{0}::{1}'".format(structDef.name, memberName))
 
                     # If it has a "len" attribute then it's also an array, just a dynamically sized one
-                    if member.get('len') != None:
-                        lenMeta = member.get('len').split(',')
+                    lenAttrib = memberAttrib.get('len')
+                    if lenAttrib != None:
+                        lenMeta = lenAttrib.split(',')
                         for len in lenMeta:
                             if len == 'null-terminated':
                                 # Values are null-terminated
-                                structDef.members[name].nullTerminated = True
+                                memberDef.nullTerminated = True
                             else:
                                 # This is a pointer to an array with a corresponding count member
-                                structDef.members[name].isArray = True
-                                structDef.members[name].arraySizeMember = len
+                                memberDef.isArray = True
+                                memberDef.arraySizeMember = len
 
             # If any of the members is a dynamic array then we should remove the corresponding count member
-            for member in list(structDef.members.values()):
-                if member.isArray and member.arraySizeMember != None and struct.get('name') not in struct_with_valid_dynamic_array:
-                    structDef.members.pop(member.arraySizeMember, None)
+            for member in list(members.values()):
+                if member.isArray and member.arraySizeMember != None and name not in struct_with_valid_dynamic_array:
+                    members.pop(member.arraySizeMember, None)
 
             # Store struct definition
-            self.structs[struct.get('name')] = structDef
+            self.structs[name] = structDef
 
     def parsePrerequisites(self, xml):
+        structs = self.structs
+
         # Check features (i.e. API versions)
-        for feature in self.findAllFeatures(xml):
-            for requireType in feature.findall('./require/type'):
+        for feature, version in self.versionElements:
+            for requireType in XPATH_REQUIRE_TYPES(feature):
                 # Add feature as the source of the definition of a struct
-                if requireType.get('name') in self.structs:
-                    self.structs[requireType.get('name')].definedByVersion = VulkanVersionNumber(feature.get('number'), self.api, feature.get('name'))
+                structDef = structs.get(requireType.get('name'))
+                if structDef != None:
+                    structDef.definedByVersion = version.number
 
         # Check extensions
-        for extension in self.findAllExtensions(xml):
-            for requireType in extension.findall('./require/type'):
+        for extension, ext in self.extensionElements:
+            for requireType in XPATH_REQUIRE_TYPES(extension):
                 # Add extension as the source of the definition of a struct
-                if requireType.get('name') in self.structs:
-                    self.structs[requireType.get('name')].definedByExtensions.append(extension.get('name'))
+                structDef = structs.get(requireType.get('name'))
+                if structDef != None:
+                    structDef.definedByExtensions.append(ext.name)
 
     def parseEnums(self, xml):
         self.enums = dict()
+
+        # Collect the enum values added by core versions and extensions in a single pass
+        versionValues = dict()
+        for value in self.findAllFeatures(xml, "./require/enum[@extends]"):
+            versionValues.setdefault(value.get('extends'), []).append(value)
+        extensionValues = dict()
+        for value in self.findAllExtensions(xml, "./require/enum[@extends]"):
+            extensionValues.setdefault(value.get('extends'), []).append(value)
+
         # Find enum definitions
-        for enum in xml.findall("./types/type[@category='enum']"):
+        for enum in xml.iterfind("./types/type[@category='enum']"):
             name = enum.get('name')
 
             # Don't process enum type if it is not required or if it is removed
@@ -3586,16 +1185,16 @@ class VulkanRegistry():
 
             # First collect base values
             values = xml.find("./enums[@name='" + enumDef.name + "']")
-            if values:
-                for value in values.findall("./enum"):
+            if values is not None:
+                for value in values.iterfind("./enum"):
                     if value.get('alias') is None:
                         enumDef.values.append(value.get('name'))
 
             # Then find extension values
-            for value in self.findAllFeatures(xml, "./require/enum[@extends='" + enumDef.name + "']"):
+            for value in versionValues.get(enumDef.name, []):
                 if value.get('alias') is None:
                     enumDef.values.append(value.get('name'))
-            for value in self.findAllExtensions(xml, "./require/enum[@extends='" + enumDef.name + "']"):
+            for value in extensionValues.get(enumDef.name, []):
                 if value.get('alias') is None:
                     enumDef.values.append(value.get('name'))
 
@@ -3612,7 +1211,7 @@ class VulkanRegistry():
 
     def parseFormats(self, xml):
         self.formatCompression = dict()
-        for enum in xml.findall("./formats/format"):
+        for enum in xml.iterfind("./formats/format"):
             if enum.get('compressed'):
                 self.formatCompression[enum.get('name')] = enum.get('compressed')
 
@@ -3627,7 +1226,7 @@ class VulkanRegistry():
     def parseBitmasks(self, xml):
         self.bitmasks = dict()
         # Find bitmask definitions
-        for bitmask in xml.findall("./types/type[@category='bitmask']"):
+        for bitmask in xml.iterfind("./types/type[@category='bitmask']"):
             # Only consider non-alias bitmasks
             name = bitmask.find("./name")
             if bitmask.get('alias') is None and name != None:
@@ -3658,7 +1257,7 @@ class VulkanRegistry():
     def parseConstants(self, xml):
         self.constants = dict()
         # Find constant definitions
-        constants = xml.find("./enums[@name='API Constants']").findall("./enum[@value]")
+        constants = xml.find("./enums[@name='API Constants']").iterfind("./enum[@value]")
         if constants != None:
             for constant in constants:
                 self.constants[constant.get('name')] = constant.get('value')
@@ -3666,68 +1265,55 @@ class VulkanRegistry():
             Log.f("Failed to find API constants in the registry")
 
     def parseAliases(self, xml):
-        # Find any struct aliases
-        for struct in xml.findall("./types/type[@category='struct']"):
-            name = struct.get('name')
-
-            # Don't process structure if it is not required or if it is removed
-            if name not in self.require.types or name in self.remove.types:
+        # Process the struct aliases found by parseStructInfo
+        for name, alias in self.structAliases:
+            # Don't process alias if it is not required or if it is removed
+            if alias not in self.require.types or alias in self.remove.types:
                 continue
 
-            alias = struct.get('alias')
-            if alias != None:
-                # Don't process alias if it is not required or if it is removed
-                if alias not in self.require.types or alias in self.remove.types:
-                    continue
-
-                if alias in self.structs:
-                    baseStructDef = self.structs[alias]
-                    aliasStructDef = self.structs[name]
-
-                    # Set as alias
-                    aliasStructDef.isAlias = True
-
-                    # Fill missing struct information for the alias
-                    aliasStructDef.extends = baseStructDef.extends
-                    aliasStructDef.members = baseStructDef.members
-                    aliasStructDef.aliases = baseStructDef.aliases
-                    aliasStructDef.aliases.append(name)
-
-                    # Use alias structure dependencies as the structure dependencies if the latter has none
-                    # This is needed to handle the case when the structure is not part of the target API
-                    # but is a dependency of the alias
-                    if baseStructDef.definedByVersion is None and len(baseStructDef.definedByExtensions) == 0:
-                        baseStructDef.definedByVersion = aliasStructDef.definedByVersion
-                        baseStructDef.definedByExtensions = aliasStructDef.definedByExtensions
-
-                    if baseStructDef.sType != None:
-                        sTypeAlias = None
-
-                        # First try to find sType alias in core versions
-                        if aliasStructDef.definedByVersion != None:
-                            for versionName in self.versions:
-                                version = self.versions[versionName]
-                                if version.number <= aliasStructDef.definedByVersion:
-                                    sTypeAlias = version.sTypeAliases.get(baseStructDef.sType)
-                                    if sTypeAlias != None:
-                                        break
-
-                        # Otherwise need to find sType alias in extension
-                        if sTypeAlias == None:
-                            for extName in aliasStructDef.definedByExtensions:
-                                sTypeAlias = self.extensions[extName].sTypeAliases.get(baseStructDef.sType)
-                                if sTypeAlias != None:
-                                    break
-
-                        #Workaround due to a vk.xml issue that was resolved with 1.1.119
-                        if alias == 'VkPhysicalDeviceVariablePointersFeatures':
-                            sTypeAlias = 'VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VARIABLE_POINTERS_FEATURES'
-                        
-                        if sTypeAlias != None:
-                            aliasStructDef.sType = sTypeAlias
+            if alias in self.structs:
+                baseStructDef = self.structs[alias]
+                aliasStructDef = self.structs[name]
+
+                # Set as alias
+                aliasStructDef.isAlias = True
+
+                # Fill missing struct information for the alias
+                aliasStructDef.extends = baseStructDef.extends
+                aliasStructDef.members = baseStructDef.members
+                aliasStructDef.aliases = baseStructDef.aliases
+                aliasStructDef.aliases.append(name)
+
+                # Use alias structure dependencies as the structure dependencies if the latter has none
+                # This is needed to handle the case when the structure is not part of the target API
+                # but is a dependency of the alias
+                if baseStructDef.definedByVersion is None and len(baseStructDef.definedByExtensions) == 0:
+                    baseStructDef.definedByVersion = aliasStructDef.definedByVersion
+                    baseStructDef.definedByExtensions = aliasStructDef.definedByExtensions
+
+                if baseStructDef.sType != None:
+                    sTypeAlias = None
+
+                    # First try to find sType alias in core versions
+                    if aliasStructDef.definedByVersion != None:
+                        sTypeAlias = self.versionSTypeAliases[aliasStructDef.definedByVersion.versionName].get(baseStructDef.sType)
+
+                    # Otherwise need to find sType alias in extension
+                    if sTypeAlias == None:
+                        for extName in aliasStructDef.definedByExtensions:
+                            sTypeAlias = self.extensions[extName].sTypeAliases.get(baseStructDef.sType)
+                            if sTypeAlias != None:
+                                break
+
+                    #Workaround due to a vk.xml issue that was resolved with 1.1.119
+                    if alias == 'VkPhysicalDeviceVariablePointersFeatures':
+                        sTypeAlias = 'VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VARIABLE_POINTERS_FEATURES'
+                    
+                    if sTypeAlias != None:
+                        aliasStructDef.sType = sTypeAlias
 
         # Find any enum aliases
-        for enum in xml.findall("./types/type[@category='enum']"):
+        for enum in xml.iterfind("./types/type[@category='enum']"):
             name = enum.get('name')
 
             # Don't process enum type if it is not required or if it is removed
@@ -3760,10 +1346,10 @@ class VulkanRegistry():
                     Log.f("Failed to find alias '{0}' of enum '{1}'".format(alias, enum.get('name')))
 
         # Find any enum value aliases
-        for enum in xml.findall("./enums"):
+        for enum in xml.iterfind("./enums"):
             if enum.get('name') in self.enums.keys():
                 enumDef = self.enums[enum.get('name')]
-                for aliasValue in enum.findall("./enum[@alias]"):
+                for aliasValue in enum.iterfind("./enum[@alias]"):
                     name = aliasValue.get('name')
                     alias = aliasValue.get('alias')
                     enumDef.values.append(name)
@@ -3777,7 +1363,7 @@ class VulkanRegistry():
                 enumDef.aliasValues[name] = alias
 
         # Find any bitmask (flags) aliases
-        for bitmask in xml.findall("./types/type[@category='bitmask']"):
+        for bitmask in xml.iterfind("./types/type[@category='bitmask']"):
             name = bitmask.get('name')
 
             # Don't process bitmask if it is not required or if it is removed
@@ -3806,7 +1392,7 @@ class VulkanRegistry():
                     Log.f("Failed to find alias '{0}' of bitmask '{1}'".format(alias, bitmask.get('name')))
 
         # Find any constant aliases
-        for constant in xml.find("./enums[@name='API Constants']").findall("./enum[@alias]"):
+        for constant in xml.find("./enums[@name='API Constants']").iterfind("./enum[@alias]"):
             self.constants[constant.get('name')] = self.constants[constant.get('alias')]
 
     def parseExternalTypes(self, xml):
@@ -3814,11 +1400,11 @@ class VulkanRegistry():
         self.externalTypes = set()
 
         # Find all include definitions
-        for include in xml.findall("./types/type[@category='include']"):
+        for include in xml.iterfind("./types/type[@category='include']"):
             self.includes.add(include.get('name'))
 
         # Find all types depending on the includes
-        for type in xml.findall("./types/type[@requires]"):
+        for type in xml.iterfind("./types/type[@requires]"):
             if type.get('requires') in self.includes:
                 self.externalTypes.add(type.get('name'))
 
@@ -3835,7 +1421,7 @@ class VulkanRegistry():
                 # For all other versions use the feature structures required by it
                 featureStructNames = []
                 xmlVersion = xml.find("./feature[@name='" + version.name + "']")
-                for type in xmlVersion.findall("./require/type"):
+                for type in XPATH_REQUIRE_TYPES(xmlVersion):
                     name = type.get('name')
                     if name in self.structs and 'VkPhysicalDeviceFeatures2' in self.structs[name].extends:
                         featureStructNames.append(name)
@@ -3858,7 +1444,7 @@ class VulkanRegistry():
         for extension in self.extensions.values():
             featureStructNames = []
             xmlExtension = xml.find("./extensions/extension[@name='" + extension.name + "']")
-            for type in xmlExtension.findall("./require/type"):
+            for type in XPATH_REQUIRE_TYPES(xmlExtension):
                 name = type.get('name')
                 if name in self.structs and 'VkPhysicalDeviceFeatures2' in self.structs[name].extends:
                     featureStructNames.append(name)
@@ -3890,7 +1476,7 @@ class VulkanRegistry():
                 # For all other versions use the property structures required by it
                 limitStructNames = []
                 xmlVersion = xml.find("./feature[@name='" + version.name + "']")
-                for type in xmlVersion.findall("./require/type"):
+                for type in XPATH_REQUIRE_TYPES(xmlVersion):
                     name = type.get('name')
                     if name in self.structs and 'VkPhysicalDeviceProperties2' in self.structs[name].extends:
                         limitStructNames.append(name)
@@ -3913,7 +1499,7 @@ class VulkanRegistry():
         for extension in self.extensions.values():
             limitStructNames = []
             xmlExtension = xml.find("./extensions/extension[@name='" + extension.name + "']")
-            for type in xmlExtension.findall("./require/type"):
+            for type in XPATH_REQUIRE_TYPES(xmlExtension):
                 name = type.get('name')
                 if name in self.structs and 'VkPhysicalDeviceProperties2' in self.structs[name].extends:
                     limitStructNames.append(name)
@@ -3935,19 +1521,19 @@ class VulkanRegistry():
         maxVersionNumber = self.versions[max(self.versions, key = lambda version: self.versions[version].number)].number
         self.headerVersionNumber = VulkanVersionNumber(str(maxVersionNumber))
         # Add patch from VK_HEADER_VERSION define
-        for define in xml.findall("./types/type[@category='define']"):
+        for define in xml.iterfind("./types/type[@category='define']"):
             name = define.find('./name')
             if name != None and name.text == 'VK_HEADER_VERSION':
                 self.headerVersionNumber.patch = int(name.tail.lstrip())
                 return
 
     def parseVideoConstants(self, videoxml):
-        for constant in videoxml.findall("./extensions/extension/require/enum[@value]"):
+        for constant in videoxml.iterfind("./extensions/extension/require/enum[@value]"):
             self.constants[constant.get('name')] = constant.get('value')
 
     def parseVideoEnums(self, videoxml):
         # Find enum definitions
-        for enum in videoxml.findall("./enums[@name]"):
+        for enum in videoxml.iterfind("./enums[@name]"):
             name = enum.get('name')
 
             # Only add video enum type if it is a required external type
@@ -3956,7 +1542,7 @@ class VulkanRegistry():
                 enumDef = VulkanEnum(name)
 
                 # First collect base values
-                for value in enum.findall("./enum"):
+                for value in enum.iterfind("./enum"):
                     if value.get('alias') is None:
                         enumDef.values.append(value.get('name'))
 
@@ -3982,7 +1568,7 @@ class VulkanRegistry():
         self.parseVideoEnums(videoxml)
 
         xmlVideoCodecs = xml.find("./videocodecs")
-        for xmlVideoCodec in xmlVideoCodecs.findall("./videocodec"):
+        for xmlVideoCodec in xmlVideoCodecs.iterfind("./videocodec"):
             name = xmlVideoCodec.get('name')
             extend = xmlVideoCodec.get('extend')
             value = xmlVideoCodec.get('value')
@@ -3995,26 +1581,26 @@ class VulkanRegistry():
                 self.videoCodecsByValue[value] = self.videoCodecs[name]
             videoCodec = self.videoCodecs[name]
 
-            for xmlVideoProfiles in xmlVideoCodec.findall("./videoprofiles"):
+            for xmlVideoProfiles in xmlVideoCodec.iterfind("./videoprofiles"):
                 videoProfileStructName = xmlVideoProfiles.get('struct')
                 videoCodec.profileStructs[videoProfileStructName] = VulkanVideoProfileStruct(videoProfileStructName)
                 videoProfileStruct = videoCodec.profileStructs[videoProfileStructName]
                 self.videoCodecsByStructName[videoProfileStructName] = videoCodec
 
-                for xmlVideoProfileMember in xmlVideoProfiles.findall("./videoprofilemember"):
+                for xmlVideoProfileMember in xmlVideoProfiles.iterfind("./videoprofilemember"):
                     memberName = xmlVideoProfileMember.get('name')
                     videoProfileStruct.members[memberName] = VulkanVideoProfileStructMember(memberName)
                     videoProfileStructMember = videoProfileStruct.members[memberName]
 
-                    for xmlVideoProfile in xmlVideoProfileMember.findall("./videoprofile"):
+                    for xmlVideoProfile in xmlVideoProfileMember.iterfind("./videoprofile"):
                         videoProfileStructMember.values[xmlVideoProfile.get('value')] = xmlVideoProfile.get('name')
 
-            for xmlVideoCapabilities in xmlVideoCodec.findall("./videocapabilities"):
+            for xmlVideoCapabilities in xmlVideoCodec.iterfind("./videocapabilities"):
                 capabilityStructName = xmlVideoCapabilities.get('struct')
                 videoCodec.capabilities[capabilityStructName] = capabilityStructName
                 self.videoCodecsByStructName[capabilityStructName] = videoCodec
 
-            for xmlVideoFormat in xmlVideoCodec.findall("./videoformat"):
+            for xmlVideoFormat in xmlVideoCodec.iterfind("./videoformat"):
                 videoFormatName = xmlVideoFormat.get('name')
                 videoFormatExtend = xmlVideoFormat.get('extend')
                 if videoFormatName is not None:
@@ -4031,12 +1617,12 @@ class VulkanRegistry():
                 else:
                     Log.f('"name" or "extend" is attribute is required for "videoformat" element')
 
-                for xmlVideoFormatProperties in xmlVideoFormat.findall("./videoformatproperties"):
+                for xmlVideoFormatProperties in xmlVideoFormat.iterfind("./videoformatproperties"):
                     propertiesStructName = xmlVideoFormatProperties.get('struct')
                     videoFormat.properties[propertiesStructName] = propertiesStructName
                     self.videoCodecsByStructName[propertiesStructName] = videoCodec
 
-                for xmlVideoFormatRequiredCap in xmlVideoFormat.findall("./videorequirecapabilities"):
+                for xmlVideoFormatRequiredCap in xmlVideoFormat.iterfind("./videorequirecapabilities"):
                     requiredCapStruct = xmlVideoFormatRequiredCap.get('struct')
                     requiredCapMember = xmlVideoFormatRequiredCap.get('member')
                     requiredCapValue = xmlVideoFormatRequiredCap.get('value')
@@ -4207,255 +1793,24 @@ class VulkanRegistry():
         if self.headerVersionNumber.patch < 207: # vk.xml declares maxColorAttachments with 'bitmask' limittype before header 207
             self.structs['VkPhysicalDeviceLimits'].members['maxColorAttachments'].limittype = 'max'
 
-        # TODO: We currently have to apply workarounds due to "noauto" limittypes and other bugs related to limittypes in the vk.xml
-        # These can only be solved permanently if we make modifications to the registry xml itself
-        if 'VkPhysicalDeviceLimits' in self.structs:
-            self.structs['VkPhysicalDeviceLimits'].members['subPixelPrecisionBits'].limittype = 'bits'
-            self.structs['VkPhysicalDeviceLimits'].members['subTexelPrecisionBits'].limittype = 'bits'
-            self.structs['VkPhysicalDeviceLimits'].members['mipmapPrecisionBits'].limittype = 'bits'
-            self.structs['VkPhysicalDeviceLimits'].members['viewportSubPixelBits'].limittype = 'bits'
-            self.structs['VkPhysicalDeviceLimits'].members['subPixelInterpolationOffsetBits'].limittype = 'bits'
-            self.structs['VkPhysicalDeviceLimits'].members['minMemoryMapAlignment'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceLimits'].members['minTexelBufferOffsetAlignment'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceLimits'].members['minUniformBufferOffsetAlignment'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceLimits'].members['minStorageBufferOffsetAlignment'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceLimits'].members['optimalBufferCopyOffsetAlignment'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceLimits'].members['optimalBufferCopyRowPitchAlignment'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceLimits'].members['nonCoherentAtomSize'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceLimits'].members['timestampPeriod'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceLimits'].members['bufferImageGranularity'].limittype = 'min,mul'
-            self.structs['VkPhysicalDeviceLimits'].members['pointSizeGranularity'].limittype = 'min,mul'
-            self.structs['VkPhysicalDeviceLimits'].members['lineWidthGranularity'].limittype = 'min,mul'
-            self.structs['VkPhysicalDeviceLimits'].members['strictLines'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceLimits'].members['standardSampleLocations'].limittype = 'exact'
-
-        if 'VkPhysicalDeviceSparseProperties' in self.structs:
-            self.structs['VkPhysicalDeviceSparseProperties'].members['residencyAlignedMipSize'].limittype = 'not'
-
-        if 'VkPhysicalDeviceVulkan11Properties' in self.structs:
-            self.structs['VkPhysicalDeviceVulkan11Properties'].members['deviceUUID'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceVulkan11Properties'].members['driverUUID'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceVulkan11Properties'].members['deviceLUID'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceVulkan11Properties'].members['deviceNodeMask'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceVulkan11Properties'].members['deviceLUIDValid'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceVulkan11Properties'].members['subgroupSize'].limittype = 'max,pot'
-            self.structs['VkPhysicalDeviceVulkan11Properties'].members['pointClippingBehavior'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceVulkan11Properties'].members['protectedNoFault'].limittype = 'exact'
-
-        if 'VkPhysicalDeviceVulkan12Properties' in self.structs:
-            self.structs['VkPhysicalDeviceVulkan12Properties'].members['driverID'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceVulkan12Properties'].members['driverName'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceVulkan12Properties'].members['driverInfo'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceVulkan12Properties'].members['conformanceVersion'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceVulkan12Properties'].members['denormBehaviorIndependence'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceVulkan12Properties'].members['roundingModeIndependence'].limittype = 'exact'
-
-        if 'VkPhysicalDeviceVulkan13Properties' in self.structs:
-            self.structs['VkPhysicalDeviceVulkan13Properties'].members['storageTexelBufferOffsetAlignmentBytes'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceVulkan13Properties'].members['storageTexelBufferOffsetSingleTexelAlignment'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceVulkan13Properties'].members['uniformTexelBufferOffsetAlignmentBytes'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceVulkan13Properties'].members['uniformTexelBufferOffsetSingleTexelAlignment'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceVulkan13Properties'].members['minSubgroupSize'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceVulkan13Properties'].members['maxSubgroupSize'].limittype = 'max,pot'
-
-        if 'VkPhysicalDeviceVulkan14Properties' in self.structs:
-            self.structs['VkPhysicalDeviceVulkan14Properties'].members['maxCombinedImageSamplerDescriptorCount'].limittype = 'min,pot'
-
-        if 'VkPhysicalDeviceTexelBufferAlignmentProperties' in self.structs:
-            self.structs['VkPhysicalDeviceTexelBufferAlignmentProperties'].members['storageTexelBufferOffsetAlignmentBytes'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceTexelBufferAlignmentProperties'].members['storageTexelBufferOffsetSingleTexelAlignment'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceTexelBufferAlignmentProperties'].members['uniformTexelBufferOffsetAlignmentBytes'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceTexelBufferAlignmentProperties'].members['uniformTexelBufferOffsetSingleTexelAlignment'].limittype = 'exact'
-
-        if 'VkPhysicalDeviceProperties' in self.structs:
-            self.structs['VkPhysicalDeviceProperties'].members['apiVersion'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceProperties'].members['driverVersion'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceProperties'].members['vendorID'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceProperties'].members['deviceID'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceProperties'].members['deviceType'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceProperties'].members['deviceName'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceProperties'].members['pipelineCacheUUID'].limittype = 'noauto'
-
-        if 'VkPhysicalDeviceToolProperties' in self.structs:
-            self.structs['VkPhysicalDeviceToolProperties'].members['name'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceToolProperties'].members['version'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceToolProperties'].members['purposes'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceToolProperties'].members['description'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceToolProperties'].members['layer'].limittype = 'noauto'
-
-        if 'VkPhysicalDeviceSubgroupSizeControlProperties' in self.structs:
-            self.structs['VkPhysicalDeviceSubgroupSizeControlProperties'].members['minSubgroupSize'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceSubgroupSizeControlProperties'].members['maxSubgroupSize'].limittype = 'max,pot'
-
-        if 'VkPhysicalDeviceDriverProperties' in self.structs:
-            self.structs['VkPhysicalDeviceDriverProperties'].members['driverID'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceDriverProperties'].members['driverName'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceDriverProperties'].members['driverInfo'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceDriverProperties'].members['conformanceVersion'].limittype = 'noauto'
-
-        if 'VkPhysicalDeviceIDProperties' in self.structs:
-            self.structs['VkPhysicalDeviceIDProperties'].members['deviceUUID'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceIDProperties'].members['driverUUID'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceIDProperties'].members['deviceLUID'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceIDProperties'].members['deviceNodeMask'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceIDProperties'].members['deviceLUIDValid'].limittype = 'noauto'
-
-        if 'VkPhysicalDeviceSubgroupProperties' in self.structs:
-            self.structs['VkPhysicalDeviceSubgroupProperties'].members['subgroupSize'].limittype = 'max,pot'
-
-        if 'VkPhysicalDevicePointClippingProperties' in self.structs:
-            self.structs['VkPhysicalDevicePointClippingProperties'].members['pointClippingBehavior'].limittype = 'exact'
-
-        if 'VkPhysicalDeviceProtectedMemoryProperties' in self.structs:
-            self.structs['VkPhysicalDeviceProtectedMemoryProperties'].members['protectedNoFault'].limittype = 'exact'
-
-        if 'VkPhysicalDeviceFloatControlsProperties' in self.structs:
-            self.structs['VkPhysicalDeviceFloatControlsProperties'].members['denormBehaviorIndependence'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceFloatControlsProperties'].members['roundingModeIndependence'].limittype = 'exact'
-
-        if 'VkPhysicalDeviceTexelBufferAlignmentProperties' in self.structs:
-            self.structs['VkPhysicalDeviceTexelBufferAlignmentProperties'].members['storageTexelBufferOffsetSingleTexelAlignment'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceTexelBufferAlignmentProperties'].members['uniformTexelBufferOffsetSingleTexelAlignment'].limittype = 'exact'
-
-        if 'VkPhysicalDevicePortabilitySubsetPropertiesKHR' in self.structs: # BETA extension
-            self.structs['VkPhysicalDevicePortabilitySubsetPropertiesKHR'].members['minVertexInputBindingStrideAlignment'].limittype = 'min,pot'
-
-        if 'VkPhysicalDeviceFragmentShadingRatePropertiesKHR' in self.structs:
-            self.structs['VkPhysicalDeviceFragmentShadingRatePropertiesKHR'].members['maxFragmentShadingRateAttachmentTexelSizeAspectRatio'].limittype = 'max,pot'
-            self.structs['VkPhysicalDeviceFragmentShadingRatePropertiesKHR'].members['maxFragmentSizeAspectRatio'].limittype = 'max,pot'
-            self.structs['VkPhysicalDeviceFragmentShadingRatePropertiesKHR'].members['maxFragmentShadingRateCoverageSamples'].limittype = 'max'
-
-        if 'VkPhysicalDeviceRayTracingPipelinePropertiesKHR' in self.structs:
-            self.structs['VkPhysicalDeviceRayTracingPipelinePropertiesKHR'].members['shaderGroupHandleSize'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceRayTracingPipelinePropertiesKHR'].members['shaderGroupBaseAlignment'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceRayTracingPipelinePropertiesKHR'].members['shaderGroupHandleCaptureReplaySize'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceRayTracingPipelinePropertiesKHR'].members['shaderGroupHandleAlignment'].limittype = 'min,pot'
-
         if self.headerVersionNumber.patch < 215: # vk.xml declares maxFragmentShadingRateRasterizationSamples with 'noauto' limittype before header 215
             if 'VkPhysicalDeviceFragmentShadingRatePropertiesKHR' in self.structs:
                 self.structs['VkPhysicalDeviceFragmentShadingRatePropertiesKHR'].members['maxFragmentShadingRateRasterizationSamples'].limittype = 'max'
 
-        if 'VkPhysicalDeviceConservativeRasterizationPropertiesEXT' in self.structs:
-            self.structs['VkPhysicalDeviceConservativeRasterizationPropertiesEXT'].members['primitiveOverestimationSize'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceConservativeRasterizationPropertiesEXT'].members['extraPrimitiveOverestimationSizeGranularity'].limittype = 'min,mul'
-            self.structs['VkPhysicalDeviceConservativeRasterizationPropertiesEXT'].members['conservativePointAndLineRasterization'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceConservativeRasterizationPropertiesEXT'].members['degenerateTrianglesRasterized'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceConservativeRasterizationPropertiesEXT'].members['degenerateLinesRasterized'].limittype = 'exact'
-
-        if 'VkPhysicalDeviceLineRasterizationPropertiesEXT' in self.structs:
-            self.structs['VkPhysicalDeviceLineRasterizationPropertiesEXT'].members['lineSubPixelPrecisionBits'].limittype = 'bits'
-
         if self.headerVersionNumber.patch < 213:
             if 'VkPhysicalDeviceTransformFeedbackPropertiesEXT' in self.structs:
                 self.structs['VkPhysicalDeviceTransformFeedbackPropertiesEXT'].members['maxTransformFeedbackBufferDataStride'].limittype = 'max'
-
-        if 'VkPhysicalDeviceExternalMemoryHostPropertiesEXT' in self.structs:
-            self.structs['VkPhysicalDeviceExternalMemoryHostPropertiesEXT'].members['minImportedHostPointerAlignment'].limittype = 'min,pot'
-
-        if 'VkPhysicalDevicePCIBusInfoPropertiesEXT' in self.structs:
-            self.structs['VkPhysicalDevicePCIBusInfoPropertiesEXT'].members['pciDomain'].limittype = 'noauto'
-            self.structs['VkPhysicalDevicePCIBusInfoPropertiesEXT'].members['pciBus'].limittype = 'noauto'
-            self.structs['VkPhysicalDevicePCIBusInfoPropertiesEXT'].members['pciDevice'].limittype = 'noauto'
-            self.structs['VkPhysicalDevicePCIBusInfoPropertiesEXT'].members['pciFunction'].limittype = 'noauto'
-
-        if 'VkPhysicalDeviceDrmPropertiesEXT' in self.structs:
-            self.structs['VkPhysicalDeviceDrmPropertiesEXT'].members['hasPrimary'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceDrmPropertiesEXT'].members['hasRender'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceDrmPropertiesEXT'].members['primaryMajor'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceDrmPropertiesEXT'].members['primaryMinor'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceDrmPropertiesEXT'].members['renderMajor'].limittype = 'noauto'
-            self.structs['VkPhysicalDeviceDrmPropertiesEXT'].members['renderMinor'].limittype = 'noauto'
-
-        if 'VkPhysicalDeviceFragmentDensityMap2PropertiesEXT' in self.structs:
-            self.structs['VkPhysicalDeviceFragmentDensityMap2PropertiesEXT'].members['subsampledLoads'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceFragmentDensityMap2PropertiesEXT'].members['subsampledCoarseReconstructionEarlyAccess'].limittype = 'exact'
-
-        if 'VkPhysicalDeviceSampleLocationsPropertiesEXT' in self.structs:
-            self.structs['VkPhysicalDeviceSampleLocationsPropertiesEXT'].members['sampleLocationSubPixelBits'].limittype = 'bits'
-
-        if 'VkPhysicalDeviceRobustness2PropertiesEXT' in self.structs:
-            self.structs['VkPhysicalDeviceRobustness2PropertiesEXT'].members['robustStorageBufferAccessSizeAlignment'].limittype = 'min,pot'
-            self.structs['VkPhysicalDeviceRobustness2PropertiesEXT'].members['robustUniformBufferAccessSizeAlignment'].limittype = 'min,pot'
-
-        if 'VkPhysicalDeviceShaderCorePropertiesAMD' in self.structs:
-            self.structs['VkPhysicalDeviceShaderCorePropertiesAMD'].members['shaderEngineCount'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceShaderCorePropertiesAMD'].members['shaderArraysPerEngineCount'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceShaderCorePropertiesAMD'].members['computeUnitsPerShaderArray'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceShaderCorePropertiesAMD'].members['simdPerComputeUnit'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceShaderCorePropertiesAMD'].members['wavefrontsPerSimd'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceShaderCorePropertiesAMD'].members['wavefrontSize'].limittype = 'max'
-            self.structs['VkPhysicalDeviceShaderCorePropertiesAMD'].members['sgprsPerSimd'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceShaderCorePropertiesAMD'].members['sgprAllocationGranularity'].limittype = 'min,mul'
-            self.structs['VkPhysicalDeviceShaderCorePropertiesAMD'].members['vgprsPerSimd'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceShaderCorePropertiesAMD'].members['vgprAllocationGranularity'].limittype = 'min,mul'
-
-        if 'VkPhysicalDeviceSubpassShadingPropertiesHUAWEI' in self.structs:
-            self.structs['VkPhysicalDeviceSubpassShadingPropertiesHUAWEI'].members['maxSubpassShadingWorkgroupSizeAspectRatio'].limittype = 'max,pot'
-
-        if 'VkPhysicalDeviceRayTracingPropertiesNV' in self.structs:
-            self.structs['VkPhysicalDeviceRayTracingPropertiesNV'].members['shaderGroupHandleSize'].limittype = 'exact'
-            self.structs['VkPhysicalDeviceRayTracingPropertiesNV'].members['shaderGroupBaseAlignment'].limittype = 'exact'
-
-        if 'VkPhysicalDeviceShadingRateImagePropertiesNV' in self.structs:
-            self.structs['VkPhysicalDeviceShadingRateImagePropertiesNV'].members['shadingRateTexelSize'].limittype = 'exact'
-
-        if 'VkPhysicalDeviceMeshShaderPropertiesNV' in self.structs:
-            self.structs['VkPhysicalDeviceMeshShaderPropertiesNV'].members['meshOutputPerVertexGranularity'].limittype = 'min,mul'
-            self.structs['VkPhysicalDeviceMeshShaderPropertiesNV'].members['meshOutputPerPrimitiveGranularity'].limittype = 'min,mul'
-
-        if 'VkPhysicalDevicePipelineRobustnessPropertiesEXT' in self.structs:
-            self.structs['VkPhysicalDevicePipelineRobustnessPropertiesEXT'].members['defaultRobustnessStorageBuffers'].limittype = 'exact'
-            self.structs['VkPhysicalDevicePipelineRobustnessPropertiesEXT'].members['defaultRobustnessUniformBuffers'].limittype = 'exact'
-            self.structs['VkPhysicalDevicePipelineRobustnessPropertiesEXT'].members['defaultRobustnessVertexInputs'].limittype = 'exact'
-            self.structs['VkPhysicalDevicePipelineRobustnessPropertiesEXT'].members['defaultRobustnessImages'].limittype = 'exact'
-
-        if self.headerVersionNumber.patch < 213:
             if 'VkPhysicalDeviceDeviceGeneratedCommandsPropertiesNV' in self.structs:
                 self.structs['VkPhysicalDeviceDeviceGeneratedCommandsPropertiesNV'].members['minSequencesCountBufferOffsetAlignment'].limittype = 'min'
                 self.structs['VkPhysicalDeviceDeviceGeneratedCommandsPropertiesNV'].members['minSequencesIndexBufferOffsetAlignment'].limittype = 'min'
                 self.structs['VkPhysicalDeviceDeviceGeneratedCommandsPropertiesNV'].members['minIndirectCommandsBufferOffsetAlignment'].limittype = 'min'
 
-        if 'VkPhysicalDeviceFragmentDensityMapOffsetPropertiesQCOM' in self.structs:
-            self.structs['VkPhysicalDeviceFragmentDensityMapOffsetPropertiesQCOM'].members['fragmentDensityOffsetGranularity'].limittype = 'min,mul'
-
-        if 'VkPhysicalDeviceSchedulingControlsPropertiesARM' in self.structs:
-            self.structs['VkPhysicalDeviceSchedulingControlsPropertiesARM'].members['schedulingControlsFlags'].limittype = 'bitmask'
-
-        if 'VkPhysicalDeviceExternalFormatResolvePropertiesANDROID' in self.structs:
-            self.structs['VkPhysicalDeviceExternalFormatResolvePropertiesANDROID'].members['nullColorAttachmentWithExternalFormatResolve'].limittype = 'not'
-
-        if 'VkPhysicalDeviceRenderPassStripedPropertiesARM' in self.structs:
-            self.structs['VkPhysicalDeviceRenderPassStripedPropertiesARM'].members['renderPassStripeGranularity'].limittype = 'min'
-            self.structs['VkPhysicalDeviceRenderPassStripedPropertiesARM'].members['maxRenderPassStripes'].limittype = 'max'
-
-        if 'VkPhysicalDeviceMaintenance6PropertiesKHR' in self.structs:
-            self.structs['VkPhysicalDeviceMaintenance6PropertiesKHR'].members['maxCombinedImageSamplerDescriptorCount'].limittype = 'max'
-
-        if 'VkPhysicalDeviceDeviceGeneratedCommandsPropertiesEXT' in self.structs:
-            self.structs['VkPhysicalDeviceDeviceGeneratedCommandsPropertiesEXT'].members['supportedIndirectCommandsInputModes'].limittype = 'bitmask'
-            self.structs['VkPhysicalDeviceDeviceGeneratedCommandsPropertiesEXT'].members['supportedIndirectCommandsShaderStages'].limittype = 'bitmask'
-            self.structs['VkPhysicalDeviceDeviceGeneratedCommandsPropertiesEXT'].members['supportedIndirectCommandsShaderStagesPipelineBinding'].limittype = 'bitmask'
-            self.structs['VkPhysicalDeviceDeviceGeneratedCommandsPropertiesEXT'].members['supportedIndirectCommandsShaderStagesShaderBinding'].limittype = 'bitmask'
-
-        # TODO: The registry xml is also missing limittype definitions for format and queue family properties
-        # For now we just add the important ones, this needs a larger overhaul in the vk.xml
-        self.structs['VkFormatProperties'].members['linearTilingFeatures'].limittype = 'bitmask'
-        self.structs['VkFormatProperties'].members['optimalTilingFeatures'].limittype = 'bitmask'
-        self.structs['VkFormatProperties'].members['bufferFeatures'].limittype = 'bitmask'
-        if 'VkFormatProperties3' in self.structs:
-            self.structs['VkFormatProperties3'].members['linearTilingFeatures'].limittype = 'bitmask'
-            self.structs['VkFormatProperties3'].members['optimalTilingFeatures'].limittype = 'bitmask'
-            self.structs['VkFormatProperties3'].members['bufferFeatures'].limittype = 'bitmask'
-
-        self.structs['VkQueueFamilyProperties'].members['queueFlags'].limittype = 'bitmask'
-        self.structs['VkQueueFamilyProperties'].members['queueCount'].limittype = 'max'
-        self.structs['VkQueueFamilyProperties'].members['timestampValidBits'].limittype = 'bits'
-        self.structs['VkQueueFamilyProperties'].members['minImageTransferGranularity'].limittype = 'min,mul'
-
-        if 'VkSparseImageFormatProperties' in self.structs:
-            self.structs['VkSparseImageFormatProperties'].members['aspectMask'].limittype = 'bitmask'
-            self.structs['VkSparseImageFormatProperties'].members['imageGranularity'].limittype = 'min,mul'
-            self.structs['VkSparseImageFormatProperties'].members['flags'].limittype = 'bitmask'
+        for structName, limittypes in LIMITTYPE_WORKAROUNDS.items():
+            structDef = self.structs.get(structName)
+            if structDef != None:
+                members = structDef.members
+                for memberName, limittype in limittypes.items():
+                    members[memberName].limittype = limittype
 
         # TODO: The registry xml contains some return structures that contain count + pointers to arrays
         # While the script itself is prepared to drop those, as they are ill-formed, as return structures
@@ -4466,6 +1821,8 @@ class VulkanRegistry():
         self.structs.pop('VkDrmFormatModifierPropertiesList2EXT', None)
 
     def getExtensionPromotedToVersion(self, extensionName):
+        if extensionName in self.extensionPromotedToVersion:
+            return self.extensionPromotedToVersion[extensionName]
         promotedTo = self.extensions[extensionName].promotedTo.copy()
         version = None
         while len(promotedTo) > 0:
@@ -4481,9 +1838,12 @@ class VulkanRegistry():
             else:
                 # Version or extension is not included in the target API
                 promotedTo.remove(target)
+        self.extensionPromotedToVersion[extensionName] = version
         return version
 
     def getExtensionPromotedToExtensionList(self, extensionName):
+        if extensionName in self.extensionPromotedToExtensionList:
+            return self.extensionPromotedToExtensionList[extensionName]
         promotedTo = self.extensions[extensionName].promotedTo.copy()
         extensions = []
         while len(promotedTo) > 0:
@@ -4496,6 +1856,7 @@ class VulkanRegistry():
             else:
                 # Extension is not included in the target API or is a version, skip
                 promotedTo.remove(target)
+        self.extensionPromotedToExtensionList[extensionName] = extensions
         return extensions
 
     def getChainableStructDef(self, name, extends):
@@ -4504,7 +1865,7 @@ class VulkanRegistry():
             Log.f("Structure '{0}' does not exist".format(name))
         if structDef.sType == None:
             Log.f("Structure '{0}' is not chainable".format(name))
-        if not extends in structDef.extends + [ name ]:
+        if extends != name and extends not in structDef.extends:
             Log.f("Structure '{0}' does not extend '{1}'".format(name, extends))
         return structDef
 
@@ -4557,40 +1918,57 @@ class VulkanProfileCapabilities():
             self.mergeProfileQueueFamiliesProperties(caps)
             self.mergeProfileVideoProfiles(registry, caps)
 
+    def shareMergedCaps(self, caps):
+        # Extensions and features are merged the same way in every mode
+        self.extensions = caps.extensions
+        self.instanceExtensions = caps.instanceExtensions
+        self.deviceExtensions = caps.deviceExtensions
+        self.features = caps.features
+
     def mergeProfileCapData(self, dst, src):
-        if type(src) != type(dst):
-            Log.f("Data type confict during profile capability data merge (src is '{0}', dst is '{1}')".format(type(src), type(dst)))
-        elif type(src) == dict:
+        srcType = type(src)
+        if srcType is not type(dst):
+            Log.f("Data type confict during profile capability data merge (src is '{0}', dst is '{1}')".format(srcType, type(dst)))
+        elif srcType is not dict:
+            Log.f("Unexpected data type during profile capability data merge (src is '{0}', dst is '{1}')".format(srcType, type(dst)))
+
+        # Walk the nested dicts with an explicit stack instead of recursing
+        stack = [(dst, src)]
+        while stack:
+            dst, src = stack.pop()
             for key, val in src.items():
-                if type(val) == dict:
-                    if not key in dst:
-                        dst[key] = dict()
-                    self.mergeProfileCapData(dst[key], val)
-
-                elif type(val) == list:
-                    if not key in dst:
-                        dst[key] = []
-                    dst[key].extend(val)
-
-                else:
-                    if key in dst and type(dst[key]) != type(val):
-                        # For some cases where float value are written as integer in JSON files, eg: pointSizeGranularity and lineWidthGranularity
-                        if type(val) is int and type(dst[key]) is float:
-                            dst[key] = float(val)
-                        elif type(val) is float and type(dst[key]) is int:
-                            dst[key] = float(val)
-                        else:
-                            Log.f("'{0}' data type conflict during profile capability data merge (src is '{1}', dst is '{2}')".format(key, type(val), type(dst[key])))
+                valType = type(val)
+                dstVal = dst.get(key)
+                if valType is dict:
+                    if dstVal is None:
+                        dstVal = dst[key] = dict()
+                    elif type(dstVal) is not dict:
+                        Log.f("Data type confict during profile capability data merge (src is '{0}', dst is '{1}')".format(valType, type(dstVal)))
+                    stack.append((dstVal, val))
+
+                elif valType is list:
+                    if dstVal is None:
+                        dstVal = dst[key] = []
+                    dstVal.extend(val)
+
+                elif dstVal is not None and type(dstVal) is not valType:
+                    dstValType = type(dstVal)
+                    # For some cases where float value are written as integer in JSON files, eg: pointSizeGranularity and lineWidthGranularity
+                    if valType is int and dstValType is float:
+                        dst[key] = float(val)
+                    elif valType is float and dstValType is int:
+                        dst[key] = float(val)
                     else:
-                        dst[key] = val
-        else:
-            Log.f("Unexpected data type during profile capability data merge (src is '{0}', dst is '{1}')".format(type(src), type(dst)))
+                        Log.f("'{0}' data type conflict during profile capability data merge (src is '{1}', dst is '{2}')".format(key, valType, dstValType))
+                else:
+                    dst[key] = val
 
     def mergeProfileExtensions(self, registry, data):
-        if data.get('extensions') != None:
-            for extName, specVer in data['extensions'].items():
+        extensions = data.get('extensions')
+        if extensions is not None:
+            for extName, specVer in extensions.items():
                 extInfo = registry.extensions.get(extName)
-                if extInfo != None:
+                if extInfo is not None:
                     self.extensions[extName] = specVer
                     if extInfo.type == 'instance':
                         self.instanceExtensions[extName] = specVer
@@ -4602,24 +1980,29 @@ class VulkanProfileCapabilities():
                     Log.f("Extension '{0}' does not exist".format(extName))
 
     def mergeProfileFeatures(self, data):
-        if data.get('features') != None:
-            self.mergeProfileCapData(self.features, data['features'])
+        features = data.get('features')
+        if features is not None:
+            self.mergeProfileCapData(self.features, features)
 
     def mergeProfileProperties(self, data):
-        if data.get('properties') != None:
-            self.mergeProfileCapData(self.properties, data['properties'])
+        properties = data.get('properties')
+        if properties is not None:
+            self.mergeProfileCapData(self.properties, properties)
 
     def mergeProfileFormats(self, data):
-        if data.get('formats') != None:
-            self.mergeProfileCapData(self.formats, data['formats'])
+        formats = data.get('formats')
+        if formats is not None:
+            self.mergeProfileCapData(self.formats, formats)
 
     def mergeProfileQueueFamiliesProperties(self, data):
-        if data.get('queueFamiliesProperties') != None:
-            self.queueFamiliesProperties.extend(data['queueFamiliesProperties'])
+        queueFamiliesProperties = data.get('queueFamiliesProperties')
+        if queueFamiliesProperties is not None:
+            self.queueFamiliesProperties.extend(queueFamiliesProperties)
 
     def mergeProfileVideoProfiles(self, registry, data):
-        if data.get('videoProfiles') != None:
-            for videoProfile in data.get('videoProfiles'):
+        videoProfiles = data.get('videoProfiles')
+        if videoProfiles is not None:
+            for videoProfile in videoProfiles:
                 videoProfileName = registry.getVideoProfileNameFromVideoProfile(videoProfile)
                 if not videoProfileName in self.videoProfilesByName:
                     self.videoProfilesByName[videoProfileName] = {
@@ -4650,8 +2033,9 @@ class VulkanProfileStructs():
                         if registry.structs['VkPhysicalDeviceFeatures2'] not in self.feature:
                             self.feature.append(registry.structs['VkPhysicalDeviceFeatures2'])
                 else:
-                    if registry.getChainableStructDef(name, 'VkPhysicalDeviceFeatures2') not in self.feature:
-                        self.feature.append(registry.getChainableStructDef(name, 'VkPhysicalDeviceFeatures2'))
+                    structDef = registry.getChainableStructDef(name, 'VkPhysicalDeviceFeatures2')
+                    if structDef not in self.feature:
+                        self.feature.append(structDef)
         self.eliminateAliases(self.feature)
 
         # Property struct types
@@ -4668,8 +2052,9 @@ class VulkanProfileStructs():
                         if registry.structs['VkPhysicalDeviceProperties2'] not in self.property:
                             self.property.append(registry.structs['VkPhysicalDeviceProperties2'])
                 else:
-                    if registry.getChainableStructDef(name, 'VkPhysicalDeviceProperties2') not in self.property:
-                        self.property.append(registry.getChainableStructDef(name, 'VkPhysicalDeviceProperties2'))
+                    structDef = registry.getChainableStructDef(name, 'VkPhysicalDeviceProperties2')
+                    if structDef not in self.property:
+                        self.property.append(structDef)
         self.eliminateAliases(self.property)
 
         # Queue family struct types
@@ -4689,8 +2074,9 @@ class VulkanProfileStructs():
                         if registry.structs['VkQueueFamilyProperties2'] not in self.queueFamily:
                             self.queueFamily.append(registry.structs['VkQueueFamilyProperties2'])
                 else:
-                    if registry.getChainableStructDef(name, 'VkQueueFamilyProperties2') not in self.queueFamily:
-                        self.queueFamily.append(registry.getChainableStructDef(name, 'VkQueueFamilyProperties2'))
+                    structDef = registry.getChainableStructDef(name, 'VkQueueFamilyProperties2')
+                    if structDef not in self.queueFamily:
+                        self.queueFamily.append(structDef)
         self.eliminateAliases(self.queueFamily)
 
         # Format struct types
@@ -4713,8 +2099,9 @@ class VulkanProfileStructs():
                         if registry.structs['VkFormatProperties3KHR'] not in self.format:
                             self.format.append(registry.structs['VkFormatProperties3KHR'])
                 else:
-                    if registry.getChainableStructDef(name, 'VkFormatProperties2') not in self.format:
-                        self.format.append(registry.getChainableStructDef(name, 'VkFormatProperties2'))
+                    structDef = registry.getChainableStructDef(name, 'VkFormatProperties2')
+                    if structDef not in self.format:
+                        self.format.append(structDef)
         self.eliminateAliases(self.format)
 
         # Video profile struct types
@@ -4765,10 +2152,101 @@ class VulkanProfileStructs():
             structs.remove(duplicate)
 
 
+# Initializer of the VpProfileProperties of a profile, profiles are referenced this way by name many times
+@functools.lru_cache(maxsize = None)
+def profilePropertiesInit(profileName):
+    ukey = profileName.upper()
+    return f'{ukey}_NAME, {ukey}_SPEC_VERSION'
+
+
+# Structures whose members are filled and compared through a wrapper structure, and how to access them
+WRAPPED_STRUCTS = {
+    'VkPhysicalDeviceFeatures2': ('VkPhysicalDeviceFeatures', '->features.'),
+    'VkPhysicalDeviceFeatures2KHR': ('VkPhysicalDeviceFeatures', '->features.'),
+    'VkPhysicalDeviceProperties2': ('VkPhysicalDeviceProperties', '->properties.'),
+    'VkPhysicalDeviceProperties2KHR': ('VkPhysicalDeviceProperties', '->properties.'),
+    'VkQueueFamilyProperties2': ('VkQueueFamilyProperties', '->queueFamilyProperties.'),
+    'VkQueueFamilyProperties2KHR': ('VkQueueFamilyProperties', '->queueFamilyProperties.'),
+    'VkFormatProperties2': ('VkFormatProperties', '->formatProperties.'),
+    'VkFormatProperties2KHR': ('VkFormatProperties', '->formatProperties.')
+}
+
+# Predicates used to compare a device value ({0}) against a profile value ({1}) for each limittype
+COMPARE_PREDICATES = {
+    # Compare everything else with equality
+    None: '{0} == {1}',
+    'noauto': '{0} == {1}',
+    'not': '{0} == {1}',
+    'exact': '{0} == {1}',
+    'struct': '{0} == {1}',
+    # Compare bitmask by checking if device value contains every bit of profile value
+    'bitmask': 'vpCheckFlags({0}, {1})',
+    # Compare max limit by checking if device value is greater than or equal to profile value
+    'max': '{0} >= {1}',
+    # Behaves like max, but smaller values are allowed
+    'bits': '{0} >= {1}',
+    # Compare min limit by checking if device value is less than or equal to profile value
+    'min': '{0} <= {1}',
+    # Compare max/min limit and check if the device value is a power of two
+    'max,pot': [ '{0} >= {1}', '({0} & ({0} - 1)) == 0' ],
+    'pot,max': [ '{0} >= {1}', '({0} & ({0} - 1)) == 0' ],
+    'pot': [ '({0} & ({0} - 1)) == 0' ],
+    'min,pot': [ '{0} <= {1}', '({0} & ({0} - 1)) == 0' ],
+    'pot,min': [ '{0} <= {1}', '({0} & ({0} - 1)) == 0' ],
+    # Compare min limit by checking if device value is less than or equal to profile value and a multiple of profile value
+    'min,mul': [ '{0} <= {1}', '({1} % {0}) == 0' ],
+    'mul,min': [ '{0} <= {1}', '({1} % {0}) == 0' ],
+    # Compare range limit by checking if device range is larger than or equal to profile range
+    'range': [ '{0} <= {1}', '{0} >= {1}' ]
+}
+
+# Floating point members can't use the integer bit tricks, these override the predicates above
+FLOAT_COMPARE_PREDICATES = {
+    'max,pot': [ '{0} >= {1}' ],
+    'pot,max': [ '{0} >= {1}' ],
+    'pot': [ 'isPowerOfTwo({0})' ],
+    'min,pot': [ '{0} <= {1}', 'isPowerOfTwo({0})' ],
+    'pot,min': [ '{0} <= {1}', 'isPowerOfTwo({0})' ],
+    'min,mul': [ '{0} <= {1}', 'isMultiple({1}, {0})' ],
+    'mul,min': [ '{0} <= {1}', 'isMultiple({1}, {0})' ]
+}
+
+
+# Resolves the limittype and comparison predicate of every member of a structure, these are the same for all profiles
+@functools.lru_cache(maxsize = None)
+def getCompareMembers(structDef, parentLimittype):
+    compareMembers = dict()
+    for name, member in structDef.members.items():
+        limittype = member.limittype
+        if limittype == None:
+            # Use parent's limit type
+            limittype = parentLimittype
+
+        comparePredFmt = None
+        if member.type == 'float' or member.type == 'double':
+            comparePredFmt = FLOAT_COMPARE_PREDICATES.get(limittype)
+        if comparePredFmt is None:
+            comparePredFmt = COMPARE_PREDICATES.get(limittype)
+
+        compareMembers[name] = (member, limittype, comparePredFmt)
+    return compareMembers
+
+
+# Resolves the literal suffix of floating point values assigned to every member of a structure
+@functools.lru_cache(maxsize = None)
+def getFillMembers(structDef):
+    fillMembers = dict()
+    for name, member in structDef.members.items():
+        fillMembers[name] = (member, '' if member.type == 'double' else 'f')
+    return fillMembers
+
+
 class VulkanProfile():
     def __init__(self, registry, json_profiles_database, json_profile_key, json_profile_value, json_capabilities):
         self.registry = registry
         self.key = json_profile_key
+        self.ukey = json_profile_key.upper()
+        self.propertiesInit = profilePropertiesInit(json_profile_key)
         self.label = json_profile_value['label']
         self.description = json_profile_value['description']
         self.version = json_profile_value['version']
@@ -4789,18 +2267,22 @@ class VulkanProfile():
         collected_json_capabilities = []
         collected_json_capabilities.extend(json_profiles_database.collectProfileCapabilities(profile_list))
 
-        self.merge_capabilities = VulkanProfileCapabilities(registry, json_profile_key, json_profile_value, '"MERGED"', collected_json_capabilities, True, False)
         self.doc_capabilities = VulkanProfileCapabilities(registry, json_profile_key, json_profile_value, '"DOC"', collected_json_capabilities, False, True)
+        # The merged capabilities are a subset of the documentation ones, reuse them instead of merging all blocks again
+        self.merge_capabilities = VulkanProfileCapabilities(registry, json_profile_key, json_profile_value, '"MERGED"', [], True, False)
+        self.merge_capabilities.shareMergedCaps(self.doc_capabilities)
         self.split_capabilities = dict()
         for referenced_capability in json_profile_value['capabilities']:
             # When we have multiple possible capabilities blocks, we load them all but effectively the API library can't effectively implement this behavior.
             if type(referenced_capability).__name__ == 'list':
                 for capability_key in referenced_capability:
-                    self.split_capabilities[capability_key] = VulkanProfileCapabilities(registry, json_profile_key, json_profile_value, capability_key, json_capabilities[capability_key], False, False)
+                    self.split_capabilities[capability_key] = json_profiles_database.getBlockCapabilities(registry, json_profile_key, json_profile_value, capability_key, json_capabilities[capability_key])
             elif referenced_capability in json_capabilities:
-                self.split_capabilities[referenced_capability] = VulkanProfileCapabilities(registry, json_profile_key, json_profile_value, referenced_capability, json_capabilities[referenced_capability], False, False)
+                self.split_capabilities[referenced_capability] = json_profiles_database.getBlockCapabilities(registry, json_profile_key, json_profile_value, referenced_capability, json_capabilities[referenced_capability])
 
         self.structs = VulkanProfileStructs(registry, self.split_capabilities)
+        self.structCodeCache = dict()
+        self.structFuncEntries = dict()
         self.multiple_variants = self.checkMultipleVariants(json_profile_value)
         self.collectCompileTimeRequirements()
         self.validate()
@@ -4829,6 +2311,8 @@ class VulkanProfile():
 
 
     def validate(self):
+        # Queue family and video profile structs repeat within a block, only check their dependencies once per block
+        self.structDependencies = dict()
         self.validateStructDependencies('MERGE', self.merge_capabilities)
         for capabilities_key, capabilities_value in self.split_capabilities.items():
             self.validateStructDependencies(capabilities_key, capabilities_value)
@@ -4859,19 +2343,22 @@ class VulkanProfile():
 
 
     def validateStructDependency(self, capabilities_key, capabilities_value, structName):
-        if structName in self.registry.structs:
-            structDef = self.registry.structs[structName]
-            depFound = False
-
-            # Check if the required API version defines this struct
-            if structDef.definedByVersion != None and structDef.definedByVersion <= self.apiVersionNumber:
-                depFound = True
+        structDef = self.registry.structs.get(structName)
+        if structDef is not None:
+            dependencyKey = (id(capabilities_value), structName)
+            depFound = self.structDependencies.get(dependencyKey)
+            if depFound is None:
+                depFound = False
+
+                # Check if the required API version defines this struct
+                if structDef.definedByVersion is not None and structDef.definedByVersion <= self.apiVersionNumber:
+                    depFound = True
 
-            # Check if any required extension defines this struct
-            for definedByExtension in structDef.definedByExtensions:
-                if definedByExtension in capabilities_value.extensions:
+                # Check if any required extension defines this struct
+                elif not capabilities_value.extensions.keys().isdisjoint(structDef.definedByExtensions):
                     depFound = True
-                    break
+
+                self.structDependencies[dependencyKey] = depFound
 
             if not depFound:
                 if structDef.definedByExtensions and structDef.definedByVersion:
@@ -4926,290 +2413,244 @@ class VulkanProfile():
 
 
     def generatePrivateImpl(self, debugMessages):
-        uname = self.key.upper()
-        gen = ('#ifdef {0}\n'
-               'namespace {1} {{\n').format(self.key, uname)
+        uname = self.ukey
+        gen = [(f'#ifdef {self.key}\n'
+                f'namespace {uname} {{\n')]
 
-        gen += self.gen_structTypeData()
+        gen.append(self.gen_structTypeData())
 
         if not self.multiple_variants:
-            gen += self.gen_extensionData(self.merge_capabilities, 'instance')
-            gen += self.gen_extensionData(self.merge_capabilities, 'device')
-            gen += self.gen_structDesc(self.merge_capabilities, debugMessages)
-            gen += self.gen_videoProfileStructDesc(self.merge_capabilities, debugMessages)
-        gen += '\n'
-
-        gen += 'namespace blocks {\n'
+            gen.append(self.gen_extensionData(self.merge_capabilities, 'instance'))
+            gen.append(self.gen_extensionData(self.merge_capabilities, 'device'))
+            gen.append(self.gen_structDesc(self.merge_capabilities, debugMessages))
+            gen.append(self.gen_videoProfileStructDesc(self.merge_capabilities, debugMessages))
+        gen.append(self.gen_structChainerDesc())
+        gen.append('\n')
+
+        gen.append('namespace blocks {\n')
         for key, value in self.split_capabilities.items():
-            gen += ('namespace {0} {{\n').format(key)
-            gen += self.gen_extensionData(value, 'instance')
-            gen += self.gen_extensionData(value, 'device')
-            gen += self.gen_structDesc(value, debugMessages)
-            gen += self.gen_videoProfileStructDesc(value, debugMessages)
-            gen += ('}} // namespace {0}\n').format(key)
-        gen += '} // namespace blocks\n'
-
-        gen += ('}} // namespace {1}\n'
-                '#endif // {0}\n\n').format(self.key, uname)
-        return gen
+            gen.append(f'namespace {key} {{\n')
+            gen.append(self.gen_extensionData(value, 'instance'))
+            gen.append(self.gen_extensionData(value, 'device'))
+            gen.append(self.gen_structDesc(value, debugMessages))
+            gen.append(self.gen_videoProfileStructDesc(value, debugMessages))
+            gen.append(f'}} // namespace {key}\n')
+        gen.append('} // namespace blocks\n')
+
+        gen.append((f'}} // namespace {uname}\n'
+                    f'#endif // {self.key}\n\n'))
+        return ''.join(gen)
 
     def gen_extensionData(self, capabilities, type):
-        foundExt = False
-        gen = '\n'
-        gen += 'static const VkExtensionProperties {0}Extensions[] = {{\n'.format(type)
-        for extName, specVer in sorted(capabilities.extensions.items()):
-            extInfo = self.registry.extensions[extName]
-            if extInfo.type == type:
-                gen += '    VkExtensionProperties{{ {0}_EXTENSION_NAME, {1} }},\n'.format(extInfo.upperCaseName, specVer)
-                foundExt = True
-        gen += '};\n'
-        return gen if foundExt else ''
+        # Extensions are already classified by type when merging the capabilities
+        extensions = capabilities.instanceExtensions if type == 'instance' else capabilities.deviceExtensions
+        if not extensions:
+            return ''
+        registryExtensions = self.registry.extensions
+        gen = ['\n',
+               f'static const VkExtensionProperties {type}Extensions[] = {{\n']
+        for extName, specVer in sorted(extensions.items()):
+            gen.append(f'    VkExtensionProperties{{ {registryExtensions[extName].upperCaseName}_EXTENSION_NAME, {specVer} }},\n')
+        gen.append('};\n')
+        return ''.join(gen)
 
     def gen_structTypeData(self, structDefs = None, name = None):
-        gen = ''
         if structDefs == None:
-            gen += self.gen_structTypeData(self.structs.feature, 'feature')
-            gen += self.gen_structTypeData(self.structs.property, 'property')
-            gen += self.gen_structTypeData(self.structs.queueFamily, 'queueFamily')
-            gen += self.gen_structTypeData(self.structs.format, 'format')
+            return ''.join([
+                self.gen_structTypeData(self.structs.feature, 'feature'),
+                self.gen_structTypeData(self.structs.property, 'property'),
+                self.gen_structTypeData(self.structs.queueFamily, 'queueFamily'),
+                self.gen_structTypeData(self.structs.format, 'format')
+            ])
+        elif structDefs:
+            gen = [('\n'
+                    f'static const VkStructureType {name}StructTypes[] = {{\n')]
+            for structDef in structDefs:
+                gen.append(f'    {structDef.sType},\n')
+            gen.append('};\n')
+            return ''.join(gen)
         else:
-            if structDefs:
-                gen += ('\n'
-                        'static const VkStructureType {0}StructTypes[] = {{\n').format(name)
-                for structDef in structDefs:
-                    gen += '    {0},\n'.format(structDef.sType)
-                gen += '};\n'
-        return gen
+            return ''
 
 
     def gen_listValue(self, values, isEnum = True):
-        gen = ''
-        if isEnum:
-            gen += '('
-        else:
-            gen += '{ '
-
-        separator = ''
-        if values != None and len(values) > 0:
-            for value in values:
-                gen += separator + str(value)
-                if isEnum:
-                    separator = ' | '
-                else:
-                    separator = ', '
+        if not values:
+            return '(0)' if isEnum else '{  }'
         elif isEnum:
-            gen += '0'
-
-        if isEnum:
-            gen += ')'
+            # Enum values are OR'ed together
+            return '(' + ' | '.join(map(str, values)) + ')'
         else:
-            gen += ' }'
-        return gen
+            return '{ ' + ', '.join(map(str, values)) + ' }'
 
 
     def gen_structFill(self, fmt, structDef, var, values):
-        gen = ''
-        for member, value in sorted(values.items()):
-            if member in structDef.members:
-                if type(value) == dict:
-                    # Nested structure
-                    memberDef = self.registry.structs.get(structDef.members[member].type)
-                    if memberDef != None:
-                        gen += self.gen_structFill(fmt, memberDef, var + member + '.', value)
-                    else:
-                        Log.f("Member '{0}' in structure '{1}' is not a struct".format(member, structDef.name))
-
-                elif type(value) == list:
-                    # Some sort of list (enums or integer/float list for structure initialization)
-                    if len(value) == 0:
-                        # If list is empty then ignore
-                        continue
-                    if structDef.members[member].isArray:
-                        if not isinstance(self.registry.evalArraySize(structDef.members[member].arraySize), int):
-                            Log.f("Unsupported array member '{0}' in structure '{1}'".format(member, structDef.name) +
-                                  "(currently only 1D non-dynamic arrays are supported in this context)")
-                        # If it's an array we have to generate per-element assignment code
-                        for i, v in enumerate(value):
-                            if type(v) == float:
-                                if structDef.members[member].type == 'double':
-                                    gen += fmt.format('{0}{1}[{2}] = {3}'.format(var, member, i, v))
+        gen = []
+        # Bind the methods used for every member once
+        append = gen.append
+        formatLine = fmt.format
+        structs = self.registry.structs
+        # Nested structures are visited in place through a stack of member iterators instead of recursing
+        stack = [(structDef, var, iter(sorted(values.items())))]
+        while stack:
+            structDef, var, memberValues = stack[-1]
+            getFillMember = getFillMembers(structDef).get
+            for member, value in memberValues:
+                fillMember = getFillMember(member)
+                if fillMember is not None:
+                    memberInfo, floatSuffix = fillMember
+                    if type(value) is dict:
+                        # Nested structure
+                        memberDef = structs.get(memberInfo.type)
+                        if memberDef != None:
+                            stack.append((memberDef, var + member + '.', iter(sorted(value.items()))))
+                            break
+                        else:
+                            Log.f(f"Member '{member}' in structure '{structDef.name}' is not a struct")
+
+                    elif type(value) is list:
+                        # Some sort of list (enums or integer/float list for structure initialization)
+                        if len(value) == 0:
+                            # If list is empty then ignore
+                            continue
+                        if memberInfo.isArray:
+                            if not isinstance(self.registry.evalArraySize(memberInfo.arraySize), int):
+                                Log.f(f"Unsupported array member '{member}' in structure '{structDef.name}'" +
+                                      "(currently only 1D non-dynamic arrays are supported in this context)")
+                            # If it's an array we have to generate per-element assignment code
+                            for i, v in enumerate(value):
+                                if type(v) is float:
+                                    append(formatLine(f'{var}{member}[{i}] = {v}{floatSuffix}'))
                                 else:
-                                    gen += fmt.format('{0}{1}[{2}] = {3}f'.format(var, member, i, v))
-                            else:
-                                gen += fmt.format('{0}{1}[{2}] = {3}'.format(var, member, i, v))
-                    else:
-                        # For enums and struct initialization, most of the code can be shared
-                        isEnum = isinstance(value[0], str)
-                        if isEnum:
-                            # For enums we only add bits
-                            genAssign = '{0}{1} |= '.format(var, member)
+                                    append(formatLine(f'{var}{member}[{i}] = {v}'))
                         else:
-                            genAssign = '{0}{1} = '.format(var, member)
-                        genAssign += '{0}'.format(self.gen_listValue(value, isEnum))
-                        gen += fmt.format(genAssign)
-                elif type(value) == float:
-                    if structDef.members[member].type == 'double':
-                        gen += fmt.format('{0}{1} = {2}'.format(var, member, value))
-                    else:
-                        gen += fmt.format('{0}{1} = {2}f'.format(var, member, value))
-                elif type(value) == bool:
-                    # Boolean
-                    gen += fmt.format('{0}{1} = {2}'.format(var, member, 'VK_TRUE' if value else 'VK_FALSE'))
+                            # For enums and struct initialization, most of the code can be shared
+                            isEnum = isinstance(value[0], str)
+                            if isEnum:
+                                # For enums we only add bits
+                                genAssign = f'{var}{member} |= '
+                            else:
+                                genAssign = f'{var}{member} = '
+                            genAssign += self.gen_listValue(value, isEnum)
+                            append(formatLine(genAssign))
+                    elif type(value) is float:
+                        append(formatLine(f'{var}{member} = {value}{floatSuffix}'))
+                    elif type(value) is bool:
+                        # Boolean
+                        append(formatLine(f'{var}{member} = ' + ('VK_TRUE' if value else 'VK_FALSE')))
 
+                    else:
+                        # Everything else
+                        append(formatLine(f'{var}{member} = {value}'))
                 else:
-                    # Everything else
-                    gen += fmt.format('{0}{1} = {2}'.format(var, member, value))
+                    Log.f(f"No member '{member}' in structure '{structDef.name}'")
             else:
-                Log.f("No member '{0}' in structure '{1}'".format(member, structDef.name))
-        return gen
+                stack.pop()
+        return ''.join(gen)
 
 
     def gen_structCompare(self, fmt, structDef, var, values, parentLimittype = None):
-        gen = ''
-        for member, value in sorted(values.items()):
-            if member in structDef.members:
-                limittype = structDef.members[member].limittype
-                membertype = structDef.members[member].type
-                if limittype == None:
-                    # Use parent's limit type
-                    limittype = parentLimittype
-
-                if limittype == 'not':
-                    # Compare everything else with equality
-                    comparePredFmt = '{0} == {1}'
-                elif limittype == 'bitmask' and type == 'VkBool32':
-                    # Compare everything else with equality
-                    comparePredFmt = '{0} == {1}'
-                elif limittype == 'bitmask':
-                    # Compare bitmask by checking if device value contains every bit of profile value
-                    comparePredFmt = 'vpCheckFlags({0}, {1})'
-                elif limittype == 'bits':
-                    # Compare max limit by checking if device value is greater than or equal to profile value
-                    comparePredFmt = '{0} >= {1}'
-                elif limittype == 'max':
-                    # Compare max limit by checking if device value is greater than or equal to profile value
-                    comparePredFmt = '{0} >= {1}'
-                elif limittype == 'max,pot' or limittype == 'pot,max':
-                    # Compare max limit by checking if device value is greater than or equal to profile value
-                    if (membertype == 'float' or membertype == 'double'):
-                        comparePredFmt = [ '{0} >= {1}' ]
-                    else:
-                        comparePredFmt = [ '{0} >= {1}', '({0} & ({0} - 1)) == 0' ]
-                elif limittype == 'bits':
-                    # Behaves like max, but smaller values are allowed
-                    comparePredFmt = '{0} >= {1}'
-                elif limittype == 'min':
-                    # Compare min limit by checking if device value is less than or equal to profile value
-                    comparePredFmt = '{0} <= {1}'
-                elif limittype == 'pot':
-                    if (membertype == 'float' or membertype == 'double'):
-                        comparePredFmt = [ 'isPowerOfTwo({0})' ]
-                    else:
-                        comparePredFmt = [ '({0} & ({0} - 1)) == 0' ]
-                elif limittype == 'min,pot' or limittype == 'pot,min':
-                    # Compare min limit by checking if device value is less than or equal to profile value and if the value is a power of two
-                    if (membertype == 'float' or membertype == 'double'):
-                        comparePredFmt = [ '{0} <= {1}', 'isPowerOfTwo({0})' ]
-                    else:
-                        comparePredFmt = [ '{0} <= {1}', '({0} & ({0} - 1)) == 0' ]
-                elif limittype == 'min,mul' or limittype == 'mul,min':
-                    # Compare min limit by checking if device value is less than or equal to profile value and a multiple of profile value
-                    if (membertype == 'float' or membertype == 'double'):
-                        comparePredFmt = [ '{0} <= {1}', 'isMultiple({1}, {0})' ]
-                    else:
-                        comparePredFmt = [ '{0} <= {1}', '({1} % {0}) == 0' ]
-                elif limittype == 'range':
-                    # Compare range limit by checking if device range is larger than or equal to profile range
-                    comparePredFmt = [ '{0} <= {1}', '{0} >= {1}' ]
-                elif limittype == 'exact' or limittype == 'struct':
-                    # Compare everything else with equality
-                    comparePredFmt = '{0} == {1}'
-                elif limittype is None or limittype == 'noauto':
-                    comparePredFmt = '{0} == {1}'
-                else:
-                    Log.f("Unsupported limittype '{0}' in member '{1}' of structure '{2}'".format(limittype, member, structDef.name))
+        gen = []
+        # Bind the methods used for every member once
+        append = gen.append
+        formatLine = fmt.format
+        structs = self.registry.structs
+        # Nested structures are visited in place through a stack of member iterators instead of recursing
+        stack = [(structDef, var, iter(sorted(values.items())), parentLimittype)]
+        while stack:
+            structDef, var, memberValues, parentLimittype = stack[-1]
+            getCompareMember = getCompareMembers(structDef, parentLimittype).get
+            for member, value in memberValues:
+                compareMember = getCompareMember(member)
+                if compareMember is not None:
+                    memberInfo, limittype, comparePredFmt = compareMember
+                    if comparePredFmt is None:
+                        Log.f(f"Unsupported limittype '{limittype}' in member '{member}' of structure '{structDef.name}'")
+
+                    if type(value) is dict:
+                        # Nested structure
+                        memberDef = structs.get(memberInfo.type)
+                        if memberDef != None:
+                            stack.append((memberDef, var + member + '.', iter(sorted(value.items())), limittype))
+                            break
+                        else:
+                            Log.f(f"Member '{member}' in structure '{structDef.name}' is not a struct")
 
-                if type(value) == dict:
-                    # Nested structure
-                    memberDef = self.registry.structs.get(structDef.members[member].type)
-                    if memberDef != None:
-                        gen += self.gen_structCompare(fmt, memberDef, var + member + '.', value, limittype)
-                    else:
-                        Log.f("Member '{0}' in structure '{1}' is not a struct".format(member, structDef.name))
-
-                elif type(value) == list:
-                    # Some sort of list (enums or integer/float list for structure initialization)
-                    if len(value) == 0:
-                        # If list is empty then ignore
-                        continue
-                    if structDef.members[member].isArray:
-                        if not isinstance(self.registry.evalArraySize(structDef.members[member].arraySize), int):
-                            Log.f("Unsupported array member '{0}' in structure '{1}'".format(member, structDef.name) +
-                                  "(currently only 1D non-dynamic arrays are supported in this context)")
-                        # If it's an array we have to generate per-element comparison code
-                        for i in range(len(value)):
+                    elif type(value) is list:
+                        # Some sort of list (enums or integer/float list for structure initialization)
+                        if len(value) == 0:
+                            # If list is empty then ignore
+                            continue
+                        if memberInfo.isArray:
+                            if not isinstance(self.registry.evalArraySize(memberInfo.arraySize), int):
+                                Log.f(f"Unsupported array member '{member}' in structure '{structDef.name}'" +
+                                      "(currently only 1D non-dynamic arrays are supported in this context)")
+                            # If it's an array we have to generate per-element comparison code
+                            arrayVar = var + member
                             if limittype == 'range':
-                                gen += fmt.format(comparePredFmt[i].format('{0}{1}[{2}]'.format(var, member, i), value[i]))
+                                # Range limits compare each bound with its own predicate
+                                for i, v in enumerate(value):
+                                    append(formatLine(comparePredFmt[i].format(f'{arrayVar}[{i}]', v)))
                             else:
-                                gen += fmt.format(comparePredFmt.format('{0}{1}[{2}]'.format(var, member, i), value[i]))
-                    else:
-                        # Enum flags and basic structs can be compared directly
-                        isEnum = isinstance(value[0], str)
-                        gen += fmt.format(comparePredFmt.format('{0}{1}'.format(var, member), self.gen_listValue(value, isEnum)))
+                                for i, v in enumerate(value):
+                                    append(formatLine(comparePredFmt.format(f'{arrayVar}[{i}]', v)))
+                        else:
+                            # Enum flags and basic structs can be compared directly
+                            isEnum = isinstance(value[0], str)
+                            append(formatLine(comparePredFmt.format(f'{var}{member}', self.gen_listValue(value, isEnum))))
 
-                elif type(value) == bool:
-                    # Boolean
-                    gen += fmt.format(comparePredFmt.format('{0}{1}'.format(var, member), 'VK_TRUE' if value else 'VK_FALSE'))
+                    elif type(value) is bool:
+                        # Boolean
+                        append(formatLine(comparePredFmt.format(f'{var}{member}', 'VK_TRUE' if value else 'VK_FALSE')))
 
+                    else:
+                        # Everything else
+                        if type(comparePredFmt) is list:
+                            for i in range(len(comparePredFmt)):
+                                append(formatLine(comparePredFmt[i].format(f'{var}{member}', value)))
+                        elif comparePredFmt is not None:
+                            append(formatLine(comparePredFmt.format(f'{var}{member}', value)))
                 else:
-                    # Everything else
-                    if type(comparePredFmt) == list:
-                        for i in range(len(comparePredFmt)):
-                            gen += fmt.format(comparePredFmt[i].format('{0}{1}'.format(var, member), value))
-                    elif comparePredFmt is not None:
-                        gen += fmt.format(comparePredFmt.format('{0}{1}'.format(var, member), value))
+                    Log.f(f"No member '{member}' in structure '{structDef.name}'")
             else:
-                Log.f("No member '{0}' in structure '{1}'".format(member, structDef.name))
-        return gen
+                stack.pop()
+        return ''.join(gen)
+
+
+    def getStructFuncEntries(self, structDefs):
+        # The structure lists are the same for every capabilities block of the profile, so resolve their wrapped structures only once
+        entries = self.structFuncEntries.get(id(structDefs))
+        if entries is None:
+            entries = []
+            for structDef in structDefs:
+                wrapped = WRAPPED_STRUCTS.get(structDef.name)
+                if wrapped is not None:
+                    innerName, innerAccess = wrapped
+                    wrapped = (self.registry.structs[innerName], innerAccess)
+                entries.append((structDef, structDef.name, wrapped))
+            self.structFuncEntries[id(structDefs)] = entries
+        return entries
 
 
     def gen_structFunc(self, structDefs, caps, func, fmt, debugMessages = False):
-        gen = ''
+        gen = []
 
         hasData = False
 
-        gen += ('            switch (p->sType) {\n')
+        gen.append('            switch (p->sType) {\n')
 
-        for structDef in structDefs:
+        for structDef, structName, wrapped in self.getStructFuncEntries(structDefs):
             paramList = []
 
-            # Fill VkPhysicalDeviceFeatures into VkPhysicalDeviceFeatures2[KHR]
-            if structDef.name in ['VkPhysicalDeviceFeatures2', 'VkPhysicalDeviceFeatures2KHR']:
-                innerCap = caps.get('VkPhysicalDeviceFeatures')
-                if innerCap:
-                    paramList.append((self.registry.structs['VkPhysicalDeviceFeatures'], '->features.', innerCap))
-
-            # Fill VkPhysicalDeviceProperties into VkPhysicalDeviceProperties2[KHR]
-            if structDef.name in ['VkPhysicalDeviceProperties2', 'VkPhysicalDeviceProperties2KHR']:
-                innerCap = caps.get('VkPhysicalDeviceProperties')
-                if innerCap:
-                    paramList.append((self.registry.structs['VkPhysicalDeviceProperties'], '->properties.', innerCap))
-
-            # Fill VkQueueFamilyProperties into VkQueueFamilyProperties2[KHR]
-            if structDef.name in ['VkQueueFamilyProperties2', 'VkQueueFamilyProperties2KHR']:
-                innerCap = caps.get('VkQueueFamilyProperties')
-                if innerCap:
-                    paramList.append((self.registry.structs['VkQueueFamilyProperties'], '->queueFamilyProperties.', innerCap))
-
-            # Fill VkFormatProperties into VkFormatProperties2[KHR]
-            if structDef.name in ['VkFormatProperties2', 'VkFormatProperties2KHR']:
-                innerCap = caps.get('VkFormatProperties')
+            # Fill the wrapped structure (e.g. VkPhysicalDeviceFeatures into VkPhysicalDeviceFeatures2[KHR])
+            if wrapped is not None:
+                innerDef, innerAccess = wrapped
+                innerCap = caps.get(innerDef.name)
                 if innerCap:
-                    paramList.append((self.registry.structs['VkFormatProperties'], '->formatProperties.', innerCap))
+                    paramList.append((innerDef, innerAccess, innerCap))
 
             # Fill all other structures directly
-            if structDef.name in caps:
-                paramList.append((structDef, '->', caps[structDef.name]))
+            if structName in caps:
+                paramList.append((structDef, '->', caps[structName]))
 
             # Use variable names in the debug version of the library that can be later prettified
             if debugMessages:
@@ -5219,69 +2660,87 @@ class VulkanProfile():
 
             if paramList:
                 hasLocalCastPtr = False # track if we have defined local pointer yet
-                gen += '                case {0}: {{\n'.format(structDef.sType)
+                gen.append(f'                case {structDef.sType}: {{\n')
                 for params in paramList:
-                    genAssign = func('                    ' + fmt, params[0], varName + params[1], params[2])
+                    # The merged and the split capabilities blocks often carry the same values, so generate their code only once
+                    structCodeKey = (func.__name__, fmt, params[0].name, varName + params[1], json.dumps(params[2], sort_keys = True))
+                    genAssign = self.structCodeCache.get(structCodeKey)
+                    if genAssign is None:
+                        genAssign = func('                    ' + fmt, params[0], varName + params[1], params[2])
+                        self.structCodeCache[structCodeKey] = genAssign
                     if genAssign != '':
                         if hasLocalCastPtr == False: 
                             # only define pointer in the event that it has data
-                            gen += '                    {0}* {1} = static_cast<{0}*>(static_cast<void*>(p));\n'.format(structDef.name, varName)
+                            gen.append(f'                    {structDef.name}* {varName} = static_cast<{structDef.name}*>(static_cast<void*>(p));\n')
                             hasLocalCastPtr = True
                         hasData = True
-                        gen += genAssign
-                gen += '                } break;\n'
+                        gen.append(genAssign)
+                gen.append('                } break;\n')
 
-        gen += ('                default: break;\n'
+        gen.append('                default: break;\n'
                 '            }\n')
-        return gen if hasData else ''
+        return ''.join(gen) if hasData else ''
+
+
+    def gen_structChainerDesc(self):
+        # The chainers only depend on the structures of the profile, so all capabilities blocks share a single descriptor
+        return ''.join([
+            '\n',
+            'static const VpStructChainerDesc chainerDesc = {\n',
+            self.gen_structChainerFunc(self.structs.feature, 'VkPhysicalDeviceFeatures2KHR'),
+            self.gen_structChainerFunc(self.structs.property, 'VkPhysicalDeviceProperties2KHR'),
+            self.gen_structArrayChainerFunc(self.structs.queueFamily, 'VkQueueFamilyProperties2KHR'),
+            self.gen_structChainerFunc(self.structs.format, 'VkFormatProperties2KHR'),
+            '};\n'
+        ])
 
 
     def gen_structChainerFunc(self, structDefs, baseStruct):
-        gen = '    [](VkBaseOutStructure* p, void* pUser, PFN_vpStructChainerCb pfnCb) {\n'
+        gen = ['    [](VkBaseOutStructure* p, void* pUser, PFN_vpStructChainerCb pfnCb) {\n']
         if structDefs:
             pNext = 'nullptr'
             for structDef in structDefs:
                 if structDef.name != baseStruct:
                     varName = structDef.name[2].lower() + structDef.name[3:]
-                    gen += '        {0} {1}{{ {2}, {3} }};\n'.format(structDef.name, varName, structDef.sType, pNext)
+                    gen.append(f'        {structDef.name} {varName}{{ {structDef.sType}, {pNext} }};\n')
                     pNext = '&' + varName
-            gen += '        p->pNext = static_cast<VkBaseOutStructure*>(static_cast<void*>({0}));\n'.format(pNext)
+            gen.append(f'        p->pNext = static_cast<VkBaseOutStructure*>(static_cast<void*>({pNext}));\n')
 
-        gen += ('        pfnCb(p, pUser);\n'
+        gen.append('        pfnCb(p, pUser);\n'
                 '    },\n')
-        return gen
+        return ''.join(gen)
 
 
     def gen_structArrayChainerFunc(self, structDefs, baseStruct):
-        gen = '    [](uint32_t count, VkBaseOutStructure* p, void* pUser, PFN_vpStructArrayChainerCb pfnCb) {\n'
+        gen = ['    [](uint32_t count, VkBaseOutStructure* p, void* pUser, PFN_vpStructArrayChainerCb pfnCb) {\n']
         if len(structDefs) > 0:
-            gen += '        struct ExtStructs {\n'
+            gen.append('        struct ExtStructs {\n')
             for structDef in structDefs:
                 if structDef.name != baseStruct:
                     varName = structDef.name[2].lower() + structDef.name[3:]
-                    gen += '            {0} {1};\n'.format(structDef.name, varName)
-            gen += '        };\n'
-            gen += '        std::vector<ExtStructs> ext_structs{};\n'
-            gen += '        if (count > 0) {\n'
-            gen += '            ext_structs.resize(count);\n'
-            gen += '            {0}* pArray = static_cast<{0}*>(static_cast<void*>(p));\n'.format(baseStruct)
-            gen += '            for (uint32_t i = 0; i < count; ++i) {\n'
+                    gen.append(f'            {structDef.name} {varName};\n')
+            gen.append('        };\n')
+            gen.append('        std::vector<ExtStructs> ext_structs{};\n')
+            gen.append('        if (count > 0) {\n')
+            gen.append('            ext_structs.resize(count);\n')
+            gen.append(f'            {baseStruct}* pArray = static_cast<{baseStruct}*>(static_cast<void*>(p));\n')
+            gen.append('            for (uint32_t i = 0; i < count; ++i) {\n')
             pNext = 'nullptr'
             for structDef in structDefs:
                 if structDef.name != baseStruct:
                     varName = structDef.name[2].lower() + structDef.name[3:]
-                    gen += '                ext_structs[i].{0} = {1}{{ {2}, {3} }};\n'.format(varName, structDef.name, structDef.sType, pNext)
+                    gen.append(f'                ext_structs[i].{varName} = {structDef.name}{{ {structDef.sType}, {pNext} }};\n')
                     pNext = '&ext_structs[i].' + varName
-            gen += '                pArray[i].pNext = static_cast<VkBaseOutStructure*>(static_cast<void*>({0}));\n'.format(pNext)
-            gen += '            }\n'
-            gen += '        }\n'
-        gen += ('        pfnCb(count, p, pUser);\n'
+            gen.append(f'                pArray[i].pNext = static_cast<VkBaseOutStructure*>(static_cast<void*>({pNext}));\n')
+            gen.append('            }\n')
+            gen.append('        }\n')
+        gen.append('        pfnCb(count, p, pUser);\n'
                 '    },\n')
-        return gen
+        return ''.join(gen)
 
 
     def gen_structDesc(self, capabilities, debugMessages):
-        gen = ''
+        gen = []
 
         fillFmt = '{0};\n'
         cmpFmt = 'ret = ret && ({0});\n'
@@ -5292,15 +2751,15 @@ class VulkanProfile():
         else:
             cmpFmtFeatures = cmpFmt
 
-        gen += ('\n'
+        gen.append('\n'
                 'static const VpFeatureDesc featureDesc = {\n'
                 '    [](VkBaseOutStructure* p) { (void)p;\n')
-        gen += self.gen_structFunc(self.structs.feature, capabilities.features, self.gen_structFill, fillFmt)
-        gen += ('    },\n'
+        gen.append(self.gen_structFunc(self.structs.feature, capabilities.features, self.gen_structFill, fillFmt))
+        gen.append('    },\n'
                 '    [](VkBaseOutStructure* p) -> bool { (void)p;\n'
                 '        bool ret = true;\n')
-        gen += self.gen_structFunc(self.structs.feature, capabilities.features, self.gen_structCompare, cmpFmtFeatures, debugMessages)
-        gen += ('        return ret;\n'
+        gen.append(self.gen_structFunc(self.structs.feature, capabilities.features, self.gen_structCompare, cmpFmtFeatures, debugMessages))
+        gen.append('        return ret;\n'
                 '    }\n'
                 '};\n')
 
@@ -5310,38 +2769,38 @@ class VulkanProfile():
         else:
             cmpFmtProperties = cmpFmt
 
-        gen += ('\n'
+        gen.append('\n'
                 'static const VpPropertyDesc propertyDesc = {\n'
                 '    [](VkBaseOutStructure* p) { (void)p;\n')
-        gen += self.gen_structFunc(self.structs.property, capabilities.properties, self.gen_structFill, fillFmt)
-        gen += ('    },\n'
+        gen.append(self.gen_structFunc(self.structs.property, capabilities.properties, self.gen_structFill, fillFmt))
+        gen.append('    },\n'
                 '    [](VkBaseOutStructure* p) -> bool { (void)p;\n'
                 '        bool ret = true;\n')
-        gen += self.gen_structFunc(self.structs.property, capabilities.properties, self.gen_structCompare, cmpFmtProperties, debugMessages)
-        gen += ('        return ret;\n'
+        gen.append(self.gen_structFunc(self.structs.property, capabilities.properties, self.gen_structCompare, cmpFmtProperties, debugMessages))
+        gen.append('        return ret;\n'
                 '    }\n'
                 '};\n')
 
         # Queue family descriptor
         if self.structs.queueFamily and capabilities.queueFamiliesProperties:
-            gen += ('\n'
+            gen.append('\n'
                     'static const VpQueueFamilyDesc queueFamilyDesc[] = {\n')
             for queueFamilyCaps in capabilities.queueFamiliesProperties:
-                gen += ('    {\n'
+                gen.append('    {\n'
                         '        [](VkBaseOutStructure* p) { (void)p;\n')
-                gen += self.gen_structFunc(self.structs.queueFamily, queueFamilyCaps, self.gen_structFill, fillFmt)
-                gen += ('        },\n'
+                gen.append(self.gen_structFunc(self.structs.queueFamily, queueFamilyCaps, self.gen_structFill, fillFmt))
+                gen.append('        },\n'
                         '        [](VkBaseOutStructure* p) -> bool { (void)p;\n'
                         '            bool ret = true;\n')
-                gen += self.gen_structFunc(self.structs.queueFamily, queueFamilyCaps, self.gen_structCompare, cmpFmt)
-                gen += ('            return ret;\n'
+                gen.append(self.gen_structFunc(self.structs.queueFamily, queueFamilyCaps, self.gen_structCompare, cmpFmt))
+                gen.append('            return ret;\n'
                         '        }\n'
                         '    },\n')
-            gen += ('};\n')
+            gen.append('};\n')
 
         # Format descriptor
         if capabilities.formats:
-            gen += ('\n'
+            gen.append('\n'
                     'static const VpFormatDesc formatDesc[] = {\n')
             for formatName, formatCaps in sorted(capabilities.formats.items()):
                 if debugMessages:
@@ -5349,34 +2808,27 @@ class VulkanProfile():
                 else:
                     cmpFmtFormat = cmpFmt
 
-                gen += ('    {{\n'
-                        '        {0},\n'
-                        '        [](VkBaseOutStructure* p) {{ (void)p;\n').format(formatName)
-                gen += self.gen_structFunc(self.structs.format, formatCaps, self.gen_structFill, fillFmt)
-                gen += ('        },\n'
+                gen.append('    {\n'
+                        f'        {formatName},\n'
+                        '        [](VkBaseOutStructure* p) { (void)p;\n')
+                gen.append(self.gen_structFunc(self.structs.format, formatCaps, self.gen_structFill, fillFmt))
+                gen.append('        },\n'
                         '        [](VkBaseOutStructure* p) -> bool { (void)p;\n'
                         '            bool ret = true;\n')
-                gen += self.gen_structFunc(self.structs.format, formatCaps, self.gen_structCompare, cmpFmtFormat, debugMessages)
-                gen += ('            return ret;\n'
+                gen.append(self.gen_structFunc(self.structs.format, formatCaps, self.gen_structCompare, cmpFmtFormat, debugMessages))
+                gen.append('            return ret;\n'
                         '        }\n'
                         '    },\n')
-            gen += '};\n'
+            gen.append('};\n')
 
-        # Structure chaining descriptors
-        gen += ('\n'
-                'static const VpStructChainerDesc chainerDesc = {\n')
-        gen += self.gen_structChainerFunc(self.structs.feature, 'VkPhysicalDeviceFeatures2KHR')
-        gen += self.gen_structChainerFunc(self.structs.property, 'VkPhysicalDeviceProperties2KHR')
-        gen += self.gen_structArrayChainerFunc(self.structs.queueFamily, 'VkQueueFamilyProperties2KHR')
-        gen += self.gen_structChainerFunc(self.structs.format, 'VkFormatProperties2KHR')
-        gen += '};\n'
+        gen = ''.join(gen)
 
         # If debug messages are needed do further prettifying (warning: obscure regular expressions follow)
         if debugMessages:
             # Prettify structure references in non-bitmask comparisons
-            gen = re.sub(r"(VP_DEBUG_COND_MSG\([^,]+[^:]+: )prettify_Vk([^\-]+)\->([^\)]+\))", r"\1Vk\2::\3", gen)
+            gen = REGEX_DEBUG_MSG_STRUCT.sub(r"\1Vk\2::\3", gen)
             # Prettify bitmask comparisons
-            gen = re.sub(r"(VP_DEBUG_COND_MSG\([^,]+[^:]+: )vpCheckFlags\(prettify_Vk([^\-]+)\->([^,]+), ([^\)]+)\)", r"\1Vk\2::\3 contains \4", gen)
+            gen = REGEX_DEBUG_MSG_FLAGS.sub(r"\1Vk\2::\3 contains \4", gen)
 
         return gen
 
@@ -5384,7 +2836,7 @@ class VulkanProfile():
         if len(capabilities.videoProfiles) == 0:
             return ''
 
-        gen = ''
+        gen = []
 
         fillFmt = '{0};\n'
         cmpFmt = 'ret = ret && ({0});\n'
@@ -5393,22 +2845,22 @@ class VulkanProfile():
         for videoProfileName, videoProfile in capabilities.videoProfilesByName.items():
             videoProfileIndex += 1
 
-            gen += '\nnamespace video_profile_{0} {{\n'.format(videoProfileIndex)
+            gen.append(f'\nnamespace video_profile_{videoProfileIndex} {{\n')
 
-            gen += self.gen_structTypeData(self.structs.videoProfileInfo[videoProfileName], 'info')
-            gen += self.gen_structTypeData(self.structs.videoCapability[videoProfileName], 'capability')
-            gen += self.gen_structTypeData(self.structs.videoFormat[videoProfileName], 'format')
+            gen.append(self.gen_structTypeData(self.structs.videoProfileInfo[videoProfileName], 'info'))
+            gen.append(self.gen_structTypeData(self.structs.videoCapability[videoProfileName], 'capability'))
+            gen.append(self.gen_structTypeData(self.structs.videoFormat[videoProfileName], 'format'))
 
             # Video profile info descriptor
-            gen += ('\n'
+            gen.append('\n'
                     'static const VpVideoProfileInfoDesc infoDesc = {\n'
                     '    [](VkBaseOutStructure* p) { (void)p;\n')
-            gen += self.gen_structFunc(self.structs.videoProfileInfo[videoProfileName], videoProfile['profile'], self.gen_structFill, fillFmt)
-            gen += ('    },\n'
+            gen.append(self.gen_structFunc(self.structs.videoProfileInfo[videoProfileName], videoProfile['profile'], self.gen_structFill, fillFmt))
+            gen.append('    },\n'
                     '    [](VkBaseOutStructure* p) -> bool { (void)p;\n'
                     '        bool ret = true;\n')
-            gen += self.gen_structFunc(self.structs.videoProfileInfo[videoProfileName], videoProfile['profile'], self.gen_structCompare, cmpFmt)
-            gen += ('        return ret;\n'
+            gen.append(self.gen_structFunc(self.structs.videoProfileInfo[videoProfileName], videoProfile['profile'], self.gen_structCompare, cmpFmt))
+            gen.append('        return ret;\n'
                     '    }\n'
                     '};\n')
 
@@ -5418,78 +2870,88 @@ class VulkanProfile():
             else:
                 cmpFmtCapabilities = cmpFmt
 
-            gen += ('\n'
+            gen.append('\n'
                     'static const VpVideoCapabilityDesc capabilityDesc = {\n'
                     '    [](VkBaseOutStructure* p) { (void)p;\n')
-            gen += self.gen_structFunc(self.structs.videoCapability[videoProfileName], videoProfile['capabilities'], self.gen_structFill, fillFmt)
-            gen += ('    },\n'
+            gen.append(self.gen_structFunc(self.structs.videoCapability[videoProfileName], videoProfile['capabilities'], self.gen_structFill, fillFmt))
+            gen.append('    },\n'
                     '    [](VkBaseOutStructure* p) -> bool { (void)p;\n'
                     '        bool ret = true;\n')
-            gen += self.gen_structFunc(self.structs.videoCapability[videoProfileName], videoProfile['capabilities'], self.gen_structCompare, cmpFmtCapabilities, debugMessages)
-            gen += ('        return ret;\n'
+            gen.append(self.gen_structFunc(self.structs.videoCapability[videoProfileName], videoProfile['capabilities'], self.gen_structCompare, cmpFmtCapabilities, debugMessages))
+            gen.append('        return ret;\n'
                     '    }\n'
                     '};\n')
 
             # Video format descriptor
             if 'formats' in videoProfile and len(videoProfile['formats']) > 0:
-                gen += ('\n'
+                gen.append('\n'
                         'static const VpVideoFormatDesc formatDesc[] = {\n')
                 for format in videoProfile['formats']:
-                    gen += ('    {\n'
+                    gen.append('    {\n'
                             '        [](VkBaseOutStructure* p) { (void)p;\n')
-                    gen += self.gen_structFunc(self.structs.videoFormat[videoProfileName], format, self.gen_structFill, fillFmt)
-                    gen += ('        },\n'
+                    gen.append(self.gen_structFunc(self.structs.videoFormat[videoProfileName], format, self.gen_structFill, fillFmt))
+                    gen.append('        },\n'
                             '        [](VkBaseOutStructure* p) -> bool { (void)p;\n'
                             '            bool ret = true;\n')
-                    gen += self.gen_structFunc(self.structs.videoFormat[videoProfileName], format, self.gen_structCompare, cmpFmt)
-                    gen += ('            return ret;\n'
+                    gen.append(self.gen_structFunc(self.structs.videoFormat[videoProfileName], format, self.gen_structCompare, cmpFmt))
+                    gen.append('            return ret;\n'
                             '        }\n'
                             '    },\n')
-                gen += '};\n'
+                gen.append('};\n')
 
             # Structure chaining descriptors
-            gen += ('\n'
+            gen.append('\n'
                     'static const VpVideoProfileStructChainerDesc chainerDesc = {\n')
-            gen += self.gen_structChainerFunc(self.structs.videoProfileInfo[videoProfileName], 'VkVideoProfileInfoKHR')
-            gen += self.gen_structChainerFunc(self.structs.videoCapability[videoProfileName], 'VkVideoCapabilitiesKHR')
-            gen += self.gen_structArrayChainerFunc(self.structs.videoFormat[videoProfileName], 'VkVideoFormatPropertiesKHR')
-            gen += '};\n'
+            gen.append(self.gen_structChainerFunc(self.structs.videoProfileInfo[videoProfileName], 'VkVideoProfileInfoKHR'))
+            gen.append(self.gen_structChainerFunc(self.structs.videoCapability[videoProfileName], 'VkVideoCapabilitiesKHR'))
+            gen.append(self.gen_structArrayChainerFunc(self.structs.videoFormat[videoProfileName], 'VkVideoFormatPropertiesKHR'))
+            gen.append('};\n')
 
-            gen += '}} // namespace video_profile_{0}\n'.format(videoProfileIndex)
+            gen.append(f'}} // namespace video_profile_{videoProfileIndex}\n')
 
         # Video profile descriptor
-        gen += ('\n'
+        gen.append('\n'
                 'static const VpVideoProfileDesc videoProfileDesc[] = {\n')
 
         def gen_dataArrayInfo(condition, namespace, name):
             if condition:
-                return 'static_cast<uint32_t>(std::size({0}::{1})), {0}::{1},\n'.format(namespace, name)
+                return f'static_cast<uint32_t>(std::size({namespace}::{name})), {namespace}::{name},\n'
             else:
                 return '0, nullptr,\n'
 
         videoProfileIndex = 0
         for videoProfileName, videoProfile in capabilities.videoProfilesByName.items():
             videoProfileIndex += 1
-            namespace = 'video_profile_{0}'.format(videoProfileIndex)
+            namespace = f'video_profile_{videoProfileIndex}'
 
-            gen += ('    {{\n'
-                    '        {{ "{0}" }},\n').format(videoProfileName)
-            gen += '        ' + gen_dataArrayInfo(self.structs.videoProfileInfo[videoProfileName], namespace, 'infoStructTypes')
-            gen += '        {0}::infoDesc,\n'.format(namespace)
-            gen += '        ' + gen_dataArrayInfo(self.structs.videoCapability[videoProfileName], namespace, 'capabilityStructTypes')
-            gen += '        {0}::capabilityDesc,\n'.format(namespace)
-            gen += '        ' + gen_dataArrayInfo(self.structs.videoFormat[videoProfileName], namespace, 'formatStructTypes')
-            gen += '        ' + gen_dataArrayInfo('formats' in videoProfile and len(videoProfile['formats']) > 0, namespace, 'formatDesc')
-            gen += '        {0}::chainerDesc,\n'.format(namespace)
-            gen += '    },\n'
+            gen.append('    {\n'
+                    f'        {{ "{videoProfileName}" }},\n')
+            gen.append('        ' + gen_dataArrayInfo(self.structs.videoProfileInfo[videoProfileName], namespace, 'infoStructTypes'))
+            gen.append(f'        {namespace}::infoDesc,\n')
+            gen.append('        ' + gen_dataArrayInfo(self.structs.videoCapability[videoProfileName], namespace, 'capabilityStructTypes'))
+            gen.append(f'        {namespace}::capabilityDesc,\n')
+            gen.append('        ' + gen_dataArrayInfo(self.structs.videoFormat[videoProfileName], namespace, 'formatStructTypes'))
+            gen.append('        ' + gen_dataArrayInfo('formats' in videoProfile and len(videoProfile['formats']) > 0, namespace, 'formatDesc'))
+            gen.append(f'        {namespace}::chainerDesc,\n')
+            gen.append('    },\n')
 
-        gen += '};\n'
+        gen.append('};\n')
 
-        return gen
+        return ''.join(gen)
 
 class VulkanProfilesDatabase():
     def __init__(self):
         self.json_files = [] # json_root[]
+        self.block_capabilities = dict() # (capability key, id(json capabilities block)) -> VulkanProfileCapabilities
+
+    def getBlockCapabilities(self, registry, json_profile_key, json_profile_value, capability_key, json_capabilities):
+        # Capabilities blocks referenced by multiple profiles are merged once and shared, as they are never modified afterwards
+        key = (capability_key, id(json_capabilities))
+        capabilities = self.block_capabilities.get(key)
+        if capabilities is None:
+            capabilities = VulkanProfileCapabilities(registry, json_profile_key, json_profile_value, capability_key, json_capabilities, False, False)
+            self.block_capabilities[key] = capabilities
+        return capabilities
 
     def recurseRequiredProfiles(self, json_files, results, profile_key):
         for json_file in json_files:
@@ -5507,13 +2969,13 @@ class VulkanProfilesDatabase():
         results = []
         self.recurseRequiredProfiles(self.json_files, results, profile_key)
         if len(results) > 1:
-            Log.i('Required profiles by the {0} profile:'.format(profile_key))
+            Log.i('Required profiles by the %s profile:', profile_key)
             for result in results:
                 if result != profile_key:
-                    Log.i('- {0}'.format(result))
+                    Log.i('- %s', result)
 
         else:
-            Log.i('Required profiles by the {0} profile: None'.format(profile_key))
+            Log.i('Required profiles by the %s profile: None', profile_key)
         return results
 
     def gatherProfileCapabilities(self, json_profile_key, json_profile_value, json_capabilities_value):
@@ -5523,16 +2985,16 @@ class VulkanProfilesDatabase():
             # When we have multiple possible capabilities blocks, we load them all but effectively the API library can't effectively implement this behavior.
             if type(cap_key).__name__ == 'list':
                 for cap_key_case in cap_key:
-                    Log.i('- {0}::{1}'.format(json_profile_key, cap_key_case))
+                    Log.i('- %s::%s', json_profile_key, cap_key_case)
                     capabilities_list.append(json_capabilities_value[cap_key_case])
             elif cap_key in json_capabilities_value:
                 capabilities_list.append(json_capabilities_value[cap_key])
-                Log.i('- {0}::{1}'.format(json_profile_key, cap_key))
+                Log.i('- %s::%s', json_profile_key, cap_key)
 
         return capabilities_list
 
     def collectProfileCapabilities(self, profile_requirements):
-        Log.i('Required capabilities blocks by the {0} profile:'.format(profile_requirements[0]))
+        Log.i('Required capabilities blocks by the %s profile:', profile_requirements[0])
         
         capabilities_list = []
         for required_profile in profile_requirements:
@@ -5553,44 +3015,79 @@ class VulkanProfilesFiles():
     def __init__(self, registry, profiles_dir, profiles_files, validate, schema):
         self.profiles = dict()
         self.json_profiles_database = VulkanProfilesDatabase()
+        # Library sections generated from these profiles that are the same with and without debug messages
+        self.librarySections = dict()
 
         dirAbsPath = os.path.abspath(profiles_dir)
-        filenames = os.listdir(dirAbsPath)
-
-        for filename in filenames:
-            skip_file = False
-            if profiles_files:
-                if filename not in profiles_files:
-                    skip_file = True
-            if skip_file:
-                continue
-            fileAbsPath = os.path.join(dirAbsPath, filename)
-            if os.path.isfile(fileAbsPath) and os.path.splitext(filename)[-1] == '.json':
-                Log.i("Loading profile file: '{0}'".format(filename))
-                with open(fileAbsPath, 'r') as f:
-                    json_root = json.load(f)
-                    if validate:
-                        try:
-                            import jsonschema
-                            Log.i("Validating profile file: '{0}'".format(filename))
-                            jsonschema.validate(json_root, schema)
-                        except ModuleNotFoundError:
-                            Log.w("`jsonschema` module is not installed, schema validation skip")
-                    self.json_profiles_database.json_files.append(json_root)
+
+        json_filenames = []
+        json_paths = []
+        with os.scandir(dirAbsPath) as entries:
+            for entry in entries:
+                filename = entry.name
+                skip_file = False
+                if profiles_files:
+                    if filename not in profiles_files:
+                        skip_file = True
+                if skip_file:
+                    continue
+                if os.path.splitext(filename)[-1] == '.json' and entry.is_file():
+                    json_filenames.append(filename)
+                    json_paths.append(entry.path)
+
+        # The schema is checked and its validator is built once rather than for each profile file
+        validator = None
+        if validate:
+            try:
+                import jsonschema
+                validatorClass = jsonschema.validators.validator_for(schema)
+                validatorClass.check_schema(schema)
+                validator = validatorClass(schema)
+            except ModuleNotFoundError:
+                Log.w("`jsonschema` module is not installed, schema validation skip")
+
+        def loadProfileFile(fileAbsPath):
+            with open(fileAbsPath, 'rb') as f:
+                json_root = loadJson(f)
+            if validator is not None:
+                error = jsonschema.exceptions.best_match(validator.iter_errors(json_root))
+                if error is not None:
+                    raise error
+            return json_root
+
+        # Read, parse and validate the profile files concurrently, but log and collect them in order
+        with ThreadPoolExecutor() as executor:
+            for filename, json_root in zip(json_filenames, executor.map(loadProfileFile, json_paths)):
+                Log.i("Loading profile file: '%s'", filename)
+                if validator is not None:
+                    Log.i("Validated profile file: '%s'", filename)
+                self.json_profiles_database.json_files.append(json_root)
 
         for json_file_data in self.json_profiles_database.json_files:
             self.parseProfiles(registry, json_file_data['profiles'], json_file_data['capabilities'])
 
     def parseProfiles(self, registry, json_profiles, json_caps):
         for json_profile_key, json_profile_value in json_profiles.items():
-            Log.i("Registering profile '{0}'".format(json_profile_key))
+            Log.i("Registering profile '%s'", json_profile_key)
             if json_profile_key not in self.profiles:
                 self.profiles[json_profile_key] = VulkanProfile(registry, self.json_profiles_database, json_profile_key, json_profile_value, json_caps)
 
+# The private implementation of each profile is generated independently, with many profiles it's spread over forked worker processes
+PARALLEL_PROFILES_THRESHOLD = 32
+
+# Profiles inherited by the forked workers, so that only the generated code has to be sent back
+forkedProfiles = None
+
+def generateForkedPrivateImpl(index, debugMessages):
+    return forkedProfiles[index].generatePrivateImpl(debugMessages)
+
+
 class VulkanProfilesLibraryGenerator():
     def __init__(self, registry, input_profiles_files, output_filename, debugMessages = False):
         self.registry = registry
         self.profiles_files = input_profiles_files
+        # Profiles are always emitted ordered by their key
+        self.sortedProfiles = sorted(input_profiles_files.profiles.items())
         self.debugMessages = debugMessages
         self.outputFilename = output_filename
 
@@ -5609,58 +3106,63 @@ class VulkanProfilesLibraryGenerator():
 
 
     def generate(self, outIncDir, outSrcDir):
+        # Resolve the output paths once, the .h and .hpp files share the include directory
+        incBasePath = os.path.join(os.path.abspath(outIncDir), self.outputFilename)
         if outSrcDir != None:
-            self.generate_h(outIncDir)
-            self.generate_cpp(outSrcDir)
-        self.generate_hpp(outIncDir)
-
-
-    def generate_h(self, outDir):
-        fileAbsPath = os.path.join(os.path.abspath(outDir), "{0}.h".format(self.outputFilename))
-        Log.i("Generating '{0}'...".format(fileAbsPath))
-        with open(fileAbsPath, 'w') as f:
-            f.write(COPYRIGHT_HEADER)
-            f.write(H_HEADER)
-            f.write(self.gen_profileDefs())
-            f.write(API_DEFS)
-            f.write(H_FOOTER)
-
-
-    def generate_cpp(self, outDir):
-        fileAbsPath = os.path.join(os.path.abspath(outDir), "{0}.cpp".format(self.outputFilename))
-        Log.i("Generating '{0}'...".format(fileAbsPath))
-        with open(fileAbsPath, 'w') as f:
-            f.write(COPYRIGHT_HEADER)
-            f.write(SHARED_INCLUDE)
-            if self.debugMessages:
-                f.write('#include <vulkan/debug/{0}.h>\n'.format(self.outputFilename))
-                f.write(DEBUG_MSG_CB_DEFINE)
-            else:
-                f.write('#include <vulkan/{0}.h>\n'.format(self.outputFilename))
-            f.write(self.gen_privateImpl())
-            f.write(self.gen_publicImpl())
-
-
-    def generate_hpp(self, outDir):
-        fileAbsPath = os.path.join(os.path.abspath(outDir), '{0}.hpp'.format(self.outputFilename))
-        Log.i("Generating '{0}'...".format(fileAbsPath))
-        with open(fileAbsPath, 'w') as f:
-            f.write(COPYRIGHT_HEADER)
-            f.write(HPP_HEADER)
-            f.write(SHARED_INCLUDE)
-            f.write(self.gen_profileDefs())
-            f.write(API_DEFS)
-            if self.debugMessages:
-                f.write(DEBUG_MSG_CB_DEFINE)
-            f.write(self.gen_privateImpl())
-            f.write(self.gen_publicImpl())
+            self.generate_h(incBasePath + '.h')
+            self.generate_cpp(os.path.join(os.path.abspath(outSrcDir), self.outputFilename) + '.cpp')
+        self.generate_hpp(incBasePath + '.hpp')
+
+
+    def generate_h(self, fileAbsPath):
+        Log.i("Generating '%s'...", fileAbsPath)
+        gen = [
+            COPYRIGHT_HEADER,
+            H_HEADER,
+            self.gen_sharedSection(self.gen_profileDefs),
+            API_DEFS,
+            H_FOOTER
+        ]
+        writeFile(fileAbsPath, ''.join(gen))
+
+
+    def generate_cpp(self, fileAbsPath):
+        Log.i("Generating '%s'...", fileAbsPath)
+        gen = [COPYRIGHT_HEADER, SHARED_INCLUDE]
+        if self.debugMessages:
+            gen.append(f'#include <vulkan/debug/{self.outputFilename}.h>\n')
+            gen.append(DEBUG_MSG_CB_DEFINE)
+        else:
+            gen.append(f'#include <vulkan/{self.outputFilename}.h>\n')
+        gen.append(self.gen_privateImpl())
+        gen.append(self.gen_publicImpl())
+        writeFile(fileAbsPath, ''.join(gen))
+
+
+    def generate_hpp(self, fileAbsPath):
+        Log.i("Generating '%s'...", fileAbsPath)
+        gen = [COPYRIGHT_HEADER, HPP_HEADER, SHARED_INCLUDE, self.gen_sharedSection(self.gen_profileDefs), API_DEFS]
+        if self.debugMessages:
+            gen.append(DEBUG_MSG_CB_DEFINE)
+        gen.append(self.gen_privateImpl())
+        gen.append(self.gen_publicImpl())
+        writeFile(fileAbsPath, ''.join(gen))
+
+
+    # Sections that do not depend on debug messages are generated once for all library variants of the same profiles
+    def gen_sharedSection(self, genSection):
+        sections = self.profiles_files.librarySections
+        name = genSection.__name__
+        if name not in sections:
+            sections[name] = genSection()
+        return sections[name]
 
 
     def gen_profileDefs(self):
-        gen = ''
+        gen = []
         profiles_ordered = []
 
-        for profile_key, profile_data in sorted(self.profiles_files.profiles.items()):
+        for profile_key, profile_data in self.sortedProfiles:
             for required_profile in profile_data.profileRequirements:
                 if required_profile not in profiles_ordered:
                     profiles_ordered.append(required_profile)
@@ -5670,24 +3172,24 @@ class VulkanProfilesLibraryGenerator():
         for profile_key in profiles_ordered:
             profile = self.profiles_files.profiles[profile_key]
 
-            profile_ukey = profile_key.upper()
-            gen += '\n'
+            profile_ukey = profile.ukey
+            gen.append('\n')
 
             # Add prerequisites
             allRequirements = sorted(profile.versionRequirements) + sorted(profile.profileRequirements) + sorted(profile.extensionRequirements)
             if allRequirements:
                 for i, requirement in enumerate(allRequirements):
                     if i == 0:
-                        gen += '#if '
+                        gen.append('#if ')
                     else:
-                        gen += '    '
+                        gen.append('    ')
 
-                    gen += 'defined({0})'.format(requirement)
+                    gen.append(f'defined({requirement})')
 
                     if i < len(allRequirements) - 1:
-                        gen += ' && \\\n'
+                        gen.append(' && \\\n')
                     else:
-                        gen += '\n'
+                        gen.append('\n')
 
             version = profile.apiVersion.split('.')
             major = int(version[0])
@@ -5699,60 +3201,71 @@ class VulkanProfilesLibraryGenerator():
                 minor = max(minor, int(version[1]))
                 patch = max(patch, int(version[2]))
 
-            gen += '#define {0} 1\n'.format(profile_key)
-            gen += '#define {0}_NAME "{1}"\n'.format(profile_ukey, profile_key)
-            gen += '#define {0}_SPEC_VERSION {1}\n'.format(profile_ukey, profile.version)
-            gen += '#define {0}_MIN_API_VERSION VK_MAKE_VERSION({1}, {2}, {3})\n'.format(profile_ukey, major, minor, patch)
+            gen.append(f'#define {profile_key} 1\n')
+            gen.append(f'#define {profile_ukey}_NAME "{profile_key}"\n')
+            gen.append(f'#define {profile_ukey}_SPEC_VERSION {profile.version}\n')
+            gen.append(f'#define {profile_ukey}_MIN_API_VERSION VK_MAKE_VERSION({major}, {minor}, {patch})\n')
 
             if allRequirements:
-                gen += '#endif\n'
+                gen.append('#endif\n')
 
-        return gen
+        return ''.join(gen)
 
 
+    @functools.lru_cache(maxsize = None)
     def gen_privateImpl(self):
-        gen = '\n'
-        gen += 'namespace detail {\n\n'
-        gen += PRIVATE_DEFS
-        gen += self.gen_videoProfileEnumerator()
-        gen += self.gen_profilePrivateImpl()
-        gen += self.gen_profileDescTable()
-        gen += self.gen_profileFeatureChain()
-        gen += PRIVATE_IMPL_BODY
-        gen += '\n} // namespace detail\n'
+        gen = ''.join([
+            '\n',
+            'namespace detail {\n\n',
+            PRIVATE_DEFS,
+            self.gen_sharedSection(self.gen_videoProfileEnumerator),
+            self.gen_profilePrivateImpl(),
+            self.gen_sharedSection(self.gen_profileDescTable),
+            self.gen_sharedSection(self.gen_profileFeatureChain),
+            PRIVATE_IMPL_BODY,
+            '\n} // namespace detail\n'
+        ])
         return self.patch_code(gen)
 
 
     def gen_profilePrivateImpl(self):
-        gen = ''
-        for _, profile in sorted(self.profiles_files.profiles.items()):
-            gen += profile.generatePrivateImpl(self.debugMessages)
-        return gen
+        global forkedProfiles
+        profiles = [profile for _, profile in self.sortedProfiles]
+        jobs = min(len(profiles), os.cpu_count() or 1)
+        if len(profiles) < PARALLEL_PROFILES_THRESHOLD or jobs < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+            return ''.join(profile.generatePrivateImpl(self.debugMessages) for profile in profiles)
+
+        forkedProfiles = profiles
+        try:
+            with ProcessPoolExecutor(max_workers = jobs, mp_context = multiprocessing.get_context('fork')) as executor:
+                return ''.join(executor.map(generateForkedPrivateImpl, range(len(profiles)), itertools.repeat(self.debugMessages), chunksize = 4))
+        finally:
+            forkedProfiles = None
 
 
     def gen_dataArrayInfo(self, condition, name):
         if condition:
-            return '        static_cast<uint32_t>(std::size({0})), {0},\n'.format(name)
+            return f'        static_cast<uint32_t>(std::size({name})), {name},\n'
         else:
             return '        0, nullptr,\n'
 
     def gen_variants(self, capabilities_key, capabilities_value):
-        gen = '                {\n'
-        gen += '            ' + ('        "{0}",\n').format(capabilities_value.blockName)
-        gen += '            ' + self.gen_dataArrayInfo(capabilities_value.instanceExtensions, 'blocks::{0}::instanceExtensions'.format(capabilities_key))
-        gen += '            ' + self.gen_dataArrayInfo(capabilities_value.deviceExtensions, 'blocks::{0}::deviceExtensions'.format(capabilities_key))
-        gen += '            ' + self.gen_dataArrayInfo(capabilities_value.features, 'featureStructTypes')
-        gen += '                    blocks::{0}::featureDesc,\n'.format(capabilities_key)
-        gen += '            ' + self.gen_dataArrayInfo(capabilities_value.properties, 'propertyStructTypes')
-        gen += '                    blocks::{0}::propertyDesc,\n'.format(capabilities_key)
-        gen += '            ' + self.gen_dataArrayInfo(capabilities_value.queueFamiliesProperties, 'queueFamilyStructTypes')
-        gen += '            ' + self.gen_dataArrayInfo(capabilities_value.queueFamiliesProperties, 'blocks::{0}::queueFamilyDesc'.format(capabilities_key))
-        gen += '            ' + self.gen_dataArrayInfo(capabilities_value.formats, 'formatStructTypes')
-        gen += '            ' + self.gen_dataArrayInfo(capabilities_value.formats, 'blocks::{0}::formatDesc'.format(capabilities_key))
-        gen += '                    blocks::{0}::chainerDesc,\n'.format(capabilities_key)
-        gen += '            ' + self.gen_dataArrayInfo(capabilities_value.videoProfiles, 'blocks::{0}::videoProfileDesc'.format(capabilities_key))
-        gen += '                },\n'
-        return gen
+        gen = ['                {\n']
+        gen.append('            ' + f'        "{capabilities_value.blockName}",\n')
+        gen.append('            ' + self.gen_dataArrayInfo(capabilities_value.instanceExtensions, f'blocks::{capabilities_key}::instanceExtensions'))
+        gen.append('            ' + self.gen_dataArrayInfo(capabilities_value.deviceExtensions, f'blocks::{capabilities_key}::deviceExtensions'))
+        gen.append('            ' + self.gen_dataArrayInfo(capabilities_value.features, 'featureStructTypes'))
+        gen.append(f'                    blocks::{capabilities_key}::featureDesc,\n')
+        gen.append('            ' + self.gen_dataArrayInfo(capabilities_value.properties, 'propertyStructTypes'))
+        gen.append(f'                    blocks::{capabilities_key}::propertyDesc,\n')
+        gen.append('            ' + self.gen_dataArrayInfo(capabilities_value.queueFamiliesProperties, 'queueFamilyStructTypes'))
+        gen.append('            ' + self.gen_dataArrayInfo(capabilities_value.queueFamiliesProperties, f'blocks::{capabilities_key}::queueFamilyDesc'))
+        gen.append('            ' + self.gen_dataArrayInfo(capabilities_value.formats, 'formatStructTypes'))
+        gen.append('            ' + self.gen_dataArrayInfo(capabilities_value.formats, f'blocks::{capabilities_key}::formatDesc'))
+        gen.append('                    chainerDesc,\n')
+        gen.append('            ' + self.gen_dataArrayInfo(capabilities_value.videoProfiles, f'blocks::{capabilities_key}::videoProfileDesc'))
+        gen.append('                },\n')
+        return ''.join(gen)
 
     def get_blockName(self, capability_keys):
         blockName = ""
@@ -5765,104 +3278,106 @@ class VulkanProfilesLibraryGenerator():
         return blockName
 
     def gen_profileDescTable(self):
-        gen = '\n'
-        for profile_key, profile_value in sorted(self.profiles_files.profiles.items()):
-            profile_ukey = profile_key.upper()
+        gen = ['\n']
+        for profile_key, profile_value in self.sortedProfiles:
+            profile_ukey = profile_value.ukey
         
-            gen += ('#ifdef {0}\n').format(profile_key)
-            gen += ('namespace {0} {{\n').format(profile_ukey)
+            gen.append(f'#ifdef {profile_key}\n')
+            gen.append(f'namespace {profile_ukey} {{\n')
 
             if not profile_value.multiple_variants:
-                gen += '    static const VpVariantDesc mergedCapabilities[] = {\n'
-                gen += '        {\n'  # <- new open curly
-                gen += ('        {0},\n').format(profile_value.merge_capabilities.blockName)
-                gen += self.gen_dataArrayInfo(profile_value.merge_capabilities.instanceExtensions, 'instanceExtensions')
-                gen += self.gen_dataArrayInfo(profile_value.merge_capabilities.deviceExtensions, 'deviceExtensions')
-                gen += self.gen_dataArrayInfo(profile_value.merge_capabilities.features, 'featureStructTypes')
-                gen += '            featureDesc,\n'
-                gen += self.gen_dataArrayInfo(profile_value.merge_capabilities.properties, 'propertyStructTypes')
-                gen += '            propertyDesc,\n'
-                gen += self.gen_dataArrayInfo(profile_value.merge_capabilities.queueFamiliesProperties, 'queueFamilyStructTypes')
-                gen += self.gen_dataArrayInfo(profile_value.merge_capabilities.queueFamiliesProperties, 'queueFamilyDesc')
-                gen += self.gen_dataArrayInfo(profile_value.merge_capabilities.formats, 'formatStructTypes')
-                gen += self.gen_dataArrayInfo(profile_value.merge_capabilities.formats, 'formatDesc')
-                gen += '        chainerDesc,\n'
-                gen += self.gen_dataArrayInfo(profile_value.merge_capabilities.videoProfiles, 'videoProfileDesc')
-                gen += '        },\n' # <- new closing curly
-                gen += '    };\n\n'
-
-            gen += '    namespace blocks {'
+                mergedCaps = profile_value.merge_capabilities
+                gen.append('    static const VpVariantDesc mergedCapabilities[] = {\n')
+                gen.append('        {\n')  # <- new open curly
+                gen.append(f'        {mergedCaps.blockName},\n')
+                gen.append(self.gen_dataArrayInfo(mergedCaps.instanceExtensions, 'instanceExtensions'))
+                gen.append(self.gen_dataArrayInfo(mergedCaps.deviceExtensions, 'deviceExtensions'))
+                gen.append(self.gen_dataArrayInfo(mergedCaps.features, 'featureStructTypes'))
+                gen.append('            featureDesc,\n')
+                gen.append(self.gen_dataArrayInfo(mergedCaps.properties, 'propertyStructTypes'))
+                gen.append('            propertyDesc,\n')
+                gen.append(self.gen_dataArrayInfo(mergedCaps.queueFamiliesProperties, 'queueFamilyStructTypes'))
+                gen.append(self.gen_dataArrayInfo(mergedCaps.queueFamiliesProperties, 'queueFamilyDesc'))
+                gen.append(self.gen_dataArrayInfo(mergedCaps.formats, 'formatStructTypes'))
+                gen.append(self.gen_dataArrayInfo(mergedCaps.formats, 'formatDesc'))
+                gen.append('        chainerDesc,\n')
+                gen.append(self.gen_dataArrayInfo(mergedCaps.videoProfiles, 'videoProfileDesc'))
+                gen.append('        },\n') # <- new closing curly
+                gen.append('    };\n\n')
+
+            gen.append('    namespace blocks {')
             for capability_keys in profile_value.referencedCapabilities:
                 blockName = self.get_blockName(capability_keys)
-                gen += ('\n        namespace {0} {{\n').format(blockName)
+                gen.append(f'\n        namespace {blockName} {{\n')
                 if type(capability_keys).__name__ == 'list':
-                    gen += '            static const VpVariantDesc variants[] = {\n'
+                    gen.append('            static const VpVariantDesc variants[] = {\n')
                     for capability_key in capability_keys:
-                        gen += self.gen_variants(capability_key, profile_value.split_capabilities[capability_key])
-                    gen += '            };\n'
-                    gen += '            static const uint32_t variantCount = static_cast<uint32_t>(std::size(variants));\n'
+                        gen.append(self.gen_variants(capability_key, profile_value.split_capabilities[capability_key]))
+                    gen.append('            };\n')
+                    gen.append('            static const uint32_t variantCount = static_cast<uint32_t>(std::size(variants));\n')
                 else:
-                    gen += '            static const VpVariantDesc variants[] = {\n'
-                    gen += self.gen_variants(capability_keys, profile_value.split_capabilities[capability_keys])
-                    gen += '            };\n'
-                    gen += '            static const uint32_t variantCount = static_cast<uint32_t>(std::size(variants));\n'
-                gen += ('        }} // namespace {0}\n').format(blockName)
-            gen += '    } // namespace blocks\n\n'
-
-            gen += '    static const VpCapabilitiesDesc capabilities[] = {\n'
+                    gen.append('            static const VpVariantDesc variants[] = {\n')
+                    gen.append(self.gen_variants(capability_keys, profile_value.split_capabilities[capability_keys]))
+                    gen.append('            };\n')
+                    gen.append('            static const uint32_t variantCount = static_cast<uint32_t>(std::size(variants));\n')
+                gen.append(f'        }} // namespace {blockName}\n')
+            gen.append('    } // namespace blocks\n\n')
+
+            gen.append('    static const VpCapabilitiesDesc capabilities[] = {\n')
             for capability_keys in profile_value.referencedCapabilities:
-                gen += ('        {{ blocks::{0}::variantCount, blocks::{0}::variants }},\n').format(self.get_blockName(capability_keys))
-            gen += '    };\n'
-            gen += '    static const uint32_t capabilityCount = static_cast<uint32_t>(std::size(capabilities));\n'
+                blockName = self.get_blockName(capability_keys)
+                gen.append(f'        {{ blocks::{blockName}::variantCount, blocks::{blockName}::variants }},\n')
+            gen.append('    };\n')
+            gen.append('    static const uint32_t capabilityCount = static_cast<uint32_t>(std::size(capabilities));\n')
 
             if profile_value.fallbacks:
-                gen += ('\n'
+                gen.append('\n'
                     '    static const VpProfileProperties fallbacks[] = {\n')
                 for fallback in profile_value.fallbacks:
-                    gen += '        {{{0}_NAME, {0}_SPEC_VERSION}},\n'.format(fallback.upper())
-                gen += ('    };\n'
+                    gen.append(f'        {{{profilePropertiesInit(fallback)}}},\n')
+                gen.append('    };\n'
                     '    static const uint32_t fallbackCount = static_cast<uint32_t>(std::size(fallbacks));\n')
 
             if profile_value.profileRequirements:
-                gen += ('\n'
+                gen.append('\n'
                     '    static const VpProfileProperties profiles[] = {\n')
                 for profile in profile_value.profileRequirements:
-                    gen += '        {{{0}_NAME, {0}_SPEC_VERSION}},\n'.format(profile.upper())
-                gen += ('    };\n'
+                    gen.append(f'        {{{profilePropertiesInit(profile)}}},\n')
+                gen.append('    };\n'
                     '    static const uint32_t profileCount = static_cast<uint32_t>(std::size(profiles));\n')
 
-            gen += ('}} // namespace {0}\n').format(profile_ukey)
-            gen += ('#endif //{0}\n\n').format(profile_key)
+            gen.append(f'}} // namespace {profile_ukey}\n')
+            gen.append(f'#endif //{profile_key}\n\n')
 
-        gen += 'static const VpProfileDesc profiles[] = {\n'
-        for profile_key, profile_value in sorted(self.profiles_files.profiles.items()):
-            profile_ukey = profile_key.upper()
-            gen += ('#ifdef {0}\n'
-                    '    VpProfileDesc{{\n'
-                    '        VpProfileProperties{{ {1}_NAME, {1}_SPEC_VERSION }},\n'
-                    '        {1}_MIN_API_VERSION,\n').format(profile_key, profile_ukey)
+        gen.append('static const VpProfileDesc profiles[] = {\n')
+        for profile_key, profile_value in self.sortedProfiles:
+            profile_ukey = profile_value.ukey
+            gen.append((f'#ifdef {profile_key}\n'
+                    f'    VpProfileDesc{{\n'
+                    f'        VpProfileProperties{{ {profile_value.propertiesInit} }},\n'
+                    f'        {profile_ukey}_MIN_API_VERSION,\n'))
             if profile_value.multiple_variants:
-                gen += '        nullptr,\n'
+                gen.append('        nullptr,\n')
             else:
-                gen += ('        {0}::mergedCapabilities,\n').format(profile_ukey)
+                gen.append(f'        {profile_ukey}::mergedCapabilities,\n')
             if profile_value.profileRequirements:
-                gen += ('        {0}::profileCount, {0}::profiles,\n').format(profile_ukey)
+                gen.append(f'        {profile_ukey}::profileCount, {profile_ukey}::profiles,\n')
             else:
-                gen += ('        0, nullptr,\n')
-            gen += ('        {0}::capabilityCount, {0}::capabilities,\n').format(profile_ukey)
+                gen.append('        0, nullptr,\n')
+            gen.append(f'        {profile_ukey}::capabilityCount, {profile_ukey}::capabilities,\n')
             if profile_value.fallbacks:
-                gen += ('        {1}::fallbackCount, {1}::fallbacks,\n').format(profile_key, profile_ukey)
+                gen.append(f'        {profile_ukey}::fallbackCount, {profile_ukey}::fallbacks,\n')
             else:
-                gen += ('        0, nullptr,\n')
-            gen += ('    }},\n'
-                    '#endif // {0}\n').format(profile_ukey)
+                gen.append('        0, nullptr,\n')
+            gen.append((f'    }},\n'
+                    f'#endif // {profile_ukey}\n'))
 
-        gen += ('};\n'
+        gen.append('};\n'
                 'static const uint32_t profileCount = static_cast<uint32_t>(std::size(profiles));\n')
-        return gen
+        return ''.join(gen)
 
     def gen_StructureSizeImpl(self):
-        gen = '\n'
+        gen = ['\n']
         for struct_key, struct_data in self.registry.structs.items():
             if 'VkPhysicalDeviceFeatures2' not in struct_data.extends or 'VkDeviceCreateInfo' not in struct_data.extends:
                 continue
@@ -5875,20 +3390,20 @@ class VulkanProfilesLibraryGenerator():
             for extension in struct_data.definedByExtensions:
                 platform = self.registry.extensions[extension].platform
                 if platform:
-                    gen += '#ifdef {0}\n'.format(self.registry.platforms[platform].protect)
+                    gen.append(f'#ifdef {self.registry.platforms[platform].protect}\n')
                     platform_protection = True
 
-            gen += '        this->structureSize.insert({{ {0}, size<{1}>() }});\n'.format(struct_data.sType, struct_key)
+            gen.append(f'        this->structureSize.insert({{ {struct_data.sType}, size<{struct_key}>() }});\n')
 
             if platform_protection:
-                gen += '#endif\n'
+                gen.append('#endif\n')
 
-        gen += '        this->structureSize.insert({ VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2_KHR, size<VkPhysicalDeviceFeatures2KHR>() });'
-        return gen
+        gen.append('        this->structureSize.insert({ VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2_KHR, size<VkPhysicalDeviceFeatures2KHR>() });')
+        return ''.join(gen)
 
     def gen_StructureFeatureChain(self):
-        gen = '\n        //Initializing the full list of available structure features\n'
-        gen += '        void* pNext = nullptr;\n'
+        gen = ['\n        //Initializing the full list of available structure features\n']
+        gen.append('        void* pNext = nullptr;\n')
 
         for struct_key, struct_data in self.registry.structs.items():
             if 'VkPhysicalDeviceFeatures2' not in struct_data.extends or 'VkDeviceCreateInfo' not in struct_data.extends:
@@ -5904,21 +3419,21 @@ class VulkanProfilesLibraryGenerator():
             for extension in struct_data.definedByExtensions:
                 platform = self.registry.extensions[extension].platform
                 if platform:
-                    gen += '#ifdef {0}\n'.format(self.registry.platforms[platform].protect)
+                    gen.append(f'#ifdef {self.registry.platforms[platform].protect}\n')
                     platform_protection = True
 
-            gen += '        {0}.pNext = pNext;\n'.format(currentVarName)
-            gen += '        pNext = &{0};\n'.format(currentVarName)
+            gen.append(f'        {currentVarName}.pNext = pNext;\n')
+            gen.append(f'        pNext = &{currentVarName};\n')
  
             if platform_protection:
-                gen += '#endif\n'
+                gen.append('#endif\n')
 
-        gen += "        physicalDeviceFeatures2KHR.pNext = pNext;\n"
+        gen.append("        physicalDeviceFeatures2KHR.pNext = pNext;\n")
 
-        return gen
+        return ''.join(gen)
 
     def gen_StructureFeatureImpl(self):
-        gen = '\n'
+        gen = ['\n']
 
         for struct_key, struct_data in self.registry.structs.items():
             if 'VkPhysicalDeviceFeatures2' not in struct_data.extends or 'VkDeviceCreateInfo' not in struct_data.extends:
@@ -5934,54 +3449,31 @@ class VulkanProfilesLibraryGenerator():
             for extension in struct_data.definedByExtensions:
                 platform = self.registry.extensions[extension].platform
                 if platform:
-                    gen += '#ifdef {0}\n'.format(self.registry.platforms[platform].protect)
+                    gen.append(f'#ifdef {self.registry.platforms[platform].protect}\n')
                     platform_protection = True
 
-            gen += '    {0} {1}{{ {2}, nullptr }};\n'.format(struct_key, currentVarName, struct_data.sType)
+            gen.append(f'    {struct_key} {currentVarName}{{ {struct_data.sType}, nullptr }};\n')
  
             if platform_protection:
-                gen += '#endif\n'
+                gen.append('#endif\n')
 
-        gen += "    VkPhysicalDeviceFeatures2KHR physicalDeviceFeatures2KHR{ VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2_KHR, nullptr };\n"
+        gen.append("    VkPhysicalDeviceFeatures2KHR physicalDeviceFeatures2KHR{ VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2_KHR, nullptr };\n")
 
-        return gen
+        return ''.join(gen)
 
     def gen_profileFeatureChain(self):
-        genStructureSize = self.gen_StructureSizeImpl()
-        genStructureFeatures = self.gen_StructureFeatureImpl()
-        gen_StructureFeatureChain = self.gen_StructureFeatureChain()
-
-        gen = '\n'
-        gen += '''
-struct FeaturesChain {
-    std::map<VkStructureType, std::size_t> structureSize;
-
-    template<typename T>
-    constexpr std::size_t size() const {
-        return (sizeof(T) - sizeof(VkBaseOutStructure)) / sizeof(VkBool32);
-    }\n'''
-
-        gen += '''\n\t// Chain with all Vulkan Features structures{0}'''.format(genStructureFeatures)
-
-        gen += '''
-    FeaturesChain() {{
-        // Initializing all feature structures, number of Features (VkBool32) per structure.{0}\n{1}
-    }}\n\n'''.format(genStructureSize, gen_StructureFeatureChain)
-
-        gen += PRIVATE_IMPL_FEATURES_CHAIN_IMPL
-
-        gen += '}; // struct FeaturesChain\n'
-
-        Template(gen).substitute(genStructureSize=genStructureSize, genStructureFeatures=genStructureFeatures)
-        return gen
+        return FEATURES_CHAIN.substitute(
+            genStructureFeatures = self.gen_StructureFeatureImpl(),
+            genStructureSize = self.gen_StructureSizeImpl(),
+            genStructureFeatureChain = self.gen_StructureFeatureChain())
 
     def gen_videoProfileEnumerator(self):
         # Generates an enumerator function that goes through all supportable video profiles
         # Used to handle "wildcard" video profiles where only partial video profile info is specified
         # in the JSON and the defined capabilities and video format properties apply to all video profiles
         # that match the "wildcard".
-        gen = '\n'
-        gen += '''
+        gen = ['\n']
+        gen.append('''
 #ifdef VK_KHR_video_queue
 VPAPI_ATTR void vpForEachMatchingVideoProfiles(
     VkVideoProfileInfoKHR*                      pVideoProfileInfo,
@@ -6004,18 +3496,18 @@ VPAPI_ATTR void vpForEachMatchingVideoProfiles(
             pVideoProfileInfo->lumaBitDepth = bit_depth_list[lumaBitDepth_idx];
             for (size_t chromaBitDepth_idx = 0; chromaBitDepth_idx < std::size(bit_depth_list); ++chromaBitDepth_idx) {
                 pVideoProfileInfo->chromaBitDepth = bit_depth_list[chromaBitDepth_idx];
-'''
+''')
 
         for videoCodecOp, videoCodec in self.registry.videoCodecsByValue.items():
-            gen += '{0}{{\n'.format(' ' * 16)
-            indent = ' ' * 20
-            gen += '{0}pVideoProfileInfo->pNext = nullptr;\n'.format(indent)
-            gen += '{0}pVideoProfileInfo->videoCodecOperation = {1};\n'.format(indent, videoCodecOp)
+            gen.append('                {\n')
+            indent = '                    '
+            gen.append(f'{indent}pVideoProfileInfo->pNext = nullptr;\n')
+            gen.append(f'{indent}pVideoProfileInfo->videoCodecOperation = {videoCodecOp};\n')
             for profileStruct in videoCodec.profileStructs:
                 profileStructDef = self.registry.structs[profileStruct]
-                gen += '{0}{1} var_{2} = {{ {3} }};\n'.format(indent, profileStruct, profileStruct[2:], profileStructDef.sType)
-                gen += '{0}var_{1}.pNext = pVideoProfileInfo->pNext;\n'.format(indent, profileStruct[2:])
-                gen += '{0}pVideoProfileInfo->pNext = &var_{1};\n'.format(indent, profileStruct[2:])
+                gen.append(f'{indent}{profileStruct} var_{profileStruct[2:]} = {{ {profileStructDef.sType} }};\n')
+                gen.append(f'{indent}var_{profileStruct[2:]}.pNext = pVideoProfileInfo->pNext;\n')
+                gen.append(f'{indent}pVideoProfileInfo->pNext = &var_{profileStruct[2:]};\n')
 
             # Permute profiles for each profile struct member value
             profiles = OrderedDict({'': []})
@@ -6040,20 +3532,21 @@ VPAPI_ATTR void vpForEachMatchingVideoProfiles(
                     for elem in profile:
                         if elem['struct'] == profileStruct:
                             if lastValue[elem['struct']][elem['member']] != elem['value']:
-                                gen += '{0}var_{1}.{2} = {3};\n'.format(indent, elem['struct'][2:], elem['member'], elem['value'])
+                                gen.append(f"{indent}var_{elem['struct'][2:]}.{elem['member']} = {elem['value']};\n")
                                 lastValue[elem['struct']][elem['member']] = elem['value']
-                gen += '{0}pfnCb(reinterpret_cast<VkBaseOutStructure*>(pVideoProfileInfo), pUser);\n'.format(indent)
+                gen.append(f'{indent}pfnCb(reinterpret_cast<VkBaseOutStructure*>(pVideoProfileInfo), pUser);\n')
 
-            gen += '{0}}}\n'.format(' ' * 16)
+            gen.append('                }\n')
 
-        gen += '''            }
+        gen.append('''            }
         }
     }
 }
 #endif  // VK_KHR_video_queue
-'''
-        return gen
+''')
+        return ''.join(gen)
 
+    @functools.lru_cache(maxsize = None)
     def gen_publicImpl(self):
         gen = PUBLIC_IMPL_BODY
         return self.patch_code(gen)
@@ -6074,9 +3567,8 @@ class VulkanProfilesSchemaGenerator():
             Log.w("`jsonschema` module is not installed, schema validation skip")
 
     def generate(self, outSchema):
-        Log.i("Generating '{0}'...".format(outSchema))
-        with open(outSchema, 'w') as f:
-            f.write(json.dumps(self.schema, indent=4))
+        Log.i("Generating '%s'...", outSchema)
+        writeFile(outSchema, json.dumps(self.schema, indent=4))
 
 
     def gen_schema(self):
@@ -6539,7 +4031,7 @@ class VulkanProfilesSchemaGenerator():
 
             if memberDef.type in self.registry.externalTypes and not memberDef.type in definitions:
                 # Members with types defined externally and aren't manually defined are ignored
-                Log.w("Ignoring member '{0}' in struct '{1}' with external type '{2}'".format(memberName, name, memberDef.type))
+                Log.w("Ignoring member '%s' in struct '%s' with external type '%s'", memberName, name, memberDef.type)
                 continue
 
             if memberDef.isArray:
@@ -6547,7 +4039,7 @@ class VulkanProfilesSchemaGenerator():
                     # This array is a dynamic one (count + pointer to array) which is not allowed
                     # for return structures. Such structures hence are ill-formed and shouldn't
                     # be included in the schema
-                    Log.w("Ignoring member '{0}' in struct '{1}' containing ill-formed pointer to array".format(memberName, name))
+                    Log.w("Ignoring member '%s' in struct '%s' containing ill-formed pointer to array", memberName, name)
                 else:
                     members[memberDef.name] = self.gen_array(memberDef.type, memberDef.arraySize, definitions)
             else:
@@ -6700,56 +4192,55 @@ class VulkanProfilesDocGenerator():
 
 
     def generate(self, outDoc):
-        Log.i("Generating '{0}'...".format(outDoc))
-        with open(outDoc, 'w') as f:
-            f.write(self.gen_doc())
+        Log.i("Generating '%s'...", outDoc)
+        writeFile(outDoc, self.gen_doc())
 
 
     def gen_doc(self):
-        gen = DOC_MD_HEADER
-        gen += '\n# Vulkan Profiles Definitions\n'
-        gen += self.gen_profilesList()
-        gen += self.gen_extensions()
-        gen += self.gen_features()
-        gen += self.gen_limits()
-        gen += self.gen_queueFamilies()
-        gen += self.gen_formats()
-        gen += self.gen_videoProfiles()
-        return gen
+        return ''.join([
+            DOC_MD_HEADER,
+            '\n# Vulkan Profiles Definitions\n',
+            self.gen_profilesList(),
+            self.gen_extensions(),
+            self.gen_features(),
+            self.gen_limits(),
+            self.gen_queueFamilies(),
+            self.gen_formats(),
+            self.gen_videoProfiles()
+        ])
 
 
     def gen_manPageLink(self, entry, text):
         # The version is irrelevant currently in the man page base link as it gets redirected to
         # the latest version's corresponding page, so we simply use version 1.1 as convention
-        return '[{0}](https://www.khronos.org/registry/vulkan/specs/1.1-extensions/man/html/{1}.html)'.format(text, entry)
+        return f'[{text}](https://www.khronos.org/registry/vulkan/specs/1.1-extensions/man/html/{entry}.html)'
+
+
+    def gen_tableHeader(self):
+        header = '| Profiles |' + ''.join([f' {profile.key} |' for profile in self.profiles])
+        return [header, '\n', re.sub(r"[^|]", '-', header)]
 
 
     def gen_table(self, rowHandlers):
-        gen = '| Profiles |'
-        cellFmt = ' {0} |'
-        for profile in self.profiles:
-            gen += cellFmt.format(profile.key)
-        gen += '\n{0}'.format(re.sub(r"[^|]", '-', gen))
+        gen = self.gen_tableHeader()
+        append = gen.append
         for row, rowHandler in rowHandlers.items():
-            gen += '\n| {0} |'.format(row)
+            append(f'\n| {row} |')
             for profile in self.profiles:
-                gen += cellFmt.format(rowHandler(row, profile))
-        return gen
+                append(f' {rowHandler(row, profile)} |')
+        return ''.join(gen)
 
 
     def gen_sectionedTable(self, rowHandlers):
-        gen = '| Profiles |'
-        cellFmt = ' {0} |'
-        for profile in self.profiles:
-            gen += cellFmt.format(profile.key)
-        gen += '\n{0}'.format(re.sub(r"[^|]", '-', gen))
+        gen = self.gen_tableHeader()
+        append = gen.append
         for section, sectionRowHandlers in rowHandlers.items():
-            gen += '\n| **{0}** |'.format(section)
+            append(f'\n| **{section}** |')
             for row, rowHandler in sectionRowHandlers.items():
-                gen += '\n| {0} |'.format(rowHandler(section, row))
+                append(f'\n| {rowHandler(section, row)} |')
                 for profile in self.profiles:
-                    gen += cellFmt.format(rowHandler(section, row, profile))
-        return gen
+                    append(f' {rowHandler(section, row, profile)} |')
+        return ''.join(gen)
 
 
     def gen_profilesList(self):
@@ -6811,7 +4302,7 @@ class VulkanProfilesDocGenerator():
             'Instance extensions': OrderedDict({ row: self.gen_extension for row in instanceExtensions }),
             'Device extensions': OrderedDict({ row: self.gen_extension for row in deviceExtensions })
         }))
-        return '\n## Vulkan Profiles Extensions\n\n{0}\n{1}\n'.format(legend, table)
+        return f'\n## Vulkan Profiles Extensions\n\n{legend}\n{table}\n'
 
 
     def has_nestedFeatureData(self, data):
@@ -6828,7 +4319,7 @@ class VulkanProfilesDocGenerator():
             where = 'Vulkan 1.1'
             isExactMatch = (section == where)
         elif structDef.definedByVersion != None:
-            where = 'Vulkan {0}'.format(str(structDef.definedByVersion))
+            where = f'Vulkan {structDef.definedByVersion}'
             isExactMatch = (section == where)
         elif len(structDef.definedByExtensions) > 0:
             where = '/'.join(structDef.definedByExtensions)
@@ -6838,9 +4329,9 @@ class VulkanProfilesDocGenerator():
             isExactMatch = (section == where)
         if supported:
             if isExactMatch:
-                return '<span title="defined in {0} ({1})">:heavy_check_mark:</span>'.format(struct, where)
+                return f'<span title="defined in {struct} ({where})">:heavy_check_mark:</span>'
             else:
-                return '<span title="equivalent defined in {0} ({1})">:warning:</span>'.format(struct, where)
+                return f'<span title="equivalent defined in {struct} ({where})">:warning:</span>'
         else:
             return ':x:'
 
@@ -6872,7 +4363,7 @@ class VulkanProfilesDocGenerator():
         # We don't want to link to the man page VkPhysicalDeviceVulkanXXFeatures structures,
         # instead we prefer to use the more specific non-alias structure if possible
         for alias in self.getFeatureStructSynonyms(struct, member):
-            if re.match(r"^VkPhysicalDeviceVulkan[0-9]+Features$", alias) is None:
+            if REGEX_CORE_FEATURES_STRUCT.match(alias) is None:
                 structDef = self.registry.structs[alias]
                 if not structDef.isAlias:
                     struct = alias
@@ -6886,9 +4377,11 @@ class VulkanProfilesDocGenerator():
             return self.gen_manPageLink(self.getFeatureStructForManPageLink(struct, member),
                                         member)
 
+        profileFeatures = profile.doc_capabilities.features
+
         # If this feature struct member is defined in the profile as is, consider it supported
-        if struct in profile.doc_capabilities.features:
-            featureStruct = profile.doc_capabilities.features[struct]
+        if struct in profileFeatures:
+            featureStruct = profileFeatures[struct]
             if member in featureStruct:
                 return self.formatFeatureSupport(featureStruct[member], struct, section)
 
@@ -6897,16 +4390,16 @@ class VulkanProfilesDocGenerator():
         # consider it supported
         if struct == 'VkPhysicalDeviceFeatures':
             for wrapperStruct in [ 'VkPhysicalDeviceFeatures2', 'VkPhysicalDeviceFeatures2KHR' ]:
-                if wrapperStruct in profile.doc_capabilities.features:
-                    featureStruct = profile.doc_capabilities.features[wrapperStruct]['features']
+                if wrapperStruct in profileFeatures:
+                    featureStruct = profileFeatures[wrapperStruct]['features']
                     if member in featureStruct:
                         return self.formatFeatureSupport(featureStruct[member], struct, section)
 
         # If the struct has aliases and the feature struct member is defined in the profile in
         # one of those, consider it supported
         for alias in self.getFeatureStructSynonyms(struct, member):
-            if alias in profile.doc_capabilities.features:
-                featureStruct = profile.doc_capabilities.features[alias]
+            if alias in profileFeatures:
+                featureStruct = profileFeatures[alias]
                 if member in featureStruct:
                     return self.formatFeatureSupport(featureStruct[member], alias, section)
 
@@ -6944,7 +4437,7 @@ class VulkanProfilesDocGenerator():
                     featureStructName = 'VkPhysicalDeviceFeatures'
                     features = features['features']
                 elif self.has_nestedFeatureData(features):
-                    Log.f("Unexpected nested feature data in profile '{0}' structure '{1}'".format(profile.name, featureStructName))
+                    Log.f(f"Unexpected nested feature data in profile '{profile.name}' structure '{featureStructName}'")
                 # If this is an alias structure then find the non-alias one and use that
                 featureStructName = self.registry.getNonAliasTypeName(featureStructName, self.registry.structs)
                 # Copy defined feature structure data
@@ -6992,7 +4485,7 @@ class VulkanProfilesDocGenerator():
 
         # Generate table
         table = self.gen_sectionedTable(tableData)
-        return '\n## Vulkan Profile Features\n\n{0}\n\n{1}\n{2}\n'.format(disclaimer, legend, table)
+        return f'\n## Vulkan Profile Features\n\n{disclaimer}\n\n{legend}\n{table}\n'
 
 
     def formatValue(self, value):
@@ -7023,7 +4516,7 @@ class VulkanProfilesDocGenerator():
             where = 'Vulkan 1.1'
             isExactMatch = (section == where)
         elif structDef.definedByVersion != None:
-            where = 'Vulkan {0}'.format(str(structDef.definedByVersion))
+            where = f'Vulkan {structDef.definedByVersion}'
             isExactMatch = (section == where)
         elif len(structDef.definedByExtensions) > 0:
             where = '/'.join(structDef.definedByExtensions)
@@ -7032,9 +4525,9 @@ class VulkanProfilesDocGenerator():
             where = 'Vulkan 1.0'
             isExactMatch = (section == where)
         if isExactMatch or section == None:
-            return '<span title="defined in {0} ({1})">{2}</span>'.format(struct, where, self.formatValue(value))
+            return f'<span title="defined in {struct} ({where})">{self.formatValue(value)}</span>'
         else:
-            return '<span title="equivalent defined in {0} ({1})">_{2}_</span>'.format(struct, where, self.formatValue(value))
+            return f'<span title="equivalent defined in {struct} ({where})">_{self.formatValue(value)}_</span>'
 
 
     def formatLimitName(self, struct, member):
@@ -7063,7 +4556,7 @@ class VulkanProfilesDocGenerator():
         elif limittype == 'range':
             return member + ' (min-max)'
         else:
-            Log.f("Unexpected limittype '{0}'".format(limittype))
+            Log.f(f"Unexpected limittype '{limittype}'")
 
 
     def getLimitStructSynonyms(self, struct, member):
@@ -7101,7 +4594,7 @@ class VulkanProfilesDocGenerator():
         # We don't want to link to the man page VkPhysicalDeviceVulkanXXProperties structures,
         # instead we prefer to use the more specific non-alias structure if possible
         for alias in self.getLimitStructSynonyms(struct, member):
-            if re.match(r"^VkPhysicalDeviceVulkan[0-9]+Properties$", alias) is None:
+            if REGEX_CORE_PROPERTIES_STRUCT.match(alias) is None:
                 structDef = self.registry.structs[alias]
                 if not structDef.isAlias:
                     struct = alias
@@ -7116,9 +4609,11 @@ class VulkanProfilesDocGenerator():
             return self.gen_manPageLink(self.getLimitStructForManPageLink(struct, member),
                                         self.formatLimitName(struct, member))
 
+        profileProperties = profile.doc_capabilities.properties
+
         # If this limit/property struct member is defined in the profile as is, include it
-        if struct in profile.doc_capabilities.properties:
-            limitStruct = profile.doc_capabilities.properties[struct]
+        if struct in profileProperties:
+            limitStruct = profileProperties[struct]
             if member in limitStruct:
                 return self.formatProperty(limitStruct[member], struct, section)
 
@@ -7132,13 +4627,13 @@ class VulkanProfilesDocGenerator():
             else:
                 memberStruct = 'sparseProperties'
             propertyStruct = None
-            if 'VkPhysicalDeviceProperties' in profile.doc_capabilities.properties:
+            if 'VkPhysicalDeviceProperties' in profileProperties:
                 propertyStructName = 'VkPhysicalDeviceProperties'
-                propertyStruct = profile.doc_capabilities.properties[propertyStructName]
+                propertyStruct = profileProperties[propertyStructName]
             for wrapperStruct in [ 'VkPhysicalDeviceProperties2', 'VkPhysicalDeviceProperties2KHR' ]:
-                if wrapperStruct in profile.doc_capabilities.properties:
+                if wrapperStruct in profileProperties:
                     propertyStructName = wrapperStruct
-                    propertyStruct = profile.doc_capabilities.properties[wrapperStruct]['properties']
+                    propertyStruct = profileProperties[wrapperStruct]['properties']
             if propertyStruct != None: # and memberStruct != 'sparseProperties':
                 if memberStruct in propertyStruct:
                     limitStruct = propertyStruct[memberStruct]
@@ -7148,8 +4643,8 @@ class VulkanProfilesDocGenerator():
         # If the struct has aliases and the limit/property struct member is defined in the profile
         # in one of those then include it
         for alias in self.getLimitStructSynonyms(struct, member):
-            if alias in profile.doc_capabilities.properties:
-                limitStruct = profile.doc_capabilities.properties[alias]
+            if alias in profileProperties:
+                limitStruct = profileProperties[alias]
                 if member in limitStruct and limitStruct[member]:
                     return self.formatProperty(limitStruct[member], alias, section)
 
@@ -7241,7 +4736,7 @@ class VulkanProfilesDocGenerator():
 
         # Generate table
         table = self.gen_sectionedTable(tableData)
-        return '\n## Vulkan Profile Limits (Properties)\n\n{0}\n\n{1}\n{2}\n'.format(disclaimer, legend, table)
+        return f'\n## Vulkan Profile Limits (Properties)\n\n{disclaimer}\n\n{legend}\n{table}\n'
 
 
     def gen_queueFamily(self, index, struct, section, member, profile = None):
@@ -7254,10 +4749,11 @@ class VulkanProfilesDocGenerator():
         # If this profile doesn't even define this queue family index then early out
         if len(profile.doc_capabilities.queueFamiliesProperties) <= index:
             return ''
+        profileQueueFamily = profile.doc_capabilities.queueFamiliesProperties[index]
 
         # If this queue family property struct member is defined in the profile as is, include it
-        if struct in profile.doc_capabilities.queueFamiliesProperties[index]:
-            propertyStruct = profile.doc_capabilities.queueFamiliesProperties[index][struct]
+        if struct in profileQueueFamily:
+            propertyStruct = profileQueueFamily[struct]
             if member in propertyStruct:
                 return self.formatProperty(propertyStruct[member], struct)
 
@@ -7266,8 +4762,8 @@ class VulkanProfilesDocGenerator():
         # for the profile and then include it
         if struct == 'VkPhysicalDeviceQueueFamilyProperties':
             for wrapperStruct in [ 'VkPhysicalDeviceQueueFamilyProperties2', 'VkPhysicalDeviceQueueFamilyProperties2KHR' ]:
-                if wrapperStruct in profile.doc_capabilities.queueFamiliesProperties[index]:
-                    propertyStruct = profile.doc_capabilities.queueFamiliesProperties[index][wrapperStruct]['queueFamilyProperties']
+                if wrapperStruct in profileQueueFamily:
+                    propertyStruct = profileQueueFamily[wrapperStruct]['queueFamilyProperties']
                     if member in propertyStruct and propertyStruct[member]:
                         return self.formatProperty(propertyStruct[member], wrapperStruct)
 
@@ -7275,8 +4771,8 @@ class VulkanProfilesDocGenerator():
         # in one of those then include it
         structDef = self.registry.structs[struct]
         for alias in structDef.aliases:
-            if alias in profile.doc_capabilities.queueFamiliesProperties[index]:
-                propertyStruct = profile.doc_capabilities.queueFamiliesProperties[index][alias]
+            if alias in profileQueueFamily:
+                propertyStruct = profileQueueFamily[alias]
                 if member in propertyStruct and propertyStruct[member]:
                     return self.formatProperty(propertyStruct[member], alias)
 
@@ -7331,7 +4827,7 @@ class VulkanProfilesDocGenerator():
 
         # Generate table
         table = self.gen_sectionedTable(tableData)
-        return '\n## Vulkan Profile Queue Families\n\n{0}\n{1}\n'.format(legend, table)
+        return f'\n## Vulkan Profile Queue Families\n\n{legend}\n{table}\n'
 
 
     def getFormatStructForManPageLink(self, struct):
@@ -7350,17 +4846,19 @@ class VulkanProfilesDocGenerator():
             return self.gen_manPageLink(self.getFormatStructForManPageLink(struct),
                                         self.formatLimitName(struct, member))
 
+        profileFormats = profile.doc_capabilities.formats
+
         # If this profile doesn't even define this format then early out
-        if not format in profile.doc_capabilities.formats:
+        if not format in profileFormats:
             # Before doing so, though, we have to check whether any of the aliases of the format
             # are defined by the profile
             formatAliases = self.registry.enums['VkFormat'].aliasValues
-            if not format in formatAliases or not formatAliases[format] in profile.doc_capabilities.formats:
+            if not format in formatAliases or not formatAliases[format] in profileFormats:
                 return ''
 
         # If this format property struct member is defined in the profile as is, include it
-        if struct in profile.doc_capabilities.formats[format]:
-            propertyStruct = profile.doc_capabilities.formats[format][struct]
+        if struct in profileFormats[format]:
+            propertyStruct = profileFormats[format][struct]
             if member in propertyStruct:
                 return self.formatProperty(propertyStruct[member], struct)
 
@@ -7368,8 +4866,8 @@ class VulkanProfilesDocGenerator():
         # the flag bit to check for, so we check for that, or any of its aliases
         if struct == 'VkFormatProperties':
             for alternative in [ 'VkFormatProperties', 'VkFormatProperties2', 'VkFormatProperties2KHR', 'VkFormatProperties3', 'VkFormatProperties3KHR' ]:
-                if alternative in profile.doc_capabilities.formats[format]:
-                    propertyStruct = profile.doc_capabilities.formats[format][alternative]
+                if alternative in profileFormats[format]:
+                    propertyStruct = profileFormats[format][alternative]
                     # VkFormatProperties2[KHR] wrap the real structure in a member
                     if 'formatProperties' in propertyStruct:
                         propertyStruct = propertyStruct['formatProperties']
@@ -7380,8 +4878,8 @@ class VulkanProfilesDocGenerator():
         # in one of those then include it
         structDef = self.registry.structs[struct]
         for alias in structDef.aliases:
-            if alias in profile.doc_capabilities.formats[format]:
-                propertyStruct = profile.doc_capabilities.formats[format][alias]
+            if alias in profileFormats[format]:
+                propertyStruct = profileFormats[format][alias]
                 if member in propertyStruct and propertyStruct[member]:
                     return self.formatProperty(propertyStruct[member], alias)
 
@@ -7454,7 +4952,7 @@ class VulkanProfilesDocGenerator():
 
         # Generate table
         table = self.gen_sectionedTable(tableData)
-        return '\n## Vulkan Profile Formats\n\n{0}\n\n{1}\n{2}\n'.format(disclaimer, legend, table)
+        return f'\n## Vulkan Profile Formats\n\n{disclaimer}\n\n{legend}\n{table}\n'
 
 
     def gen_videoProfile(self, videoProfilesPerProfileKey, videoProfileName, profile = None):
@@ -7512,14 +5010,14 @@ class VulkanProfilesDocGenerator():
             videoProfile = definedVideoProfiles[videoProfileName]
             videoCodec = self.registry.getVideoCodecFromVideoProfile(videoProfile)
 
-            videoProfileSections += "\n### {0}\n\n".format(videoProfileName)
+            videoProfileSections += f"\n### {videoProfileName}\n\n"
             videoProfileSections += self.gen_videoProfileDefinition(videoProfile, videoCodec)
             videoProfileSections += self.gen_videoCapabilities(videoProfileName, videoCodec)
             videoProfileSections += self.gen_videoFormats(videoProfileName, videoCodec)
 
         # Generate table
         table = self.gen_table(tableData)
-        return '\n## Vulkan Profile Video Profiles\n\n{0}\n{1}\n{2}'.format(legend, table, videoProfileSections)
+        return f'\n## Vulkan Profile Video Profiles\n\n{legend}\n{table}\n{videoProfileSections}'
 
 
     def gen_videoProfileDefinition(self, videoProfile, videoCodec):
@@ -7529,11 +5027,11 @@ class VulkanProfilesDocGenerator():
         # Construct table data
         table = '| Profile member | Value |\n'
         table += '|----------------|-------|\n'
-        table += '| **{0}** |\n'.format(baseStructName)
+        table += f'| **{baseStructName}** |\n'
         for member in self.registry.structs[baseStructName].members:
             # Asterisk marks unspecified members (wildcard members)
             value = base[member] if base is not None and member in base else "*"
-            table += '| {0} | {1} |\n'.format(self.gen_manPageLink(baseStructName, member), value)
+            table += f'| {self.gen_manPageLink(baseStructName, member)} | {value} |\n'
 
         if 'profile' in videoProfile:
             videoProfileDesc = videoProfile['profile']
@@ -7542,7 +5040,7 @@ class VulkanProfilesDocGenerator():
 
         for profileStruct in videoCodec.profileStructs.values():
             extStructName = self.registry.getNonAliasTypeName(profileStruct.struct, self.registry.structs)
-            table += '| **{0}** |\n'.format(extStructName)
+            table += f'| **{extStructName}** |\n'
 
             videoProfileStruct = None
             if extStructName in videoProfileDesc:
@@ -7556,18 +5054,18 @@ class VulkanProfilesDocGenerator():
             for profileStructMember in profileStruct.members.values():
                 # Asterisk marks unspecified members (wildcard members)
                 value = videoProfileStruct[profileStructMember.name] if videoProfileStruct is not None and profileStructMember.name in videoProfileStruct else "*"
-                table += '| {0} | {1} |\n'.format(self.gen_manPageLink(extStructName, profileStructMember.name), value)
+                table += f'| {self.gen_manPageLink(extStructName, profileStructMember.name)} | {value} |\n'
 
-        return '\n#### Video Profile Definition\n\n{0}'.format(table)
+        return f'\n#### Video Profile Definition\n\n{table}'
 
 
     def formatVideoProfileProperty(self, value, struct):
         structDef = self.registry.structs[struct]
         if structDef.definedByVersion != None:
-            where = 'Vulkan {0}'.format(str(structDef.definedByVersion))
+            where = f'Vulkan {structDef.definedByVersion}'
         elif len(structDef.definedByExtensions) > 0:
             where = '/'.join(structDef.definedByExtensions)
-        return '<span title="defined in {0} ({1})">{2}</span>'.format(struct, where, self.formatValue(value))
+        return f'<span title="defined in {struct} ({where})">{self.formatValue(value)}</span>'
 
 
     def gen_videoCapability(self, videoProfileName, struct, member, profile = None):
@@ -7631,7 +5129,7 @@ class VulkanProfilesDocGenerator():
 
         # Generate table
         table = self.gen_sectionedTable(tableData)
-        return '\n#### Video Capabilities\n\n{0}'.format(table)
+        return f'\n#### Video Capabilities\n\n{table}'
 
 
     def gen_videoFormat(self, definedVideoFormatsPerProfile, videoProfileName, videoFormatCategory, index, struct, section, member, profile = None):
@@ -7719,7 +5217,7 @@ class VulkanProfilesDocGenerator():
             if videoFormatCategory.name in definedVideoFormats:
                 # There are formats falling in this video format category
                 for index in range(definedVideoFormats[videoFormatCategory.name]):
-                    section = tableData["{0} Format #{1}".format(videoFormatCategory.name, index + 1)] = OrderedDict()
+                    section = tableData[f"{videoFormatCategory.name} Format #{index + 1}"] = OrderedDict()
                     # Include all video format properties that apply to this video format category
                     for videoFormatProps in [ 'VkVideoFormatPropertiesKHR' ] + list(videoFormatCategory.properties.keys()):
                         propsStruct = self.registry.structs[self.registry.getNonAliasTypeName(videoFormatProps, self.registry.structs)]
@@ -7733,15 +5231,15 @@ class VulkanProfilesDocGenerator():
 
         # Generate table
         table = self.gen_sectionedTable(tableData)
-        return '\n#### Video Formats\n\n{0}'.format(table)
+        return f'\n#### Video Formats\n\n{table}'
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
 
-    parser.add_argument('--registry', '-r', action='store', required=True,
+    parser.add_argument('--registry', '-r', action='store', required=True, type=existingFile,
                         help='Use specified registry file instead of vk.xml (video.xml must be present in the same directory for video support).')
-    parser.add_argument('--input', '-i', action='store', required=True,
+    parser.add_argument('--input', '-i', action='store', required=True, type=existingDir,
                         help='Path to directory with profiles.')
     parser.add_argument('--input-filenames', action='store',
                         help='The optional filenames of the profiles files in the directory. If this parameter is not set, all profiles files are loaded.')
@@ -7749,9 +5247,9 @@ if __name__ == '__main__':
                         default='vulkan',
                         choices=['vulkan'],
                         help="Target API")
-    parser.add_argument('--output-library-inc', action='store',
+    parser.add_argument('--output-library-inc', action='store', type=existingDir,
                         help='Output include directory for profile library')
-    parser.add_argument('--output-library-src', action='store',
+    parser.add_argument('--output-library-src', action='store', type=existingDir,
                         help='Output source directory for profile library')
     parser.add_argument('--output-library-filename', action='store',
                         default='vulkan_profiles',
@@ -156,12 +156,12 @@ bool IsSupported(VkPhysicalDevice device, const char* extension_name){
 class ProfileGenerator():
     i = 1
     skipped_features = []
-    skipped_members = ["sType", "pNext", "physicalDevices", "driverID"]
+    # Member name prefixes, kept as a tuple so that str.startswith checks all of them in a single call
+    skipped_members = ("sType", "pNext", "physicalDevices", "driverID")
     skipped_properties_structs = ["VkPhysicalDeviceHostImageCopyPropertiesEXT", "VkPhysicalDeviceLineRasterizationPropertiesEXT", "VkPhysicalDeviceLayeredApiPropertiesListKHR"]
 
     def generate_profile(self, outProfile, registry):
-        with open(outProfile, 'w') as f:
-            f.write(self.gen_privateImpl(registry))
+        gen_profiles_solution.writeFile(outProfile, self.gen_privateImpl(registry))
 
     def gen_extensions(self, extensions):
         gen = ''
@@ -310,12 +310,7 @@ class ProfileGenerator():
                             property_size = int(registry.constants[member.arraySize])
                         else:
                             property_size = member.arraySize
-                    skip = False
-                    for skipped in self.skipped_members:
-                        if (property_name.startswith(skipped)):
-                            skip = True
-                            break
-                    if skip:
+                    if property_name.startswith(self.skipped_members):
                         continue
                     if first_property:
                         first_property = False
@@ -606,8 +601,7 @@ class ProfileGenerator():
         return gen
 
     def generate_tests(self, outTests, registry):
-        with open(outTests, 'w') as f:
-            f.write(self.gen_tests(registry))
+        gen_profiles_solution.writeFile(outTests, self.gen_tests(registry))
 
     def gen_tests(self, registry):
         gen = TESTS_HEADER
@@ -819,7 +813,7 @@ if __name__ == '__main__':
                         default='vulkan',
                         choices=['vulkan'],
                         help="Target API")
-    parser.add_argument('--registry', action='store',
+    parser.add_argument('--registry', action='store', type=gen_profiles_solution.existingFile,
                         help='Use specified registry file instead of vk.xml')
     parser.add_argument('--out-profile', action='store',
                         help='Output profiles file')